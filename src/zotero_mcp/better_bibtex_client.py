@@ -5,6 +5,8 @@ Provides direct access to Zotero's annotations without requiring PDF extraction.
 
 import json
 import requests
+
+from zotero_mcp import http_client
 import os
 import sys
 from typing import Dict, Any, List, Optional
@@ -51,7 +53,7 @@ class ZoteroBetterBibTexAPI:
         }
 
         try:
-            response = requests.post(
+            response = http_client.post(
                 self.base_url,
                 headers=self.headers,
                 data=json.dumps(payload),
@@ -75,7 +77,7 @@ class ZoteroBetterBibTexAPI:
     def is_zotero_running(self) -> bool:
         """Check if Zotero is running and accessible."""
         try:
-            response = requests.get(
+            response = http_client.get(
                 f"http://127.0.0.1:{self.port}/better-bibtex/cayw?probe=true",
                 headers=self.headers,
                 timeout=5
@@ -360,6 +362,19 @@ def format_annotation_markdown(annotation: dict[str, Any]) -> str:
 
     return "\n".join(md)
 
+# Zotero's built-in annotation colors
+ANNOTATION_COLORS = {
+    "#ffd400": "Yellow",
+    "#ff6666": "Red",
+    "#5fb236": "Green",
+    "#2ea8e5": "Blue",
+    "#a28ae5": "Purple",
+    "#e56eee": "Magenta",
+    "#f19837": "Orange",
+    "#aaaaaa": "Gray"
+}
+
+
 def get_color_category(hex_color: str) -> str:
     """
     Get a color category name from a hex color code.
@@ -370,16 +385,4 @@ def get_color_category(hex_color: str) -> str:
     Returns:
         A color category name
     """
-    # Simple implementation based on common annotation colors
-    color_map = {
-        "#ffd400": "Yellow",
-        "#ff6666": "Red",
-        "#5fb236": "Green",
-        "#2ea8e5": "Blue",
-        "#a28ae5": "Purple",
-        "#e56eee": "Magenta",
-        "#f19837": "Orange",
-        "#aaaaaa": "Gray"
-    }
-
-    return color_map.get(hex_color.lower(), "")
+    return ANNOTATION_COLORS.get(hex_color.lower(), "")
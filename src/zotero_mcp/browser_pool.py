@@ -0,0 +1,248 @@
+"""
+Shared Playwright browser for the PDF rescue path.
+
+Chromium is started on first use and kept running, so repeated rescues during
+a batch import or repair skip the browser startup. Playwright's sync API is
+bound to the thread that started it, so one worker thread owns the browser
+and runs every job handed to the pool; concurrent imports queue up on it
+instead of each launching their own browser. A caller's timeout covers its
+own job only, not the time spent queued behind other rescues.
+
+Each host gets its own browser context, so cookies set by a publisher's
+challenge page are reused by later downloads from that host. At most
+ZOTERO_MCP_PLAYWRIGHT_MAX_CONTEXTS contexts stay open (least recently used
+ones are closed first), and the browser shuts down after
+ZOTERO_MCP_PLAYWRIGHT_IDLE_SEC seconds without work. With
+ZOTERO_MCP_PLAYWRIGHT_USER_DATA_DIR set, all hosts share the one persistent
+profile context. A context that closes on its own (a crashed browser or
+persistent profile) is dropped and replaced on the next job.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONTEXTS = 4
+DEFAULT_IDLE_SECONDS = 300.0
+
+_PERSISTENT_HOST = "*"
+
+
+@dataclass(frozen=True)
+class LaunchOptions:
+    headless: bool = True
+    channel: str | None = None
+    user_data_dir: str | None = None
+
+    @classmethod
+    def from_env(cls) -> "LaunchOptions":
+        return cls(
+            headless=os.environ.get("ZOTERO_MCP_PLAYWRIGHT_HEADLESS", "1").strip().lower()
+            not in {"0", "false", "no"},
+            channel=os.environ.get("ZOTERO_MCP_PLAYWRIGHT_CHANNEL", "").strip() or None,
+            user_data_dir=os.environ.get("ZOTERO_MCP_PLAYWRIGHT_USER_DATA_DIR", "").strip() or None,
+        )
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class BrowserPool:
+    """A lazily started browser whose contexts are reused per host."""
+
+    def __init__(
+        self,
+        options: LaunchOptions,
+        *,
+        max_contexts: int = DEFAULT_MAX_CONTEXTS,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        start_playwright: Callable[[], Any] | None = None,
+    ):
+        self.options = options
+        self.max_contexts = max(1, max_contexts)
+        self.idle_seconds = idle_seconds
+        self._start_playwright = start_playwright or _start_sync_playwright
+        self._jobs: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        # Owned by the worker thread only.
+        self._playwright: Any = None
+        self._browser: Any = None
+        self._contexts: OrderedDict[str, Any] = OrderedDict()
+        self.launches = 0
+
+    def run(self, host: str, job: Callable[[Any], Any], *, timeout: float | None = None) -> Any:
+        """
+        Run `job(context)` on the browser thread with the context for `host`.
+
+        `timeout` starts counting when the job starts, so callers queued
+        behind other rescues still get their full budget.
+        """
+        future: Future = Future()
+        started = threading.Event()
+        with self._lock:
+            self._jobs.put((host, job, future, started))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._worker, name="zotero-mcp-browser", daemon=True
+                )
+                self._thread.start()
+        started.wait()
+        return future.result(timeout=timeout)
+
+    def close(self) -> None:
+        """Ask the worker to shut the browser down and wait briefly for it."""
+        with self._lock:
+            thread = self._thread
+            if thread is None or not thread.is_alive():
+                return
+            self._jobs.put(None)
+        thread.join(timeout=10)
+
+    def _worker(self) -> None:
+        while True:
+            try:
+                job = self._jobs.get(timeout=self.idle_seconds)
+            except queue.Empty:
+                with self._lock:
+                    # A job may have arrived between the timeout and taking the lock.
+                    if not self._jobs.empty():
+                        continue
+                    self._shutdown()
+                    self._thread = None
+                return
+            if job is None:
+                self._shutdown()
+                with self._lock:
+                    # Keep serving jobs queued after close(); run() waits for them to start.
+                    if self._jobs.empty():
+                        self._thread = None
+                        return
+                continue
+            host, fn, future, started = job
+            future.set_running_or_notify_cancel()
+            started.set()
+            try:
+                future.set_result(fn(self._context_for(host)))
+            except BaseException as exc:
+                future.set_exception(exc)
+                if not self._browser_alive():
+                    self._shutdown()
+
+    def _context_for(self, host: str) -> Any:
+        if self.options.user_data_dir:
+            host = _PERSISTENT_HOST
+        context = self._contexts.get(host)
+        if context is not None:
+            self._contexts.move_to_end(host)
+            return context
+
+        if self._playwright is None:
+            self._playwright = self._start_playwright()
+            self.launches += 1
+        launch_kwargs: dict[str, Any] = {"headless": self.options.headless}
+        if self.options.channel:
+            launch_kwargs["channel"] = self.options.channel
+        if self.options.user_data_dir:
+            context = self._playwright.chromium.launch_persistent_context(
+                self.options.user_data_dir,
+                accept_downloads=True,
+                ignore_https_errors=True,
+                **launch_kwargs,
+            )
+        else:
+            if self._browser is None:
+                self._browser = self._playwright.chromium.launch(**launch_kwargs)
+            context = self._browser.new_context(accept_downloads=True, ignore_https_errors=True)
+
+        while len(self._contexts) >= self.max_contexts:
+            _, oldest = self._contexts.popitem(last=False)
+            _close_quietly(oldest)
+        self._contexts[host] = context
+        context.on("close", lambda _closed: self._forget_context(host, context))
+        return context
+
+    def _forget_context(self, host: str, context: Any) -> None:
+        if self._contexts.get(host) is context:
+            del self._contexts[host]
+
+    def _browser_alive(self) -> bool:
+        if self._browser is None:
+            return True
+        try:
+            return bool(self._browser.is_connected())
+        except Exception:
+            return False
+
+    def _shutdown(self) -> None:
+        contexts = list(self._contexts.values())
+        self._contexts.clear()
+        for context in contexts:
+            _close_quietly(context)
+        if self._browser is not None:
+            _close_quietly(self._browser)
+            self._browser = None
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception as exc:
+                logger.debug(f"Stopping Playwright failed: {exc}")
+            self._playwright = None
+
+
+def _close_quietly(closable: Any) -> None:
+    try:
+        closable.close()
+    except Exception as exc:
+        logger.debug(f"Closing Playwright object failed: {exc}")
+
+
+def _start_sync_playwright() -> Any:
+    from playwright.sync_api import sync_playwright  # type: ignore
+
+    return sync_playwright().start()
+
+
+_pool: BrowserPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide pool, replacing it if the launch settings changed."""
+    global _pool
+    options = LaunchOptions.from_env()
+    with _pool_lock:
+        if _pool is not None and _pool.options != options:
+            _pool.close()
+            _pool = None
+        if _pool is None:
+            _pool = BrowserPool(
+                options,
+                max_contexts=int(_env_number("ZOTERO_MCP_PLAYWRIGHT_MAX_CONTEXTS", DEFAULT_MAX_CONTEXTS)),
+                idle_seconds=_env_number("ZOTERO_MCP_PLAYWRIGHT_IDLE_SEC", DEFAULT_IDLE_SECONDS),
+            )
+        return _pool
+
+
+def shutdown_browser_pool() -> None:
+    """Close the shared browser, if one is running."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_browser_pool)
@@ -201,6 +201,11 @@ def main():
                                  help="Limit number of items to process (for testing)")
     update_db_parser.add_argument("--fulltext", action="store_true",
                                  help="Extract fulltext content from local Zotero database (slower but more comprehensive)")
+    update_db_parser.add_argument("--pdf-engine", choices=["auto", "pymupdf", "pdfminer"],
+                                 help="PDF text engine for --fulltext (default: auto = Zotero's "
+                                      "full-text cache, then PyMuPDF, then pdfminer)")
+    update_db_parser.add_argument("--pdf-max-pages", type=int,
+                                 help="Page cap for PDF text extraction in this run")
     update_db_parser.add_argument("--config-path",
                                  help="Path to semantic search configuration file")
     update_db_parser.add_argument("--db-path",
@@ -391,7 +396,9 @@ def main():
             stats = search.update_database(
                 force_full_rebuild=args.force_rebuild,
                 limit=args.limit,
-                extract_fulltext=args.fulltext
+                extract_fulltext=args.fulltext,
+                pdf_engine=args.pdf_engine,
+                pdf_max_pages=args.pdf_max_pages,
             )
 
             print(f"\nDatabase update completed:")
@@ -401,6 +408,9 @@ def main():
             print(f"- Updated: {stats.get('updated_items', 0)}")
             print(f"- Skipped: {stats.get('skipped_items', 0)}")
             print(f"- Errors: {stats.get('errors', 0)}")
+            if stats.get('fulltext_sources'):
+                sources = ", ".join(f"{name}: {count}" for name, count in sorted(stats['fulltext_sources'].items()))
+                print(f"- Fulltext sources: {sources}")
             print(f"- Duration: {stats.get('duration', 'Unknown')}")
 
             if stats.get('error'):
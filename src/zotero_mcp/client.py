@@ -3,6 +3,8 @@ Zotero client wrapper for MCP server.
 """
 
 import os
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -100,6 +102,125 @@ class AttachmentDetails:
     title: str
     filename: str
     content_type: str
+    md5: str = ""
+    mtime: int | None = None
+
+
+# Client registry: pyzotero clients are reused per (mode, library, thread) and
+# every client of a mode shares one pooled HTTP session. pyzotero keeps query
+# state on the instance (add_parameters), hence one instance per thread;
+# clients of threads that have exited are dropped when the next one is created.
+_client_lock = threading.Lock()
+_cached_clients: dict[tuple, zotero.Zotero] = {}
+_shared_sessions: dict[bool, Any] = {}
+# Result of the last local API probe: (reachable, checked_at monotonic time)
+_local_health: tuple[bool, float] | None = None
+
+
+def _client_health_ttl() -> float:
+    try:
+        return max(float(os.getenv("ZOTERO_MCP_CLIENT_HEALTH_TTL", "30")), 0.0)
+    except ValueError:
+        return 30.0
+
+
+def _cached_zotero_client(
+    library_id: str, library_type: str, api_key: str | None, local: bool
+) -> zotero.Zotero:
+    """Return the registry's client for these settings, creating it on first use."""
+    key = (local, library_id, library_type, api_key, threading.get_ident())
+    with _client_lock:
+        client = _cached_clients.get(key)
+        if client is None:
+            kwargs: dict[str, Any] = {}
+            if (session := _shared_sessions.get(local)) is not None:
+                kwargs["client"] = session
+            client = zotero.Zotero(
+                library_id=library_id,
+                library_type=library_type,
+                api_key=api_key,
+                local=local,
+                **kwargs,
+            )
+            session = getattr(client, "client", None)
+            if session is not None and local not in _shared_sessions:
+                _shared_sessions[local] = session
+                if local:
+                    _watch_local_session(session)
+            _prune_exited_thread_clients()
+            _cached_clients[key] = client
+    # Drop parameters left behind by a call that failed before its request
+    client.url_params = None
+    return client
+
+
+def _prune_exited_thread_clients() -> None:
+    """Drop clients owned by threads that no longer exist. Caller holds _client_lock."""
+    live = {thread.ident for thread in threading.enumerate()}
+    for key in [key for key in _cached_clients if key[-1] not in live]:
+        # The session is shared; keep pyzotero's __del__ from closing it
+        _cached_clients.pop(key).client = None
+
+
+def _watch_local_session(session: Any) -> None:
+    """Re-probe local Zotero after any failed request on the shared local session."""
+    send = getattr(session, "send", None)
+    if send is None:
+        return
+
+    def send_and_watch(*args: Any, **kwargs: Any) -> Any:
+        try:
+            response = send(*args, **kwargs)
+        except Exception:
+            invalidate_zotero_client_health()
+            raise
+        if getattr(response, "status_code", 0) >= 500:
+            invalidate_zotero_client_health()
+        return response
+
+    try:
+        session.send = send_and_watch
+    except AttributeError:
+        pass
+
+
+def _local_zotero_healthy(client: zotero.Zotero) -> bool:
+    """Probe the local API at most once per ZOTERO_MCP_CLIENT_HEALTH_TTL seconds."""
+    global _local_health
+    now = time.monotonic()
+    cached = _local_health
+    if cached is not None and now - cached[1] < _client_health_ttl():
+        return cached[0]
+    try:
+        client.items(limit=1)
+        healthy = True
+    except Exception:
+        healthy = False
+    _local_health = (healthy, now)
+    return healthy
+
+
+def invalidate_zotero_client_health() -> None:
+    """Forget the last local API probe so the next client lookup probes again."""
+    global _local_health
+    _local_health = None
+
+
+def reset_zotero_clients() -> None:
+    """Drop all cached clients and close their shared HTTP sessions."""
+    global _local_health
+    with _client_lock:
+        for client in _cached_clients.values():
+            # The session is shared; keep pyzotero's __del__ from closing it per client
+            client.client = None
+        _cached_clients.clear()
+        for session in _shared_sessions.values():
+            try:
+                session.close()
+            except Exception:
+                pass
+        _shared_sessions.clear()
+        _local_health = None
 
 
 def get_zotero_client() -> zotero.Zotero:
@@ -114,6 +235,9 @@ def get_zotero_client() -> zotero.Zotero:
     If a runtime library override is active (via set_active_library()),
     those values take precedence over environment variables.
 
+    Clients are cached, and in auto mode the local API probe is reused for
+    ZOTERO_MCP_CLIENT_HEALTH_TTL seconds (default 30).
+
     Returns:
         A configured Zotero client instance.
 
@@ -128,12 +252,7 @@ def get_zotero_client() -> zotero.Zotero:
 
     if local_env in ("true", "yes", "1"):
         # Explicit local mode
-        return zotero.Zotero(
-            library_id=library_id or "0",
-            library_type=library_type,
-            api_key=api_key,
-            local=True,
-        )
+        return _cached_zotero_client(library_id or "0", library_type, api_key, local=True)
 
     if local_env in ("false", "no", "0"):
         # Explicit web mode
@@ -141,37 +260,19 @@ def get_zotero_client() -> zotero.Zotero:
             raise ValueError(
                 "Missing required environment variables. Please set ZOTERO_LIBRARY_ID and ZOTERO_API_KEY."
             )
-        return zotero.Zotero(
-            library_id=library_id,
-            library_type=library_type,
-            api_key=api_key,
-            local=False,
-        )
+        return _cached_zotero_client(library_id, library_type, api_key, local=False)
 
     # Auto mode: try local Zotero desktop first, fall back to Web API
-    try:
-        client = zotero.Zotero(
-            library_id=library_id or "0",
-            library_type=library_type,
-            api_key=None,
-            local=True,
-        )
-        client.items(limit=1)
+    client = _cached_zotero_client(library_id or "0", library_type, None, local=True)
+    if _local_zotero_healthy(client):
         return client
-    except Exception:
-        pass
 
     if not (library_id and api_key):
         raise ValueError(
             "Local Zotero is not running and web credentials are not configured. "
             "Either start Zotero desktop, or set ZOTERO_API_KEY and ZOTERO_LIBRARY_ID."
         )
-    return zotero.Zotero(
-        library_id=library_id,
-        library_type=library_type,
-        api_key=api_key,
-        local=False,
-    )
+    return _cached_zotero_client(library_id, library_type, api_key, local=False)
 
 
 def get_local_zotero_client() -> zotero.Zotero | None:
@@ -185,19 +286,9 @@ def get_local_zotero_client() -> zotero.Zotero | None:
     Returns:
         A local Zotero client instance, or None if local Zotero is not available.
     """
-    try:
-        # Create a local client - library_id 0 is the default for local
-        client = zotero.Zotero(
-            library_id="0",
-            library_type="user",
-            api_key=None,
-            local=True,
-        )
-        # Test connection by making a simple request
-        client.items(limit=1)
-        return client
-    except Exception:
-        return None
+    # library_id 0 is the default for local
+    client = _cached_zotero_client("0", "user", None, local=True)
+    return client if _local_zotero_healthy(client) else None
 
 
 def get_web_zotero_client() -> zotero.Zotero | None:
@@ -217,12 +308,7 @@ def get_web_zotero_client() -> zotero.Zotero | None:
     if not library_id or not api_key:
         return None
 
-    return zotero.Zotero(
-        library_id=library_id,
-        library_type=library_type,
-        api_key=api_key,
-        local=False,
-    )
+    return _cached_zotero_client(library_id, library_type, api_key, local=False)
 
 
 def is_local_zotero_available() -> bool:
@@ -441,6 +527,8 @@ def get_attachment_details(
             title=data.get("title", "Untitled"),
             filename=data.get("filename", ""),
             content_type=data.get("contentType", ""),
+            md5=data.get("md5") or "",
+            mtime=data.get("mtime"),
         )
 
     # For regular items, look for child attachments
@@ -463,7 +551,10 @@ def get_attachment_details(
                 # Use MD5 as proxy for size (longer MD5 usually means larger file)
                 size_proxy = len(child_data.get("md5", ""))
 
-                attachment = (key, title, filename, content_type, size_proxy)
+                attachment = (
+                    key, title, filename, content_type, size_proxy,
+                    child_data.get("md5") or "", child_data.get("mtime"),
+                )
 
                 if content_type == "application/pdf":
                     pdfs.append(attachment)
@@ -477,12 +568,14 @@ def get_attachment_details(
         for category in [pdfs, htmls, others]:
             if category:
                 category.sort(key=lambda x: x[4], reverse=True)
-                key, title, filename, content_type, _ = category[0]
+                key, title, filename, content_type, _, md5, mtime = category[0]
                 return AttachmentDetails(
                     key=key,
                     title=title,
                     filename=filename,
                     content_type=content_type,
+                    md5=md5,
+                    mtime=mtime,
                 )
     except Exception:
         pass
@@ -490,6 +583,42 @@ def get_attachment_details(
     return None
 
 
+CONVERSION_ERROR_PREFIX = "Error converting file to markdown: "
+
+
+def convert_pdf_pages_to_markdown(
+    file_path: str | Path,
+    page_start: int | None = None,
+    page_end: int | None = None,
+) -> tuple[str, int, int, int]:
+    """
+    Extract text from a page range of a PDF with PyMuPDF.
+
+    Only the requested pages are loaded, so reading one chapter of a long
+    book does not pay for converting the whole file.
+
+    Args:
+        file_path: Path to the PDF.
+        page_start: First page, 1-based (default: 1).
+        page_end: Last page, inclusive (default: the last page).
+
+    Returns:
+        (text, first page, last page, page count); the range is clamped to the
+        document, and first > last when it lies past the end.
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open(str(file_path))
+    try:
+        page_count = len(doc)
+        first = max(page_start or 1, 1)
+        last = min(page_end or page_count, page_count)
+        parts = [doc.load_page(index).get_text("text") for index in range(first - 1, last)]
+        return "\n".join(parts).strip(), first, last, page_count
+    finally:
+        doc.close()
+
+
 def convert_to_markdown(file_path: str | Path) -> str:
     """
     Convert a file to markdown.
@@ -535,7 +664,7 @@ def convert_to_markdown(file_path: str | Path) -> str:
                 return _convert_pdf_with_pymupdf()
             except Exception as pdf_error:
                 return (
-                    "Error converting file to markdown: "
+                    f"{CONVERSION_ERROR_PREFIX}"
                     f"{markitdown_error} (PDF fallback failed: {pdf_error})"
                 )
-        return f"Error converting file to markdown: {markitdown_error}"
+        return f"{CONVERSION_ERROR_PREFIX}{markitdown_error}"
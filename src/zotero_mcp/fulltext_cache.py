@@ -0,0 +1,165 @@
+"""
+On-disk cache for attachment text converted to markdown.
+
+Converting a long PDF takes seconds, so the result is stored in a SQLite
+database under the state directory, one row per attachment. Each row records
+a fingerprint of the file it came from (the attachment's md5 from Zotero, or
+the local file's mtime and size), and a lookup with a different fingerprint
+is a miss, so a replaced file is converted again. The least recently read
+entries are evicted once the cache grows past ZOTERO_MCP_FULLTEXT_CACHE_MAX_MB.
+
+Set ZOTERO_MCP_FULLTEXT_CACHE=off to disable the cache.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from zotero_mcp.utils import state_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 200.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS fulltext (
+    attachment_key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    markdown TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_fulltext_accessed ON fulltext(accessed_at);
+"""
+
+
+def cache_enabled() -> bool:
+    return os.getenv("ZOTERO_MCP_FULLTEXT_CACHE", "on").strip().lower() not in {
+        "0", "false", "no", "off", "disabled",
+    }
+
+
+def file_fingerprint(path: Path) -> str:
+    """Fingerprint a file without reading it: modification time and size."""
+    stat = path.stat()
+    return f"stat:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def file_md5(path: Path) -> str:
+    """MD5 of a file's contents, read in chunks; matches Zotero's attachment md5."""
+    digest = hashlib.md5()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FulltextCache:
+    """SQLite-backed markdown store shared by all threads of the process."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(self, attachment_key: str, fingerprints: list[str]) -> str | None:
+        """Return the cached markdown if it was converted from any of `fingerprints`."""
+        fingerprints = [fp for fp in fingerprints if fp]
+        if not fingerprints:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT markdown FROM fulltext WHERE attachment_key = ? "
+                    f"AND fingerprint IN ({', '.join('?' * len(fingerprints))})",
+                    (attachment_key, *fingerprints),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE fulltext SET accessed_at = ? WHERE attachment_key = ?",
+                    (time.time(), attachment_key),
+                )
+        except sqlite3.Error as exc:
+            logger.debug(f"Fulltext cache lookup failed: {exc}")
+            return None
+        return row[0]
+
+    def store(self, attachment_key: str, fingerprint: str, markdown: str) -> None:
+        if not fingerprint or not markdown:
+            return
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO fulltext "
+                    "(attachment_key, fingerprint, markdown, size, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (attachment_key, fingerprint, markdown, len(markdown.encode("utf-8")), now, now),
+                )
+            with self._lock:
+                self._writes += 1
+                should_evict = self._writes % 20 == 1
+            if should_evict:
+                self.evict()
+        except sqlite3.Error as exc:
+            logger.debug(f"Fulltext cache store failed: {exc}")
+
+    def evict(self) -> int:
+        """Drop least recently read entries until the cache fits in max_bytes."""
+        removed = 0
+        with self._connect() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM fulltext").fetchone()[0]
+            if total <= self.max_bytes:
+                return removed
+            excess = total - self.max_bytes
+            for key, size in conn.execute(
+                "SELECT attachment_key, size FROM fulltext ORDER BY accessed_at"
+            ).fetchall():
+                if excess <= 0:
+                    break
+                conn.execute("DELETE FROM fulltext WHERE attachment_key = ?", (key,))
+                excess -= size
+                removed += 1
+        return removed
+
+
+_cache: FulltextCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_fulltext_cache() -> FulltextCache | None:
+    """Return the cache for the current state directory, or None when disabled."""
+    global _cache
+    if not cache_enabled():
+        return None
+    path = Path(os.getenv("ZOTERO_MCP_FULLTEXT_CACHE_PATH") or state_dir() / "fulltext-cache.sqlite")
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            try:
+                max_mb = float(os.getenv("ZOTERO_MCP_FULLTEXT_CACHE_MAX_MB", DEFAULT_MAX_MB))
+            except ValueError:
+                max_mb = DEFAULT_MAX_MB
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _cache = FulltextCache(path, int(max_mb * 1024 * 1024))
+        return _cache
@@ -0,0 +1,257 @@
+"""
+On-disk cache for metadata API responses.
+
+Crossref, arXiv, OpenAlex, Unpaywall and Europe PMC responses are stored in a
+SQLite database under the state directory, keyed by method and normalized URL
+(query parameters sorted, contact-only parameters dropped). Each service has
+its own TTL, 404s are cached for a shorter time, and the least recently used
+entries are evicted once the cache grows past its size limit.
+
+Set ZOTERO_MCP_HTTP_CACHE=off to disable the cache entirely, or =refresh to
+skip cached reads while still storing fresh responses.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from zotero_mcp.utils import state_dir
+
+logger = logging.getLogger(__name__)
+
+_DAY = 24 * 60 * 60
+
+# Host -> service name for responses worth caching.
+SERVICE_HOSTS = {
+    "api.crossref.org": "crossref",
+    "export.arxiv.org": "arxiv",
+    "api.openalex.org": "openalex",
+    "api.unpaywall.org": "unpaywall",
+    "www.ebi.ac.uk": "europepmc",
+}
+
+# Seconds a successful response stays fresh. Bibliographic records rarely
+# change; open-access locations move more often.
+SERVICE_TTLS = {
+    "crossref": 30 * _DAY,
+    "arxiv": 30 * _DAY,
+    "openalex": 7 * _DAY,
+    "unpaywall": 7 * _DAY,
+    "europepmc": 7 * _DAY,
+}
+NEGATIVE_TTL = 1 * _DAY
+DEFAULT_MAX_MB = 100.0
+
+# Parameters that identify the caller rather than the resource.
+_IGNORED_PARAMS = {"mailto", "email"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    service TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    url TEXT,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at);
+"""
+
+
+def cache_enabled() -> bool:
+    return os.getenv("ZOTERO_MCP_HTTP_CACHE", "on").strip().lower() not in {
+        "0", "false", "no", "off", "disabled",
+    }
+
+
+def refresh_mode() -> bool:
+    return os.getenv("ZOTERO_MCP_HTTP_CACHE", "").strip().lower() == "refresh"
+
+
+def service_for(url: str) -> str | None:
+    """Return the cached service name for `url`, or None if it is not cached."""
+    return SERVICE_HOSTS.get((urlsplit(url).hostname or "").lower())
+
+
+def cache_key(method: str, url: str, params: dict[str, Any] | None = None) -> str:
+    """Normalize method + URL + params into a stable cache key."""
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    for name, value in (params or {}).items():
+        values = value if isinstance(value, (list, tuple)) else [value]
+        query.extend((name, str(v)) for v in values)
+    query = sorted((k, v) for k, v in query if k.lower() not in _IGNORED_PARAMS)
+    normalized = urlunsplit((
+        parts.scheme.lower(),
+        (parts.hostname or "").lower() + (f":{parts.port}" if parts.port else ""),
+        parts.path,
+        urlencode(query),
+        "",
+    ))
+    return f"{method.upper()} {normalized}"
+
+
+class CachedResponse:
+    """Replay of a stored response with the parts of requests.Response we use."""
+
+    def __init__(self, status_code: int, headers: dict[str, str], content: bytes, url: str | None):
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.url = url
+        self.from_cache = True
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 8192) -> Iterator[bytes]:
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError(
+                f"{self.status_code} Error (cached) for url: {self.url}", response=self
+            )
+
+
+class ResponseCache:
+    """SQLite-backed response store shared by all threads of the process."""
+
+    def __init__(self, path: Path, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def lookup(self, key: str) -> CachedResponse | None:
+        now = time.time()
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT status, headers, body, url FROM responses "
+                    "WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        except sqlite3.Error as exc:
+            logger.debug(f"HTTP cache lookup failed: {exc}")
+            return None
+        status, headers, body, url = row
+        return CachedResponse(status, json.loads(headers), bytes(body), url)
+
+    def store(
+        self,
+        key: str,
+        service: str,
+        *,
+        status: int,
+        content: bytes,
+        headers: dict[str, str] | None = None,
+        url: str | None = None,
+    ) -> None:
+        """Store a non-empty 2xx or a 404 response; anything else is not cached."""
+        if 200 <= status < 300 and content:
+            ttl = SERVICE_TTLS.get(service, 7 * _DAY)
+        elif status == 404:
+            ttl = NEGATIVE_TTL
+        else:
+            return
+        now = time.time()
+        keep = {k: v for k, v in (headers or {}).items() if k.lower() == "content-type"}
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, service, status, headers, body, url, stored_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, service, status, json.dumps(keep), content, url, now, now + ttl, now),
+                )
+            with self._lock:
+                self._writes += 1
+                should_evict = self._writes % 50 == 1
+            if should_evict:
+                self.evict()
+        except sqlite3.Error as exc:
+            logger.debug(f"HTTP cache store failed: {exc}")
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones beyond max_bytes."""
+        removed = 0
+        with self._connect() as conn:
+            removed += conn.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(length(body)), 0) FROM responses").fetchone()[0]
+            if total <= self.max_bytes:
+                return removed
+            excess = total - self.max_bytes
+            for key, size in conn.execute(
+                "SELECT key, length(body) FROM responses ORDER BY accessed_at"
+            ).fetchall():
+                if excess <= 0:
+                    break
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                excess -= size
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+_cache: ResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the cache for the current state directory, or None when disabled."""
+    global _cache
+    if not cache_enabled():
+        return None
+    path = Path(os.getenv("ZOTERO_MCP_HTTP_CACHE_PATH") or state_dir() / "http-cache.sqlite")
+    with _cache_lock:
+        if _cache is None or _cache.path != path:
+            try:
+                max_mb = float(os.getenv("ZOTERO_MCP_HTTP_CACHE_MAX_MB", DEFAULT_MAX_MB))
+            except ValueError:
+                max_mb = DEFAULT_MAX_MB
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _cache = ResponseCache(path, int(max_mb * 1024 * 1024))
+        return _cache
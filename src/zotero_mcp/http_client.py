@@ -0,0 +1,204 @@
+"""
+Shared HTTP session for outbound requests.
+
+Crossref, arXiv, OpenAlex, Unpaywall, Europe PMC, landing pages, PDF downloads
+and the local Zotero connector all go through one pooled `requests.Session`,
+so repeated calls to the same host reuse keep-alive (and TLS) connections.
+Each remote host is paced by a token bucket so concurrent imports stay within
+the services' published rate limits.
+"""
+
+import os
+import threading
+import time
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from zotero_mcp import http_cache
+from zotero_mcp._version import __version__
+
+# Browser-like User-Agent for publisher landing pages and PDF hosts, which
+# often reject obvious API clients.
+BROWSER_USER_AGENT = "Mozilla/5.0 zotero-mcp/1.0"
+
+DEFAULT_TIMEOUT = 30.0
+# Per-host (connect/read) timeout in seconds; hosts not listed use DEFAULT_TIMEOUT.
+HOST_TIMEOUTS: dict[str, float] = {
+    "api.crossref.org": 15.0,
+    "export.arxiv.org": 15.0,
+    "api.openalex.org": 15.0,
+    "api.unpaywall.org": 15.0,
+    "www.ebi.ac.uk": 20.0,
+    "127.0.0.1": 30.0,
+}
+
+# Per-host (requests per second, burst) limits. Hosts not listed share
+# DEFAULT_HOST_RATE each; loopback hosts are never throttled.
+HOST_RATES: dict[str, tuple[float, float]] = {
+    "api.crossref.org": (10.0, 10.0),
+    "api.openalex.org": (10.0, 10.0),
+    "api.unpaywall.org": (10.0, 10.0),
+    "www.ebi.ac.uk": (10.0, 10.0),
+    "export.arxiv.org": (1 / 3, 1.0),
+    "api.zotero.org": (4.0, 4.0),
+}
+DEFAULT_HOST_RATE = (2.0, 4.0)
+_UNTHROTTLED_HOSTS = {"127.0.0.1", "localhost", "::1", ""}
+
+_POOL_SIZE = 16
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def contact_email() -> str:
+    """Contact address for polite-pool API access (Crossref, OpenAlex, Unpaywall)."""
+    return (
+        os.getenv("ZOTERO_MCP_CONTACT_EMAIL", "").strip()
+        or os.getenv("UNPAYWALL_EMAIL", "").strip()
+    )
+
+
+def user_agent() -> str:
+    """User-Agent sent to metadata APIs, with a mailto: when an address is configured."""
+    email = contact_email()
+    suffix = f" (mailto:{email})" if email else ""
+    return f"zotero-mcp/{__version__}{suffix}"
+
+
+def timeout_for(url: str) -> float:
+    """Timeout for `url`, from ZOTERO_MCP_HTTP_TIMEOUT or the per-host table."""
+    override = os.getenv("ZOTERO_MCP_HTTP_TIMEOUT")
+    if override:
+        try:
+            return float(override)
+        except ValueError:
+            pass
+    host = (urlsplit(url).hostname or "").lower()
+    return HOST_TIMEOUTS.get(host, DEFAULT_TIMEOUT)
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=_POOL_SIZE, pool_maxsize=_POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = user_agent()
+                _session = session
+    return _session
+
+
+def close_session() -> None:
+    """Close pooled connections; the next request opens a fresh session."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() sleeps until a token is available."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping if needed; returns the seconds waited."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+_buckets: dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def throttle(url: str) -> float:
+    """Wait for the rate limit of the host `url` points at; returns the seconds waited."""
+    host = (urlsplit(url).hostname or "").lower()
+    if host in _UNTHROTTLED_HOSTS:
+        return 0.0
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            rate, capacity = HOST_RATES.get(host, DEFAULT_HOST_RATE)
+            bucket = _buckets[host] = TokenBucket(rate, capacity)
+    return bucket.acquire()
+
+
+def request(method: str, url: str, **kwargs: Any) -> requests.Response:
+    """Send a request through the shared session with the host's default timeout."""
+    if kwargs.get("timeout") is None:
+        kwargs["timeout"] = timeout_for(url)
+    throttle(url)
+    return get_session().request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def head(url: str, **kwargs: Any) -> requests.Response:
+    return request("HEAD", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    return request("POST", url, **kwargs)
+
+
+def cached_get(
+    url: str,
+    *,
+    params: dict[str, Any] | None = None,
+    bypass_cache: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    GET through the on-disk response cache for metadata APIs.
+
+    URLs outside the cached services (see http_cache.SERVICE_HOSTS) go
+    straight to get(). With bypass_cache=True the cache is not read, but the
+    fresh response still replaces the stored one.
+    """
+    if params is not None:
+        kwargs["params"] = params
+    service = http_cache.service_for(url)
+    cache = http_cache.get_response_cache() if service else None
+    if cache is None:
+        return get(url, **kwargs)
+
+    key = http_cache.cache_key("GET", url, params)
+    bypass_cache = bypass_cache or http_cache.refresh_mode()
+    if not bypass_cache and (cached := cache.lookup(key)) is not None:
+        return cached
+    response = get(url, **kwargs)
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+        cache.store(
+            key,
+            service,
+            status=response.status_code,
+            content=content,
+            headers=dict(getattr(response, "headers", {}) or {}),
+            url=getattr(response, "url", None) or url,
+        )
+    return response
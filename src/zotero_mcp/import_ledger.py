@@ -0,0 +1,259 @@
+"""
+SQLite store for the import ledger.
+
+Every import and reconcile event is one row in a WAL-mode database under the
+state directory, indexed by item key, local item key, action, status and
+time. Inserts are single statements, so concurrent imports never interleave
+entries, and lookups no longer parse the whole history. Entries older than
+ZOTERO_MCP_IMPORT_LEDGER_MAX_AGE_DAYS, or beyond the newest
+ZOTERO_MCP_IMPORT_LEDGER_MAX_ENTRIES, are pruned as the ledger grows.
+
+An existing import-ledger.jsonl next to the database is imported on first
+use and renamed to import-ledger.jsonl.migrated.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from zotero_mcp.utils import state_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 50_000
+DEFAULT_MAX_AGE_DAYS = 365.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at REAL NOT NULL,
+    timestamp TEXT,
+    action TEXT,
+    status TEXT,
+    item_key TEXT,
+    local_item_key TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_item_key ON entries(item_key);
+CREATE INDEX IF NOT EXISTS idx_entries_local_item_key ON entries(local_item_key);
+CREATE INDEX IF NOT EXISTS idx_entries_action ON entries(action, status);
+CREATE INDEX IF NOT EXISTS idx_entries_status ON entries(status);
+CREATE INDEX IF NOT EXISTS idx_entries_recorded_at ON entries(recorded_at);
+"""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _recorded_at(entry: dict[str, Any]) -> float:
+    try:
+        return datetime.fromisoformat(str(entry.get("timestamp"))).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
+
+def _row(entry: dict[str, Any], recorded_at: float) -> tuple[Any, ...]:
+    return (
+        recorded_at,
+        entry.get("timestamp"),
+        entry.get("action"),
+        entry.get("status"),
+        entry.get("item_key"),
+        entry.get("local_item_key"),
+        json.dumps(entry, ensure_ascii=False),
+    )
+
+
+class ImportLedger:
+    """Append-only event log shared by all threads of the process."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        legacy_path: Path | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_days: float = DEFAULT_MAX_AGE_DAYS,
+    ):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self._lock = threading.Lock()
+        self._writes = 0
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        self._migrate_legacy()
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _migrate_legacy(self) -> int:
+        """Import and retire the JSONL ledger if one is present."""
+        legacy = self.legacy_path
+        if legacy is None or not legacy.exists():
+            return 0
+        with self._lock:
+            if not legacy.exists():
+                return 0
+            rows = []
+            with legacy.open("r", encoding="utf-8") as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(entry, dict):
+                        rows.append(_row(entry, _recorded_at(entry)))
+            conn = sqlite3.connect(self.path, timeout=10)
+            try:
+                conn.execute("PRAGMA journal_mode=WAL")
+                with conn:
+                    conn.executescript(_SCHEMA)
+                    conn.executemany(
+                        "INSERT INTO entries "
+                        "(recorded_at, timestamp, action, status, item_key, local_item_key, entry) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+            finally:
+                conn.close()
+            legacy.replace(legacy.with_name(legacy.name + ".migrated"))
+        logger.info(f"Migrated {len(rows)} import ledger entries from {legacy}")
+        return len(rows)
+
+    def append(self, entry: dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO entries "
+                "(recorded_at, timestamp, action, status, item_key, local_item_key, entry) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                _row(entry, time.time()),
+            )
+        with self._lock:
+            self._writes += 1
+            should_prune = self._writes % 100 == 1
+        if should_prune:
+            try:
+                self.prune()
+            except sqlite3.Error as exc:
+                logger.debug(f"Import ledger prune failed: {exc}")
+
+    def recent(
+        self,
+        limit: int | None = None,
+        *,
+        action: str | None = None,
+        status: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching entries, oldest first; with `limit`, only the newest `limit`."""
+        clauses, params = [], []
+        if action:
+            clauses.append("action = ?")
+            params.append(action)
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT entry FROM entries{where} ORDER BY id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(max(limit, 0))
+        with self._connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
+
+    def latest(
+        self,
+        *,
+        item_key: str | None = None,
+        local_item_key: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the newest entry for either key, or None."""
+        clauses, params = [], []
+        if item_key:
+            clauses.append("SELECT id, entry FROM entries WHERE item_key = ?")
+            params.append(item_key)
+        if local_item_key:
+            clauses.append("SELECT id, entry FROM entries WHERE local_item_key = ?")
+            params.append(local_item_key)
+        if not clauses:
+            return None
+        with self._connect() as conn:
+            row = conn.execute(
+                f"SELECT entry FROM ({' UNION ALL '.join(clauses)}) ORDER BY id DESC LIMIT 1",
+                params,
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def prune(self) -> int:
+        """Drop entries past the age limit, then the oldest beyond max_entries."""
+        removed = 0
+        with self._connect() as conn:
+            if self.max_age_days > 0:
+                cutoff = time.time() - self.max_age_days * 24 * 60 * 60
+                removed += conn.execute(
+                    "DELETE FROM entries WHERE recorded_at < ?", (cutoff,)
+                ).rowcount
+            if self.max_entries > 0:
+                removed += conn.execute(
+                    "DELETE FROM entries WHERE id <= "
+                    "(SELECT id FROM entries ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        return removed
+
+
+_ledger: ImportLedger | None = None
+_ledger_lock = threading.Lock()
+
+
+def ledger_paths() -> tuple[Path, Path]:
+    """
+    Return (database path, legacy JSONL path).
+
+    ZOTERO_MCP_IMPORT_LEDGER_PATH may name either file; the other one sits
+    next to it with the matching suffix.
+    """
+    override = os.getenv("ZOTERO_MCP_IMPORT_LEDGER_PATH")
+    path = Path(override).expanduser() if override else state_dir() / "import-ledger.sqlite"
+    if path.suffix == ".jsonl":
+        return path.with_suffix(".sqlite"), path
+    return path, path.with_suffix(".jsonl")
+
+
+def get_import_ledger() -> ImportLedger:
+    """Return the ledger for the current state directory."""
+    global _ledger
+    path, legacy_path = ledger_paths()
+    with _ledger_lock:
+        if _ledger is None or _ledger.path != path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _ledger = ImportLedger(
+                path,
+                legacy_path=legacy_path,
+                max_entries=int(_env_float("ZOTERO_MCP_IMPORT_LEDGER_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+                max_age_days=_env_float("ZOTERO_MCP_IMPORT_LEDGER_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS),
+            )
+        return _ledger
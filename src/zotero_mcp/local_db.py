@@ -5,18 +5,21 @@ Provides direct SQLite access to Zotero's local database for faster semantic sea
 when running in local mode.
 """
 
+import json
 import os
+import re
 import sqlite3
 import platform
 import logging
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 
 from .utils import is_local_mode
 
 
-@dataclass
+@dataclass(slots=True)
 class ZoteroItem:
     """Represents a Zotero item with text content for semantic search."""
     item_id: int
@@ -66,6 +69,73 @@ class ZoteroItem:
         return "\n\n".join(parts)
 
 
+@dataclass(slots=True)
+class AttachmentRecord:
+    """An attachment row joined with its parent and resolved storage path."""
+    item_id: int
+    key: str
+    parent_item_id: int | None = None
+    parent_key: str | None = None
+    content_type: str | None = None
+    link_mode: int | None = None
+    path: str | None = None  # raw Zotero path, e.g. 'storage:file.pdf'
+    resolved_path: Path | None = None
+    exists: bool = False
+    size: int | None = None
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.content_type == "application/pdf"
+
+    @property
+    def is_usable(self) -> bool:
+        """True when the attachment file exists locally and is non-empty."""
+        return self.exists and bool(self.size)
+
+
+# Keep IN (...) lists well below SQLite's host parameter limit.
+_SQL_BATCH_SIZE = 500
+
+# PDF text extraction engines. "auto" reads Zotero's own full-text cache first,
+# then falls back to PyMuPDF and finally pdfminer.
+PDF_ENGINES = ("auto", "pymupdf", "pdfminer")
+ZOTERO_FULLTEXT_CACHE = ".zotero-ft-cache"
+
+
+class LocalBackendUnsupported(Exception):
+    """Raised when a read request needs a feature the SQLite reader cannot serve."""
+
+
+# Zotero stores dates as "YYYY-MM-DD original text"; the API returns the original.
+_MULTIPART_DATE = re.compile(r"^\d{4}-\d{2}-\d{2} (.*)$", re.S)
+_QUICKSEARCH_TOKEN = re.compile(r'"([^"]+)"|(\S+)')
+# Base "title" field and the type-specific fields mapped onto it
+_TITLE_FIELDS = ("title", "caseName", "nameOfAct", "subject")
+_LINK_MODES = {
+    0: "imported_file",
+    1: "imported_url",
+    2: "linked_file",
+    3: "linked_url",
+    4: "embedded_image",
+}
+# itemAnnotations.type -> API annotationType
+_ANNOTATION_TYPES = {
+    1: "highlight",
+    2: "note",
+    3: "image",
+    4: "ink",
+    5: "underline",
+    6: "text",
+}
+
+
+def _api_date(value: str | None) -> str | None:
+    if not value:
+        return value
+    match = _MULTIPART_DATE.match(value)
+    return match.group(1) if match else value
+
+
 class LocalZoteroReader:
     """
     Direct SQLite reader for Zotero's local database.
@@ -74,16 +144,27 @@ class LocalZoteroReader:
     without going through the Zotero API.
     """
 
-    def __init__(self, db_path: str | None = None, pdf_max_pages: int | None = None):
+    def __init__(
+        self,
+        db_path: str | None = None,
+        pdf_max_pages: int | None = None,
+        pdf_engine: str | None = None,
+    ):
         """
         Initialize the local database reader.
 
         Args:
             db_path: Optional path to zotero.sqlite. If None, auto-detect.
+            pdf_max_pages: Page cap for PDF extraction. If None, use
+                ZOTERO_PDF_MAXPAGES or 10.
+            pdf_engine: One of PDF_ENGINES. If None, use ZOTERO_PDF_ENGINE or "auto".
         """
         self.db_path = db_path or self._find_zotero_db()
         self._connection: sqlite3.Connection | None = None
         self.pdf_max_pages: int | None = pdf_max_pages
+        self.pdf_engine: str | None = pdf_engine
+        # Number of documents extracted per source (zotero_cache, pymupdf, ...)
+        self.extraction_stats: Counter[str] = Counter()
         # Reduce noise from pdfminer warnings
         try:
             logging.getLogger("pdfminer").setLevel(logging.ERROR)
@@ -167,27 +248,225 @@ class LocalZoteroReader:
             # Handle nested paths if present
             parts = [p for p in rel.split("/") if p]
             return storage_dir / attachment_key / Path(*parts)
-        # External links not supported in first pass
+        # Linked files store an absolute path; base-directory relative
+        # ('attachments:') links depend on Zotero prefs and are not resolved.
+        path = Path(zotero_path)
+        if path.is_absolute():
+            return path
         return None
 
-    def _extract_text_from_pdf(self, file_path: Path) -> str:
-        """Extract text from a PDF using pdfminer with a page cap to avoid stalls."""
+    def _query_attachment_records(
+        self,
+        where: str,
+        values: Iterable[Any] | None,
+        stat_cache: dict[Path, os.stat_result | None],
+    ) -> list[AttachmentRecord]:
+        """Run the grouped attachment query, chunking `values` into IN (...) batches."""
+        conn = self._get_connection()
+        base_query = """
+            SELECT att.itemID as attachmentItemID,
+                   att.key as attachmentKey,
+                   ia.parentItemID as parentItemID,
+                   parent.key as parentKey,
+                   ia.contentType as contentType,
+                   ia.linkMode as linkMode,
+                   ia.path as path
+            FROM itemAttachments ia
+            JOIN items att ON att.itemID = ia.itemID
+            LEFT JOIN items parent ON parent.itemID = ia.parentItemID
+            """
+
+        if values is None:
+            batches: list[list[Any]] = [[]]
+        else:
+            unique = list(dict.fromkeys(v for v in values if v is not None))
+            if not unique:
+                return []
+            batches = [
+                unique[i:i + _SQL_BATCH_SIZE]
+                for i in range(0, len(unique), _SQL_BATCH_SIZE)
+            ]
+
+        records: list[AttachmentRecord] = []
+        for batch in batches:
+            if values is None:
+                query = base_query + " ORDER BY ia.parentItemID, att.itemID"
+            else:
+                placeholders = ",".join("?" for _ in batch)
+                query = (
+                    base_query
+                    + f" WHERE {where} IN ({placeholders})"
+                    + " ORDER BY ia.parentItemID, att.itemID"
+                )
+            for row in conn.execute(query, batch):
+                key = row["attachmentKey"]
+                resolved = self._resolve_attachment_path(key, row["path"] or "")
+                stat = None
+                if resolved is not None:
+                    if resolved not in stat_cache:
+                        try:
+                            stat_cache[resolved] = resolved.stat()
+                        except OSError:
+                            stat_cache[resolved] = None
+                    stat = stat_cache[resolved]
+                records.append(
+                    AttachmentRecord(
+                        item_id=row["attachmentItemID"],
+                        key=key,
+                        parent_item_id=row["parentItemID"],
+                        parent_key=row["parentKey"],
+                        content_type=row["contentType"],
+                        link_mode=row["linkMode"],
+                        path=row["path"],
+                        resolved_path=resolved,
+                        exists=stat is not None,
+                        size=stat.st_size if stat is not None else None,
+                    )
+                )
+        return records
+
+    def get_attachments_for_parents(
+        self, parent_ids: Iterable[int] | None = None
+    ) -> dict[int, list[AttachmentRecord]]:
+        """
+        Get attachments for many parent items in one grouped query.
+
+        Args:
+            parent_ids: Parent item IDs. If None, return attachments for every
+                parent item in the database.
+
+        Returns:
+            Mapping of parent item ID to its attachment records.
+        """
+        stat_cache: dict[Path, os.stat_result | None] = {}
+        grouped: dict[int, list[AttachmentRecord]] = {}
+        for record in self._query_attachment_records("ia.parentItemID", parent_ids, stat_cache):
+            if record.parent_item_id is None:
+                continue
+            grouped.setdefault(record.parent_item_id, []).append(record)
+        return grouped
+
+    def get_attachments_for_parent_keys(
+        self, parent_keys: Iterable[str]
+    ) -> dict[str, list[AttachmentRecord]]:
+        """
+        Get attachments for many parent items, addressed by item key.
+
+        Args:
+            parent_keys: Parent item keys.
+
+        Returns:
+            Mapping of parent item key to its attachment records.
+        """
+        stat_cache: dict[Path, os.stat_result | None] = {}
+        grouped: dict[str, list[AttachmentRecord]] = {}
+        for record in self._query_attachment_records("parent.key", parent_keys, stat_cache):
+            if record.parent_key is None:
+                continue
+            grouped.setdefault(record.parent_key, []).append(record)
+        return grouped
+
+    def get_attachments_by_key(
+        self, attachment_keys: Iterable[str]
+    ) -> dict[str, AttachmentRecord]:
+        """
+        Resolve many attachment keys to their records in one query.
+
+        Args:
+            attachment_keys: Attachment item keys.
+
+        Returns:
+            Mapping of attachment key to its record. Unknown keys are omitted.
+        """
+        stat_cache: dict[Path, os.stat_result | None] = {}
+        return {
+            record.key: record
+            for record in self._query_attachment_records("att.key", attachment_keys, stat_cache)
+        }
+
+    def _get_pdf_max_pages(self) -> int:
+        """Determine page cap: config value > env > default (10)."""
+        if isinstance(self.pdf_max_pages, int) and self.pdf_max_pages > 0:
+            return self.pdf_max_pages
+        max_pages_env = os.getenv("ZOTERO_PDF_MAXPAGES")
+        try:
+            maxpages = int(max_pages_env) if max_pages_env else 10
+        except ValueError:
+            maxpages = 10
+        return maxpages if maxpages > 0 else 10
+
+    def _get_pdf_engine(self) -> str:
+        """Determine PDF engine: config value > env > default ("auto")."""
+        engine = (self.pdf_engine or os.getenv("ZOTERO_PDF_ENGINE") or "auto").strip().lower()
+        return engine if engine in PDF_ENGINES else "auto"
+
+    def _read_zotero_fulltext_cache(self, attachment_key: str, file_path: Path) -> str:
+        """Return Zotero's cached full text for an attachment if it is not stale."""
+        cache_path = self._get_storage_dir() / attachment_key / ZOTERO_FULLTEXT_CACHE
+        try:
+            cache_stat = cache_path.stat()
+        except OSError:
+            return ""
+        try:
+            if cache_stat.st_mtime < file_path.stat().st_mtime:
+                return ""
+        except OSError:
+            pass
+        try:
+            return cache_path.read_text(encoding="utf-8", errors="ignore")
+        except Exception:
+            return ""
+
+    def _extract_text_with_pymupdf(self, file_path: Path, maxpages: int) -> str:
+        try:
+            import fitz  # PyMuPDF
+
+            with fitz.open(str(file_path)) as doc:
+                parts = []
+                for page_index in range(min(maxpages, doc.page_count)):
+                    parts.append(doc.load_page(page_index).get_text("text"))
+            return "\n".join(parts).strip()
+        except Exception:
+            return ""
+
+    def _extract_text_with_pdfminer(self, file_path: Path, maxpages: int) -> str:
         try:
             from pdfminer.high_level import extract_text  # type: ignore
-            # Determine page cap: config value > env > default (10)
-            if isinstance(self.pdf_max_pages, int) and self.pdf_max_pages > 0:
-                maxpages = self.pdf_max_pages
-            else:
-                max_pages_env = os.getenv("ZOTERO_PDF_MAXPAGES")
-                try:
-                    maxpages = int(max_pages_env) if max_pages_env else 10
-                except ValueError:
-                    maxpages = 10
-            text = extract_text(str(file_path), maxpages=maxpages)
-            return text or ""
+
+            return extract_text(str(file_path), maxpages=maxpages) or ""
         except Exception:
             return ""
 
+    def _extract_text_from_pdf(self, file_path: Path, attachment_key: str | None = None) -> str:
+        """Extract text from a PDF with a page cap to avoid stalls.
+
+        In "auto" mode Zotero's .zotero-ft-cache is preferred, then PyMuPDF,
+        then pdfminer. Explicit engines skip the cache and other engines.
+        """
+        engine = self._get_pdf_engine()
+        maxpages = self._get_pdf_max_pages()
+
+        if engine == "auto":
+            if attachment_key:
+                text = self._read_zotero_fulltext_cache(attachment_key, file_path)
+                if text.strip():
+                    self.extraction_stats["zotero_cache"] += 1
+                    return text
+            chain = ("pymupdf", "pdfminer")
+        else:
+            chain = (engine,)
+
+        for name in chain:
+            if name == "pymupdf":
+                text = self._extract_text_with_pymupdf(file_path, maxpages)
+            else:
+                text = self._extract_text_with_pdfminer(file_path, maxpages)
+            if text.strip():
+                self.extraction_stats[name] += 1
+                return text
+        self.extraction_stats["failed"] += 1
+        return ""
+
     def _extract_text_from_html(self, file_path: Path) -> str:
         """Extract text from HTML using markitdown if available; fallback to stripping tags."""
         # Try markitdown first
@@ -206,13 +485,16 @@ class LocalZoteroReader:
         except Exception:
             return ""
 
-    def _extract_text_from_file(self, file_path: Path) -> str:
+    def _extract_text_from_file(self, file_path: Path, attachment_key: str | None = None) -> str:
         """Extract text content from a file based on extension, with fallbacks."""
         suffix = file_path.suffix.lower()
         if suffix == ".pdf":
-            return self._extract_text_from_pdf(file_path)
+            return self._extract_text_from_pdf(file_path, attachment_key)
         if suffix in {".html", ".htm"}:
-            return self._extract_text_from_html(file_path)
+            text = self._extract_text_from_html(file_path)
+            if text:
+                self.extraction_stats["html"] += 1
+            return text
         # Generic best-effort
         try:
             return file_path.read_text(errors="ignore")
@@ -226,27 +508,35 @@ class LocalZoteroReader:
 
         return meta
 
-    def _extract_fulltext_for_item(self, item_id: int) -> tuple[str, str] | None:
+    def _extract_fulltext_for_item(
+        self, item_id: int, attachments: list[AttachmentRecord] | None = None
+    ) -> tuple[str, str] | None:
         """Attempt to extract fulltext and source from the item's best attachment.
 
         Preference: use PDF when available; fall back to HTML when no PDF exists.
         Returns (text, source) where source is 'pdf' or 'html'.
+
+        `attachments` may carry records prefetched with get_attachments_for_parents()
+        to avoid a per-item query.
         """
+        if attachments is None:
+            attachments = self.get_attachments_for_parents([item_id]).get(item_id, [])
         best_pdf = None
         best_html = None
-        for key, path, ctype in self._iter_parent_attachments(item_id):
-            resolved = self._resolve_attachment_path(key, path or "")
-            if not resolved or not resolved.exists():
+        for record in attachments:
+            resolved = record.resolved_path
+            if not resolved or not record.exists:
                 continue
-            if ctype == "application/pdf" and best_pdf is None:
-                best_pdf = resolved
-            elif (ctype or "").startswith("text/html") and best_html is None:
-                best_html = resolved
+            if record.is_pdf and best_pdf is None:
+                best_pdf = record
+            elif (record.content_type or "").startswith("text/html") and best_html is None:
+                best_html = record
         # Prefer PDF, otherwise fall back to HTML
-        target = best_pdf or best_html
-        if not target:
+        best = best_pdf or best_html
+        if not best:
             return None
-        text = self._extract_text_from_file(target)
+        target = best.resolved_path
+        text = self._extract_text_from_file(target, best.key)
         if not text:
             return None
         # Truncate to keep embeddings reasonable
@@ -361,6 +651,528 @@ class LocalZoteroReader:
         ).fetchall()
         return [dict(row) for row in rows]
 
+    # ------------------------------------------------------------------
+    # API-shaped read backend
+    #
+    # These methods return payloads shaped like pyzotero results
+    # ({"key", "version", "data", "meta"}) so server tools can format them
+    # unchanged. They raise LocalBackendUnsupported for requests that only
+    # the Zotero API can answer.
+    # ------------------------------------------------------------------
+
+    def resolve_library_id(self, library_type: str = "user", library_id: str | int | None = None) -> int:
+        """Map an API-style (library_type, library_id) pair to a local libraryID."""
+        conn = self._get_connection()
+        if library_type == "group":
+            row = conn.execute(
+                "SELECT libraryID FROM groups WHERE groupID = ?", (int(library_id or 0),)
+            ).fetchone()
+        elif library_type == "feed":
+            row = conn.execute(
+                "SELECT libraryID FROM libraries WHERE libraryID = ? AND type = 'feed'",
+                (int(library_id or 0),),
+            ).fetchone()
+        else:
+            row = conn.execute(
+                "SELECT libraryID FROM libraries WHERE type = 'user' ORDER BY libraryID LIMIT 1"
+            ).fetchone()
+        if not row:
+            raise LocalBackendUnsupported(
+                f"library {library_type}:{library_id} is not in the local database"
+            )
+        return int(row[0])
+
+    def _chunked_rows(self, query: str, ids: list[Any]) -> list[sqlite3.Row]:
+        """Run `query` (containing `{placeholders}`) over `ids` in IN (...) batches."""
+        conn = self._get_connection()
+        rows: list[sqlite3.Row] = []
+        for i in range(0, len(ids), _SQL_BATCH_SIZE):
+            batch = ids[i:i + _SQL_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            rows.extend(conn.execute(query.format(placeholders=placeholders), batch))
+        return rows
+
+    def _build_item_payloads(self, item_ids: list[int]) -> list[dict[str, Any]]:
+        """Build API-shaped item payloads for `item_ids`, preserving order."""
+        ids = list(dict.fromkeys(item_ids))
+        if not ids:
+            return []
+
+        payloads: dict[int, dict[str, Any]] = {}
+        for row in self._chunked_rows(
+            """
+            SELECT i.itemID, i.key, i.version, i.dateAdded, i.dateModified,
+                   it.typeName,
+                   COALESCE(na.key, aa.key) as parentKey,
+                   n.note as note,
+                   a.linkMode, a.contentType, a.path,
+                   (SELECT COUNT(*) FROM itemNotes cn
+                    WHERE cn.parentItemID = i.itemID
+                    AND cn.itemID NOT IN (SELECT itemID FROM deletedItems))
+                 + (SELECT COUNT(*) FROM itemAttachments ca
+                    WHERE ca.parentItemID = i.itemID
+                    AND ca.itemID NOT IN (SELECT itemID FROM deletedItems)) as numChildren
+            FROM items i
+            JOIN itemTypes it ON it.itemTypeID = i.itemTypeID
+            LEFT JOIN itemNotes n ON n.itemID = i.itemID
+            LEFT JOIN items na ON na.itemID = n.parentItemID
+            LEFT JOIN itemAttachments a ON a.itemID = i.itemID
+            LEFT JOIN items aa ON aa.itemID = a.parentItemID
+            WHERE i.itemID IN ({placeholders})
+            """,
+            ids,
+        ):
+            data: dict[str, Any] = {
+                "key": row["key"],
+                "version": row["version"] or 0,
+                "itemType": row["typeName"],
+                "dateAdded": row["dateAdded"],
+                "dateModified": row["dateModified"],
+            }
+            if row["parentKey"]:
+                data["parentItem"] = row["parentKey"]
+            if row["typeName"] == "note":
+                data["note"] = row["note"] or ""
+            elif row["typeName"] == "attachment":
+                data["linkMode"] = _LINK_MODES.get(row["linkMode"], "imported_file")
+                data["contentType"] = row["contentType"] or ""
+                raw_path = row["path"] or ""
+                if raw_path.startswith("storage:"):
+                    data["filename"] = raw_path.split(":", 1)[1]
+                elif raw_path:
+                    data["path"] = raw_path
+            else:
+                data["creators"] = []
+            data["tags"] = []
+            data["collections"] = []
+            payloads[row["itemID"]] = {
+                "key": row["key"],
+                "version": row["version"] or 0,
+                "data": data,
+                "meta": {"numChildren": row["numChildren"] or 0},
+            }
+
+        for row in self._chunked_rows(
+            """
+            SELECT d.itemID, f.fieldName, v.value
+            FROM itemData d
+            JOIN fields f ON f.fieldID = d.fieldID
+            JOIN itemDataValues v ON v.valueID = d.valueID
+            WHERE d.itemID IN ({placeholders})
+            """,
+            ids,
+        ):
+            payload = payloads.get(row["itemID"])
+            if payload is None:
+                continue
+            name = row["fieldName"]
+            value = _api_date(row["value"]) if name == "date" else row["value"]
+            if name in _TITLE_FIELDS:
+                payload["data"].setdefault("title", value)
+            payload["data"][name] = value
+
+        for row in self._chunked_rows(
+            """
+            SELECT ic.itemID, c.firstName, c.lastName, c.fieldMode, ct.creatorType
+            FROM itemCreators ic
+            JOIN creators c ON c.creatorID = ic.creatorID
+            LEFT JOIN creatorTypes ct ON ct.creatorTypeID = ic.creatorTypeID
+            WHERE ic.itemID IN ({placeholders})
+            ORDER BY ic.itemID, ic.orderIndex
+            """,
+            ids,
+        ):
+            payload = payloads.get(row["itemID"])
+            if payload is None:
+                continue
+            creator: dict[str, str] = {"creatorType": row["creatorType"] or "author"}
+            if row["fieldMode"] == 1 or not row["firstName"]:
+                creator["name"] = row["lastName"] or ""
+            else:
+                creator["firstName"] = row["firstName"] or ""
+                creator["lastName"] = row["lastName"] or ""
+            payload["data"].setdefault("creators", []).append(creator)
+
+        for row in self._chunked_rows(
+            """
+            SELECT it.itemID, t.name, it.type
+            FROM itemTags it
+            JOIN tags t ON t.tagID = it.tagID
+            WHERE it.itemID IN ({placeholders})
+            ORDER BY t.name
+            """,
+            ids,
+        ):
+            payload = payloads.get(row["itemID"])
+            if payload is None:
+                continue
+            tag: dict[str, Any] = {"tag": row["name"]}
+            if row["type"]:
+                tag["type"] = row["type"]
+            payload["data"]["tags"].append(tag)
+
+        for row in self._chunked_rows(
+            """
+            SELECT ci.itemID, c.key
+            FROM collectionItems ci
+            JOIN collections c ON c.collectionID = ci.collectionID
+            WHERE ci.itemID IN ({placeholders})
+            """,
+            ids,
+        ):
+            payload = payloads.get(row["itemID"])
+            if payload is not None:
+                payload["data"]["collections"].append(row["key"])
+
+        return [payloads[item_id] for item_id in ids if item_id in payloads]
+
+    @staticmethod
+    def _item_type_clause(item_type: str | None) -> tuple[str, list[Any]]:
+        """Translate an API itemType filter ("book", "-attachment", "a || b") to SQL."""
+        if not item_type:
+            return "", []
+        negate = item_type.startswith("-")
+        names = [n.strip() for n in item_type.lstrip("-").split("||") if n.strip()]
+        if not names:
+            return "", []
+        placeholders = ",".join("?" for _ in names)
+        op = "NOT IN" if negate else "IN"
+        return f" AND it.typeName {op} ({placeholders})", names
+
+    @staticmethod
+    def _tag_clause(tags: list[str] | None) -> tuple[str, list[Any]]:
+        """Translate API tag conditions (ANDed; each supports `||` and leading `-`)."""
+        sql = ""
+        params: list[Any] = []
+        for condition in tags or []:
+            negate = condition.startswith("-")
+            names = [n.strip() for n in condition.lstrip("-").split("||") if n.strip()]
+            if not names:
+                continue
+            placeholders = ",".join("?" for _ in names)
+            exists = "NOT EXISTS" if negate else "EXISTS"
+            sql += (
+                f" AND {exists} (SELECT 1 FROM itemTags itg JOIN tags tg ON tg.tagID = itg.tagID"
+                f" WHERE itg.itemID = i.itemID AND tg.name IN ({placeholders}))"
+            )
+            params.extend(names)
+        return sql, params
+
+    def search_items(
+        self,
+        query: str,
+        *,
+        qmode: str = "titleCreatorYear",
+        item_type: str | None = "-attachment",
+        limit: int | None = None,
+        tags: list[str] | None = None,
+        library_id: int = 1,
+    ) -> list[dict[str, Any]]:
+        """
+        Quick-search items like the API's `q` parameter in titleCreatorYear mode.
+
+        Every word (or quoted phrase) must match the title, a creator name, or
+        the date. Results are sorted by dateModified, newest first.
+
+        Raises:
+            LocalBackendUnsupported: For qmode="everything", which also searches
+                Zotero's full-text word index.
+        """
+        if qmode != "titleCreatorYear":
+            raise LocalBackendUnsupported(f"qmode={qmode!r} requires the Zotero API")
+
+        sql = """
+            SELECT i.itemID
+            FROM items i
+            JOIN itemTypes it ON it.itemTypeID = i.itemTypeID
+            WHERE i.libraryID = ?
+            AND it.typeName != 'annotation'
+            AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+            """
+        params: list[Any] = [library_id]
+        title_fields = ",".join("?" for _ in _TITLE_FIELDS)
+        for match in _QUICKSEARCH_TOKEN.finditer(query):
+            word = match.group(1) or match.group(2)
+            pattern = f"%{word}%"
+            sql += f"""
+            AND (
+                EXISTS (SELECT 1 FROM itemData d
+                        JOIN fields f ON f.fieldID = d.fieldID
+                        JOIN itemDataValues v ON v.valueID = d.valueID
+                        WHERE d.itemID = i.itemID
+                        AND (f.fieldName IN ({title_fields}) OR f.fieldName = 'date')
+                        AND v.value LIKE ?)
+                OR EXISTS (SELECT 1 FROM itemCreators ic
+                           JOIN creators c ON c.creatorID = ic.creatorID
+                           WHERE ic.itemID = i.itemID
+                           AND (c.lastName LIKE ? OR c.firstName LIKE ?))
+                OR EXISTS (SELECT 1 FROM itemNotes qn
+                           WHERE qn.itemID = i.itemID AND qn.title LIKE ?)
+            )"""
+            params.extend([*_TITLE_FIELDS, pattern, pattern, pattern, pattern])
+
+        type_sql, type_params = self._item_type_clause(item_type)
+        tag_sql, tag_params = self._tag_clause(tags)
+        sql += type_sql + tag_sql + " ORDER BY i.dateModified DESC, i.itemID DESC"
+        params.extend(type_params + tag_params)
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        conn = self._get_connection()
+        item_ids = [row[0] for row in conn.execute(sql, params)]
+        return self._build_item_payloads(item_ids)
+
+    def get_recent_items(self, limit: int = 10, *, library_id: int = 1) -> list[dict[str, Any]]:
+        """Get the most recently added items (sort=dateAdded, direction=desc)."""
+        conn = self._get_connection()
+        rows = conn.execute(
+            """
+            SELECT i.itemID
+            FROM items i
+            JOIN itemTypes it ON it.itemTypeID = i.itemTypeID
+            WHERE i.libraryID = ?
+            AND it.typeName != 'annotation'
+            AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+            ORDER BY i.dateAdded DESC, i.itemID DESC
+            LIMIT ?
+            """,
+            (library_id, int(limit)),
+        ).fetchall()
+        return self._build_item_payloads([row[0] for row in rows])
+
+    def get_item(self, key: str, *, library_id: int = 1) -> dict[str, Any] | None:
+        """Get one API-shaped item payload by key."""
+        row = self._get_connection().execute(
+            "SELECT itemID FROM items WHERE key = ? AND libraryID = ?", (key, library_id)
+        ).fetchone()
+        if not row:
+            return None
+        payloads = self._build_item_payloads([row[0]])
+        return payloads[0] if payloads else None
+
+    def get_children(self, parent_key: str, *, library_id: int = 1) -> list[dict[str, Any]]:
+        """Get the attachments and notes under a parent item."""
+        rows = self._get_connection().execute(
+            """
+            SELECT child.itemID
+            FROM items parent
+            JOIN (
+                SELECT itemID, parentItemID FROM itemAttachments
+                UNION ALL
+                SELECT itemID, parentItemID FROM itemNotes
+            ) c ON c.parentItemID = parent.itemID
+            JOIN items child ON child.itemID = c.itemID
+            WHERE parent.key = ? AND parent.libraryID = ?
+            AND child.itemID NOT IN (SELECT itemID FROM deletedItems)
+            ORDER BY child.itemID
+            """,
+            (parent_key, library_id),
+        ).fetchall()
+        return self._build_item_payloads([row[0] for row in rows])
+
+    def get_collections(self, limit: int | None = None, *, library_id: int = 1) -> list[dict[str, Any]]:
+        """Get collections as API-shaped payloads (parentCollection is a key or False)."""
+        sql = """
+            SELECT c.key, c.version, c.collectionName, p.key as parentKey,
+                   (SELECT COUNT(*) FROM collections sub
+                    WHERE sub.parentCollectionID = c.collectionID) as numCollections,
+                   (SELECT COUNT(*) FROM collectionItems ci
+                    WHERE ci.collectionID = c.collectionID) as numItems
+            FROM collections c
+            LEFT JOIN collections p ON p.collectionID = c.parentCollectionID
+            WHERE c.libraryID = ?
+            AND c.collectionID NOT IN (SELECT collectionID FROM deletedCollections)
+            ORDER BY c.collectionName COLLATE NOCASE, c.key
+            """
+        params: list[Any] = [library_id]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [
+            {
+                "key": row["key"],
+                "version": row["version"] or 0,
+                "data": {
+                    "key": row["key"],
+                    "name": row["collectionName"],
+                    "parentCollection": row["parentKey"] or False,
+                },
+                "meta": {
+                    "numCollections": row["numCollections"],
+                    "numItems": row["numItems"],
+                },
+            }
+            for row in self._get_connection().execute(sql, params)
+        ]
+
+    def get_collection(self, collection_key: str, *, library_id: int = 1) -> dict[str, Any] | None:
+        """Get one collection payload by key."""
+        for collection in self.get_collections(library_id=library_id):
+            if collection["key"] == collection_key:
+                return collection
+        return None
+
+    def get_collection_items(
+        self, collection_key: str, limit: int | None = None, *, library_id: int = 1
+    ) -> list[dict[str, Any]]:
+        """Get items directly in a collection, newest modification first."""
+        sql = """
+            SELECT i.itemID
+            FROM collections c
+            JOIN collectionItems ci ON ci.collectionID = c.collectionID
+            JOIN items i ON i.itemID = ci.itemID
+            WHERE c.key = ? AND c.libraryID = ?
+            AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+            ORDER BY i.dateModified DESC, i.itemID DESC
+            """
+        params: list[Any] = [collection_key, library_id]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        rows = self._get_connection().execute(sql, params).fetchall()
+        return self._build_item_payloads([row[0] for row in rows])
+
+    def get_tags(self, limit: int | None = None, *, library_id: int = 1) -> list[str]:
+        """Get the distinct tag names used by items in a library."""
+        sql = """
+            SELECT DISTINCT t.name
+            FROM tags t
+            JOIN itemTags it ON it.tagID = t.tagID
+            JOIN items i ON i.itemID = it.itemID
+            WHERE i.libraryID = ?
+            AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+            ORDER BY t.name
+            """
+        params: list[Any] = [library_id]
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [row[0] for row in self._get_connection().execute(sql, params)]
+
+    def get_annotations(
+        self,
+        item_key: str | None = None,
+        *,
+        colors: list[str] | None = None,
+        tags: list[str] | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        collection_key: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        library_id: int = 1,
+    ) -> list[dict[str, Any]]:
+        """
+        Get annotations with their attachment and parent item in one query.
+
+        Args:
+            item_key: Only annotations on this item or attachment
+            colors: Hex colors to keep (case-insensitive)
+            tags: API tag conditions on the annotation itself
+            since: Keep annotations added on or after this date (YYYY-MM-DD)
+            until: Keep annotations added on or before this date (YYYY-MM-DD)
+            collection_key: Only annotations whose parent item is in this collection
+            limit: Maximum number of annotations to return
+            offset: Number of matching annotations to skip
+
+        Returns:
+            API-shaped annotation payloads. Reading order (attachment, then
+            sortIndex) for a single item, otherwise newest first. Each payload's
+            data also carries `_attachment_title`, `_parent_key`, `_parent_title`,
+            `_pdf_page` and `_pageLabel` for display.
+        """
+        title_fields = ",".join("?" for _ in _TITLE_FIELDS)
+        title_sql = f"""(SELECT v.value FROM itemData d
+                    JOIN fields f ON f.fieldID = d.fieldID
+                    JOIN itemDataValues v ON v.valueID = d.valueID
+                    WHERE d.itemID = {{item}} AND f.fieldName IN ({title_fields})
+                    LIMIT 1)"""
+        sql = f"""
+            SELECT i.key, i.version, i.dateAdded, i.dateModified,
+                   ia.type, ia.text, ia.comment, ia.color, ia.pageLabel,
+                   ia.sortIndex, ia.position,
+                   att.key as attachmentKey,
+                   {title_sql.format(item="att.itemID")} as attachmentTitle,
+                   p.key as parentKey,
+                   {title_sql.format(item="p.itemID")} as parentTitle,
+                   (SELECT json_group_array(json_object('tag', tg.name, 'type', itg.type))
+                    FROM itemTags itg JOIN tags tg ON tg.tagID = itg.tagID
+                    WHERE itg.itemID = i.itemID) as tagsJson
+            FROM itemAnnotations ia
+            JOIN items i ON i.itemID = ia.itemID
+            JOIN items att ON att.itemID = ia.parentItemID
+            LEFT JOIN itemAttachments a ON a.itemID = att.itemID
+            LEFT JOIN items p ON p.itemID = a.parentItemID
+            WHERE i.libraryID = ?
+            AND i.itemID NOT IN (SELECT itemID FROM deletedItems)
+            AND att.itemID NOT IN (SELECT itemID FROM deletedItems)
+            AND (p.itemID IS NULL OR p.itemID NOT IN (SELECT itemID FROM deletedItems))
+            """
+        params: list[Any] = [*_TITLE_FIELDS, *_TITLE_FIELDS, library_id]
+        if item_key:
+            sql += " AND (p.key = ? OR att.key = ?)"
+            params.extend([item_key, item_key])
+        if colors:
+            sql += f" AND lower(ia.color) IN ({','.join('?' for _ in colors)})"
+            params.extend(c.lower() for c in colors)
+        if since:
+            sql += " AND date(i.dateAdded) >= date(?)"
+            params.append(since)
+        if until:
+            sql += " AND date(i.dateAdded) <= date(?)"
+            params.append(until)
+        if collection_key:
+            sql += """ AND EXISTS (SELECT 1 FROM collectionItems ci
+                       JOIN collections c ON c.collectionID = ci.collectionID
+                       WHERE ci.itemID = COALESCE(p.itemID, att.itemID)
+                       AND c.key = ? AND c.libraryID = i.libraryID)"""
+            params.append(collection_key)
+        tag_sql, tag_params = self._tag_clause(tags)
+        sql += tag_sql
+        params.extend(tag_params)
+        if item_key:
+            sql += " ORDER BY att.itemID, ia.sortIndex, i.itemID"
+        else:
+            sql += " ORDER BY i.dateAdded DESC, i.itemID DESC"
+        if limit or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([int(limit) if limit else -1, int(offset or 0)])
+
+        annotations = []
+        for row in self._get_connection().execute(sql, params):
+            data: dict[str, Any] = {
+                "key": row["key"],
+                "version": row["version"] or 0,
+                "itemType": "annotation",
+                "parentItem": row["attachmentKey"],
+                "annotationType": _ANNOTATION_TYPES.get(row["type"], "highlight"),
+                "annotationText": row["text"] or "",
+                "annotationComment": row["comment"] or "",
+                "annotationColor": row["color"] or "",
+                "annotationPageLabel": row["pageLabel"] or "",
+                "annotationSortIndex": row["sortIndex"] or "",
+                "annotationPosition": row["position"] or "",
+                "dateAdded": row["dateAdded"],
+                "dateModified": row["dateModified"],
+                "tags": [
+                    {"tag": t["tag"], **({"type": t["type"]} if t["type"] else {})}
+                    for t in json.loads(row["tagsJson"] or "[]")
+                ],
+                "_attachment_title": row["attachmentTitle"] or "",
+                "_parent_key": row["parentKey"] or row["attachmentKey"],
+                "_parent_title": row["parentTitle"] or row["attachmentTitle"] or "Untitled",
+            }
+            try:
+                page_index = json.loads(row["position"] or "{}").get("pageIndex")
+            except (ValueError, AttributeError):
+                page_index = None
+            if page_index is not None:
+                data["_pdf_page"] = int(page_index) + 1
+                data["_pageLabel"] = row["pageLabel"] or str(int(page_index) + 1)
+            annotations.append({"key": row["key"], "version": row["version"] or 0, "data": data})
+        return annotations
+
     def get_item_count(self) -> int:
         """
         Get total count of non-attachment items.
@@ -383,12 +1195,36 @@ class LocalZoteroReader:
         """
         Get all items with their text content for semantic search.
 
+        Materializes iter_items(); prefer the iterator for library-wide scans.
+
         Args:
             limit: Optional limit on number of items to return.
 
         Returns:
             List of ZoteroItem objects with text content.
         """
+        return list(self.iter_items(limit=limit, include_fulltext=include_fulltext))
+
+    def iter_items(
+        self,
+        limit: int | None = None,
+        include_fulltext: bool = False,
+        batch_size: int = 500,
+    ) -> Iterator[ZoteroItem]:
+        """
+        Stream items with their text content for semantic search.
+
+        Rows are pulled with cursor.fetchmany(batch_size) so only one batch of
+        items (and, with include_fulltext, its attachments) is held at a time.
+
+        Args:
+            limit: Optional limit on number of items to yield.
+            include_fulltext: Whether to extract fulltext for each item.
+            batch_size: Number of rows fetched from SQLite per round trip.
+
+        Yields:
+            ZoteroItem objects, most recently modified first.
+        """
         conn = self._get_connection()
 
         # Query to get items with their text content (simplified for now)
@@ -453,36 +1289,49 @@ class LocalZoteroReader:
             query += f" LIMIT {limit}"
 
         cursor = conn.execute(query)
-        items = []
-
-        for row in cursor:
-            item = ZoteroItem(
-                item_id=row['itemID'],
-                key=row['key'],
-                item_type_id=row['itemTypeID'],
-                item_type=row['item_type'],
-                doi=row['doi'],
-                title=row['title'],
-                abstract=row['abstract'],
-                creators=row['creators'],
-                fulltext=(res := (self._extract_fulltext_for_item(row['itemID']) if include_fulltext else None)) and res[0],
-                fulltext_source=res[1] if include_fulltext and res else None,
-                notes=row['notes'],
-                extra=row['extra'],
-                date_added=row['dateAdded'],
-                date_modified=row['dateModified']
+        batch_size = max(1, batch_size)
+
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            attachments_by_parent = (
+                self.get_attachments_for_parents([row['itemID'] for row in rows])
+                if include_fulltext
+                else {}
             )
-            items.append(item)
-
-        return items
+            for row in rows:
+                res = (
+                    self._extract_fulltext_for_item(row['itemID'], attachments_by_parent.get(row['itemID'], []))
+                    if include_fulltext
+                    else None
+                )
+                yield ZoteroItem(
+                    item_id=row['itemID'],
+                    key=row['key'],
+                    item_type_id=row['itemTypeID'],
+                    item_type=row['item_type'],
+                    doi=row['doi'],
+                    title=row['title'],
+                    abstract=row['abstract'],
+                    creators=row['creators'],
+                    fulltext=res[0] if res else None,
+                    fulltext_source=res[1] if res else None,
+                    notes=row['notes'],
+                    extra=row['extra'],
+                    date_added=row['dateAdded'],
+                    date_modified=row['dateModified']
+                )
 
     # Public helper to quickly check full text metadata for item
     def get_fulltext_meta_for_item(self, item_id: int) -> tuple[str, str] | None:
         return self._get_fulltext_meta_for_item(item_id)
 
     # Public helper to extract fulltext on demand for a specific item
-    def extract_fulltext_for_item(self, item_id: int) -> tuple[str, str] | None:
-        return self._extract_fulltext_for_item(item_id)
+    def extract_fulltext_for_item(
+        self, item_id: int, attachments: list[AttachmentRecord] | None = None
+    ) -> tuple[str, str] | None:
+        return self._extract_fulltext_for_item(item_id, attachments)
 
     def get_item_by_key(self, key: str) -> ZoteroItem | None:
         """
@@ -494,8 +1343,7 @@ class LocalZoteroReader:
         Returns:
             ZoteroItem if found, None otherwise.
         """
-        items = self.get_items_with_text()
-        for item in items:
+        for item in self.iter_items():
             if item.key == key:
                 return item
         return None
@@ -511,12 +1359,11 @@ class LocalZoteroReader:
         Returns:
             List of matching ZoteroItem objects.
         """
-        items = self.get_items_with_text()
         matching_items = []
 
         query_lower = query.lower()
 
-        for item in items:
+        for item in self.iter_items():
             searchable_text = item.get_searchable_text().lower()
             if query_lower in searchable_text:
                 matching_items.append(item)
@@ -11,8 +11,9 @@ import os
 import sys
 from contextlib import contextmanager
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple
 import logging
 
 from pyzotero import zotero
@@ -20,11 +21,18 @@ from pyzotero import zotero
 from .chroma_client import ChromaClient, create_chroma_client
 from .client import get_zotero_client
 from .utils import format_creators, is_local_mode
-from .local_db import LocalZoteroReader, get_local_zotero_reader
+from .local_db import LocalZoteroReader, ZoteroItem, get_local_zotero_reader
 
 logger = logging.getLogger(__name__)
 
 
+def _batched(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield successive lists of up to `size` items from any iterable."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
 @contextmanager
 def suppress_stdout():
     """Context manager to suppress stdout temporarily."""
@@ -56,6 +64,8 @@ class ZoteroSemanticSearch:
         self.zotero_client = get_zotero_client()
         self.config_path = config_path
         self.db_path = db_path  # CLI override for Zotero database path
+        # Documents per full-text source from the last local extraction run
+        self.last_fulltext_sources: dict[str, int] = {}
 
         # Load update configuration
         self.update_config = self._load_update_config()
@@ -198,6 +208,58 @@ class ZoteroSemanticSearch:
 
         return metadata
 
+    def _create_local_document_text(self, item: ZoteroItem) -> str:
+        """
+        Create searchable text from a local ZoteroItem.
+
+        Mirrors _create_document_text() without building an API dict first.
+
+        Args:
+            item: Local Zotero item record
+
+        Returns:
+            Combined text for embedding
+        """
+        creators_text = format_creators(self._parse_creators_string(item.creators) if item.creators else [])
+        return " ".join(filter(None, [item.title, creators_text, item.abstract]))
+
+    def _create_local_metadata(self, item: ZoteroItem) -> dict[str, Any]:
+        """
+        Create ChromaDB metadata from a local ZoteroItem.
+
+        Args:
+            item: Local Zotero item record
+
+        Returns:
+            Metadata dictionary for ChromaDB
+        """
+        metadata = {
+            "item_key": item.key,
+            "item_type": item.item_type or "journalArticle",
+            "title": item.title or "",
+            "date": "",
+            "date_added": item.date_added or "",
+            "date_modified": item.date_modified or "",
+            "creators": format_creators(self._parse_creators_string(item.creators) if item.creators else []),
+            "publication": "",
+            "url": "",
+            "doi": item.doi or "",
+            "tags": "",
+        }
+        if item.fulltext:
+            metadata["has_fulltext"] = True
+            if item.fulltext_source:
+                metadata["fulltext_source"] = item.fulltext_source
+
+        citation_key = ""
+        for line in (item.extra or "").split("\n"):
+            if line.lower().startswith(("citation key:", "citationkey:")):
+                citation_key = line.split(":", 1)[1].strip()
+                break
+        metadata["citation_key"] = citation_key
+
+        return metadata
+
     def should_update_database(self) -> bool:
         """Check if the database should be updated based on configuration."""
         if not self.update_config.get("auto_update", False):
@@ -230,7 +292,7 @@ class ZoteroSemanticSearch:
 
         return False
 
-    def _get_items_from_source(self, limit: int | None = None, extract_fulltext: bool = False, chroma_client: ChromaClient | None = None, force_rebuild: bool = False) -> list[dict[str, Any]]:
+    def _get_items_from_source(self, limit: int | None = None, extract_fulltext: bool = False, chroma_client: ChromaClient | None = None, force_rebuild: bool = False, pdf_engine: str | None = None, pdf_max_pages: int | None = None) -> list[dict[str, Any]]:
         """
         Get items from either local database or API.
 
@@ -242,6 +304,8 @@ class ZoteroSemanticSearch:
             extract_fulltext: Whether to extract fulltext content
             chroma_client: ChromaDB client to check for existing documents (None to skip checks)
             force_rebuild: Whether to force extraction even if item exists
+            pdf_engine: Per-run PDF extraction engine override (see local_db.PDF_ENGINES)
+            pdf_max_pages: Per-run PDF page cap override
 
         Returns:
             List of items in API-compatible format
@@ -251,210 +315,256 @@ class ZoteroSemanticSearch:
                 limit,
                 extract_fulltext=extract_fulltext,
                 chroma_client=chroma_client,
-                force_rebuild=force_rebuild
+                force_rebuild=force_rebuild,
+                pdf_engine=pdf_engine,
+                pdf_max_pages=pdf_max_pages,
             )
         else:
             return self._get_items_from_api(limit)
 
-    def _get_items_from_local_db(self, limit: int | None = None, extract_fulltext: bool = False, chroma_client: ChromaClient | None = None, force_rebuild: bool = False) -> list[dict[str, Any]]:
+    def _get_items_from_local_db(self, limit: int | None = None, extract_fulltext: bool = False, chroma_client: ChromaClient | None = None, force_rebuild: bool = False, pdf_engine: str | None = None, pdf_max_pages: int | None = None) -> list[dict[str, Any]]:
         """
         Get items from local Zotero database.
 
+        Materializes _iter_items_from_local_db() as API-compatible dicts. The
+        indexing path in update_database() consumes the stream directly instead.
+
         Args:
             limit: Optional limit on number of items
             extract_fulltext: Whether to extract fulltext content
             chroma_client: ChromaDB client to check for existing documents (None to skip checks)
             force_rebuild: Whether to force extraction even if item exists
+            pdf_engine: Per-run PDF extraction engine (overrides config)
+            pdf_max_pages: Per-run PDF page cap (overrides config)
 
         Returns:
             List of items in API-compatible format
         """
+        api_items = []
+        for item in self._iter_items_from_local_db(
+            limit,
+            extract_fulltext=extract_fulltext,
+            chroma_client=chroma_client,
+            force_rebuild=force_rebuild,
+            pdf_engine=pdf_engine,
+            pdf_max_pages=pdf_max_pages,
+        ):
+            api_items.append(self._local_item_to_api_item(item, extract_fulltext) if isinstance(item, ZoteroItem) else item)
+        logger.info(f"Retrieved {len(api_items)} items from local database")
+        return api_items
+
+    def _local_item_to_api_item(self, item: ZoteroItem, extract_fulltext: bool = False) -> dict[str, Any]:
+        """Convert a local ZoteroItem into the API-compatible item structure."""
+        api_item = {
+            "key": item.key,
+            "version": 0,  # Local items don't have versions
+            "data": {
+                "key": item.key,
+                "itemType": item.item_type or "journalArticle",
+                "title": item.title or "",
+                "abstractNote": item.abstract or "",
+                "extra": item.extra or "",
+                # Include fulltext only when extracted
+                "fulltext": item.fulltext or "" if extract_fulltext else "",
+                "fulltextSource": item.fulltext_source or "" if extract_fulltext else "",
+                "dateAdded": item.date_added,
+                "dateModified": item.date_modified,
+                "creators": self._parse_creators_string(item.creators) if item.creators else []
+            }
+        }
+
+        # Add notes if available
+        if item.notes:
+            api_item["data"]["notes"] = item.notes
+
+        return api_item
+
+    def _load_local_extraction_config(self, pdf_engine: str | None, pdf_max_pages: int | None) -> tuple[str | None, str | None, int | None]:
+        """Resolve (zotero_db_path, pdf_engine, pdf_max_pages) from CLI overrides and config."""
+        zotero_db_path = self.db_path  # CLI override takes precedence
+        # If semantic_search config file exists, use its settings unless overridden per run
+        try:
+            if self.config_path and os.path.exists(self.config_path):
+                with open(self.config_path) as _f:
+                    _cfg = json.load(_f)
+                    semantic_cfg = _cfg.get('semantic_search', {})
+                    extraction_cfg = semantic_cfg.get('extraction', {})
+                    if pdf_max_pages is None:
+                        pdf_max_pages = extraction_cfg.get('pdf_max_pages')
+                    if pdf_engine is None:
+                        pdf_engine = extraction_cfg.get('pdf_engine')
+                    # Use config db_path only if no CLI override
+                    if not zotero_db_path:
+                        zotero_db_path = semantic_cfg.get('zotero_db_path')
+        except Exception:
+            pass
+        return zotero_db_path, pdf_engine, pdf_max_pages
+
+    @staticmethod
+    def _shadowed_preprint_keys(reader: LocalZoteroReader, limit: int | None) -> tuple[set[str], int]:
+        """
+        Find preprints that share a DOI or title with a journal article.
+
+        Streams the library once, keeping only (key, type) per DOI/title, and
+        returns the keys to drop together with the number of candidates seen.
+        """
+        def norm(s: str | None) -> str | None:
+            if not s:
+                return None
+            return "".join(s.lower().split())
+
+        prefer_types = {"journalArticle": 2, "preprint": 1}
+        # (kind, normalized value) -> (key, item_type) of the preferred item
+        key_to_best: dict[tuple[str, str], tuple[str, str | None]] = {}
+        preprints: list[tuple[str, tuple[str, str] | None, tuple[str, str] | None]] = []
+        candidate_count = 0
+
+        for it in reader.iter_items(limit=limit):
+            candidate_count += 1
+            doi_key = ("doi", norm(it.doi)) if it.doi else None
+            title_key = ("title", norm(it.title)) if it.title else None
+            for k in (doi_key, title_key):
+                if not k:
+                    continue
+                cur = key_to_best.get(k)
+                # Prefer journalArticle over preprint; otherwise keep first
+                if cur is None or prefer_types.get(it.item_type or "", 0) > prefer_types.get(cur[1] or "", 0):
+                    key_to_best[k] = (it.key, it.item_type)
+            if it.item_type == "preprint":
+                preprints.append((it.key, doi_key, title_key))
+
+        # If a preprint loses against a journal article for same DOI/title, drop it
+        dropped: set[str] = set()
+        for key, doi_key, title_key in preprints:
+            for k in (doi_key, title_key):
+                if not k:
+                    continue
+                best = key_to_best.get(k)
+                if best is not None and best[0] != key and best[1] == "journalArticle":
+                    dropped.add(key)
+                    break
+        return dropped, candidate_count
+
+    def _iter_items_from_local_db(self, limit: int | None = None, extract_fulltext: bool = False, chroma_client: ChromaClient | None = None, force_rebuild: bool = False, pdf_engine: str | None = None, pdf_max_pages: int | None = None) -> Iterator[ZoteroItem | dict[str, Any]]:
+        """
+        Stream items from the local Zotero database for indexing.
+
+        Yields ZoteroItem records with fulltext extracted on demand. If the
+        local database cannot be opened, falls back to yielding API items.
+
+        Args:
+            limit: Optional limit on number of items
+            extract_fulltext: Whether to extract fulltext content
+            chroma_client: ChromaDB client to check for existing documents (None to skip checks)
+            force_rebuild: Whether to force extraction even if item exists
+            pdf_engine: Per-run PDF extraction engine (overrides config)
+            pdf_max_pages: Per-run PDF page cap (overrides config)
+        """
         logger.info("Fetching items from local Zotero database...")
+        zotero_db_path, pdf_engine, pdf_max_pages = self._load_local_extraction_config(pdf_engine, pdf_max_pages)
 
         try:
-            # Load per-run config, including extraction limits and db path if provided
-            pdf_max_pages = None
-            zotero_db_path = self.db_path  # CLI override takes precedence
-            # If semantic_search config file exists, prefer its setting
+            reader = LocalZoteroReader(db_path=zotero_db_path, pdf_max_pages=pdf_max_pages, pdf_engine=pdf_engine)
+            # Phase 1: stream metadata once to build the preprint dedup index (fast)
+            sys.stderr.write("Scanning local Zotero database for items...\n")
+            dropped, candidate_count = self._shadowed_preprint_keys(reader, limit)
+        except Exception as e:
+            logger.error(f"Error reading from local database: {e}")
+            logger.info("Falling back to API...")
+            yield from self._get_items_from_api(limit)
+            return
+
+        with reader:
+            sys.stderr.write(f"Found {candidate_count} candidate items.\n")
+            total_to_extract = candidate_count - len(dropped)
+            self._local_scan_total = total_to_extract
             try:
-                if self.config_path and os.path.exists(self.config_path):
-                    with open(self.config_path) as _f:
-                        _cfg = json.load(_f)
-                        semantic_cfg = _cfg.get('semantic_search', {})
-                        pdf_max_pages = semantic_cfg.get('extraction', {}).get('pdf_max_pages')
-                        # Use config db_path only if no CLI override
-                        if not zotero_db_path:
-                            zotero_db_path = semantic_cfg.get('zotero_db_path')
+                if total_to_extract != candidate_count:
+                    sys.stderr.write(f"After filtering/dedup: {total_to_extract} items to process. Extracting content...\n")
+                else:
+                    sys.stderr.write("Extracting content...\n")
             except Exception:
                 pass
 
-            with suppress_stdout(), LocalZoteroReader(db_path=zotero_db_path, pdf_max_pages=pdf_max_pages) as reader:
-                # Phase 1: fetch metadata only (fast)
-                sys.stderr.write("Scanning local Zotero database for items...\n")
-                local_items = reader.get_items_with_text(limit=limit, include_fulltext=False)
-                candidate_count = len(local_items)
-                sys.stderr.write(f"Found {candidate_count} candidate items.\n")
-
-                # Optional deduplication: if preprint and journalArticle share a DOI/title, keep journalArticle
-                # Build index by (normalized DOI or normalized title)
-                def norm(s: str | None) -> str | None:
-                    if not s:
-                        return None
-                    return "".join(s.lower().split())
-
-                key_to_best = {}
-                for it in local_items:
-                    doi_key = ("doi", norm(getattr(it, "doi", None))) if getattr(it, "doi", None) else None
-                    title_key = ("title", norm(getattr(it, "title", None))) if getattr(it, "title", None) else None
-
-                    def consider(k):
-                        if not k:
-                            return
-                        cur = key_to_best.get(k)
-                        # Prefer journalArticle over preprint; otherwise keep first
-                        if cur is None:
-                            key_to_best[k] = it
+            # Phase 2: stream again, selectively extracting fulltext only when requested
+            extracted = 0
+            skipped_existing = 0
+            updated_existing = 0
+            batch_size = 50
+            pending: list[ZoteroItem] = []
+
+            def drain(batch: list[ZoteroItem]) -> Iterator[ZoteroItem]:
+                nonlocal extracted, skipped_existing, updated_existing
+                existing_ids: set[str] = set()
+                if extract_fulltext and chroma_client and not force_rebuild:
+                    existing_ids = chroma_client.get_existing_ids([it.key for it in batch])
+                # One grouped query for the batch's attachments
+                attachments_by_parent = (
+                    reader.get_attachments_for_parents([it.item_id for it in batch])
+                    if extract_fulltext
+                    else {}
+                )
+                for it in batch:
+                    if not extract_fulltext:
+                        # Skip fulltext extraction for faster processing
+                        it.fulltext = None
+                        it.fulltext_source = None
+                        yield it
+                        continue
+
+                    attachments = attachments_by_parent.get(it.item_id, [])
+                    # CHECK IF ITEM ALREADY EXISTS (unless force_rebuild or no client)
+                    existing_metadata = chroma_client.get_document_metadata(it.key) if it.key in existing_ids else None
+                    if existing_metadata:
+                        chroma_has_fulltext = existing_metadata.get("has_fulltext", False)
+                        local_has_fulltext = len(attachments) > 0
+
+                        # Skip only if chroma does not have the fulltext embedding but local does (e.g. the users updated it)
+                        if not chroma_has_fulltext and local_has_fulltext:
+                            # Document exists but lacks fulltext - we need to update it
+                            updated_existing += 1
                         else:
-                            prefer_types = {"journalArticle": 2, "preprint": 1}
-                            cur_score = prefer_types.get(getattr(cur, "item_type", ""), 0)
-                            new_score = prefer_types.get(getattr(it, "item_type", ""), 0)
-                            if new_score > cur_score:
-                                key_to_best[k] = it
-
-                    consider(doi_key)
-                    consider(title_key)
-
-                # If a preprint loses against a journal article for same DOI/title, drop it
-                filtered_items = []
-                for it in local_items:
-                    # If there is a journalArticle alternative for same DOI or title, and this is preprint, drop
-                    if getattr(it, "item_type", None) == "preprint":
-                        k_doi = ("doi", norm(getattr(it, "doi", None))) if getattr(it, "doi", None) else None
-                        k_title = ("title", norm(getattr(it, "title", None))) if getattr(it, "title", None) else None
-                        drop = False
-                        for k in (k_doi, k_title):
-                            if not k:
-                                continue
-                            best = key_to_best.get(k)
-                            if best is not None and best is not it and getattr(best, "item_type", None) == "journalArticle":
-                                drop = True
-                                break
-                        if drop:
+                            skipped_existing += 1
                             continue
-                    filtered_items.append(it)
 
-                local_items = filtered_items
-                total_to_extract = len(local_items)
-                if total_to_extract != candidate_count:
-                    try:
-                        sys.stderr.write(f"After filtering/dedup: {total_to_extract} items to process. Extracting content...\n")
-                    except Exception:
-                        pass
-                else:
-                    try:
-                        sys.stderr.write("Extracting content...\n")
-                    except Exception:
-                        pass
-
-                # Phase 2: selectively extract fulltext only when requested
-                if extract_fulltext:
-                    extracted = 0
-                    skipped_existing = 0
-                    updated_existing = 0
-                    items_to_process = []
-
-                    for it in local_items:
-                        should_extract = True
-
-                        # CHECK IF ITEM ALREADY EXISTS (unless force_rebuild or no client)
-                        if chroma_client and not force_rebuild:
-                            existing_metadata = chroma_client.get_document_metadata(it.key)
-                            if existing_metadata:
-                                chroma_has_fulltext = existing_metadata.get("has_fulltext", False)
-                                local_has_fulltext = len(reader.get_fulltext_meta_for_item(it.item_id)) > 0
-
-                                # Skip only if chroma does not have the fulltext embedding but local does (e.g. the users updated it)
-                                if not chroma_has_fulltext and local_has_fulltext:
-                                    # Document exists but lacks fulltext - we need to update it
-                                    updated_existing += 1
-                                else:
-                                    should_extract = False
-                                    skipped_existing += 1
-
-                        if should_extract:
-                            # Extract fulltext if item doesn't have it yet
-                            if not getattr(it, "fulltext", None):
-                                text = reader.extract_fulltext_for_item(it.item_id)
-                                if text:
-                                    # Support new (text, source) return format
-                                    if isinstance(text, tuple) and len(text) == 2:
-                                        it.fulltext, it.fulltext_source = text[0], text[1]
-                                    else:
-                                        it.fulltext = text
-                            extracted += 1
-                            items_to_process.append(it)
-
-                            if extracted % 25 == 0 and total_to_extract:
-                                try:
-                                    sys.stderr.write(f"Extracted content for {extracted}/{total_to_extract} items (skipped {skipped_existing} existing, updating {updated_existing})...\n")
-                                except Exception:
-                                    pass
-
-                    # Replace local_items with filtered list
-                    local_items = items_to_process
-
-                    # Report final stats
-                    if skipped_existing > 0 or updated_existing > 0:
+                    # Extract fulltext if item doesn't have it yet
+                    if not it.fulltext:
+                        with suppress_stdout():
+                            text = reader.extract_fulltext_for_item(it.item_id, attachments)
+                        if text:
+                            it.fulltext, it.fulltext_source = text[0], text[1]
+                    extracted += 1
+                    if extracted % 25 == 0 and total_to_extract:
                         try:
-                            msg_parts = []
-                            if skipped_existing > 0:
-                                msg_parts.append(f"Skipped {skipped_existing} items with up to date embeddings")
-                            if updated_existing > 0:
-                                msg_parts.append(f"Updated {updated_existing} items with new fulltext")
-                            sys.stderr.write(", ".join(msg_parts) + "\n")
+                            sys.stderr.write(f"Extracted content for {extracted}/{total_to_extract} items (skipped {skipped_existing} existing, updating {updated_existing})...\n")
                         except Exception:
                             pass
-                else:
-                    # Skip fulltext extraction for faster processing
-                    for it in local_items:
-                        it.fulltext = None
-                        it.fulltext_source = None
-
-                # Convert to API-compatible format
-                api_items = []
-                for item in local_items:
-                    # Create API-compatible item structure
-                    api_item = {
-                        "key": item.key,
-                        "version": 0,  # Local items don't have versions
-                        "data": {
-                            "key": item.key,
-                            "itemType": getattr(item, 'item_type', None) or "journalArticle",
-                            "title": item.title or "",
-                            "abstractNote": item.abstract or "",
-                            "extra": item.extra or "",
-                            # Include fulltext only when extracted
-                            "fulltext": getattr(item, 'fulltext', None) or "" if extract_fulltext else "",
-                            "fulltextSource": getattr(item, 'fulltext_source', None) or "" if extract_fulltext else "",
-                            "dateAdded": item.date_added,
-                            "dateModified": item.date_modified,
-                            "creators": self._parse_creators_string(item.creators) if item.creators else []
-                        }
-                    }
-
-                    # Add notes if available
-                    if item.notes:
-                        api_item["data"]["notes"] = item.notes
-
-                    api_items.append(api_item)
-
-                logger.info(f"Retrieved {len(api_items)} items from local database")
-                return api_items
+                    yield it
 
-        except Exception as e:
-            logger.error(f"Error reading from local database: {e}")
-            logger.info("Falling back to API...")
-            return self._get_items_from_api(limit)
+            for it in reader.iter_items(limit=limit):
+                if it.key in dropped:
+                    continue
+                pending.append(it)
+                if len(pending) >= batch_size:
+                    yield from drain(pending)
+                    pending = []
+            if pending:
+                yield from drain(pending)
+
+            if extract_fulltext:
+                self.last_fulltext_sources = dict(reader.extraction_stats)
+
+            # Report final stats
+            if skipped_existing > 0 or updated_existing > 0:
+                try:
+                    msg_parts = []
+                    if skipped_existing > 0:
+                        msg_parts.append(f"Skipped {skipped_existing} items with up to date embeddings")
+                    if updated_existing > 0:
+                        msg_parts.append(f"Updated {updated_existing} items with new fulltext")
+                    sys.stderr.write(", ".join(msg_parts) + "\n")
+                except Exception:
+                    pass
 
     def _parse_creators_string(self, creators_str: str) -> list[dict[str, str]]:
         """
@@ -549,7 +659,9 @@ class ZoteroSemanticSearch:
     def update_database(self,
                        force_full_rebuild: bool = False,
                        limit: int | None = None,
-                       extract_fulltext: bool = False) -> dict[str, Any]:
+                       extract_fulltext: bool = False,
+                       pdf_engine: str | None = None,
+                       pdf_max_pages: int | None = None) -> dict[str, Any]:
         """
         Update the semantic search database with Zotero items.
 
@@ -557,6 +669,8 @@ class ZoteroSemanticSearch:
             force_full_rebuild: Whether to rebuild the entire database
             limit: Limit number of items to process (for testing)
             extract_fulltext: Whether to extract fulltext content from local database
+            pdf_engine: PDF extraction engine for this run ("auto", "pymupdf", "pdfminer")
+            pdf_max_pages: PDF page cap for this run
 
         Returns:
             Update statistics
@@ -581,30 +695,50 @@ class ZoteroSemanticSearch:
                 logger.info("Force rebuilding database...")
                 self.chroma_client.reset_collection()
 
-            # Get all items from either local DB or API
-            all_items = self._get_items_from_source(
-                limit=limit,
-                extract_fulltext=extract_fulltext,
-                chroma_client=self.chroma_client if not force_full_rebuild else None,
-                force_rebuild=force_full_rebuild
-            )
-
-            stats["total_items"] = len(all_items)
-            logger.info(f"Found {stats['total_items']} items to process")
-            # Immediate progress line so users see counts up-front
-            try:
-                sys.stderr.write(f"Total items to index: {stats['total_items']}\n")
-            except Exception:
-                pass
+            # Get all items from either local DB or API. The local path is
+            # streamed straight into ChromaDB batches as ZoteroItem records.
+            self.last_fulltext_sources = {}
+            self._local_scan_total = None
+            if extract_fulltext and is_local_mode():
+                item_stream = self._iter_items_from_local_db(
+                    limit,
+                    extract_fulltext=extract_fulltext,
+                    chroma_client=self.chroma_client if not force_full_rebuild else None,
+                    force_rebuild=force_full_rebuild,
+                    pdf_engine=pdf_engine,
+                    pdf_max_pages=pdf_max_pages,
+                )
+                expected_total = None
+            else:
+                all_items = self._get_items_from_source(
+                    limit=limit,
+                    extract_fulltext=extract_fulltext,
+                    chroma_client=self.chroma_client if not force_full_rebuild else None,
+                    force_rebuild=force_full_rebuild
+                )
+                item_stream = iter(all_items)
+                expected_total = len(all_items)
+
+            def announce_total() -> None:
+                # Known for API lists; for the local stream, the dedup scan's count
+                stats["total_items"] = expected_total if expected_total is not None else (self._local_scan_total or 0)
+                logger.info(f"Found {stats['total_items']} items to process")
+                # Immediate progress line so users see counts up-front
+                try:
+                    sys.stderr.write(f"Total items to index: {stats['total_items']}\n")
+                except Exception:
+                    pass
 
             # Process items in batches
             batch_size = 50
             # Track next milestone for progress printing (every 10 items)
-            next_milestone = 10 if stats["total_items"] >= 10 else stats["total_items"]
+            next_milestone = 10
             # Count of items seen (including skipped), used for progress milestones
             seen_items = 0
-            for i in range(0, len(all_items), batch_size):
-                batch = all_items[i:i + batch_size]
+            for batch in _batched(item_stream, batch_size):
+                if not seen_items:
+                    announce_total()
+                    next_milestone = 10 if stats["total_items"] >= 10 else stats["total_items"]
                 batch_stats = self._process_item_batch(batch, force_full_rebuild)
 
                 stats["processed_items"] += batch_stats["processed"]
@@ -626,6 +760,14 @@ class ZoteroSemanticSearch:
                 except Exception:
                     pass
 
+            if not seen_items:
+                announce_total()
+            # Items skipped before indexing (e.g. up-to-date embeddings) are not counted
+            stats["total_items"] = seen_items
+
+            if extract_fulltext:
+                stats["fulltext_sources"] = dict(self.last_fulltext_sources)
+
             # Update last update time
             self.update_config["last_update"] = datetime.now().isoformat()
             self._save_update_config()
@@ -644,8 +786,8 @@ class ZoteroSemanticSearch:
             stats["duration"] = str(end_time - start_time)
             return stats
 
-    def _process_item_batch(self, items: list[dict[str, Any]], force_rebuild: bool = False) -> dict[str, int]:
-        """Process a batch of items."""
+    def _process_item_batch(self, items: list[dict[str, Any] | ZoteroItem], force_rebuild: bool = False) -> dict[str, int]:
+        """Process a batch of API item dicts or local ZoteroItem records."""
         stats = {"processed": 0, "added": 0, "updated": 0, "skipped": 0, "errors": 0}
 
         documents = []
@@ -654,16 +796,24 @@ class ZoteroSemanticSearch:
 
         for item in items:
             try:
-                item_key = item.get("key", "")
+                if isinstance(item, ZoteroItem):
+                    item_key = item.key
+                    fulltext = item.fulltext or ""
+                else:
+                    item_key = item.get("key", "")
+                    fulltext = item.get("data", {}).get("fulltext", "")
                 if not item_key:
                     stats["skipped"] += 1
                     continue
 
                 # Create document text and metadata
                 # Prefer fulltext if available, else fall back to structured fields
-                fulltext = item.get("data", {}).get("fulltext", "")
-                doc_text = fulltext if fulltext.strip() else self._create_document_text(item)
-                metadata = self._create_metadata(item)
+                if isinstance(item, ZoteroItem):
+                    doc_text = fulltext if fulltext.strip() else self._create_local_document_text(item)
+                    metadata = self._create_local_metadata(item)
+                else:
+                    doc_text = fulltext if fulltext.strip() else self._create_document_text(item)
+                    metadata = self._create_metadata(item)
 
                 if not doc_text.strip():
                     stats["skipped"] += 1
@@ -676,7 +826,7 @@ class ZoteroSemanticSearch:
                 stats["processed"] += 1
 
             except Exception as e:
-                logger.error(f"Error processing item {item.get('key', 'unknown')}: {e}")
+                logger.error(f"Error processing item {getattr(item, 'key', None) or item.get('key', 'unknown')}: {e}")
                 stats["errors"] += 1
 
         # Add documents to ChromaDB if any
@@ -6,30 +6,40 @@ are defined and used and piped through to the main server tools. See bottom of f
 """
 
 import asyncio
-from contextlib import asynccontextmanager, suppress
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import asynccontextmanager, contextmanager, suppress
+import contextvars
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
+import functools
 from html import unescape
+import inspect
 import json
 import os
 from pathlib import Path
 import re
 import shutil
+import socket
 import sqlite3
 import subprocess
 import sys
 import tempfile
 import textwrap
+import threading
 import time
-from typing import Any, Literal
+from typing import Any, Iterator, Literal
 from urllib.parse import unquote, urljoin, urlparse
 import uuid
+import weakref
 import xml.etree.ElementTree as ET
 
 from fastmcp import Context, FastMCP
 
 from zotero_mcp.client import (
+    CONVERSION_ERROR_PREFIX,
     clear_active_library,
+    convert_pdf_pages_to_markdown,
     convert_to_markdown,
     format_item_metadata,
     generate_bibtex,
@@ -38,12 +48,17 @@ from zotero_mcp.client import (
     get_local_zotero_client,
     get_web_zotero_client,
     get_zotero_client,
+    invalidate_zotero_client_health,
     set_active_library,
 )
 import httpx
 import requests
+import urllib3
+from pyzotero import zotero_errors
 
-from zotero_mcp.utils import format_creators, clean_html
+from zotero_mcp import browser_pool, fulltext_cache, http_client, import_ledger
+
+from zotero_mcp.utils import format_creators, clean_html, state_dir
 
 
 def _ctx_warning(ctx: Context, message: str) -> None:
@@ -78,8 +93,24 @@ def _file_url_to_local_path(file_url: str) -> Path | None:
     return Path(path)
 
 
-def _dump_attachment_via_local_redirect(zot, attachment_key: str, dest: Path) -> bool:
-    """Fetch attachment bytes by resolving the local API redirect to a file:// path."""
+def _stream_response_to_file(resp, dest: Path) -> bool:
+    with dest.open("wb") as handle:
+        for chunk in resp.iter_bytes():
+            handle.write(chunk)
+    if dest.stat().st_size:
+        return True
+    dest.unlink()
+    return False
+
+
+def _dump_attachment_via_file_endpoint(zot, attachment_key: str, dest: Path) -> bool:
+    """
+    Stream an attachment's `/file` endpoint to `dest` without holding it in memory.
+
+    The web API redirects to a signed download URL, which is fetched without
+    the Zotero API headers. The local API either answers inline or redirects
+    to a `file://` path, which httpx cannot follow, so it is linked or copied.
+    """
     from pyzotero._utils import build_url
 
     file_url = build_url(
@@ -87,55 +118,81 @@ def _dump_attachment_via_local_redirect(zot, attachment_key: str, dest: Path) ->
         f"/{zot.library_type}/{zot.library_id}/items/{attachment_key}/file",
     )
 
-    # Do NOT follow redirects here; Zotero local API returns 302 to file://...
-    resp = httpx.Client(headers=zot.default_headers(), follow_redirects=False).get(
-        file_url,
-    )
-    if resp.status_code == 200 and resp.content:
-        dest.write_bytes(resp.content)
-        return True
+    with httpx.Client(headers=zot.default_headers(), follow_redirects=False) as client:
+        with client.stream("GET", file_url) as resp:
+            if resp.status_code == 200:
+                return _stream_response_to_file(resp, dest)
+            location = resp.headers.get("Location") or resp.headers.get("location")
+            if not location:
+                resp.raise_for_status()
 
-    location = resp.headers.get("Location") or resp.headers.get("location")
     if not location:
         return False
     local_path = _file_url_to_local_path(location)
-    if not local_path:
+    if local_path:
+        _link_or_copy_file(local_path, dest)
+        return True
+    download_url = urljoin(file_url, location)
+    if urlparse(download_url).scheme not in {"http", "https"}:
         return False
-    dest.write_bytes(local_path.read_bytes())
-    return True
+    with httpx.Client(follow_redirects=True) as client:
+        with client.stream("GET", download_url) as resp:
+            resp.raise_for_status()
+            return _stream_response_to_file(resp, dest)
 
 
 def _dump_attachment_via_resolved_local_path(attachment_key: str, dest: Path) -> bool:
     local_path = _resolve_local_attachment_path(attachment_key)
     if local_path is None or not local_path.exists():
         return False
-    dest.write_bytes(local_path.read_bytes())
+    _link_or_copy_file(local_path, dest)
     return True
 
 
+def _link_or_copy_file(source: Path, dest: Path) -> None:
+    """Hardlink `source` at `dest`; across filesystems, fall back to the OS copy fast path."""
+    dest.unlink(missing_ok=True)
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
 def dump_attachment_to_file(zot, attachment_key: str, dest: Path, *, ctx: Context) -> None:
     """
     Dump an attachment to disk.
 
-    Local Zotero API may redirect `/file` to a `file://...` URL. httpx won't follow
-    scheme-changing redirects, so we resolve it ourselves when needed.
+    A file already in local Zotero storage is linked or copied; otherwise the
+    `/file` endpoint is streamed to `dest` in chunks.
     """
     if _dump_attachment_via_resolved_local_path(attachment_key, dest):
         return
 
-    try:
-        zot.dump(attachment_key, filename=dest.name, path=str(dest.parent))
+    ctx.info("Streaming attachment file from the Zotero API")
+    if _dump_attachment_via_file_endpoint(zot, attachment_key, dest):
         return
-    except Exception as dump_error:
-        if "unsupported protocol 'file://'" not in str(dump_error):
-            raise
+    if _dump_attachment_via_resolved_local_path(attachment_key, dest):
+        return
+    raise RuntimeError(f"Failed to download the file for attachment {attachment_key}")
+
+
+@contextmanager
+def _attachment_file(zot, attachment_key: str, *, filename: str | None, ctx: Context) -> Iterator[Path]:
+    """
+    Yield a path to an attachment's file for reading.
 
-    ctx.info("Attachment download hit file:// redirect; resolving via local file path")
-    ok = _dump_attachment_via_local_redirect(zot, attachment_key, dest)
-    if not ok and _dump_attachment_via_resolved_local_path(attachment_key, dest):
+    A file already in local Zotero storage is used in place and must not be
+    modified; anything else is dumped into a temporary directory that is
+    removed on exit.
+    """
+    local_path = _resolve_local_attachment_path(attachment_key)
+    if local_path is not None and local_path.is_file():
+        yield local_path
         return
-    if not ok:
-        raise RuntimeError("Failed to resolve file:// redirect for attachment download")
+    with tempfile.TemporaryDirectory(prefix="zotero-mcp-") as tmpdir:
+        dest = Path(tmpdir) / (filename or f"{attachment_key}.pdf")
+        dump_attachment_to_file(zot, attachment_key, dest, ctx=ctx)
+        yield dest
 
 
 @asynccontextmanager
@@ -180,6 +237,7 @@ async def server_lifespan(server: FastMCP):
         with suppress(asyncio.CancelledError):
             await background_task
 
+    browser_pool.shutdown_browser_pool()
     sys.stderr.write("Shutting down Zotero MCP server...\n")
 
 
@@ -196,6 +254,65 @@ mcp = FastMCP(
 )
 
 
+# Tool bodies are blocking (requests, urllib, sqlite, polling sleeps,
+# Playwright). Each tool is registered as an async wrapper that runs the body
+# on the executor of its lane, so imports, PDF work and other writes ("work")
+# cannot starve quick library reads ("read") of worker threads.
+_TOOL_LANE_WORKERS = {"read": 16, "work": 8}
+_tool_lanes: dict[str, ThreadPoolExecutor] = {}
+_tool_lanes_lock = threading.Lock()
+_tool_semaphores: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+] = weakref.WeakKeyDictionary()
+
+
+def _tool_lane(lane: str) -> ThreadPoolExecutor:
+    with _tool_lanes_lock:
+        executor = _tool_lanes.get(lane)
+        if executor is None:
+            default = _TOOL_LANE_WORKERS[lane]
+            try:
+                workers = max(1, int(os.environ.get(f"ZOTERO_MCP_{lane.upper()}_WORKERS", default)))
+            except ValueError:
+                workers = default
+            executor = _tool_lanes[lane] = ThreadPoolExecutor(
+                max_workers=workers,
+                thread_name_prefix=f"zotero-{lane}",
+            )
+        return executor
+
+
+def _tool_semaphore(name: str, limit: int) -> asyncio.Semaphore:
+    semaphores = _tool_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if name not in semaphores:
+        semaphores[name] = asyncio.Semaphore(limit)
+    return semaphores[name]
+
+
+def _tool(*, name: str, lane: Literal["read", "work"], max_concurrency: int | None = None, **kwargs):
+    """
+    Register a blocking tool function with MCP, offloaded to `lane`.
+
+    `max_concurrency` caps how many calls of this tool run at once; further
+    calls wait without holding a lane thread. The undecorated function is
+    returned so it can still be called directly.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def run_in_lane(*args, **call_kwargs):
+            call = functools.partial(contextvars.copy_context().run, fn, *args, **call_kwargs)
+            loop = asyncio.get_running_loop()
+            if max_concurrency is None:
+                return await loop.run_in_executor(_tool_lane(lane), call)
+            async with _tool_semaphore(name, max_concurrency):
+                return await loop.run_in_executor(_tool_lane(lane), call)
+
+        mcp.tool(name=name, **kwargs)(run_in_lane)
+        return fn
+
+    return decorator
+
+
 def _require_unsafe(level: str) -> str | None:
     """Return an error string if UNSAFE_OPERATIONS env var doesn't permit `level`.
 
@@ -225,61 +342,45 @@ CONNECTOR_URL_FASTPATH_DISABLED_HOSTS: set[str] = set()
 
 
 def _state_dir() -> Path:
-    override = os.environ.get("ZOTERO_MCP_STATE_DIR")
-    base = Path(override).expanduser() if override else Path.home() / ".config" / "zotero-mcp" / "state"
-    base.mkdir(parents=True, exist_ok=True)
-    return base
+    return state_dir()
 
 
 def _import_ledger_path() -> Path:
-    override = os.environ.get("ZOTERO_MCP_IMPORT_LEDGER_PATH")
-    if override:
-        path = Path(override).expanduser()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        return path
-    return _state_dir() / "import-ledger.jsonl"
+    return import_ledger.ledger_paths()[0]
+
+
+# Set per worker thread by _run_import_batch so ledger entries from concurrent
+# imports are written in input order rather than completion order.
+_import_ledger_buffer = threading.local()
 
 
 def _append_import_ledger(entry: dict[str, Any], *, ctx: Context | None = None) -> None:
-    path = _import_ledger_path()
+    buffered = getattr(_import_ledger_buffer, "entries", None)
+    if buffered is not None:
+        buffered.append((entry, ctx))
+        return
     try:
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        import_ledger.get_import_ledger().append(entry)
     except Exception as exc:
         if ctx is not None:
-            _ctx_warning(ctx, f"Failed to append import ledger at {path}: {exc}")
+            _ctx_warning(ctx, f"Failed to append import ledger at {_import_ledger_path()}: {exc}")
 
 
-def _read_import_ledger(limit: int | None = None) -> list[dict[str, Any]]:
-    path = _import_ledger_path()
-    if not path.exists():
-        return []
-
-    entries: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    if limit is not None and limit >= 0:
-        return entries[-limit:]
-    return entries
+def _read_import_ledger(
+    limit: int | None = None,
+    *,
+    action: str | None = None,
+    status: str | None = None,
+) -> list[dict[str, Any]]:
+    if limit is not None and limit < 0:
+        limit = None
+    return import_ledger.get_import_ledger().recent(limit, action=action, status=status)
 
 
 def _latest_import_ledger_entry(*, item_key: str | None = None, local_item_key: str | None = None) -> dict[str, Any] | None:
     if not item_key and not local_item_key:
         return None
-
-    for entry in reversed(_read_import_ledger()):
-        if item_key and entry.get("item_key") == item_key:
-            return entry
-        if local_item_key and entry.get("local_item_key") == local_item_key:
-            return entry
-    return None
+    return import_ledger.get_import_ledger().latest(item_key=item_key, local_item_key=local_item_key)
 
 
 def _normalize_doi(raw: str | None) -> str | None:
@@ -341,6 +442,27 @@ def _normalize_arxiv_id(raw: str | None) -> str | None:
     return match.group(1)
 
 
+def _identifier_route_hints(raw_identifier: str) -> tuple[str | None, str | None]:
+    """Return (DOI, arXiv ID) hints for a mixed identifier; arXiv forms win over their DOI."""
+    arxiv_hint = _normalize_arxiv_id(raw_identifier)
+    doi_hint = None if arxiv_hint and (
+        "arxiv.org" in raw_identifier.lower()
+        or raw_identifier.lower().startswith("arxiv:")
+        or raw_identifier.lower().startswith("10.48550/arxiv.")
+    ) else _normalize_doi(raw_identifier)
+    return doi_hint, arxiv_hint
+
+
+def _identifier_batch_key(raw_identifier: str) -> tuple[str, str]:
+    """Group identifiers that resolve to the same work (DOI, or arXiv ID without version)."""
+    doi_hint, arxiv_hint = _identifier_route_hints(raw_identifier)
+    if arxiv_hint:
+        return "arxiv", re.sub(r"v\d+$", "", arxiv_hint.lower())
+    if doi_hint:
+        return "doi", doi_hint.lower()
+    return "raw", raw_identifier.strip().lower()
+
+
 def _looks_like_direct_pdf_url(url: str | None) -> bool:
     if not url:
         return False
@@ -1033,14 +1155,14 @@ def _probe_identifier_from_direct_pdf_url(
 
         local_item_key: str | None = None
         try:
-            create_resp = requests.post(
+            create_resp = http_client.post(
                 "http://127.0.0.1:23119/connector/saveItems",
                 json={"sessionID": session_id, "items": [connector_item]},
                 timeout=20,
             )
             create_resp.raise_for_status()
 
-            attach_resp = requests.post(
+            attach_resp = http_client.post(
                 "http://127.0.0.1:23119/connector/saveAttachment",
                 params={"sessionID": session_id},
                 data=b"",
@@ -1081,9 +1203,12 @@ def _probe_identifier_from_direct_pdf_url(
             if not attachment_key:
                 return None
 
-            with tempfile.TemporaryDirectory(prefix="zotero-mcp-probe-") as tmpdir:
-                probe_path = Path(tmpdir) / (_pdf_filename_for_item({}, pdf_url=pdf_url) or "probe.pdf")
-                dump_attachment_to_file(local_zot, attachment_key, probe_path, ctx=ctx)
+            with _attachment_file(
+                local_zot,
+                attachment_key,
+                filename=_pdf_filename_for_item({}, pdf_url=pdf_url) or "probe.pdf",
+                ctx=ctx,
+            ) as probe_path:
                 return _extract_pdf_probe_signals(
                     probe_path.read_bytes(),
                     pdf_url=pdf_url,
@@ -1399,6 +1524,14 @@ def _crossref_candidate_matches_work(
     return True
 
 
+# Total time budget shared by the concurrent Crossref rescue queries.
+_CROSSREF_RESCUE_DEADLINE = 20.0
+
+
+def _crossref_rescue_accepts(best_score: float, second_best: float) -> bool:
+    return best_score >= 92 or (best_score >= 80 and best_score - second_best >= 8)
+
+
 def _lookup_crossref_doi_for_signals(signals: dict[str, Any], *, ctx: Context) -> str | None:
     hints = _collect_identifier_search_hints(signals)
     title_candidates = hints.get("title_candidates") or []
@@ -1420,50 +1553,79 @@ def _lookup_crossref_doi_for_signals(signals: dict[str, Any], *, ctx: Context) -
             ({"query.bibliographic": bibliographic, "rows": 8}, f"bibliographic:{bibliographic}")
         )
 
-    best: tuple[float, str | None, dict[str, Any]] = (-1.0, None, {})
-    second_best = -1.0
-    seen_dois: set[str] = set()
+    # DOI -> (score, diagnostics); a work returned by several queries is
+    # scored once and remembers every query that found it.
+    scored: dict[str, tuple[float, dict[str, Any]]] = {}
 
-    for params, label in query_specs:
-        try:
-            resp = requests.get(
-                "https://api.crossref.org/works",
-                headers={"User-Agent": "zotero-mcp/1.0 (mailto:user@example.com)"},
-                params=params,
-                timeout=15,
-            )
-            resp.raise_for_status()
-            payload = resp.json() or {}
-        except Exception as exc:
-            _ctx_warning(ctx, f"Crossref title lookup failed for '{label}': {exc}")
-            continue
+    def ranking() -> tuple[float, str | None, dict[str, Any], float]:
+        ordered = sorted(scored.items(), key=lambda entry: entry[1][0], reverse=True)
+        if not ordered:
+            return -1.0, None, {}, -1.0
+        doi, (score, diagnostics) = ordered[0]
+        runner_up = ordered[1][1][0] if len(ordered) > 1 else -1.0
+        return score, doi, diagnostics, runner_up
 
-        items = (payload.get("message") or {}).get("items") or []
-        for work in items:
-            if not isinstance(work, dict):
-                continue
-            doi = _normalize_doi(work.get("DOI"))
-            if not doi:
-                continue
-            if doi in seen_dois:
-                continue
-            seen_dois.add(doi)
+    deadline = time.monotonic() + _CROSSREF_RESCUE_DEADLINE
 
-            score, diagnostics = _score_crossref_work(hints=hints, work=work)
-            if score < 0:
-                continue
+    def fetch(params: dict[str, Any]) -> dict[str, Any]:
+        resp = http_client.cached_get(
+            "https://api.crossref.org/works",
+            params=params,
+            timeout=max(1.0, min(15.0, deadline - time.monotonic())),
+        )
+        resp.raise_for_status()
+        return resp.json() or {}
 
-            if score > best[0]:
-                second_best = best[0]
-                best = (score, doi, diagnostics | {"query": label})
-            elif score > second_best:
-                second_best = score
+    pool = ThreadPoolExecutor(max_workers=len(query_specs), thread_name_prefix="zotero-crossref")
+    try:
+        pending = {pool.submit(fetch, params): label for params, label in query_specs}
+        while pending:
+            done, _ = wait(
+                pending,
+                timeout=max(0.0, deadline - time.monotonic()),
+                return_when=FIRST_COMPLETED,
+            )
+            if not done:
+                _ctx_warning(
+                    ctx,
+                    f"Crossref title lookup hit the {_CROSSREF_RESCUE_DEADLINE:.0f}s deadline "
+                    f"with {len(pending)} quer(ies) outstanding",
+                )
+                break
+            for future in done:
+                label = pending.pop(future)
+                try:
+                    payload = future.result()
+                except Exception as exc:
+                    _ctx_warning(ctx, f"Crossref title lookup failed for '{label}': {exc}")
+                    continue
+
+                items = (payload.get("message") or {}).get("items") or []
+                for work in items:
+                    if not isinstance(work, dict):
+                        continue
+                    doi = _normalize_doi(work.get("DOI"))
+                    if not doi:
+                        continue
+                    if doi in scored:
+                        scored[doi][1]["queries"].append(label)
+                        continue
+                    score, diagnostics = _score_crossref_work(hints=hints, work=work)
+                    if score < 0:
+                        continue
+                    scored[doi] = (score, diagnostics | {"queries": [label]})
 
-    best_score, best_doi, best_meta = best
+            best_score, _, _, second_best = ranking()
+            if pending and _crossref_rescue_accepts(best_score, second_best):
+                break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    best_score, best_doi, best_meta, second_best = ranking()
     if not best_doi:
         return None
 
-    if best_score >= 92 or (best_score >= 80 and best_score - second_best >= 8):
+    if _crossref_rescue_accepts(best_score, second_best):
         ctx.info(
             "Crossref identifier rescue matched "
             f"{best_doi} with score={best_score:.1f} meta={best_meta}"
@@ -1516,15 +1678,13 @@ def _lookup_crossref_work_from_structured_url(url: str, *, ctx: Context) -> dict
 
     bibliographic = f"{issn} {volume} {issue} {article}"
     try:
-        resp = requests.get(
+        resp = http_client.cached_get(
             "https://api.crossref.org/works",
-            headers={"User-Agent": "zotero-mcp/1.0 (mailto:user@example.com)"},
             params={
                 "filter": f"prefix:{prefix}",
                 "query.bibliographic": bibliographic,
                 "rows": 5,
             },
-            timeout=15,
         )
         resp.raise_for_status()
     except Exception as exc:
@@ -1593,9 +1753,9 @@ def _resolve_pdf_discovery_url(url: str | None, *, ctx: Context) -> str | None:
     if not url:
         return None
     try:
-        response = requests.get(
+        response = http_client.get(
             url,
-            headers={"User-Agent": "Mozilla/5.0 zotero-mcp/1.0"},
+            headers={"User-Agent": http_client.BROWSER_USER_AGENT},
             timeout=15,
         )
         response.raise_for_status()
@@ -1897,9 +2057,10 @@ def _fallback_signals_from_known_landing_page(url: str) -> dict[str, Any] | None
     }
 
 
-def _fetch_page_signals(url: str, *, ctx: Context) -> dict[str, Any]:
-    import urllib.request
+_PAGE_SIGNAL_MAX_BYTES = 256 * 1024
+
 
+def _fetch_page_signals(url: str, *, ctx: Context) -> dict[str, Any]:
     signals: dict[str, Any] = {
         "source_url": url,
         "final_url": url,
@@ -1915,13 +2076,26 @@ def _fetch_page_signals(url: str, *, ctx: Context) -> dict[str, Any]:
         "content_type": "",
     }
 
-    req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0 zotero-mcp/1.0"})
     try:
-        with urllib.request.urlopen(req, timeout=15) as response:
-            final_url = getattr(response, "geturl", lambda: url)()
-            headers = getattr(response, "headers", {})
-            content_type = headers.get("Content-Type", "") if hasattr(headers, "get") else ""
-            body = response.read(262144)
+        response = http_client.get(
+            url,
+            timeout=15,
+            stream=True,
+            headers={"User-Agent": http_client.BROWSER_USER_AGENT},
+        )
+        try:
+            response.raise_for_status()
+            final_url = response.url or url
+            content_type = response.headers.get("Content-Type", "")
+            # Only the head of the page carries the citation meta tags.
+            body = b""
+            for chunk in response.iter_content(chunk_size=65536):
+                body += chunk
+                if len(body) >= _PAGE_SIGNAL_MAX_BYTES:
+                    break
+            body = body[:_PAGE_SIGNAL_MAX_BYTES]
+        finally:
+            response.close()
     except Exception as exc:
         fallback = _fallback_signals_from_known_landing_page(url)
         if fallback is None:
@@ -2025,6 +2199,9 @@ def _iter_pdf_attachments(zot, item_key: str) -> list[dict[str, Any]]:
     try:
         children = zot.children(item_key)
     except Exception:
+        if getattr(zot, "local", False) is True:
+            # Zotero desktop may have quit; re-probe before handing out local clients
+            invalidate_zotero_client_health()
         return []
 
     pdf_children: list[dict[str, Any]] = []
@@ -2038,42 +2215,39 @@ def _iter_pdf_attachments(zot, item_key: str) -> list[dict[str, Any]]:
     return pdf_children
 
 
-def _resolve_local_attachment_path(attachment_key: str) -> Path | None:
+def _local_attachment_records(attachment_keys: list[str]) -> dict[str, Any]:
+    """Resolve many attachment keys against the local DB in one query."""
+    keys = [key for key in attachment_keys if key]
+    if not keys:
+        return {}
     try:
         from zotero_mcp.local_db import LocalZoteroReader
 
-        reader = LocalZoteroReader()
-        conn = sqlite3.connect(f"file:{reader.db_path}?immutable=1", uri=True)
-        try:
-            row = conn.execute(
-                """
-                SELECT ia.path
-                FROM itemAttachments ia
-                JOIN items i ON i.itemID = ia.itemID
-                WHERE i.key = ?
-                """,
-                (attachment_key,),
-            ).fetchone()
-        finally:
-            conn.close()
+        with LocalZoteroReader() as reader:
+            return reader.get_attachments_by_key(keys)
     except Exception:
-        return None
+        return {}
 
-    if not row:
-        return None
 
-    raw_path = row[0]
-    if not raw_path:
-        return None
+def _local_attachments_by_parent(parent_keys: list[str]) -> dict[str, list[Any]]:
+    """Fetch local attachment records for many parent items in one query."""
+    keys = [key for key in parent_keys if key]
+    if not keys:
+        return {}
+    try:
+        from zotero_mcp.local_db import LocalZoteroReader
 
-    if raw_path.startswith("storage:"):
-        rel_path = raw_path.split(":", 1)[1].lstrip("/")
-        return Path(reader.db_path).parent / "storage" / attachment_key / rel_path
+        with LocalZoteroReader() as reader:
+            return reader.get_attachments_for_parent_keys(keys)
+    except Exception:
+        return {}
 
-    path = Path(raw_path)
-    if path.is_absolute():
-        return path
-    return None
+
+def _resolve_local_attachment_path(attachment_key: str) -> Path | None:
+    record = _local_attachment_records([attachment_key]).get(attachment_key)
+    if record is None:
+        return None
+    return record.resolved_path
 
 
 def _attachment_file_exists_locally(attachment_key: str) -> bool:
@@ -2091,30 +2265,42 @@ def _item_has_materialized_local_pdf_attachment(item_key: str) -> bool:
     if local_zot is None:
         return False
 
-    for child in _iter_pdf_attachments(local_zot, item_key):
-        data = child.get("data", {})
-        attachment_key = child.get("key") or data.get("key")
-        if attachment_key and _attachment_file_exists_locally(attachment_key):
-            return True
-    return False
+    pdf_children = _iter_pdf_attachments(local_zot, item_key)
+    records = _local_attachment_records(
+        [child.get("key") or child.get("data", {}).get("key") or "" for child in pdf_children]
+    )
+    return any(record.is_usable for record in records.values())
+
 
+def _item_has_usable_pdf_attachment(
+    item_key: str,
+    *,
+    zot=None,
+    local_attachments: dict[str, list[Any]] | None = None,
+) -> bool:
+    # `local_attachments` is an optional prefetch from _local_attachments_by_parent()
+    # so batch callers can skip the local API probe for items already on disk.
+    if local_attachments is not None and any(
+        record.is_pdf and record.is_usable for record in local_attachments.get(item_key, [])
+    ):
+        return True
 
-def _item_has_usable_pdf_attachment(item_key: str, *, zot=None) -> bool:
     local_zot = get_local_zotero_client()
     if local_zot is not None:
         local_children = _iter_pdf_attachments(local_zot, item_key)
         if local_children:
+            records = _local_attachment_records(
+                [child.get("key") or child.get("data", {}).get("key") or "" for child in local_children]
+            )
             for child in local_children:
                 data = child.get("data", {})
                 attachment_key = child.get("key") or data.get("key")
-                if attachment_key and _attachment_file_exists_locally(attachment_key):
+                record = records.get(attachment_key) if attachment_key else None
+                if record is not None and record.is_usable:
                     return True
             # If we cannot resolve any local storage paths at all, fall back to
             # metadata presence. This keeps fake/local-test clients working.
-            if all(
-                _resolve_local_attachment_path((child.get("key") or child.get("data", {}).get("key") or "")) is None
-                for child in local_children
-            ):
+            if all(record.resolved_path is None for record in records.values()):
                 return True
             return False
     if zot is not None:
@@ -2208,6 +2394,79 @@ def _connector_url_attach_timeout_seconds() -> float:
     return max(1.0, min(timeout_seconds, 20.0))
 
 
+_LOCAL_WATCH_TICK = 0.05
+_LOCAL_CHANGE_RECHECK_GAP = 0.1
+_LOCAL_WAIT_MAX_INTERVAL = 4.0
+
+
+def _local_zotero_watch_paths() -> list[Path]:
+    """Files whose stat() changes whenever local Zotero commits: the database and its journals."""
+    try:
+        from zotero_mcp.local_db import LocalZoteroReader
+
+        db_path = Path(LocalZoteroReader().db_path)
+    except Exception:
+        return []
+    return [db_path] + [db_path.with_name(db_path.name + suffix) for suffix in ("-journal", "-wal")]
+
+
+def _stat_signature(paths: list[Path]) -> tuple[Any, ...]:
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _wait_for_local_change(
+    check,
+    *,
+    wait_seconds: float,
+    watch_paths=None,
+    initial_interval: float = 0.25,
+    max_interval: float = _LOCAL_WAIT_MAX_INTERVAL,
+    change_gap: float = _LOCAL_CHANGE_RECHECK_GAP,
+) -> Any:
+    """
+    Run `check` until it returns something truthy or `wait_seconds` pass.
+
+    Between attempts only the files from `watch_paths()` are stat()ed, and
+    `check` re-runs as soon as one of them changes (at most every
+    `change_gap`). Without a change it still re-runs after an interval
+    that starts at `initial_interval` and doubles up to `max_interval`, for
+    changes the watched files cannot see. Returns the last result of `check`.
+    """
+    deadline = time.monotonic() + max(wait_seconds, 0.0)
+    min_gap = max(change_gap, _LOCAL_WATCH_TICK)
+    initial_interval = max(initial_interval, _LOCAL_WATCH_TICK)
+    interval = initial_interval
+    signature = _stat_signature(watch_paths()) if watch_paths else ()
+    result = check()
+    while not result:
+        last_check = time.monotonic()
+        if last_check >= deadline:
+            return result
+        wake_at = min(last_check + interval, deadline)
+        changed = False
+        now = last_check
+        while now < wake_at:
+            time.sleep(min(_LOCAL_WATCH_TICK if watch_paths else interval, wake_at - now))
+            now = time.monotonic()
+            if watch_paths and not changed:
+                current = _stat_signature(watch_paths())
+                changed = current != signature
+                signature = current
+            if changed and now - last_check >= min_gap:
+                break
+        interval = initial_interval if changed else min(interval * 2, max_interval)
+        result = check()
+    return result
+
+
 def _confirm_local_pdf_attachment_materialized(
     item_key: str,
     *,
@@ -2225,20 +2484,21 @@ def _confirm_local_pdf_attachment_materialized(
             "message": "local Zotero is not running or local API is unavailable",
         }
 
-    deadline = time.time() + max(wait_seconds, 0.0)
-    last_error = "unknown error"
-    last_reported_error = ""
-    attempt = 0
-    while True:
-        attempt += 1
+    state = {"attempt": 0, "last_error": "unknown error", "last_reported_error": ""}
+    attachment_keys: set[str] = set()
+
+    def check() -> dict[str, Any] | None:
+        state["attempt"] += 1
+        attempt = state["attempt"]
         pdf_children = _iter_pdf_attachments(local_zot, item_key)
         if not pdf_children:
-            last_error = "no local PDF attachment placeholder found after web upload failure"
+            state["last_error"] = "no local PDF attachment placeholder found after web upload failure"
         for child in pdf_children:
             data = child.get("data", {})
             attachment_key = child.get("key") or data.get("key")
             if not attachment_key:
                 continue
+            attachment_keys.add(attachment_key)
 
             if _attachment_file_exists_locally(attachment_key):
                 return {
@@ -2254,14 +2514,12 @@ def _confirm_local_pdf_attachment_materialized(
             filename = data.get("filename") or f"{attachment_key}.pdf"
             resolved_path = _resolve_local_attachment_path(attachment_key)
             if resolved_path is not None and not resolved_path.exists():
-                last_error = (
+                state["last_error"] = (
                     "local PDF attachment placeholder exists but file has not materialized yet"
                 )
                 continue
-            with tempfile.TemporaryDirectory() as tmpdir:
-                probe_path = Path(tmpdir) / filename
-                try:
-                    dump_attachment_to_file(local_zot, attachment_key, probe_path, ctx=ctx)
+            try:
+                with _attachment_file(local_zot, attachment_key, filename=filename, ctx=ctx) as probe_path:
                     if probe_path.exists() and probe_path.stat().st_size > 0:
                         return {
                             "success": True,
@@ -2272,21 +2530,36 @@ def _confirm_local_pdf_attachment_materialized(
                             ),
                             "attachment_key": attachment_key,
                         }
-                    last_error = "local attachment probe produced an empty file"
-                except Exception as exc:
-                    last_error = str(exc)
+                    state["last_error"] = "local attachment probe produced an empty file"
+            except Exception as exc:
+                state["last_error"] = str(exc)
 
-        if time.time() >= deadline:
-            break
-        should_log = attempt == 1 or last_error != last_reported_error or attempt % 5 == 0
+        last_error = state["last_error"]
+        should_log = attempt == 1 or last_error != state["last_reported_error"] or attempt % 5 == 0
         if should_log and pdf_children:
             ctx.info(
                 f"Waiting for local PDF attachment to materialize for `{item_key}` "
                 f"(attempt {attempt}, last_error={last_error})"
             )
-            last_reported_error = last_error
-        time.sleep(max(poll_interval, 0.1))
+            state["last_reported_error"] = last_error
+        return None
+
+    db_paths = _local_zotero_watch_paths()
 
+    def watch_paths() -> list[Path]:
+        # The attachment's storage folder changes as soon as the file lands.
+        storage_dir = db_paths[0].parent / "storage"
+        return db_paths + [storage_dir / key for key in sorted(attachment_keys)]
+
+    materialized = _wait_for_local_change(
+        check,
+        wait_seconds=wait_seconds,
+        watch_paths=watch_paths if db_paths else None,
+        initial_interval=poll_interval,
+    )
+    if materialized:
+        return materialized
+    last_error = state["last_error"]
     return {
         "success": False,
         "pdf_source": "local_zotero",
@@ -2332,12 +2605,38 @@ def _item_matches_metadata(
 
 
 def _collection_items_safe(zot, collection_key: str) -> list[dict[str, Any]]:
+    """Every item in a collection; a failed page ends the listing early."""
+    return _collection_items_listing(zot, collection_key)[0]
+
+
+def _collection_items_listing(zot, collection_key: str) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Every item in a collection (children included), one page of 100 at a time.
+
+    Returns (items, complete). When a page request fails, `complete` is False
+    and `items` holds only the pages listed before it.
+    """
     if not hasattr(zot, "collection_items"):
-        return []
-    try:
-        return zot.collection_items(collection_key) or []
-    except Exception:
-        return []
+        return [], True
+    items: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    start = 0
+    while True:
+        try:
+            page = zot.collection_items(collection_key, limit=_ZOTERO_PAGE_SIZE, start=start) or []
+        except Exception:
+            return items, False
+        fresh = []
+        for item in page:
+            key = str(_coerce_item_data(item).get("key") or item.get("key") or "")
+            if key and key in seen:
+                continue
+            seen.add(key)
+            fresh.append(item)
+        items.extend(fresh)
+        if len(page) < _ZOTERO_PAGE_SIZE or not fresh:
+            return items, True
+        start += len(page)
 
 
 def _collection_data_safe(zot, collection_key: str) -> dict[str, Any] | None:
@@ -2351,10 +2650,154 @@ def _collection_data_safe(zot, collection_key: str) -> dict[str, Any] | None:
     return data
 
 
+_COLLECTION_TREE_TTL = 300.0
+
+
+class _CollectionTree:
+    """In-memory parent/child index over every collection of one library."""
+
+    def __init__(self, collections: list[dict[str, Any]], *, version: int | None, owner: Any = None):
+        self.version = version
+        self.loaded_at = time.monotonic()
+        self.owner = weakref.ref(owner) if owner is not None else None
+        self.by_key: dict[str, dict[str, Any]] = {}
+        self.children: dict[str | None, list[str]] = {}
+        for coll in collections:
+            data = coll.get("data", coll if isinstance(coll, dict) else {})
+            key = data.get("key")
+            if not key or data.get("deleted") or key in self.by_key:
+                continue
+            self.by_key[key] = data
+            self.children.setdefault(data.get("parentCollection") or None, []).append(key)
+
+    def path(self, collection_key: str) -> list[str] | None:
+        """Names from the root down to `collection_key`, or None if it is unknown."""
+        if collection_key not in self.by_key:
+            return None
+        path: list[str] = []
+        current_key: str | None = collection_key
+        seen: set[str] = set()
+        while current_key and current_key not in seen:
+            seen.add(current_key)
+            data = self.by_key.get(current_key)
+            if data is None:
+                return None
+            path.append(data.get("name") or current_key)
+            current_key = data.get("parentCollection") or None
+        return list(reversed(path))
+
+    def descendants(self, collection_key: str) -> list[str]:
+        """`collection_key` followed by all of its subcollections, breadth first."""
+        result: list[str] = []
+        queue = deque([collection_key])
+        seen: set[str] = set()
+        while queue:
+            key = queue.popleft()
+            if key in seen:
+                continue
+            seen.add(key)
+            result.append(key)
+            queue.extend(self.children.get(key, []))
+        return result
+
+
+_collection_trees: dict[Any, _CollectionTree] = {}
+_collection_trees_lock = threading.Lock()
+
+
+def _collection_tree_cache_key(zot) -> Any:
+    library_id = getattr(zot, "library_id", None)
+    if library_id is None:
+        return ("client", id(zot))
+    return (
+        str(getattr(zot, "endpoint", "") or ""),
+        str(getattr(zot, "library_type", "") or ""),
+        str(library_id),
+        bool(getattr(zot, "local", False)),
+    )
+
+
+def _fetch_all_collections(zot) -> list[dict[str, Any]]:
+    """Every collection of the library, one page of 100 at a time."""
+    collections: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    start = 0
+    while True:
+        page = zot.collections(limit=_ZOTERO_PAGE_SIZE, start=start) or []
+        fresh = []
+        for coll in page:
+            data = coll.get("data", coll if isinstance(coll, dict) else {})
+            key = data.get("key")
+            if key and key not in seen:
+                seen.add(key)
+                fresh.append(coll)
+        collections.extend(fresh)
+        if len(page) < _ZOTERO_PAGE_SIZE or not fresh:
+            return collections
+        start += len(page)
+
+
+def _collection_tree(zot) -> _CollectionTree | None:
+    """
+    Return the cached collection tree for `zot`'s library.
+
+    The tree is built from one paginated collections listing and reused until
+    a collection write tool invalidates it. After ZOTERO_MCP_COLLECTION_CACHE_TTL
+    seconds the library version is checked and the tree is rebuilt only if it
+    changed. Returns None when the collections cannot be listed.
+    """
+    if zot is None or not hasattr(zot, "collections"):
+        return None
+    cache_key = _collection_tree_cache_key(zot)
+    with _collection_trees_lock:
+        tree = _collection_trees.get(cache_key)
+    if tree is not None and tree.owner is not None and tree.owner() is not zot:
+        tree = None
+    if tree is not None:
+        try:
+            ttl = float(os.environ.get("ZOTERO_MCP_COLLECTION_CACHE_TTL", _COLLECTION_TREE_TTL))
+        except ValueError:
+            ttl = _COLLECTION_TREE_TTL
+        if time.monotonic() - tree.loaded_at < ttl:
+            return tree
+        current_version = None
+        if tree.version is not None and hasattr(zot, "last_modified_version"):
+            with suppress(Exception):
+                current_version = int(zot.last_modified_version())
+        if current_version is not None and current_version == tree.version:
+            tree.loaded_at = time.monotonic()
+            return tree
+
+    try:
+        collections = _fetch_all_collections(zot)
+    except Exception:
+        return None
+    tree = _CollectionTree(
+        collections,
+        version=_last_library_version(zot),
+        owner=zot if cache_key[0] == "client" else None,
+    )
+    with _collection_trees_lock:
+        _collection_trees[cache_key] = tree
+    return tree
+
+
+def _invalidate_collection_trees() -> None:
+    """Forget cached collection trees after a collection is created, renamed, moved or deleted."""
+    with _collection_trees_lock:
+        _collection_trees.clear()
+
+
 def _collection_path(zot, collection_key: str | None) -> list[str]:
     if not collection_key:
         return []
 
+    tree = _collection_tree(zot)
+    if tree is not None:
+        cached = tree.path(collection_key)
+        if cached is not None:
+            return cached
+
     path: list[str] = []
     current_key = collection_key
     seen: set[str] = set()
@@ -2378,15 +2821,6 @@ def _collection_label(zot, collection_key: str | None) -> str | None:
     return collection_key
 
 
-def _all_collections_safe(zot) -> list[dict[str, Any]]:
-    if not hasattr(zot, "collections"):
-        return []
-    try:
-        return zot.collections() or []
-    except Exception:
-        return []
-
-
 def _collection_descendant_keys(
     zot,
     collection_key: str | None,
@@ -2400,36 +2834,20 @@ def _collection_descendant_keys(
     if not include_subcollections:
         return [resolved_root]
 
-    collections = _all_collections_safe(zot)
-    if not collections:
+    tree = _collection_tree(zot)
+    if tree is None or not tree.by_key:
         return [resolved_root]
-
-    children_by_parent: dict[str | None, list[str]] = {}
-    for coll in collections:
-        data = coll.get("data", coll if isinstance(coll, dict) else {})
-        key = data.get("key")
-        if not key:
-            continue
-        parent_key = data.get("parentCollection") or None
-        children_by_parent.setdefault(parent_key, []).append(key)
-
-    result: list[str] = []
-    queue: list[str] = [resolved_root]
-    seen: set[str] = set()
-    while queue:
-        key = queue.pop(0)
-        if key in seen:
-            continue
-        seen.add(key)
-        result.append(key)
-        queue.extend(children_by_parent.get(key, []))
-    return result
+    return tree.descendants(resolved_root)
 
 
 def _coerce_item_data(item: dict[str, Any]) -> dict[str, Any]:
     return item.get("data", item if isinstance(item, dict) else {}) if isinstance(item, dict) else {}
 
 
+def _item_key_of(item: dict[str, Any]) -> str:
+    return str(_coerce_item_data(item).get("key") or item.get("key") or "")
+
+
 def _collection_duplicate_group_key(item_data: dict[str, Any]) -> str | None:
     doi = _normalize_doi(item_data.get("DOI"))
     if doi:
@@ -2479,12 +2897,19 @@ def _metadata_richness_score(item_data: dict[str, Any]) -> int:
 def _choose_collection_duplicate_canonical(
     zot,
     items: list[dict[str, Any]],
+    *,
+    pdf_status: dict[str, bool] | None = None,
 ) -> tuple[dict[str, Any], list[dict[str, Any]]]:
     ranked: list[tuple[int, int, str, dict[str, Any]]] = []
     for item in items:
         data = _coerce_item_data(item)
         key = str(data.get("key") or item.get("key") or "")
-        pdf_score = 100 if _item_has_usable_pdf_attachment(key, zot=zot) else 0
+        has_pdf = (
+            pdf_status[key]
+            if pdf_status is not None and key in pdf_status
+            else _item_has_usable_pdf_attachment(key, zot=zot)
+        )
+        pdf_score = 100 if has_pdf else 0
         metadata_score = _metadata_richness_score(data)
         ranked.append((pdf_score, metadata_score, key, item))
     ranked.sort(reverse=True, key=lambda entry: (entry[0], entry[1], entry[2]))
@@ -2640,34 +3065,114 @@ def _collection_items_payload_map(
     *,
     collection_key: str,
     include_subcollections: bool,
-) -> tuple[list[str], dict[str, dict[str, Any]]]:
+) -> tuple[list[str], dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]] | None]:
+    """
+    List the parent items of a collection scope from the collection listings.
+
+    Returns (scope keys, parent payloads by key, PDF attachments by parent
+    key). The listing payloads are used as-is. Child items come back in the
+    same listings, so the PDF map needs no per-item `children` calls; it is
+    None when the listings carried no child items at all, or when a page of
+    a listing failed and a parent's PDF may have been on the missing page.
+    """
     scope_keys = _collection_descendant_keys(
         zot,
         collection_key,
         include_subcollections=include_subcollections,
     )
     items_by_key: dict[str, dict[str, Any]] = {}
+    pdf_children: dict[str, list[dict[str, Any]]] = {}
+    saw_children = False
+    complete = True
     for scope_key in scope_keys:
-        for item in _collection_items_safe(zot, scope_key):
+        listing, listed_all = _collection_items_listing(zot, scope_key)
+        complete = complete and listed_all
+        for item in listing:
             data = _coerce_item_data(item)
             item_type = str(data.get("itemType") or "")
+            if data.get("parentItem"):
+                saw_children = True
+                if item_type == "attachment" and data.get("contentType") == "application/pdf":
+                    siblings = pdf_children.setdefault(str(data["parentItem"]), [])
+                    if all(_coerce_item_data(sibling).get("key") != data.get("key") for sibling in siblings):
+                        siblings.append(item)
             if item_type in {"attachment", "note", "annotation"}:
                 continue
             item_key = data.get("key") or item.get("key")
             if not item_key:
                 continue
-            payload = _get_item_payload(zot, item_key) or {"key": item_key, "data": data}
-            items_by_key[str(item_key)] = payload
-    return scope_keys, items_by_key
+            items_by_key[str(item_key)] = item if "data" in item else {"key": item_key, "data": data}
+    return scope_keys, items_by_key, pdf_children if saw_children and complete else None
 
 
-def _duplicate_groups_from_items(
-    items_by_key: dict[str, dict[str, Any]],
-) -> dict[str, list[dict[str, Any]]]:
-    grouped: dict[str, list[dict[str, Any]]] = {}
-    for payload in items_by_key.values():
-        group_key = _collection_duplicate_group_key(_coerce_item_data(payload))
-        if not group_key:
+def _usable_pdf_status(
+    zot,
+    item_keys: list[str],
+    *,
+    pdf_children: dict[str, list[dict[str, Any]]] | None,
+) -> dict[str, bool]:
+    """
+    Decide for many items at once whether they already have a usable PDF.
+
+    Local attachment records for all items come from one SQLite query. With
+    `pdf_children` from the collection listing, the remaining items are
+    answered without API calls, with the same rules as
+    _item_has_usable_pdf_attachment; otherwise they fall back to it one by one.
+    """
+    local_attachments = _local_attachments_by_parent(item_keys)
+    status: dict[str, bool] = {}
+    for item_key in item_keys:
+        records = local_attachments.get(item_key, [])
+        if any(record.is_pdf and record.is_usable for record in records):
+            status[item_key] = True
+        elif pdf_children is None:
+            status[item_key] = _item_has_usable_pdf_attachment(
+                item_key, zot=zot, local_attachments=local_attachments
+            )
+        else:
+            child_keys = {
+                str(_coerce_item_data(child).get("key") or child.get("key") or "")
+                for child in pdf_children.get(item_key, [])
+            }
+            known = [
+                record for record in records
+                if record.key in child_keys and record.resolved_path is not None
+            ]
+            # A PDF child the local DB cannot place counts as present, as in
+            # _item_has_usable_pdf_attachment.
+            status[item_key] = bool(child_keys) and not known
+    return status
+
+
+class _CallCountingClient:
+    """Wraps a Zotero client and counts the API methods called through it."""
+
+    def __init__(self, zot):
+        self._zot = zot
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._zot, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def counted(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                self.calls += 1
+            return attr(*args, **kwargs)
+
+        return counted
+
+
+def _duplicate_groups_from_items(
+    items_by_key: dict[str, dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for payload in items_by_key.values():
+        group_key = _collection_duplicate_group_key(_coerce_item_data(payload))
+        if not group_key:
             continue
         grouped.setdefault(group_key, []).append(payload)
     return {
@@ -2727,7 +3232,10 @@ def _reconcile_local_collection_duplicates_impl(
     local_db_fallback: bool,
     ctx: Context,
 ) -> tuple[str, int]:
-    scope_keys, items_by_key = _collection_items_payload_map(
+    local_zot = _CallCountingClient(local_zot)
+    if web_zot is not None:
+        web_zot = _CallCountingClient(web_zot)
+    scope_keys, items_by_key, pdf_children = _collection_items_payload_map(
         local_zot,
         collection_key=collection_key,
         include_subcollections=include_subcollections,
@@ -2738,6 +3246,11 @@ def _reconcile_local_collection_duplicates_impl(
     duplicate_groups = _duplicate_groups_from_items(items_by_key)
     if not duplicate_groups:
         return "", 0
+    pdf_status = _usable_pdf_status(
+        local_zot,
+        [_item_key_of(item) for items in duplicate_groups.values() for item in items],
+        pdf_children=pdf_children,
+    )
 
     lines = [
         "",
@@ -2752,11 +3265,13 @@ def _reconcile_local_collection_duplicates_impl(
 
     local_trash_count = 0
     for group_key, items in sorted(duplicate_groups.items()):
-        canonical, duplicates = _choose_collection_duplicate_canonical(local_zot, items)
+        canonical, duplicates = _choose_collection_duplicate_canonical(
+            local_zot, items, pdf_status=pdf_status
+        )
         canonical_data = _coerce_item_data(canonical)
         canonical_key = str(canonical_data.get("key") or canonical.get("key") or "")
         canonical_label = canonical_data.get("title") or canonical_key or group_key
-        canonical_pdf = "yes" if _item_has_usable_pdf_attachment(canonical_key, zot=local_zot) else "no"
+        canonical_pdf = "yes" if pdf_status.get(canonical_key) else "no"
         action_bits: list[str] = []
         duplicate_keys: list[str] = []
 
@@ -2836,6 +3351,8 @@ def _reconcile_local_collection_duplicates_impl(
             + " |"
         )
 
+    api_calls = local_zot.calls + (web_zot.calls if web_zot is not None else 0)
+    lines.insert(5, f"- api_calls: {api_calls}")
     return "\n".join(lines), local_trash_count
 
 
@@ -2847,7 +3364,8 @@ def _reconcile_collection_duplicates_impl(
     dry_run: bool,
     ctx: Context,
 ) -> str:
-    scope_keys, items_by_key = _collection_items_payload_map(
+    zot = _CallCountingClient(zot)
+    scope_keys, items_by_key, pdf_children = _collection_items_payload_map(
         zot,
         collection_key=collection_key,
         include_subcollections=include_subcollections,
@@ -2861,8 +3379,14 @@ def _reconcile_collection_duplicates_impl(
             f"- collection: {_collection_label(zot, collection_key) or collection_key}\n"
             "- duplicate groups: 0\n"
             "- canonical items kept: 0\n"
-            "- duplicates trashed: 0"
+            "- duplicates trashed: 0\n"
+            f"- api_calls: {zot.calls}"
         )
+    pdf_status = _usable_pdf_status(
+        zot,
+        [_item_key_of(item) for items in duplicate_groups.values() for item in items],
+        pdf_children=pdf_children,
+    )
 
     lines = [
         "Collection dedupe summary",
@@ -2879,11 +3403,13 @@ def _reconcile_collection_duplicates_impl(
     trashed_count = 0
     merged_collection_count = 0
     for group_key, items in sorted(duplicate_groups.items()):
-        canonical, duplicates = _choose_collection_duplicate_canonical(zot, items)
+        canonical, duplicates = _choose_collection_duplicate_canonical(
+            zot, items, pdf_status=pdf_status
+        )
         canonical_data = _coerce_item_data(canonical)
         canonical_key = canonical_data.get("key") or canonical.get("key")
         canonical_label = canonical_data.get("title") or canonical_key or group_key
-        canonical_pdf = "yes" if _item_has_usable_pdf_attachment(str(canonical_key), zot=zot) else "no"
+        canonical_pdf = "yes" if pdf_status.get(str(canonical_key)) else "no"
 
         target_collections = set(canonical_data.get("collections") or [])
         for duplicate in duplicates:
@@ -2973,6 +3499,7 @@ def _reconcile_collection_duplicates_impl(
     lines.insert(5, f"- canonical items kept: {kept_count}")
     lines.insert(6, f"- duplicates trashed: {trashed_count}")
     lines.insert(7, f"- collection memberships merged: {merged_collection_count}")
+    lines.insert(8, f"- api_calls: {zot.calls}")
     return "\n".join(lines)
 
 
@@ -2983,7 +3510,8 @@ def _repair_missing_pdfs_in_collection_impl(
     include_subcollections: bool,
     ctx: Context,
 ) -> str:
-    _, items_by_key = _collection_items_payload_map(
+    zot = _CallCountingClient(zot)
+    _, items_by_key, pdf_children = _collection_items_payload_map(
         zot,
         collection_key=collection_key,
         include_subcollections=include_subcollections,
@@ -2994,7 +3522,8 @@ def _repair_missing_pdfs_in_collection_impl(
             f"- collection: {_collection_label(zot, collection_key) or collection_key}\n"
             "- scanned_without_pdf: 0\n"
             "- repaired: 0\n"
-            "- failed: 0"
+            "- failed: 0\n"
+            f"- api_calls: {zot.calls}"
         )
 
     scanned_without_pdf = 0
@@ -3005,9 +3534,10 @@ def _repair_missing_pdfs_in_collection_impl(
         f"- collection: {_collection_label(zot, collection_key) or collection_key}",
     ]
 
+    pdf_status = _usable_pdf_status(zot, list(items_by_key), pdf_children=pdf_children)
     for item_key, payload in items_by_key.items():
         data = _coerce_item_data(payload)
-        if _item_has_usable_pdf_attachment(item_key, zot=zot):
+        if pdf_status[item_key]:
             continue
 
         doi = str(data.get("DOI") or "").strip()
@@ -3056,6 +3586,7 @@ def _repair_missing_pdfs_in_collection_impl(
     lines.append(f"- scanned_without_pdf: {scanned_without_pdf}")
     lines.append(f"- repaired: {repaired}")
     lines.append(f"- failed: {failed}")
+    lines.append(f"- api_calls: {zot.calls}")
     return "\n".join(lines)
 
 
@@ -3101,7 +3632,7 @@ def _resolve_connector_collection_key(collection_id: Any) -> str | None:
 
 def _connector_target_snapshot() -> dict[str, Any]:
     try:
-        resp = requests.post(
+        resp = http_client.post(
             "http://127.0.0.1:23119/connector/getSelectedCollection",
             json={},
             timeout=10,
@@ -3258,21 +3789,20 @@ def _wait_for_local_item_by_metadata(
     wait_seconds: float = 20.0,
     poll_interval: float = 1.0,
 ) -> dict[str, Any] | None:
-    deadline = time.time() + max(wait_seconds, 0.0)
-    while True:
-        item = _find_local_item_by_metadata_scoped(
+    watch_paths = _local_zotero_watch_paths()
+    return _wait_for_local_change(
+        lambda: _find_local_item_by_metadata_scoped(
             title=title,
             item_type=item_type,
             doi=doi,
             url=url,
             collection_keys=collection_keys,
             require_pdf=require_pdf,
-        )
-        if item:
-            return item
-        if time.time() >= deadline:
-            return None
-        time.sleep(max(poll_interval, 0.1))
+        ),
+        wait_seconds=wait_seconds,
+        watch_paths=(lambda: watch_paths) if watch_paths else None,
+        initial_interval=poll_interval,
+    ) or None
 
 
 def _local_item_lookup_kwargs(parent_item: dict[str, Any]) -> dict[str, Any]:
@@ -4285,7 +4815,7 @@ def _save_pdf_via_local_connector_copy(
     connector_attach_timeout = _connector_url_attach_timeout_seconds()
 
     try:
-        create_resp = requests.post(
+        create_resp = http_client.post(
             "http://127.0.0.1:23119/connector/saveItems",
             json={"sessionID": session_id, "items": [connector_item]},
             timeout=20,
@@ -4293,7 +4823,7 @@ def _save_pdf_via_local_connector_copy(
         create_resp.raise_for_status()
 
         pdf_bytes = pdf_path.read_bytes()
-        attach_resp = requests.post(
+        attach_resp = http_client.post(
             "http://127.0.0.1:23119/connector/saveAttachment",
             params={"sessionID": session_id},
             data=pdf_bytes,
@@ -4450,14 +4980,14 @@ def _save_pdf_via_local_connector_url(
     connector_attach_timeout = _connector_url_attach_timeout_seconds()
 
     try:
-        create_resp = requests.post(
+        create_resp = http_client.post(
             "http://127.0.0.1:23119/connector/saveItems",
             json={"sessionID": session_id, "items": [connector_item]},
             timeout=20,
         )
         create_resp.raise_for_status()
 
-        attach_resp = requests.post(
+        attach_resp = http_client.post(
             "http://127.0.0.1:23119/connector/saveAttachment",
             params={"sessionID": session_id},
             data=b"",
@@ -4592,7 +5122,7 @@ def _download_pdf_bytes_via_playwright(
     ctx: Context | None = None,
 ) -> tuple[bytes, str] | None:
     try:
-        from playwright.sync_api import sync_playwright  # type: ignore
+        import playwright.sync_api  # type: ignore  # noqa: F401
     except Exception:
         return None
 
@@ -4606,155 +5136,194 @@ def _download_pdf_bytes_via_playwright(
         )
         * 1000
     )
-    headless = os.environ.get("ZOTERO_MCP_PLAYWRIGHT_HEADLESS", "1").strip().lower() not in {
-        "0",
-        "false",
-        "no",
-    }
-    channel = os.environ.get("ZOTERO_MCP_PLAYWRIGHT_CHANNEL", "").strip() or None
-    user_data_dir = os.environ.get("ZOTERO_MCP_PLAYWRIGHT_USER_DATA_DIR", "").strip()
-
-    try:
-        with sync_playwright() as playwright:
-            launch_kwargs: dict[str, Any] = {"headless": headless}
-            if channel:
-                launch_kwargs["channel"] = channel
-
-            browser = None
-            if user_data_dir:
-                context = playwright.chromium.launch_persistent_context(
-                    user_data_dir,
-                    accept_downloads=True,
-                    ignore_https_errors=True,
-                    **launch_kwargs,
-                )
-            else:
-                browser = playwright.chromium.launch(**launch_kwargs)
-                context = browser.new_context(
-                    accept_downloads=True,
-                    ignore_https_errors=True,
-                )
 
-            try:
-                page = context.new_page()
-                response_candidates: list[Any] = []
-                response_urls: list[str] = []
+    def rescue(context: Any) -> tuple[bytes, str] | None:
+        page = context.new_page()
+        try:
+            response_candidates: list[Any] = []
+            response_urls: list[str] = []
 
-                def remember_response(response: Any) -> None:
-                    try:
-                        headers = response.headers or {}
-                    except Exception:
-                        headers = {}
-                    content_type = str(headers.get("content-type") or headers.get("Content-Type") or "")
-                    response_url = str(getattr(response, "url", "") or "")
-                    if "application/pdf" in content_type.lower() or _looks_like_direct_pdf_url(response_url):
-                        response_candidates.append(response)
-                        if response_url:
-                            response_urls.append(response_url)
-
-                page.on("response", remember_response)
-                initial_response = page.goto(pdf_url, wait_until="domcontentloaded", timeout=timeout_ms)
-                if initial_response is not None:
-                    remember_response(initial_response)
+            def remember_response(response: Any) -> None:
+                try:
+                    headers = response.headers or {}
+                except Exception:
+                    headers = {}
+                content_type = str(headers.get("content-type") or headers.get("Content-Type") or "")
+                response_url = str(getattr(response, "url", "") or "")
+                if "application/pdf" in content_type.lower() or _looks_like_direct_pdf_url(response_url):
+                    response_candidates.append(response)
+                    if response_url:
+                        response_urls.append(response_url)
+
+            page.on("response", remember_response)
+            initial_response = page.goto(pdf_url, wait_until="domcontentloaded", timeout=timeout_ms)
+            if initial_response is not None:
+                remember_response(initial_response)
+            with suppress(Exception):
+                page.wait_for_load_state("networkidle", timeout=min(timeout_ms, 8000))
+
+            for response in response_candidates:
                 with suppress(Exception):
-                    page.wait_for_load_state("networkidle", timeout=min(timeout_ms, 8000))
-
-                for response in response_candidates:
-                    with suppress(Exception):
-                        body = response.body()
-                        headers = response.headers or {}
-                        content_type = str(headers.get("content-type") or headers.get("Content-Type") or "")
-                        if body and (
-                            "application/pdf" in content_type.lower() or body.startswith(b"%PDF")
-                        ):
-                            return body, content_type or "application/pdf"
-
-                candidate_urls: list[str] = []
-                for candidate in [str(page.url or ""), pdf_url, *response_urls]:
-                    candidate = candidate.strip()
-                    if candidate and candidate not in candidate_urls:
-                        candidate_urls.append(candidate)
+                    body = response.body()
+                    headers = response.headers or {}
+                    content_type = str(headers.get("content-type") or headers.get("Content-Type") or "")
+                    if body and (
+                        "application/pdf" in content_type.lower() or body.startswith(b"%PDF")
+                    ):
+                        return body, content_type or "application/pdf"
+
+            candidate_urls: list[str] = []
+            for candidate in [str(page.url or ""), pdf_url, *response_urls]:
+                candidate = candidate.strip()
+                if candidate and candidate not in candidate_urls:
+                    candidate_urls.append(candidate)
+
+            with suppress(Exception):
+                embedded_urls = page.eval_on_selector_all(
+                    "iframe, embed, object",
+                    "els => els.map(el => el.src || el.data || '').filter(Boolean)",
+                )
+                for embedded_url in embedded_urls or []:
+                    embedded_url = str(embedded_url or "").strip()
+                    if embedded_url and embedded_url not in candidate_urls:
+                        candidate_urls.append(embedded_url)
 
+            referer = str(page.url or pdf_url)
+            for candidate_url in candidate_urls:
                 with suppress(Exception):
-                    embedded_urls = page.eval_on_selector_all(
-                        "iframe, embed, object",
-                        "els => els.map(el => el.src || el.data || '').filter(Boolean)",
+                    response = context.request.get(
+                        candidate_url,
+                        headers={
+                            "Referer": referer,
+                            "Accept": "application/pdf,*/*",
+                        },
+                        timeout=timeout_ms,
                     )
-                    for embedded_url in embedded_urls or []:
-                        embedded_url = str(embedded_url or "").strip()
-                        if embedded_url and embedded_url not in candidate_urls:
-                            candidate_urls.append(embedded_url)
+                    body = response.body()
+                    headers = response.headers or {}
+                    content_type = str(headers.get("content-type") or headers.get("Content-Type") or "")
+                    if body and (
+                        "application/pdf" in content_type.lower() or body.startswith(b"%PDF")
+                    ):
+                        return body, content_type or "application/pdf"
+        finally:
+            with suppress(Exception):
+                page.close()
+        return None
 
-                referer = str(page.url or pdf_url)
-                for candidate_url in candidate_urls:
-                    with suppress(Exception):
-                        response = context.request.get(
-                            candidate_url,
-                            headers={
-                                "Referer": referer,
-                                "Accept": "application/pdf,*/*",
-                            },
-                            timeout=timeout_ms,
-                        )
-                        body = response.body()
-                        headers = response.headers or {}
-                        content_type = str(headers.get("content-type") or headers.get("Content-Type") or "")
-                        if body and (
-                            "application/pdf" in content_type.lower() or body.startswith(b"%PDF")
-                        ):
-                            return body, content_type or "application/pdf"
-            finally:
-                context.close()
-                if browser is not None:
-                    browser.close()
+    try:
+        return browser_pool.get_browser_pool().run(
+            urlparse(pdf_url).hostname or "",
+            rescue,
+            timeout=timeout_ms / 1000 * 4,
+        )
     except Exception as exc:
         if ctx is not None:
             _ctx_warning(ctx, f"Playwright-assisted PDF rescue failed for {pdf_url}: {exc}")
         return None
 
-    return None
 
+_PDF_DOWNLOAD_CHUNK = 256 * 1024
+_PDF_DOWNLOAD_MAX_MB = 512.0
 
-def _download_pdf_bytes(pdf_url: str, *, ctx: Context | None = None) -> tuple[bytes, str]:
-    headers = {"User-Agent": "Mozilla/5.0 zotero-mcp/1.0"}
-    errors: list[str] = []
-    request_plans = [
-        {"timeout": (12, 35), "stream": False, "label": "buffered"},
-        {"timeout": (12, 35), "stream": True, "label": "stream"},
-    ]
 
-    for index, plan in enumerate(request_plans, start=1):
+class _PdfDownloadRejected(ValueError):
+    """The response is not a PDF; retrying the same URL will not help."""
+
+
+class _PdfTooLarge(_PdfDownloadRejected):
+    """The PDF is past the download size limit."""
+
+
+def _pdf_download_max_bytes() -> int:
+    try:
+        max_mb = float(os.environ.get("ZOTERO_MCP_PDF_MAX_MB", _PDF_DOWNLOAD_MAX_MB))
+    except ValueError:
+        max_mb = _PDF_DOWNLOAD_MAX_MB
+    return int(max_mb * 1024 * 1024)
+
+
+def _content_range_start(response) -> int | None:
+    match = re.match(r"bytes\s+(\d+)-", str(response.headers.get("Content-Range") or ""))
+    return int(match.group(1)) if match else None
+
+
+def _download_pdf_to_file(
+    pdf_url: str,
+    dest: Path,
+    *,
+    ctx: Context | None = None,
+    max_bytes: int | None = None,
+) -> tuple[int, str]:
+    """
+    Stream `pdf_url` into `dest` and return (size in bytes, content type).
+
+    The first chunk must look like a PDF (or be served as application/pdf),
+    so HTML error pages are dropped before anything else is read, and the
+    download stops once it passes `max_bytes` (ZOTERO_MCP_PDF_MAX_MB). A
+    retry resumes from the bytes already on disk with an HTTP Range request
+    when the server honours it.
+    """
+    limit = max_bytes if max_bytes is not None else _pdf_download_max_bytes()
+    headers = {"User-Agent": http_client.BROWSER_USER_AGENT}
+    errors: list[str] = []
+    attempts = 2
+    written = 0
+
+    for attempt in range(1, attempts + 1):
+        request_headers = dict(headers)
+        if written:
+            request_headers["Range"] = f"bytes={written}-"
+        response = None
         try:
-            response = requests.get(
+            response = http_client.get(
                 pdf_url,
-                timeout=plan["timeout"],
-                stream=plan["stream"],
-                headers=headers,
+                timeout=(12, 35),
+                stream=True,
+                headers=request_headers,
             )
             response.raise_for_status()
             content_type = response.headers.get("Content-Type", "")
-            if plan["stream"]:
-                first_chunk = b""
-                content = bytearray()
-                for chunk in response.iter_content(chunk_size=8192):
+            resumed = bool(written) and response.status_code == 206 and _content_range_start(response) == written
+            if not resumed:
+                written = 0
+            try:
+                remaining = int(response.headers.get("Content-Length") or 0)
+            except (TypeError, ValueError):
+                remaining = 0
+            if written + remaining > limit:
+                raise _PdfTooLarge(f"PDF is larger than the {limit // (1024 * 1024)} MB limit")
+
+            with dest.open("ab" if resumed else "wb") as handle:
+                for chunk in response.iter_content(chunk_size=_PDF_DOWNLOAD_CHUNK):
                     if not chunk:
                         continue
-                    if not first_chunk:
-                        first_chunk = chunk
-                    content.extend(chunk)
-                pdf_bytes = bytes(content)
-            else:
-                pdf_bytes = response.content or b""
-                first_chunk = pdf_bytes[:16]
-
-            if "application/pdf" not in content_type.lower() and not first_chunk.startswith(b"%PDF"):
-                raise ValueError("response is not a PDF")
-            return pdf_bytes, content_type
+                    if not written and "application/pdf" not in content_type.lower() and not chunk.startswith(b"%PDF"):
+                        raise _PdfDownloadRejected("response is not a PDF")
+                    written += len(chunk)
+                    if written > limit:
+                        raise _PdfTooLarge(f"PDF is larger than the {limit // (1024 * 1024)} MB limit")
+                    handle.write(chunk)
+            if not written:
+                raise _PdfDownloadRejected("response is not a PDF")
+            return written, content_type
+        except _PdfTooLarge as exc:
+            dest.unlink(missing_ok=True)
+            raise RuntimeError(f"attempt {attempt}: {exc}") from exc
+        except _PdfDownloadRejected as exc:
+            # An HTML or error page; the browser rescue below may still find the PDF.
+            errors.append(f"attempt {attempt}: {exc}")
+            break
         except Exception as exc:
-            errors.append(f"{plan['label']} attempt {index}: {exc}")
-            if index < len(request_plans):
+            errors.append(f"attempt {attempt}: {exc}")
+            if attempt < attempts:
                 time.sleep(1.0)
+        finally:
+            # Release the pooled connection even when the body was not read to the end.
+            if response is not None:
+                response.close()
 
+    dest.unlink(missing_ok=True)
     if ctx is not None:
         _ctx_warning(
             ctx,
@@ -4763,11 +5332,21 @@ def _download_pdf_bytes(pdf_url: str, *, ctx: Context | None = None) -> tuple[by
         )
     playwright_result = _download_pdf_bytes_via_playwright(pdf_url, ctx=ctx)
     if playwright_result is not None:
-        return playwright_result
+        pdf_bytes, content_type = playwright_result
+        dest.write_bytes(pdf_bytes)
+        return len(pdf_bytes), content_type
 
     raise RuntimeError("; ".join(errors) if errors else "failed to download PDF")
 
 
+def _download_pdf_bytes(pdf_url: str, *, ctx: Context | None = None) -> tuple[bytes, str]:
+    """Download a PDF into memory; only for callers that parse the whole file anyway."""
+    with tempfile.TemporaryDirectory(prefix="zotero-mcp-") as tmpdir:
+        dest = Path(tmpdir) / "download.pdf"
+        _, content_type = _download_pdf_to_file(pdf_url, dest, ctx=ctx)
+        return dest.read_bytes(), content_type
+
+
 def _attach_pdf_from_url(
     zot,
     item_key: str,
@@ -4822,16 +5401,15 @@ def _attach_pdf_from_url(
                     "downloading PDF bytes directly"
                 )
 
-        ctx.info(f"Downloading PDF from {pdf_url}")
-        pdf_bytes, _ = _download_pdf_bytes(pdf_url, ctx=ctx)
         with tempfile.TemporaryDirectory(prefix="zotero-mcp-") as tmpdir:
             tmp_path = Path(tmpdir) / filename
-            tmp_path.write_bytes(pdf_bytes)
+            ctx.info(f"Downloading PDF from {pdf_url}")
+            pdf_size, _ = _download_pdf_to_file(pdf_url, tmp_path, ctx=ctx)
             try:
                 if _should_prefer_local_pdf_after_download(
                     zot,
                     item_payload=parent_payload,
-                    pdf_size_bytes=len(pdf_bytes),
+                    pdf_size_bytes=pdf_size,
                 ):
                     ctx.info("Preferring local Zotero PDF handling after download")
                     connector_result = _save_pdf_via_local_connector_copy(
@@ -4917,6 +5495,19 @@ def _attach_pdf_from_url(
         }
 
 
+def _discover_unpaywall_pdf_candidate(doi: str, email: str) -> dict[str, str] | None:
+    resp = http_client.cached_get(
+        f"https://api.unpaywall.org/v2/{doi}",
+        params={"email": email},
+    )
+    resp.raise_for_status()
+    best = resp.json().get("best_oa_location") or {}
+    pdf_url = best.get("url_for_pdf") or best.get("url")
+    if not pdf_url:
+        return None
+    return {"source": "unpaywall", "url": pdf_url}
+
+
 def _attach_unpaywall_pdf(
     zot,
     doi: str,
@@ -4925,16 +5516,8 @@ def _attach_unpaywall_pdf(
     ctx: Context,
 ) -> dict[str, Any]:
     try:
-        resp = requests.get(
-            f"https://api.unpaywall.org/v2/{doi}",
-            params={"email": email},
-            timeout=15,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        best = data.get("best_oa_location") or {}
-        pdf_url = best.get("url_for_pdf") or best.get("url")
-        if not pdf_url:
+        candidate = _discover_unpaywall_pdf_candidate(doi, email)
+        if not candidate:
             return {
                 "success": False,
                 "pdf_source": "unpaywall",
@@ -4943,9 +5526,9 @@ def _attach_unpaywall_pdf(
         return _attach_pdf_from_url(
             zot,
             item_key,
-            pdf_url,
+            candidate["url"],
             ctx=ctx,
-            source="unpaywall",
+            source=candidate["source"],
         )
     except Exception as exc:
         return {
@@ -4955,22 +5538,26 @@ def _attach_unpaywall_pdf(
         }
 
 
-def _discover_openalex_pdf_candidate(doi: str) -> dict[str, str] | None:
-    resp = requests.get(
-        "https://api.openalex.org/works",
-        params={
-            "filter": f"doi:{doi}",
-            "per-page": 1,
-            "select": "best_oa_location,primary_location,open_access",
-        },
-        timeout=15,
-    )
-    resp.raise_for_status()
-    results = (resp.json() or {}).get("results") or []
-    if not results:
-        return None
+def _discover_openalex_pdf_candidate(
+    doi: str,
+    *,
+    work: dict[str, Any] | None = None,
+) -> dict[str, str] | None:
+    if work is None:
+        resp = http_client.cached_get(
+            "https://api.openalex.org/works",
+            params={
+                "filter": f"doi:{doi}",
+                "per-page": 1,
+                "select": "best_oa_location,primary_location,open_access",
+            },
+        )
+        resp.raise_for_status()
+        results = (resp.json() or {}).get("results") or []
+        if not results:
+            return None
+        work = results[0] or {}
 
-    work = results[0] or {}
     location_candidates = [
         ("openalex:best_oa_location", work.get("best_oa_location") or {}),
         ("openalex:primary_location", work.get("primary_location") or {}),
@@ -4990,15 +5577,14 @@ def _discover_openalex_pdf_candidate(doi: str) -> dict[str, str] | None:
 
 
 def _discover_europepmc_fulltext_candidate(doi: str) -> dict[str, str] | None:
-    resp = requests.get(
+    resp = http_client.cached_get(
         "https://www.ebi.ac.uk/europepmc/webservices/rest/search",
         params={
             "query": f"DOI:{doi}",
             "format": "json",
             "pageSize": 1,
         },
-        timeout=15,
-        headers={"User-Agent": "Mozilla/5.0 zotero-mcp/1.0"},
+        headers={"User-Agent": http_client.BROWSER_USER_AGENT},
     )
     resp.raise_for_status()
     results = ((resp.json() or {}).get("resultList") or {}).get("result") or []
@@ -5033,10 +5619,9 @@ def _clean_plaintext_for_pdf(text: str) -> str:
 
 
 def _extract_europepmc_fulltext_lines(pmcid: str) -> list[str]:
-    resp = requests.get(
+    resp = http_client.cached_get(
         f"https://www.ebi.ac.uk/europepmc/webservices/rest/{pmcid}/fullTextXML",
-        timeout=20,
-        headers={"User-Agent": "Mozilla/5.0 zotero-mcp/1.0"},
+        headers={"User-Agent": http_client.BROWSER_USER_AGENT},
     )
     resp.raise_for_status()
 
@@ -5288,9 +5873,12 @@ def _attach_europepmc_fulltext_pdf(
     doi: str,
     item_key: str,
     ctx: Context,
+    *,
+    candidate: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     try:
-        candidate = _discover_europepmc_fulltext_candidate(doi)
+        if candidate is None:
+            candidate = _discover_europepmc_fulltext_candidate(doi)
         if not candidate:
             return {
                 "success": False,
@@ -5369,10 +5957,8 @@ def _attach_crossref_metadata_surrogate_pdf(
 ) -> dict[str, Any]:
     try:
         if work is None:
-            resp = requests.get(
+            resp = http_client.cached_get(
                 f"https://api.crossref.org/works/{doi}",
-                headers={"User-Agent": "zotero-mcp/1.0 (mailto:user@example.com)"},
-                timeout=15,
             )
             resp.raise_for_status()
             work = resp.json().get("message", {})
@@ -5452,9 +6038,11 @@ def _attach_openalex_pdf(
     doi: str,
     item_key: str,
     ctx: Context,
+    *,
+    work: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     try:
-        candidate = _discover_openalex_pdf_candidate(doi)
+        candidate = _discover_openalex_pdf_candidate(doi, work=work)
         if not candidate:
             return {
                 "success": False,
@@ -5476,6 +6064,218 @@ def _attach_openalex_pdf(
         }
 
 
+def _pdf_cascade_mode() -> str:
+    mode = os.environ.get("ZOTERO_MCP_PDF_CASCADE", "parallel").strip().lower()
+    return "serial" if mode == "serial" else "parallel"
+
+
+_PDF_PROBE_TIMEOUT = (5, 10)
+_PDF_PROBE_WORKERS = 6
+
+
+def _is_name_resolution_error(exc: BaseException) -> bool:
+    """True when a connection error comes from DNS, not from the host itself."""
+    seen: set[int] = set()
+    pending: list[Any] = [exc]
+    while pending:
+        current = pending.pop()
+        if current is None or id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, (socket.gaierror, urllib3.exceptions.NameResolutionError)):
+            return True
+        if isinstance(current, BaseException):
+            pending.extend([current.__cause__, current.__context__, getattr(current, "reason", None)])
+            pending.extend(arg for arg in current.args if isinstance(arg, BaseException))
+    return False
+
+
+def _probe_pdf_candidate(pdf_url: str) -> dict[str, Any]:
+    """
+    Cheaply check whether `pdf_url` serves a PDF.
+
+    Fetches the first KB with a Range request and looks at the status, the
+    content type and the `%PDF` magic. The verdict is "pdf", "dead" (404/410,
+    host name does not resolve) or "unknown" for anything a full download or
+    the Playwright rescue may still get past, such as landing pages, 403s,
+    timeouts and refused or reset connections.
+    """
+    try:
+        response = http_client.get(
+            pdf_url,
+            headers={
+                "User-Agent": http_client.BROWSER_USER_AGENT,
+                "Accept": "application/pdf,*/*",
+                "Range": "bytes=0-1023",
+            },
+            timeout=_PDF_PROBE_TIMEOUT,
+            stream=True,
+        )
+    except requests.Timeout as exc:
+        return {"verdict": "unknown", "reason": f"probe timed out: {exc}", "size": None}
+    except requests.ConnectionError as exc:
+        if _is_name_resolution_error(exc):
+            return {"verdict": "dead", "reason": f"host does not resolve: {exc}", "size": None}
+        return {"verdict": "unknown", "reason": f"connection failed: {exc}", "size": None}
+    except Exception as exc:
+        return {"verdict": "unknown", "reason": f"probe failed: {exc}", "size": None}
+
+    try:
+        status_code = int(getattr(response, "status_code", 200) or 200)
+        headers = getattr(response, "headers", None) or {}
+        content_type = str(headers.get("Content-Type", "") or "")
+        size = None
+        content_range = str(headers.get("Content-Range", "") or "")
+        if "/" in content_range and content_range.rsplit("/", 1)[1].isdigit():
+            size = int(content_range.rsplit("/", 1)[1])
+        elif status_code == 200 and str(headers.get("Content-Length", "")).isdigit():
+            size = int(headers["Content-Length"])
+
+        if status_code in {404, 410}:
+            return {"verdict": "dead", "reason": f"HTTP {status_code}", "size": size}
+        if status_code >= 400:
+            return {"verdict": "unknown", "reason": f"HTTP {status_code}", "size": size}
+
+        first_chunk = b""
+        for chunk in response.iter_content(chunk_size=1024):
+            if chunk:
+                first_chunk = chunk
+                break
+        if first_chunk.lstrip().startswith(b"%PDF"):
+            return {"verdict": "pdf", "reason": "PDF magic", "size": size}
+        return {
+            "verdict": "unknown",
+            "reason": f"not a PDF yet ({content_type or 'no content type'})",
+            "size": size,
+        }
+    except Exception as exc:
+        return {"verdict": "unknown", "reason": f"probe failed: {exc}", "size": None}
+    finally:
+        with suppress(Exception):
+            response.close()
+
+
+def _race_pdf_candidates(
+    zot,
+    item_key: str,
+    *,
+    pdf_candidates: list[dict[str, str]],
+    doi: str | None,
+    email: str,
+    ctx: Context,
+    openalex_work: dict[str, Any] | None = None,
+) -> tuple[dict[str, Any] | None, list[str], dict[str, str] | None]:
+    """
+    Parallel front half of the PDF cascade.
+
+    Probes every candidate URL and runs the Unpaywall, OpenAlex and Europe PMC
+    lookups concurrently, then downloads from the first verified candidate in
+    priority order (explicit hints, Unpaywall, OpenAlex). Candidates whose
+    probe was inconclusive are tried afterwards in the same order; dead ones
+    are skipped. Outstanding probes are cancelled once a PDF is attached.
+
+    Returns (attach result or None, failure messages, Europe PMC candidate).
+    """
+    failures: list[str] = []
+    pool = ThreadPoolExecutor(max_workers=_PDF_PROBE_WORKERS, thread_name_prefix="zotero-pdf-probe")
+    try:
+        probes: dict[str, Any] = {}
+
+        def probe(candidate: dict[str, str]) -> Any:
+            url = candidate["url"]
+            if url not in probes:
+                probes[url] = pool.submit(_probe_pdf_candidate, url)
+            return probes[url]
+
+        ranked = [(candidate, probe(candidate)) for candidate in pdf_candidates]
+        lookups: dict[str, Any] = {}
+        if doi:
+            if email:
+                lookups["unpaywall"] = pool.submit(_discover_unpaywall_pdf_candidate, doi, email)
+            lookups["openalex"] = pool.submit(
+                _discover_openalex_pdf_candidate, doi, work=openalex_work
+            )
+            lookups["europepmc"] = pool.submit(_discover_europepmc_fulltext_candidate, doi)
+        if ranked or lookups:
+            ctx.info(
+                f"Probing {len(ranked)} PDF candidate(s) and {len(lookups)} OA service(s) in parallel"
+            )
+
+        deferred: list[dict[str, str]] = []
+        attempted: set[str] = set()
+
+        def try_ranked(candidate: dict[str, str], future: Any) -> dict[str, Any] | None:
+            if candidate["url"] in attempted:
+                return None
+            verdict = future.result()
+            if verdict["verdict"] == "dead":
+                attempted.add(candidate["url"])
+                failures.append(f"PDF candidate from {candidate['source']} is unavailable: {verdict['reason']}")
+                return None
+            if verdict["verdict"] != "pdf":
+                deferred.append(candidate)
+                return None
+            attempted.add(candidate["url"])
+            result = _attach_pdf_from_url(
+                zot,
+                item_key,
+                candidate["url"],
+                ctx=ctx,
+                source=candidate["source"],
+            )
+            if result.get("success"):
+                return result
+            failures.append(result["message"])
+            return None
+
+        for candidate, future in ranked:
+            if (result := try_ranked(candidate, future)) is not None:
+                return result, failures, None
+
+        oa_services = [
+            ("unpaywall", "Unpaywall", f"no OA PDF found for {doi}"),
+            ("openalex", "OpenAlex", f"no OA PDF found via OpenAlex for {doi}"),
+        ]
+        if doi and not email:
+            failures.append("UNPAYWALL_EMAIL not set")
+        for name, label, empty_message in oa_services:
+            if name not in lookups:
+                continue
+            try:
+                candidate = lookups[name].result()
+            except Exception as exc:
+                failures.append(f"PDF attach failed via {label}: {exc}")
+                continue
+            if not candidate:
+                failures.append(empty_message)
+                continue
+            if (result := try_ranked(candidate, probe(candidate))) is not None:
+                return result, failures, None
+
+        for candidate in deferred:
+            if candidate["url"] in attempted:
+                continue
+            attempted.add(candidate["url"])
+            result = _attach_pdf_from_url(
+                zot,
+                item_key,
+                candidate["url"],
+                ctx=ctx,
+                source=candidate["source"],
+            )
+            if result.get("success"):
+                return result, failures, None
+            failures.append(result["message"])
+
+        europepmc_candidate = None
+        if "europepmc" in lookups:
+            with suppress(Exception):
+                europepmc_candidate = lookups["europepmc"].result()
+        return None, failures, europepmc_candidate
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def _attach_pdf_with_cascade(
     zot,
     item_key: str,
@@ -5483,6 +6283,7 @@ def _attach_pdf_with_cascade(
     pdf_candidates: list[dict[str, str]] | None,
     doi: str | None,
     crossref_work: dict[str, Any] | None = None,
+    openalex_work: dict[str, Any] | None = None,
     collection_key: str | None,
     ctx: Context,
 ) -> dict[str, Any]:
@@ -5496,35 +6297,55 @@ def _attach_pdf_with_cascade(
         }
 
     failures: list[str] = []
-    for candidate in pdf_candidates:
-        result = _attach_pdf_from_url(
+    email = os.environ.get("UNPAYWALL_EMAIL", "")
+    europepmc_candidate: dict[str, str] | None = None
+    if _pdf_cascade_mode() == "parallel":
+        result, failures, europepmc_candidate = _race_pdf_candidates(
             zot,
             item_key,
-            candidate["url"],
+            pdf_candidates=pdf_candidates,
+            doi=doi,
+            email=email,
             ctx=ctx,
-            source=candidate["source"],
+            openalex_work=openalex_work,
         )
-        if result.get("success"):
-            return result
-        failures.append(result["message"])
-
-    email = os.environ.get("UNPAYWALL_EMAIL", "")
-    if doi and email:
-        result = _attach_unpaywall_pdf(zot, doi, item_key, email, ctx)
-        if result.get("success"):
+        if result is not None:
             return result
-        failures.append(result["message"])
-    elif doi and not email:
-        failures.append("UNPAYWALL_EMAIL not set")
+    else:
+        for candidate in pdf_candidates:
+            result = _attach_pdf_from_url(
+                zot,
+                item_key,
+                candidate["url"],
+                ctx=ctx,
+                source=candidate["source"],
+            )
+            if result.get("success"):
+                return result
+            failures.append(result["message"])
+
+        if doi and email:
+            result = _attach_unpaywall_pdf(zot, doi, item_key, email, ctx)
+            if result.get("success"):
+                return result
+            failures.append(result["message"])
+        elif doi and not email:
+            failures.append("UNPAYWALL_EMAIL not set")
 
-    if doi:
-        result = _attach_openalex_pdf(zot, doi, item_key, ctx)
-        if result.get("success"):
-            return result
-        failures.append(result["message"])
+        if doi:
+            result = _attach_openalex_pdf(zot, doi, item_key, ctx, work=openalex_work)
+            if result.get("success"):
+                return result
+            failures.append(result["message"])
 
     if doi:
-        result = _attach_europepmc_fulltext_pdf(zot, doi, item_key, ctx)
+        result = _attach_europepmc_fulltext_pdf(
+            zot,
+            doi,
+            item_key,
+            ctx,
+            candidate=europepmc_candidate,
+        )
         if result.get("success"):
             return result
         failures.append(result["message"])
@@ -5726,26 +6547,85 @@ def _record_import_event(
     )
 
 
+def _import_concurrency() -> int:
+    """Number of identifiers imported in parallel (ZOTERO_MCP_IMPORT_CONCURRENCY)."""
+    try:
+        return max(1, int(os.environ.get("ZOTERO_MCP_IMPORT_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
+def _run_import_batch(inputs: list[str], worker, *, key=None) -> list[Any]:
+    """
+    Run `worker` over `inputs` on a bounded thread pool.
+
+    Returns each worker's result in input order. Ledger entries recorded
+    by a worker are buffered and flushed in input order too, so the ledger
+    does not depend on which network call finished first. Inputs that map to
+    the same `key` run one after another, so duplicates in a batch still see
+    each other's items.
+    """
+    workers = min(_import_concurrency(), len(inputs))
+    if workers <= 1:
+        return [worker(value) for value in inputs]
+
+    key_locks: dict[Any, threading.Lock] = {}
+    for value in inputs:
+        key_locks.setdefault(key(value) if key else value, threading.Lock())
+
+    def run(value: str) -> tuple[Any, list[tuple[dict[str, Any], Context | None]]]:
+        entries: list[tuple[dict[str, Any], Context | None]] = []
+        _import_ledger_buffer.entries = entries
+        try:
+            with key_locks[key(value) if key else value]:
+                return worker(value), entries
+        finally:
+            _import_ledger_buffer.entries = None
+
+    outputs: list[Any] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zotero-import") as pool:
+        for future in [pool.submit(run, value) for value in inputs]:
+            result, entries = future.result()
+            for entry, entry_ctx in entries:
+                _append_import_ledger(entry, ctx=entry_ctx)
+            outputs.append(result)
+    return outputs
+
+
+def _throttle_zotero_write(zot) -> None:
+    """Pace writes to the Zotero web API; the local API is not rate limited."""
+    if not getattr(zot, "local", False):
+        http_client.throttle(str(getattr(zot, "endpoint", "") or ""))
+
+
 def _fetch_crossref_work(doi: str) -> dict[str, Any]:
-    resp = requests.get(
+    resp = http_client.cached_get(
         f"https://api.crossref.org/works/{doi}",
-        headers={"User-Agent": "zotero-mcp/1.0 (mailto:user@example.com)"},
-        timeout=15,
     )
     resp.raise_for_status()
     return resp.json().get("message", {})
 
 
-def _create_item_from_doi(
+def _prepare_doi_import(
     zot,
     doi: str,
     *,
     collection_key: str | None,
-    attach_pdf: bool,
     ctx: Context,
     pdf_candidates: list[dict[str, str]] | None = None,
+    work: dict[str, Any] | None = None,
+    openalex_work: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    work = _fetch_crossref_work(doi)
+    """
+    Resolve Crossref metadata for `doi` into an import plan.
+
+    `work` and `openalex_work` are records already fetched by
+    _resolve_metadata_batch; the Crossref record is fetched here otherwise.
+    Returns {"reused": result} when a local copy already exists, otherwise
+    the item template plus what the PDF cascade needs after creation.
+    """
+    if work is None:
+        work = _fetch_crossref_work(doi)
 
     desired_title = work.get("title", [""])[0] or doi
     reused = _reuse_existing_local_copy_for_import(
@@ -5757,7 +6637,7 @@ def _create_item_from_doi(
         ctx=ctx,
     )
     if reused:
-        return reused
+        return {"reused": reused}
 
     item_type = _crossref_item_type(work.get("type"))
     template = zot.item_template(item_type)
@@ -5806,21 +6686,65 @@ def _create_item_from_doi(
     effective_pdf_candidates = _dedupe_pdf_candidates(
         (pdf_candidates or []) + discovered_pdf_candidates
     )
+    return {
+        "route": "doi",
+        "template": template,
+        "doi": doi,
+        "crossref_work": work,
+        "openalex_work": openalex_work,
+        "pdf_candidates": effective_pdf_candidates,
+    }
 
-    create_resp = zot.create_items([template])
-    created = create_resp.get("successful", {})
-    if not created:
-        raise RuntimeError(str(create_resp.get("failed", {})))
 
-    key = list(created.values())[0].get("key", "?")
+def _create_planned_items(zot, plans: list[dict[str, Any]]) -> list[str | Exception]:
+    """
+    Create the parent items for import plans in POSTs of up to 50 items.
+
+    Returns the new item key, or the error, for each plan in order.
+    """
+    outcomes: list[str | Exception] = []
+    create_kwargs: dict[str, Any] = {}
+    # pyzotero releases before the per-call timeout only take the payload.
+    if "timeout" in inspect.signature(zot.create_items).parameters:
+        create_kwargs["timeout"] = _ZOTERO_BATCH_WRITE_TIMEOUT
+    for start in range(0, len(plans), _ZOTERO_WRITE_BATCH_SIZE):
+        chunk = plans[start:start + _ZOTERO_WRITE_BATCH_SIZE]
+        try:
+            _throttle_zotero_write(zot)
+            create_resp = zot.create_items([plan["template"] for plan in chunk], **create_kwargs)
+        except Exception as exc:
+            outcomes.extend(exc for _ in chunk)
+            continue
+        successful = create_resp.get("successful", {})
+        failed = create_resp.get("failed", {})
+        for index in range(len(chunk)):
+            created = successful.get(str(index))
+            if created:
+                outcomes.append(created.get("key", "?"))
+            else:
+                outcomes.append(RuntimeError(str(failed.get(str(index)) or failed)))
+    return outcomes
+
+
+def _finish_planned_import(
+    zot,
+    plan: dict[str, Any],
+    key: str,
+    *,
+    attach_pdf: bool,
+    collection_key: str | None,
+    ctx: Context,
+) -> dict[str, Any]:
+    """Run the PDF cascade for a newly created item and build the import result."""
     pdf_result = {"success": False, "pdf_source": "none", "message": "PDF attachment not requested"}
     if attach_pdf:
         pdf_result = _attach_pdf_with_cascade(
             zot,
             key,
-            pdf_candidates=effective_pdf_candidates,
-            doi=doi,
-            crossref_work=work,
+            pdf_candidates=plan["pdf_candidates"],
+            doi=plan.get("doi"),
+            crossref_work=plan.get("crossref_work"),
+            openalex_work=plan.get("openalex_work"),
             collection_key=collection_key,
             ctx=ctx,
         )
@@ -5828,9 +6752,9 @@ def _create_item_from_doi(
 
     return {
         "success": True,
-        "label": template["title"],
+        "label": plan["template"]["title"],
         "key": effective_key,
-        "route": "doi",
+        "route": plan["route"],
         "pdf_source": pdf_result.get("pdf_source", "none") if pdf_result.get("success") else "none",
         "fallback_reason": "none",
         "pdf_message": pdf_result.get("message", ""),
@@ -5843,32 +6767,286 @@ def _create_item_from_doi(
     }
 
 
-def _fetch_arxiv_entry(arxiv_id: str) -> tuple[Any, dict[str, str]]:
-    import urllib.request
+def _create_item_from_plan(
+    zot,
+    plan: dict[str, Any],
+    *,
+    attach_pdf: bool,
+    collection_key: str | None,
+    ctx: Context,
+) -> dict[str, Any]:
+    if "reused" in plan:
+        return plan["reused"]
+    key = _create_planned_items(zot, [plan])[0]
+    if isinstance(key, Exception):
+        raise key
+    return _finish_planned_import(
+        zot,
+        plan,
+        key,
+        attach_pdf=attach_pdf,
+        collection_key=collection_key,
+        ctx=ctx,
+    )
+
+
+def _format_import_lines(created: dict[str, Any], *, attach_pdf: bool) -> list[str]:
+    lines = [
+        _format_import_result(
+            success=True,
+            label=created["label"],
+            key=created["key"],
+            route=created["route"],
+            pdf_source=created["pdf_source"],
+            fallback_reason=created["fallback_reason"],
+            local_item_key=created.get("local_item_key"),
+        )
+    ]
+    if attach_pdf:
+        _append_import_note(
+            lines,
+            route=created["route"],
+            pdf_source=created["pdf_source"],
+            fallback_reason=created["fallback_reason"],
+            pdf_message=created.get("pdf_message"),
+        )
+    return lines
+
+
+def _import_planned_batch(
+    identifiers: list[str],
+    prepare,
+    *,
+    shared_zot,
+    route: str,
+    attach_pdf: bool,
+    collection_key: str | None,
+    ctx: Context,
+) -> list[str]:
+    """
+    Import a list of identifiers in three phases.
+
+    Metadata for every identifier is resolved first (in parallel), then all
+    new parent items are created in batched POSTs, and only then does each
+    item run its PDF cascade. Repeated identifiers are imported once and
+    report the same result.
+    """
+    unique = list(dict.fromkeys(identifier.lower() for identifier in identifiers))
+    originals = {}
+    for identifier in identifiers:
+        originals.setdefault(identifier.lower(), identifier)
+
+    def failure(identifier: str, error: Exception) -> list[str]:
+        return [
+            _format_import_result(
+                success=False,
+                label=identifier,
+                route=route,
+                pdf_source="none",
+                fallback_reason=f"{route}_import_failed",
+                error=str(error),
+            )
+        ]
+
+    def prepare_one(identifier: str) -> dict[str, Any] | Exception:
+        # pyzotero clients carry per-request state, so each worker thread
+        # uses its own client.
+        zot = get_web_zotero_client() or shared_zot
+        try:
+            return prepare(zot, originals[identifier], collection_key=collection_key, ctx=ctx)
+        except Exception as exc:
+            return exc
+
+    plans = dict(zip(unique, _run_import_batch(unique, prepare_one)))
+    pending = [
+        identifier
+        for identifier in unique
+        if not isinstance(plans[identifier], Exception) and "reused" not in plans[identifier]
+    ]
+    created_keys = dict(
+        zip(pending, _create_planned_items(shared_zot, [plans[identifier] for identifier in pending]))
+    )
+
+    def finish_one(identifier: str) -> list[str]:
+        plan = plans[identifier]
+        if isinstance(plan, Exception):
+            return failure(originals[identifier], plan)
+        if "reused" in plan:
+            return _format_import_lines(plan["reused"], attach_pdf=attach_pdf)
+        key = created_keys[identifier]
+        if isinstance(key, Exception):
+            return failure(originals[identifier], key)
+        zot = get_web_zotero_client() or shared_zot
+        try:
+            created = _finish_planned_import(
+                zot,
+                plan,
+                key,
+                attach_pdf=attach_pdf,
+                collection_key=collection_key,
+                ctx=ctx,
+            )
+        except Exception as exc:
+            return failure(originals[identifier], exc)
+        return _format_import_lines(created, attach_pdf=attach_pdf)
+
+    outcomes = dict(zip(unique, _run_import_batch(unique, finish_one)))
+    return [line for identifier in identifiers for line in outcomes[identifier.lower()]]
+
+
+def _create_item_from_doi(
+    zot,
+    doi: str,
+    *,
+    collection_key: str | None,
+    attach_pdf: bool,
+    ctx: Context,
+    pdf_candidates: list[dict[str, str]] | None = None,
+    work: dict[str, Any] | None = None,
+    openalex_work: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    plan = _prepare_doi_import(
+        zot,
+        doi,
+        collection_key=collection_key,
+        ctx=ctx,
+        pdf_candidates=pdf_candidates,
+        work=work,
+        openalex_work=openalex_work,
+    )
+    return _create_item_from_plan(
+        zot,
+        plan,
+        attach_pdf=attach_pdf,
+        collection_key=collection_key,
+        ctx=ctx,
+    )
+
+
+_ARXIV_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+
+_ARXIV_API_URL = "https://export.arxiv.org/api/query"
+
+
+def _fetch_arxiv_feed(params: dict[str, Any]) -> Any:
     import xml.etree.ElementTree as ET
 
-    url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
-    with urllib.request.urlopen(url, timeout=15) as response:
-        xml_data = response.read()
+    resp = http_client.cached_get(_ARXIV_API_URL, params=params)
+    resp.raise_for_status()
+    return ET.fromstring(resp.content)
 
-    ns = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "arxiv": "http://arxiv.org/schemas/atom",
-    }
-    root = ET.fromstring(xml_data)
-    entry = root.find("atom:entry", ns)
-    return entry, ns
 
+def _fetch_arxiv_entry(arxiv_id: str) -> tuple[Any, dict[str, str]]:
+    root = _fetch_arxiv_feed({"id_list": arxiv_id})
+    return root.find("atom:entry", _ARXIV_NS), _ARXIV_NS
 
-def _create_item_from_arxiv(
+
+_METADATA_BATCH_SIZE = 50
+
+
+def _fetch_crossref_works(dois: list[str]) -> dict[str, dict[str, Any]]:
+    works: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(dois), _METADATA_BATCH_SIZE):
+        chunk = dois[start:start + _METADATA_BATCH_SIZE]
+        resp = http_client.cached_get(
+            "https://api.crossref.org/works",
+            params={"filter": ",".join(f"doi:{doi}" for doi in chunk), "rows": len(chunk)},
+        )
+        resp.raise_for_status()
+        for work in ((resp.json() or {}).get("message") or {}).get("items") or []:
+            if work.get("DOI"):
+                works[str(work["DOI"]).lower()] = work
+    return works
+
+
+def _fetch_openalex_works(dois: list[str]) -> dict[str, dict[str, Any]]:
+    works: dict[str, dict[str, Any]] = {}
+    for start in range(0, len(dois), _METADATA_BATCH_SIZE):
+        chunk = dois[start:start + _METADATA_BATCH_SIZE]
+        resp = http_client.cached_get(
+            "https://api.openalex.org/works",
+            params={
+                "filter": "doi:" + "|".join(chunk),
+                "per-page": len(chunk),
+                "select": "doi,best_oa_location,primary_location,open_access",
+            },
+        )
+        resp.raise_for_status()
+        for work in (resp.json() or {}).get("results") or []:
+            doi = _normalize_doi(str((work or {}).get("doi") or ""))
+            if doi:
+                works[doi.lower()] = work
+    return works
+
+
+def _fetch_arxiv_entries(arxiv_ids: list[str]) -> dict[str, tuple[Any, dict[str, str]]]:
+    entries: dict[str, tuple[Any, dict[str, str]]] = {}
+    for start in range(0, len(arxiv_ids), _METADATA_BATCH_SIZE):
+        chunk = arxiv_ids[start:start + _METADATA_BATCH_SIZE]
+        root = _fetch_arxiv_feed({"id_list": ",".join(chunk), "max_results": len(chunk)})
+        for entry in root.findall("atom:entry", _ARXIV_NS):
+            entry_id = (entry.findtext("atom:id", "", _ARXIV_NS) or "").strip()
+            if "/abs/" not in entry_id:
+                continue
+            versioned = entry_id.split("/abs/", 1)[1].lower()
+            entries[versioned] = (entry, _ARXIV_NS)
+            entries.setdefault(re.sub(r"v\d+$", "", versioned), (entry, _ARXIV_NS))
+    return entries
+
+
+def _resolve_metadata_batch(
+    *,
+    dois: list[str] | None = None,
+    arxiv_ids: list[str] | None = None,
+    openalex: bool = False,
+    ctx: Context | None = None,
+) -> dict[str, dict[str, Any]]:
+    """
+    Resolve many identifiers with one request per service and batch.
+
+    Crossref and OpenAlex take up to 50 DOIs per filter query and arXiv takes
+    a comma-separated id_list. Returns {"crossref": {doi: work}, "openalex":
+    {doi: work}, "arxiv": {id: (entry, ns)}} keyed by lowercased identifier.
+    Identifiers missing from a response, or from a batch that failed, are
+    left out so callers fall back to their single lookups; a lone identifier
+    is never batched.
+    """
+    resolved: dict[str, dict[str, Any]] = {"crossref": {}, "openalex": {}, "arxiv": {}}
+    unique_dois = list(dict.fromkeys(doi.lower() for doi in dois or [] if doi))
+    unique_arxiv = list(dict.fromkeys(arxiv_id.lower() for arxiv_id in arxiv_ids or [] if arxiv_id))
+    batches = []
+    if len(unique_dois) > 1:
+        batches.append(("crossref", _fetch_crossref_works, unique_dois))
+        if openalex:
+            batches.append(("openalex", _fetch_openalex_works, unique_dois))
+    if len(unique_arxiv) > 1:
+        batches.append(("arxiv", _fetch_arxiv_entries, unique_arxiv))
+    for service, fetch, identifiers in batches:
+        try:
+            resolved[service] = fetch(identifiers)
+        except Exception as exc:
+            if ctx is not None:
+                _ctx_warning(ctx, f"Batched {service} lookup failed; falling back to single lookups: {exc}")
+            continue
+        if ctx is not None:
+            ctx.info(f"Resolved {len(resolved[service])}/{len(identifiers)} identifier(s) via batched {service} lookup")
+    return resolved
+
+
+def _prepare_arxiv_import(
     zot,
     arxiv_id: str,
     *,
     collection_key: str | None,
-    attach_pdf: bool,
     ctx: Context,
+    arxiv_entry: tuple[Any, dict[str, str]] | None = None,
 ) -> dict[str, Any]:
-    entry, ns = _fetch_arxiv_entry(arxiv_id)
+    """Resolve arXiv metadata into an import plan (see _prepare_doi_import)."""
+    entry, ns = arxiv_entry or _fetch_arxiv_entry(arxiv_id)
     if entry is None:
         raise RuntimeError(f"{arxiv_id}: not found on arXiv")
 
@@ -5899,7 +7077,7 @@ def _create_item_from_arxiv(
         ctx=ctx,
     )
     if reused:
-        return reused
+        return {"reused": reused}
 
     template = zot.item_template("preprint")
     template["title"] = title or arxiv_id
@@ -5916,41 +7094,40 @@ def _create_item_from_arxiv(
     if collection_key:
         template["collections"] = [collection_key]
 
-    create_resp = zot.create_items([template])
-    created = create_resp.get("successful", {})
-    if not created:
-        raise RuntimeError(str(create_resp.get("failed", {})))
-
-    key = list(created.values())[0].get("key", "?")
-    pdf_result = {"success": False, "pdf_source": "none", "message": "PDF attachment not requested"}
-    if attach_pdf:
-        pdf_result = _attach_pdf_with_cascade(
-            zot,
-            key,
-            pdf_candidates=[{"source": "arxiv_pdf", "url": f"https://arxiv.org/pdf/{arxiv_id}.pdf"}],
-            doi=doi or None,
-            collection_key=collection_key,
-            ctx=ctx,
-        )
-    effective_key = pdf_result.get("promoted_item_key") or key
-
     return {
-        "success": True,
-        "label": template["title"],
-        "key": effective_key,
         "route": "arxiv",
-        "pdf_source": pdf_result.get("pdf_source", "none") if pdf_result.get("success") else "none",
-        "fallback_reason": "none",
-        "pdf_message": pdf_result.get("message", ""),
-        "local_item_key": pdf_result.get("local_item_key"),
-        "actual_selected_collection_id": pdf_result.get("actual_selected_collection_id"),
-        "actual_selected_target": pdf_result.get("actual_selected_target"),
-        "intended_target": pdf_result.get("intended_target"),
-        "reconcile_status": pdf_result.get("reconcile_status"),
-        "reconcile_message": pdf_result.get("reconcile_message"),
+        "template": template,
+        "doi": doi or None,
+        "crossref_work": None,
+        "pdf_candidates": [{"source": "arxiv_pdf", "url": f"https://arxiv.org/pdf/{arxiv_id}.pdf"}],
     }
 
 
+def _create_item_from_arxiv(
+    zot,
+    arxiv_id: str,
+    *,
+    collection_key: str | None,
+    attach_pdf: bool,
+    ctx: Context,
+    arxiv_entry: tuple[Any, dict[str, str]] | None = None,
+) -> dict[str, Any]:
+    plan = _prepare_arxiv_import(
+        zot,
+        arxiv_id,
+        collection_key=collection_key,
+        ctx=ctx,
+        arxiv_entry=arxiv_entry,
+    )
+    return _create_item_from_plan(
+        zot,
+        plan,
+        attach_pdf=attach_pdf,
+        collection_key=collection_key,
+        ctx=ctx,
+    )
+
+
 def _create_webpage_item(
     zot,
     url: str,
@@ -5996,6 +7173,7 @@ def _create_webpage_item(
     if collection_key:
         template["collections"] = [collection_key]
 
+    _throttle_zotero_write(zot)
     create_resp = zot.create_items([template])
     created = create_resp.get("successful", {})
     if not created:
@@ -6031,8 +7209,52 @@ def _create_webpage_item(
     }
 
 
-@mcp.tool(
+def _local_read_backend_enabled() -> bool:
+    """Whether read-only tools should be served from zotero.sqlite.
+
+    ZOTERO_MCP_READ_BACKEND selects the backend:
+    - "auto" (default): use the local database when ZOTERO_LOCAL is enabled
+    - "local" / "sqlite": always try the local database first
+    - "api": always go through the Zotero API
+    """
+    backend = os.environ.get("ZOTERO_MCP_READ_BACKEND", "auto").strip().lower()
+    if backend in {"api", "web", "off"}:
+        return False
+    if backend in {"local", "sqlite", "db"}:
+        return True
+    return os.getenv("ZOTERO_LOCAL", "").lower() in ("true", "yes", "1")
+
+
+def _read_via_local_backend(method: str, *args, ctx: Context | None = None, **kwargs) -> Any | None:
+    """Call a LocalZoteroReader read method for the active library.
+
+    Returns None when the local backend is disabled or cannot serve the
+    request, so callers fall back to the Zotero API.
+    """
+    if not _local_read_backend_enabled():
+        return None
+    try:
+        from zotero_mcp.local_db import LocalBackendUnsupported, LocalZoteroReader
+
+        with LocalZoteroReader() as reader:
+            override = get_active_library()
+            library_id = reader.resolve_library_id(
+                override.get("library_type") or os.getenv("ZOTERO_LIBRARY_TYPE", "user"),
+                override.get("library_id") or os.getenv("ZOTERO_LIBRARY_ID"),
+            )
+            return getattr(reader, method)(*args, library_id=library_id, **kwargs)
+    except LocalBackendUnsupported as exc:
+        if ctx is not None:
+            ctx.info(f"Local read backend cannot serve this request ({exc}); using Zotero API")
+    except Exception as exc:
+        if ctx is not None:
+            ctx.info(f"Local read backend unavailable ({exc}); using Zotero API")
+    return None
+
+
+@_tool(
     name="zotero_search_items",
+    lane="read",
     description="Search for items in your Zotero library, given a query string."
 )
 def search_items(
@@ -6069,14 +7291,24 @@ def search_items(
             tag = []
 
         ctx.info(f"Searching Zotero for '{query}'{tag_condition_str}")
-        zot = get_zotero_client()
 
         if isinstance(limit, str):
             limit = int(limit)
 
-        # Search using the query parameters
-        zot.add_parameters(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
-        results = zot.items()
+        results = _read_via_local_backend(
+            "search_items",
+            query,
+            qmode=qmode,
+            item_type=item_type,
+            limit=limit,
+            tags=tag,
+            ctx=ctx,
+        )
+        if results is None:
+            zot = get_zotero_client()
+            # Search using the query parameters
+            zot.add_parameters(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
+            results = zot.items()
 
         if not results:
             return f"No items found matching query: '{query}'{tag_condition_str}"
@@ -6122,8 +7354,9 @@ def search_items(
         ctx.error(f"Error searching Zotero: {str(e)}")
         return f"Error searching Zotero: {str(e)}"
 
-@mcp.tool(
+@_tool(
     name="zotero_search_by_tag",
+    lane="read",
     description="Search for items in your Zotero library by tag. "
     "Conditions are ANDed, each term supports disjunction (`OR`) and exclusion (`-`)."
 )
@@ -6213,8 +7446,9 @@ def search_by_tag(
         ctx.error(f"Error searching Zotero: {str(e)}")
         return f"Error searching Zotero: {str(e)}"
 
-@mcp.tool(
+@_tool(
     name="zotero_get_item_metadata",
+    lane="read",
     description="Get detailed metadata for a specific Zotero item by its key."
 )
 def get_item_metadata(
@@ -6254,25 +7488,52 @@ def get_item_metadata(
         return f"Error fetching item metadata: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_item_fulltext",
+    lane="work",
     description="Get the full text content of a Zotero item by its key."
 )
 def get_item_fulltext(
     item_key: str,
+    refresh: bool = False,
+    offset: int | str | None = None,
+    max_chars: int | str | None = None,
+    page_start: int | str | None = None,
+    page_end: int | str | None = None,
     *,
     ctx: Context
 ) -> str:
     """
     Get the full text content of a Zotero item.
 
+    Long documents can be read in parts: `offset`/`max_chars` select a slice
+    of the text, and the response ends with the total length and the offset
+    to continue from. For PDFs, `page_start`/`page_end` convert only those
+    pages; combined with `max_chars`, the offset applies within the pages.
+
     Args:
         item_key: Zotero item key/ID
+        refresh: Convert the attachment again instead of reusing cached markdown
+        offset: Character offset to start from (default: 0)
+        max_chars: Maximum number of characters to return (default: all)
+        page_start: First PDF page to convert, 1-based
+        page_end: Last PDF page to convert, inclusive
         ctx: MCP context
 
     Returns:
         Markdown-formatted item full text
     """
+    try:
+        offset = max(int(offset or 0), 0)
+        max_chars = int(max_chars) if max_chars not in (None, "") else None
+        page_start = int(page_start) if page_start not in (None, "") else None
+        page_end = int(page_end) if page_end not in (None, "") else None
+    except (TypeError, ValueError):
+        return "Error: offset, max_chars, page_start and page_end must be integers"
+    if max_chars is not None and max_chars <= 0:
+        max_chars = None
+    page_range = page_start is not None or page_end is not None
+
     try:
         ctx.info(f"Fetching full text for item {item_key}")
         zot = get_zotero_client()
@@ -6292,12 +7553,59 @@ def get_item_fulltext(
 
         ctx.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
 
+        def respond(
+            text: str,
+            heading: str = "Full Text",
+            next_hint: str | None = None,
+            range_args: str | None = None,
+        ) -> str:
+            body = _fulltext_slice(
+                text, offset=offset, max_chars=max_chars, next_hint=next_hint, range_args=range_args
+            )
+            return f"{metadata}\n\n---\n\n## {heading}\n\n{body}"
+
+        if page_range:
+            if attachment.content_type != "application/pdf" and not (
+                attachment.filename or ""
+            ).lower().endswith(".pdf"):
+                return (
+                    f"{metadata}\n\n---\n\nPage ranges are only supported for PDF attachments; "
+                    "use offset/max_chars instead."
+                )
+            with _attachment_file(zot, attachment.key, filename=attachment.filename, ctx=ctx) as file_path:
+                ctx.info(f"Converting pages {page_start or 1}-{page_end or 'end'} of {file_path}")
+                text, first, last, page_count = convert_pdf_pages_to_markdown(
+                    file_path, page_start, page_end
+                )
+            if first > last:
+                return f"{metadata}\n\n---\n\nThe PDF has {page_count} pages; no pages in the requested range."
+            return respond(
+                text,
+                heading=f"Full Text (pages {first}-{last} of {page_count})",
+                # The next call reads a window of the same size, not the rest of the book.
+                next_hint=(
+                    f"page_start={last + 1}, page_end={min(last + (last - first + 1), page_count)}"
+                    if last < page_count
+                    else None
+                ),
+                range_args=f"page_start={first}, page_end={last}",
+            )
+
+        # Markdown converted earlier from the same file is reused unless refresh is set
+        cache = fulltext_cache.get_fulltext_cache()
+        fingerprints = _attachment_fingerprints(attachment)
+        if cache is not None and not refresh:
+            cached_text = cache.lookup(attachment.key, fingerprints)
+            if cached_text is not None:
+                ctx.info("Using cached markdown conversion")
+                return respond(cached_text)
+
         # Try fetching full text from Zotero's full text index first
         try:
             full_text_data = zot.fulltext_item(attachment.key)
             if full_text_data and "content" in full_text_data and full_text_data["content"]:
                 ctx.info("Successfully retrieved full text from Zotero's index")
-                return f"{metadata}\n\n---\n\n## Full Text\n\n{full_text_data['content']}"
+                return respond(full_text_data["content"])
         except Exception as fulltext_error:
             ctx.info(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
 
@@ -6305,15 +7613,23 @@ def get_item_fulltext(
         try:
             ctx.info(f"Attempting to download and convert attachment {attachment.key}")
 
-            # Download the file to a temporary location
-            with tempfile.TemporaryDirectory() as tmpdir:
-                file_path = Path(tmpdir) / (attachment.filename or f"{attachment.key}.pdf")
-                dump_attachment_to_file(zot, attachment.key, file_path, ctx=ctx)
-
+            # Read the local storage copy in place, or download to a temporary location
+            with _attachment_file(zot, attachment.key, filename=attachment.filename, ctx=ctx) as file_path:
                 if file_path.exists():
-                    ctx.info(f"Downloaded file to {file_path}, converting to markdown")
+                    if not fingerprints:
+                        # Nothing identified the file up front; hash the download instead.
+                        fingerprints = [f"md5:{fulltext_cache.file_md5(file_path)}"]
+                        if cache is not None and not refresh:
+                            cached_text = cache.lookup(attachment.key, fingerprints)
+                            if cached_text is not None:
+                                ctx.info("Using cached markdown conversion")
+                                return respond(cached_text)
+                    ctx.info(f"Converting {file_path} to markdown")
                     converted_text = convert_to_markdown(str(file_path))
-                    return f"{metadata}\n\n---\n\n## Full Text\n\n{converted_text}"
+                    # A failed conversion comes back as an error message; retry it next time.
+                    if cache is not None and not converted_text.startswith(CONVERSION_ERROR_PREFIX):
+                        cache.store(attachment.key, fingerprints[0], converted_text)
+                    return respond(converted_text)
                 else:
                     return f"{metadata}\n\n---\n\nFile download failed."
         except Exception as download_error:
@@ -6325,8 +7641,54 @@ def get_item_fulltext(
         return f"Error fetching item full text: {str(e)}"
 
 
-@mcp.tool(
+def _fulltext_slice(
+    text: str,
+    *,
+    offset: int = 0,
+    max_chars: int | None = None,
+    next_hint: str | None = None,
+    range_args: str | None = None,
+) -> str:
+    """
+    Cut `text` to the requested window and append where to continue.
+
+    Without a window the text is returned unchanged. Otherwise a trailing
+    line gives the character range, the total length and the `offset` (or
+    `next_hint`, e.g. the next page) to pass for the following part. When
+    `text` is itself a range (such as pages), `range_args` are repeated
+    before the offset so the next call reads the same text.
+    """
+    if not offset and max_chars is None and next_hint is None:
+        return text
+    total = len(text)
+    start = min(offset, total)
+    end = total if max_chars is None else min(start + max_chars, total)
+    if end < total:
+        cursor = f"{range_args}, offset={end}" if range_args else f"offset={end}"
+        continuation = f"Continue with {cursor}."
+    elif next_hint:
+        continuation = f"Continue with {next_hint}."
+    else:
+        continuation = "End of text."
+    return f"{text[start:end]}\n\n---\n\n_Characters {start}-{end} of {total}. {continuation}_"
+
+
+def _attachment_fingerprints(attachment) -> list[str]:
+    """Identify an attachment's file version without reading it, best match first."""
+    fingerprints = []
+    if attachment.md5:
+        fingerprints.append(f"md5:{attachment.md5}")
+    elif attachment.mtime:
+        fingerprints.append(f"mtime:{attachment.mtime}")
+    local_path = _resolve_local_attachment_path(attachment.key)
+    if local_path is not None and local_path.is_file():
+        fingerprints.append(fulltext_cache.file_fingerprint(local_path))
+    return fingerprints
+
+
+@_tool(
     name="zotero_get_collections",
+    lane="read",
     description="List all collections in your Zotero library."
 )
 def get_collections(
@@ -6346,12 +7708,14 @@ def get_collections(
     """
     try:
         ctx.info("Fetching collections")
-        zot = get_zotero_client()
 
         if isinstance(limit, str):
             limit = int(limit)
 
-        collections = zot.collections(limit=limit)
+        collections = _read_via_local_backend("get_collections", limit, ctx=ctx)
+        if collections is None:
+            zot = get_zotero_client()
+            collections = zot.collections(limit=limit)
 
         # Always return the header, even if empty
         output = ["# Zotero Collections", ""]
@@ -6418,8 +7782,9 @@ def get_collections(
         return f"# Zotero Collections\n\n{error_msg}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_collection_items",
+    lane="read",
     description="Get all items in a specific Zotero collection."
 )
 def get_collection_items(
@@ -6441,20 +7806,32 @@ def get_collection_items(
     """
     try:
         ctx.info(f"Fetching items for collection {collection_key}")
-        zot = get_zotero_client()
-
-        # First get the collection details
-        try:
-            collection = zot.collection(collection_key)
-            collection_name = collection["data"].get("name", "Unnamed Collection")
-        except Exception:
-            collection_name = f"Collection {collection_key}"
 
         if isinstance(limit, str):
             limit = int(limit)
 
-        # Then get the items
-        items = zot.collection_items(collection_key, limit=limit)
+        collection = _read_via_local_backend("get_collection", collection_key, ctx=ctx)
+        items = (
+            _read_via_local_backend("get_collection_items", collection_key, limit, ctx=ctx)
+            if collection is not None
+            else None
+        )
+        if items is None:
+            zot = get_zotero_client()
+
+            # First get the collection details
+            try:
+                collection = zot.collection(collection_key)
+            except Exception:
+                collection = None
+
+            # Then get the items
+            items = zot.collection_items(collection_key, limit=limit)
+
+        if collection is not None:
+            collection_name = collection["data"].get("name", "Unnamed Collection")
+        else:
+            collection_name = f"Collection {collection_key}"
         if not items:
             return f"No items found in collection: {collection_name} (Key: {collection_key})"
 
@@ -6488,8 +7865,9 @@ def get_collection_items(
         return f"Error fetching collection items: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_item_children",
+    lane="read",
     description="Get all child items (attachments, notes) for a specific Zotero item."
 )
 def get_item_children(
@@ -6509,17 +7887,29 @@ def get_item_children(
     """
     try:
         ctx.info(f"Fetching children for item {item_key}")
-        zot = get_zotero_client()
 
-        # First get the parent item details
-        try:
-            parent = zot.item(item_key)
+        parent = _read_via_local_backend("get_item", item_key, ctx=ctx)
+        children = (
+            _read_via_local_backend("get_children", item_key, ctx=ctx)
+            if parent is not None
+            else None
+        )
+        if children is None:
+            zot = get_zotero_client()
+
+            # First get the parent item details
+            try:
+                parent = zot.item(item_key)
+            except Exception:
+                parent = None
+
+            # Then get the children
+            children = zot.children(item_key)
+
+        if parent is not None:
             parent_title = parent["data"].get("title", "Untitled Item")
-        except Exception:
+        else:
             parent_title = f"Item {item_key}"
-
-        # Then get the children
-        children = zot.children(item_key)
         if not children:
             return f"No child items found for: {parent_title} (Key: {item_key})"
 
@@ -6602,8 +7992,9 @@ def get_item_children(
         return f"Error fetching item children: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_tags",
+    lane="read",
     description="Get all tags used in your Zotero library."
 )
 def get_tags(
@@ -6623,12 +8014,14 @@ def get_tags(
     """
     try:
         ctx.info("Fetching tags")
-        zot = get_zotero_client()
 
         if isinstance(limit, str):
             limit = int(limit)
 
-        tags = zot.tags(limit=limit)
+        tags = _read_via_local_backend("get_tags", limit, ctx=ctx)
+        if tags is None:
+            zot = get_zotero_client()
+            tags = zot.tags(limit=limit)
         if not tags:
             return "No tags found in your Zotero library."
 
@@ -6656,8 +8049,9 @@ def get_tags(
         return f"Error fetching tags: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_list_libraries",
+    lane="read",
     description="List all accessible Zotero libraries (user library, group libraries, and RSS feeds). Use this to discover available libraries before switching with zotero_switch_library.",
 )
 def list_libraries(*, ctx: Context) -> str:
@@ -6764,8 +8158,9 @@ def list_libraries(*, ctx: Context) -> str:
         return f"Error listing libraries: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_switch_library",
+    lane="read",
     description="Switch the active Zotero library context. All subsequent tool calls will operate on the selected library. Use zotero_list_libraries first to see available options. Pass library_type='default' to reset to the original environment variable configuration.",
 )
 def switch_library(
@@ -6875,8 +8270,9 @@ def validate_library_switch(library_id: str, library_type: str) -> str | None:
     return None
 
 
-@mcp.tool(
+@_tool(
     name="zotero_list_feeds",
+    lane="read",
     description="List all RSS feed subscriptions in your local Zotero installation. Shows feed names, URLs, item counts, and last check times. Local mode only.",
 )
 def list_feeds(*, ctx: Context) -> str:
@@ -6923,8 +8319,9 @@ def list_feeds(*, ctx: Context) -> str:
         return f"Error listing feeds: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_feed_items",
+    lane="read",
     description="Get items from a specific RSS feed by its library ID. Use zotero_list_feeds first to find feed library IDs. Local mode only.",
 )
 def get_feed_items(
@@ -6996,8 +8393,9 @@ def get_feed_items(
         return f"Error fetching feed items: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_recent",
+    lane="read",
     description="Get recently added items to your Zotero library."
 )
 def get_recent(
@@ -7017,7 +8415,6 @@ def get_recent(
     """
     try:
         ctx.info(f"Fetching {limit} recent items")
-        zot = get_zotero_client()
 
         if isinstance(limit, str):
             limit = int(limit)
@@ -7029,44 +8426,265 @@ def get_recent(
             limit = 100
 
         # Get recent items
-        items = zot.items(limit=limit, sort="dateAdded", direction="desc")
+        items = _read_via_local_backend("get_recent_items", limit, ctx=ctx)
+        if items is None:
+            zot = get_zotero_client()
+            items = zot.items(limit=limit, sort="dateAdded", direction="desc")
         if not items:
             return "No items found in your Zotero library."
 
         # Format items as markdown
         output = [f"# {limit} Most Recently Added Items", ""]
 
-        for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            date_added = data.get("dateAdded", "Unknown")
+        for i, item in enumerate(items, 1):
+            data = item.get("data", {})
+            title = data.get("title", "Untitled")
+            item_type = data.get("itemType", "unknown")
+            date = data.get("date", "No date")
+            key = item.get("key", "")
+            date_added = data.get("dateAdded", "Unknown")
+
+            # Format creators
+            creators = data.get("creators", [])
+            creators_str = format_creators(creators)
+
+            # Build the formatted entry
+            output.append(f"## {i}. {title}")
+            output.append(f"**Type:** {item_type}")
+            output.append(f"**Item Key:** {key}")
+            output.append(f"**Date:** {date}")
+            output.append(f"**Added:** {date_added}")
+            output.append(f"**Authors:** {creators_str}")
+
+            output.append("")  # Empty line between items
+
+        return "\n".join(output)
+
+    except Exception as e:
+        ctx.error(f"Error fetching recent items: {str(e)}")
+        return f"Error fetching recent items: {str(e)}"
+
+
+# The Zotero Web API accepts at most 50 objects per write request.
+_ZOTERO_WRITE_BATCH_SIZE = 50
+# A full batch can take longer than pyzotero's default 30 s to be acknowledged,
+# and a timeout would report items as failed that the server did create.
+_ZOTERO_BATCH_WRITE_TIMEOUT = 60.0
+# Page size cap for item listings (the API rejects limit > 100).
+_ZOTERO_PAGE_SIZE = 100
+
+
+def _search_items_paginated(zot, *, limit: int, **params: Any) -> list[dict[str, Any]]:
+    """Fetch up to `limit` items for a query, following `start` pages of at most 100."""
+    items: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    while len(items) < limit:
+        page_size = min(_ZOTERO_PAGE_SIZE, limit - len(items))
+        zot.add_parameters(**params, limit=page_size, start=len(items))
+        page = zot.items() or []
+        fresh = [item for item in page if item.get("key") not in seen]
+        for item in fresh:
+            seen.add(item.get("key"))
+        items.extend(fresh[: limit - len(items)])
+        if len(page) < page_size or not fresh:
+            break
+    return items
+
+
+def _fetch_items_by_key(zot, keys: list[str]) -> list[dict[str, Any]]:
+    """Fetch items by key, 50 keys per request."""
+    items: list[dict[str, Any]] = []
+    for start in range(0, len(keys), _ZOTERO_WRITE_BATCH_SIZE):
+        chunk = keys[start:start + _ZOTERO_WRITE_BATCH_SIZE]
+        items.extend(zot.items(itemKey=",".join(chunk), limit=len(chunk)) or [])
+    return items
+
+
+def _update_items_batched(
+    zot,
+    items: list[dict[str, Any]],
+    *,
+    reapply=None,
+    ctx: Context,
+    max_conflict_retries: int = 2,
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Write modified items back in version-checked requests of up to 50.
+
+    Each object carries its own `version`, so the API reports conflicts per
+    object. Items rejected with 412 are refetched and, when `reapply` still
+    reports a change for the fresh copy, sent again. Returns the keys that
+    were written and a key -> message map of failures.
+    """
+    updated: list[str] = []
+    failures: dict[str, str] = {}
+    pending = list(items)
+    for attempt in range(max_conflict_retries + 1):
+        conflicted: list[str] = []
+        for start in range(0, len(pending), _ZOTERO_WRITE_BATCH_SIZE):
+            chunk = pending[start:start + _ZOTERO_WRITE_BATCH_SIZE]
+            keys = [item.get("key") or item["data"].get("key", "") for item in chunk]
+            try:
+                _throttle_zotero_write(zot)
+                zot.update_items([item["data"] for item in chunk])
+            except Exception as exc:
+                for key in keys:
+                    failures[key] = str(exc)
+                continue
+
+            # pyzotero keeps the last write response; its body reports the
+            # outcome per object index.
+            outcome: dict[str, Any] = {}
+            with suppress(Exception):
+                outcome = zot.request.json() or {}
+            failed = outcome.get("failed") or {}
+            for index, key in enumerate(keys):
+                entry = failed.get(str(index))
+                if entry is None:
+                    updated.append(key)
+                elif entry.get("code") == 412 and reapply is not None:
+                    conflicted.append(key)
+                else:
+                    failures[key] = str(entry.get("message") or f"HTTP {entry.get('code')}")
+        if not conflicted:
+            break
+        if attempt == max_conflict_retries:
+            for key in conflicted:
+                failures[key] = "item was modified concurrently (412 Precondition Failed)"
+            break
+        ctx.info(f"Refetching {len(conflicted)} item(s) after version conflicts")
+        try:
+            fresh_items = _fetch_items_by_key(zot, conflicted)
+        except Exception as exc:
+            for key in conflicted:
+                failures[key] = f"refetch after version conflict failed: {exc}"
+            break
+        fresh_keys = {item.get("key") for item in fresh_items}
+        for key in conflicted:
+            if key not in fresh_keys:
+                failures[key] = "item disappeared after version conflict"
+        pending = [item for item in fresh_items if reapply(item)]
+    return updated, failures
+
+
+def _fetch_items_for_write(
+    zot,
+    keys: list[str],
+) -> tuple[dict[str, dict[str, Any]], dict[str, str], int | None]:
+    """
+    Fetch items by key in itemKey= batches of 50 before a bulk write.
+
+    A batch that fails as a whole is retried key by key, so one bad key only
+    fails itself. Returns (key -> item, key -> error, library version seen
+    by the last batch request).
+    """
+    found: dict[str, dict[str, Any]] = {}
+    errors: dict[str, str] = {}
+    library_version: int | None = None
+    unique_keys = list(dict.fromkeys(keys))
+    for start in range(0, len(unique_keys), _ZOTERO_WRITE_BATCH_SIZE):
+        chunk = unique_keys[start:start + _ZOTERO_WRITE_BATCH_SIZE]
+        try:
+            for item in zot.items(itemKey=",".join(chunk), limit=len(chunk)) or []:
+                found[item.get("key") or item["data"].get("key")] = item
+            library_version = _last_library_version(zot) or library_version
+        except Exception:
+            for key in chunk:
+                try:
+                    found[key] = zot.item(key)
+                except Exception as exc:
+                    errors[key] = str(exc)
+        for key in chunk:
+            if key not in found and key not in errors:
+                errors[key] = "item not found"
+    return found, errors, library_version
+
+
+def _last_library_version(zot, response: Any = None) -> int | None:
+    """Library version reported by `response`, or by the client's last response."""
+    if response is None:
+        response = getattr(zot, "request", None)
+    headers = getattr(response, "headers", None) or {}
+    with suppress(TypeError, ValueError):
+        return int(headers.get("last-modified-version"))
+    return None
 
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
 
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Added:** {date_added}")
-            output.append(f"**Authors:** {creators_str}")
+def _current_library_version(zot) -> int | None:
+    """Ask the server for the library version; None when it cannot be read."""
+    fetch_version = getattr(zot, "last_modified_version", None)
+    if fetch_version is None:
+        return None
+    try:
+        return int(fetch_version())
+    except Exception:
+        return None
 
-            output.append("")  # Empty line between items
 
-        return "\n".join(output)
+def _delete_items_batched(
+    zot,
+    items: list[dict[str, Any]],
+    *,
+    library_version: int | None,
+    ctx: Context,
+) -> tuple[list[str], dict[str, str]]:
+    """
+    Delete items with the multi-key endpoint, 50 keys per request.
 
-    except Exception as e:
-        ctx.error(f"Error fetching recent items: {str(e)}")
-        return f"Error fetching recent items: {str(e)}"
+    Each request sends If-Unmodified-Since-Version with the library version:
+    first the one the items were read at, then the one returned by the
+    previous delete. On 412 the batch is refetched and retried once. If the
+    library version cannot be read, items are deleted one by one against
+    their own versions.
+    """
+    deleted: list[str] = []
+    failures: dict[str, str] = {}
+    version = library_version
+    for start in range(0, len(items), _ZOTERO_WRITE_BATCH_SIZE):
+        chunk = items[start:start + _ZOTERO_WRITE_BATCH_SIZE]
+        keys = [item.get("key") or item["data"].get("key") for item in chunk]
+        for attempt in range(2):
+            if version is None:
+                version = _current_library_version(zot)
+            if version is None:
+                for item, key in zip(chunk, keys):
+                    try:
+                        _throttle_zotero_write(zot)
+                        zot.delete_item(item)
+                        deleted.append(key)
+                    except Exception as exc:
+                        failures[key] = str(exc)
+                break
+            try:
+                _throttle_zotero_write(zot)
+                response = zot.delete_item(chunk, last_modified=version)
+                deleted.extend(keys)
+                # Every delete bumps the library version; the next batch needs the new one.
+                version = _last_library_version(zot, response)
+                break
+            except zotero_errors.PreConditionFailedError as exc:
+                if attempt == 0:
+                    ctx.info(f"Library changed during delete; refetching {len(keys)} item(s)")
+                    refetched, errors, version = _fetch_items_for_write(zot, keys)
+                    failures.update(errors)
+                    chunk = [refetched[key] for key in keys if key in refetched]
+                    keys = [key for key in keys if key in refetched]
+                    if not chunk:
+                        break
+                    continue
+                for key in keys:
+                    failures[key] = str(exc)
+                break
+            except Exception as exc:
+                for key in keys:
+                    failures[key] = str(exc)
+                break
+    return deleted, failures
 
 
-@mcp.tool(
+@_tool(
     name="zotero_batch_update_tags",
+    lane="work",
     description="Batch update tags across multiple items matching a search query."
 )
 def batch_update_tags(
@@ -7142,75 +8760,70 @@ def batch_update_tags(
         if isinstance(limit, str):
             limit = int(limit)
 
-        # Search for items matching the query
-        zot.add_parameters(q=query, limit=limit)
-        items = zot.items()
+        items = _search_items_paginated(zot, q=query, limit=limit)
 
         if not items:
             return f"No items found matching query: '{query}'"
 
         # Initialize counters
-        updated_count = 0
         skipped_count = 0
         added_tag_counts = {tag: 0 for tag in (add_tags or [])}
         removed_tag_counts = {tag: 0 for tag in (remove_tags or [])}
+        # Per-item tag changes, recomputed if an item is refetched after a
+        # version conflict; only items that were written get counted.
+        changes: dict[str, tuple[list[str], list[str]]] = {}
 
-        # Process each item
+        def apply_tag_changes(item: dict[str, Any]) -> bool:
+            key = item.get("key") or item["data"].get("key", "")
+            current_tags = item["data"].get("tags", [])
+            current_tag_values = {t["tag"] for t in current_tags}
+            removed = [t["tag"] for t in current_tags if t["tag"] in remove_tags]
+            new_tags = [t for t in current_tags if t["tag"] not in remove_tags]
+            added = [tag for tag in add_tags if tag not in current_tag_values]
+            new_tags.extend({"tag": tag} for tag in added)
+            if not added and not removed:
+                changes.pop(key, None)
+                return False
+            item["data"]["tags"] = new_tags
+            changes[key] = (added, removed)
+            return True
+
+        to_update = []
         for item in items:
             # Skip attachments if they were included in the results
             if item["data"].get("itemType") == "attachment":
                 skipped_count += 1
                 continue
-
-            # Get current tags
-            current_tags = item["data"].get("tags", [])
-            current_tag_values = {t["tag"] for t in current_tags}
-
-            # Track if this item needs to be updated
-            needs_update = False
-
-            # Process tags to remove
-            if remove_tags:
-                new_tags = []
-                for tag_obj in current_tags:
-                    tag = tag_obj["tag"]
-                    if tag in remove_tags:
-                        removed_tag_counts[tag] += 1
-                        needs_update = True
-                    else:
-                        new_tags.append(tag_obj)
-                current_tags = new_tags
-
-            # Process tags to add
-            if add_tags:
-                for tag in add_tags:
-                    if tag and tag not in current_tag_values:
-                        current_tags.append({"tag": tag})
-                        added_tag_counts[tag] += 1
-                        needs_update = True
-
-            # Update the item if needed
-            # Since we are logging errors we might as well log the update.
-            if needs_update:
-                try:
-                    item["data"]["tags"] = current_tags
-                    ctx.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
-                    result = zot.update_item(item)
-                    ctx.info(f"Update result: {result}")
-                    updated_count += 1
-                except Exception as e:
-                    ctx.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
-                    # Continue with other items instead of failing completely
-                    skipped_count += 1
+            if apply_tag_changes(item):
+                to_update.append(item)
             else:
                 skipped_count += 1
 
+        updated_keys, failures = _update_items_batched(
+            zot,
+            to_update,
+            reapply=apply_tag_changes,
+            ctx=ctx,
+        )
+        updated_count = len(updated_keys)
+        skipped_count += len(to_update) - updated_count - len(failures)
+        for key in updated_keys:
+            added, removed = changes.get(key, ([], []))
+            for tag in added:
+                added_tag_counts[tag] += 1
+            for tag in removed:
+                removed_tag_counts[tag] += 1
+
         # Format the response
         response = ["# Batch Tag Update Results", ""]
         response.append(f"Query: '{query}'")
         response.append(f"Items processed: {len(items)}")
         response.append(f"Items updated: {updated_count}")
         response.append(f"Items skipped: {skipped_count}")
+        if failures:
+            response.append(f"Items failed: {len(failures)}")
+            for key, message in failures.items():
+                response.append(f"- `{key}`: {message}")
 
         if add_tags:
             response.append("\n## Tags Added")
@@ -7229,8 +8842,9 @@ def batch_update_tags(
         return f"Error in batch tag update: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_advanced_search",
+    lane="read",
     description="Perform an advanced search with multiple criteria."
 )
 def advanced_search(
@@ -7507,14 +9121,21 @@ def advanced_search(
         return f"Error in advanced search: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_annotations",
+    lane="read",
     description="Get all annotations for a specific item or across your entire Zotero library."
 )
 def get_annotations(
     item_key: str | None = None,
     use_pdf_extraction: bool = False,
     limit: int | str | None = None,
+    offset: int | str = 0,
+    color: str | list[str] | None = None,
+    tag: str | list[str] | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    collection_key: str | None = None,
     *,
     ctx: Context
 ) -> str:
@@ -7525,6 +9146,12 @@ def get_annotations(
         item_key: Optional Zotero item key/ID to filter annotations by parent item
         use_pdf_extraction: Whether to attempt direct PDF extraction as a fallback
         limit: Maximum number of annotations to return
+        offset: Number of matching annotations to skip (for paging)
+        color: Hex color(s) or color names (e.g. "yellow") to keep
+        tag: Annotation tag(s) to require
+        since: Only annotations added on or after this date (YYYY-MM-DD)
+        until: Only annotations added on or before this date (YYYY-MM-DD)
+        collection_key: Only annotations on items in this collection (local mode)
         ctx: MCP context
 
     Returns:
@@ -7534,17 +9161,118 @@ def get_annotations(
         item_key=item_key,
         use_pdf_extraction=use_pdf_extraction,
         limit=limit,
+        offset=offset,
+        color=color,
+        tag=tag,
+        since=since,
+        until=until,
+        collection_key=collection_key,
         ctx=ctx
     )
 
+
+def _normalize_annotation_colors(color: str | list[str] | None) -> list[str]:
+    """Accept hex codes or Zotero color names ("yellow"), comma-separated or as a list."""
+    from zotero_mcp.better_bibtex_client import ANNOTATION_COLORS
+
+    by_name = {name.lower(): hex_code for hex_code, name in ANNOTATION_COLORS.items()}
+    values = color.split(",") if isinstance(color, str) else (color or [])
+    colors = []
+    for value in values:
+        value = value.strip().lower()
+        if not value:
+            continue
+        if not value.startswith("#"):
+            value = by_name.get(value, f"#{value}")
+        colors.append(value)
+    return colors
+
+
+def _annotation_matches_filters(
+    data: dict[str, Any],
+    *,
+    colors: list[str],
+    tags: list[str],
+    since: str | None,
+    until: str | None,
+) -> bool:
+    """Client-side counterpart of LocalZoteroReader.get_annotations() filters."""
+    if colors and (data.get("annotationColor") or "").lower() not in colors:
+        return False
+    if tags:
+        names = {t.get("tag") for t in data.get("tags") or []}
+        if not all(t in names for t in tags):
+            return False
+    added = (data.get("dateAdded") or "")[:10]
+    if since and added and added < since[:10]:
+        return False
+    if until and added and added > until[:10]:
+        return False
+    return True
+
+
+def _fetch_parent_titles(zot, keys: list[str]) -> dict[str, str]:
+    """Fetch titles for `keys` with batched itemKey= requests instead of one per key."""
+    titles: dict[str, str] = {}
+    keys = list(dict.fromkeys(k for k in keys if k))
+    for i in range(0, len(keys), 50):
+        batch = keys[i:i + 50]
+        try:
+            for item in zot.items(itemKey=",".join(batch), limit=len(batch)):
+                titles[item.get("key", "")] = item.get("data", {}).get("title", "Untitled")
+        except Exception:
+            continue
+    return titles
+
+
 def _get_annotations(
     item_key: str | None = None,
     use_pdf_extraction: bool = False,
     limit: int | str | None = None,
+    offset: int | str = 0,
+    color: str | list[str] | None = None,
+    tag: str | list[str] | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    collection_key: str | None = None,
     *,
     ctx: Context
 ) -> str:
     try:
+        if isinstance(limit, str):
+            limit = int(limit) if limit.strip() else None
+        offset = int(offset or 0)
+        colors = _normalize_annotation_colors(color)
+        tags = [tag] if isinstance(tag, str) else list(tag or [])
+
+        # Local mode: one SQL query over itemAnnotations with parents joined in
+        local_annotations = _read_via_local_backend(
+            "get_annotations",
+            item_key,
+            colors=colors,
+            tags=tags,
+            since=since,
+            until=until,
+            collection_key=collection_key,
+            limit=limit if limit or item_key else 50,
+            offset=offset,
+            ctx=ctx,
+        )
+        if local_annotations is not None and (
+            local_annotations or not (item_key and use_pdf_extraction)
+        ):
+            ctx.info(f"Retrieved {len(local_annotations)} annotations from the local database")
+            if not local_annotations:
+                return f"No annotations found{f' for item: {item_key}' if item_key else ''}."
+            parent_title = local_annotations[0]["data"].get("_parent_title", "Untitled Item")
+            return _format_annotations(local_annotations, item_key, parent_title)
+
+        if collection_key:
+            return (
+                "Error: Filtering annotations by collection requires the local Zotero "
+                "database (set ZOTERO_LOCAL=true)."
+            )
+
         # Initialize Zotero client
         zot = get_zotero_client()
 
@@ -7695,11 +9423,10 @@ def _get_annotations(
 
                         # Extract annotations from PDFs
                         for attachment in pdf_attachments:
-                            with tempfile.TemporaryDirectory() as tmpdir:
-                                att_key = attachment.get("key", "")
-                                file_path = Path(tmpdir) / f"{att_key}.pdf"
-                                dump_attachment_to_file(zot, att_key, file_path, ctx=ctx)
-
+                            att_key = attachment.get("key", "")
+                            with tempfile.TemporaryDirectory() as tmpdir, _attachment_file(
+                                zot, att_key, filename=f"{att_key}.pdf", ctx=ctx
+                            ) as file_path:
                                 if file_path.exists():
                                     extracted = extract_annotations_from_pdf(str(file_path), tmpdir)
 
@@ -7737,97 +9464,129 @@ def _get_annotations(
 
             # Combine annotations from all sources
             annotations = better_bibtex_annotations + zotero_api_annotations + pdf_annotations
+            annotations = [
+                anno for anno in annotations
+                if _annotation_matches_filters(
+                    anno.get("data", {}), colors=colors, tags=tags, since=since, until=until
+                )
+            ]
+            annotations = annotations[offset:offset + limit if limit else None]
 
         else:
-            # Retrieve all annotations in the library
-            if isinstance(limit, str):
-                limit = int(limit)
-            zot.add_parameters(itemType="annotation", limit=limit or 50)
-            annotations = zot.everything(zot.items())
+            # Retrieve one page of annotations in the library
+            page_size = limit or 50
+            query: dict[str, Any] = {"itemType": "annotation"}
+            if tags:
+                query["tag"] = tags
+            if colors or since or until:
+                # The API cannot filter by color or date, so filter client-side
+                annotations = [
+                    anno for anno in zot.everything(zot.items(**query))
+                    if _annotation_matches_filters(
+                        anno.get("data", {}), colors=colors, tags=[], since=since, until=until
+                    )
+                ][offset:offset + page_size]
+            else:
+                annotations = zot.items(start=offset, limit=page_size, **query)
 
         # Handle no annotations found
         if not annotations:
             return f"No annotations found{f' for item: {parent_title}' if item_key else ''}."
 
-        # Generate markdown output
-        output = [f"# Annotations{f' for: {parent_title}' if item_key else ''}", ""]
+        parent_titles = {} if item_key else _fetch_parent_titles(
+            zot, [anno.get("data", {}).get("parentItem") for anno in annotations]
+        )
+        return _format_annotations(annotations, item_key, parent_title, parent_titles)
 
-        for i, anno in enumerate(annotations, 1):
-            data = anno.get("data", {})
+    except Exception as e:
+        ctx.error(f"Error fetching annotations: {str(e)}")
+        return f"Error fetching annotations: {str(e)}"
 
-            # Annotation details
-            anno_type = data.get("annotationType", "Unknown type")
-            anno_text = data.get("annotationText", "")
-            anno_comment = data.get("annotationComment", "")
-            anno_color = data.get("annotationColor", "")
-            anno_key = anno.get("key", "")
 
-            # Parent item context for library-wide retrieval
-            parent_info = ""
-            if not item_key and (parent_key := data.get("parentItem")):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
-                    parent_info = f" (parent key: {parent_key})"
+def _format_annotations(
+    annotations: list[dict[str, Any]],
+    item_key: str | None,
+    parent_title: str,
+    parent_titles: dict[str, str] | None = None,
+) -> str:
+    """Render annotation payloads as markdown."""
+    parent_titles = parent_titles or {}
+    # Generate markdown output
+    output = [f"# Annotations{f' for: {parent_title}' if item_key else ''}", ""]
+
+    for i, anno in enumerate(annotations, 1):
+        data = anno.get("data", {})
+
+        # Annotation details
+        anno_type = data.get("annotationType", "Unknown type")
+        anno_text = data.get("annotationText", "")
+        anno_comment = data.get("annotationComment", "")
+        anno_color = data.get("annotationColor", "")
+        anno_key = anno.get("key", "")
+
+        # Parent item context for library-wide retrieval
+        parent_info = ""
+        if not item_key and data.get("_parent_title"):
+            parent_info = f" (from \"{data['_parent_title']}\")"
+        elif not item_key and (parent_key := data.get("parentItem")):
+            if parent_key in parent_titles:
+                parent_info = f" (from \"{parent_titles[parent_key]}\")"
+            else:
+                parent_info = f" (parent key: {parent_key})"
 
-            # Annotation source details
-            source_info = ""
-            if data.get("_from_better_bibtex", False):
-                source_info = " (extracted via Better BibTeX)"
-            elif data.get("_from_pdf_extraction", False):
-                source_info = " (extracted directly from PDF)"
-
-            # Attachment context
-            attachment_info = ""
-            if "_attachment_title" in data and data["_attachment_title"]:
-                attachment_info = f" in {data['_attachment_title']}"
-
-            # Build markdown annotation entry
-            output.append(f"## Annotation {i}{parent_info}{attachment_info}{source_info}")
-            output.append(f"**Type:** {anno_type}")
-            output.append(f"**Key:** {anno_key}")
-
-            # Color information
-            if anno_color:
-                output.append(f"**Color:** {anno_color}")
-                if "_color_category" in data and data["_color_category"]:
-                    output.append(f"**Color Category:** {data['_color_category']}")
-
-            # Page information
-            if "_pdf_page" in data:
-                label = data.get("_pageLabel", str(data["_pdf_page"]))
-                output.append(f"**Page:** {data['_pdf_page']} (Label: {label})")
-
-            # Annotation content
-            if anno_text:
-                output.append(f"**Text:** {anno_text}")
-
-            if anno_comment:
-                output.append(f"**Comment:** {anno_comment}")
-
-            # Image annotation
-            if "_image_path" in data and os.path.exists(data["_image_path"]):
-                output.append("**Image:** This annotation includes an image (not displayed in this interface)")
+        # Annotation source details
+        source_info = ""
+        if data.get("_from_better_bibtex", False):
+            source_info = " (extracted via Better BibTeX)"
+        elif data.get("_from_pdf_extraction", False):
+            source_info = " (extracted directly from PDF)"
 
-            # Tags
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+        # Attachment context
+        attachment_info = ""
+        if "_attachment_title" in data and data["_attachment_title"]:
+            attachment_info = f" in {data['_attachment_title']}"
 
-            output.append("")  # Empty line between annotations
+        # Build markdown annotation entry
+        output.append(f"## Annotation {i}{parent_info}{attachment_info}{source_info}")
+        output.append(f"**Type:** {anno_type}")
+        output.append(f"**Key:** {anno_key}")
 
-        return "\n".join(output)
+        # Color information
+        if anno_color:
+            output.append(f"**Color:** {anno_color}")
+            if "_color_category" in data and data["_color_category"]:
+                output.append(f"**Color Category:** {data['_color_category']}")
 
-    except Exception as e:
-        ctx.error(f"Error fetching annotations: {str(e)}")
-        return f"Error fetching annotations: {str(e)}"
+        # Page information
+        if "_pdf_page" in data:
+            label = data.get("_pageLabel", str(data["_pdf_page"]))
+            output.append(f"**Page:** {data['_pdf_page']} (Label: {label})")
+
+        # Annotation content
+        if anno_text:
+            output.append(f"**Text:** {anno_text}")
+
+        if anno_comment:
+            output.append(f"**Comment:** {anno_comment}")
+
+        # Image annotation
+        if "_image_path" in data and os.path.exists(data["_image_path"]):
+            output.append("**Image:** This annotation includes an image (not displayed in this interface)")
+
+        # Tags
+        if tags := data.get("tags"):
+            tag_list = [f"`{tag['tag']}`" for tag in tags]
+            if tag_list:
+                output.append(f"**Tags:** {' '.join(tag_list)}")
+
+        output.append("")  # Empty line between annotations
 
+    return "\n".join(output)
 
-@mcp.tool(
+
+@_tool(
     name="zotero_get_notes",
+    lane="read",
     description="Retrieve notes from your Zotero library, with options to filter by parent item."
 )
 def get_notes(
@@ -7916,8 +9675,9 @@ def get_notes(
         return f"Error fetching notes: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_search_notes",
+    lane="read",
     description="Search for notes across your Zotero library."
 )
 def search_notes(
@@ -8076,8 +9836,9 @@ def search_notes(
         return f"Error searching notes: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_create_note",
+    lane="work",
     description="Create a new note for a Zotero item."
 )
 def create_note(
@@ -8162,8 +9923,9 @@ def create_note(
         return f"Error creating note: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_semantic_search",
+    lane="read",
     description="Prioritized search tool. Perform semantic search over your Zotero library using AI-powered embeddings."
 )
 def semantic_search(
@@ -8298,8 +10060,10 @@ def semantic_search(
         return f"Error in semantic search: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_update_search_database",
+    lane="work",
+    max_concurrency=1,
     description="Update the semantic search database with latest Zotero items."
 )
 def update_search_database(
@@ -8365,8 +10129,9 @@ def update_search_database(
         return f"Error updating search database: {str(e)}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_get_search_database_status",
+    lane="read",
     description="Get status information about the semantic search database."
 )
 def get_search_database_status(*, ctx: Context) -> str:
@@ -8457,8 +10222,9 @@ def _extract_item_key_from_input(value: str) -> str | None:
             return match.group(1)
     return None
 
-@mcp.tool(
+@_tool(
     name="search",
+    lane="read",
     description="ChatGPT-compatible search wrapper. Performs semantic search and returns JSON results."
 )
 def chatgpt_connector_search(
@@ -8501,8 +10267,9 @@ def chatgpt_connector_search(
         return json.dumps({"results": []}, separators=(",", ":"))
 
 
-@mcp.tool(
+@_tool(
     name="fetch",
+    lane="work",
     description="ChatGPT-compatible fetch wrapper. Retrieves fulltext/metadata for a Zotero item by ID."
 )
 def connector_fetch(
@@ -8596,8 +10363,10 @@ def connector_fetch(
 # Write Tools — Group A: Item Creation
 # ─────────────────────────────────────────────────────────────────────────────
 
-@mcp.tool(
+@_tool(
     name="zotero_add_items_by_doi",
+    lane="work",
+    max_concurrency=2,
     description=(
         "Add one or more items to Zotero by DOI. Creates proper paper items first, "
         "then runs the PDF attachment cascade when enabled."
@@ -8629,48 +10398,28 @@ def add_items_by_doi(
         if zot is None:
             return "Error: Web API credentials not configured. Set ZOTERO_API_KEY and ZOTERO_LIBRARY_ID."
 
-        results = []
-        for doi in dois:
-            doi = _normalize_doi(doi) or doi.strip()
+        dois = [_normalize_doi(doi) or doi.strip() for doi in dois]
+        resolved = _resolve_metadata_batch(dois=dois, openalex=attach_pdf, ctx=ctx)
+
+        def prepare(zot, doi: str, **kwargs: Any) -> dict[str, Any]:
             ctx.info(f"Fetching metadata for DOI: {doi}")
-            try:
-                created = _create_item_from_doi(
-                    zot,
-                    doi,
-                    collection_key=collection_key,
-                    attach_pdf=attach_pdf,
-                    ctx=ctx,
-                )
-                results.append(
-                    _format_import_result(
-                        success=True,
-                        label=created["label"],
-                        key=created["key"],
-                        route=created["route"],
-                        pdf_source=created["pdf_source"],
-                        fallback_reason=created["fallback_reason"],
-                        local_item_key=created.get("local_item_key"),
-                    )
-                )
-                if attach_pdf:
-                    _append_import_note(
-                        results,
-                        route=created["route"],
-                        pdf_source=created["pdf_source"],
-                        fallback_reason=created["fallback_reason"],
-                        pdf_message=created.get("pdf_message"),
-                    )
-            except Exception as e:
-                results.append(
-                    _format_import_result(
-                        success=False,
-                        label=doi,
-                        route="doi",
-                        pdf_source="none",
-                        fallback_reason="doi_import_failed",
-                        error=str(e),
-                    )
-                )
+            return _prepare_doi_import(
+                zot,
+                doi,
+                work=resolved["crossref"].get(doi.lower()),
+                openalex_work=resolved["openalex"].get(doi.lower()),
+                **kwargs,
+            )
+
+        results = _import_planned_batch(
+            dois,
+            prepare,
+            shared_zot=zot,
+            route="doi",
+            attach_pdf=attach_pdf,
+            collection_key=collection_key,
+            ctx=ctx,
+        )
 
         return "\n".join(results) if results else "No DOIs processed."
     except Exception as e:
@@ -8678,8 +10427,10 @@ def add_items_by_doi(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_find_and_attach_pdfs",
+    lane="work",
+    max_concurrency=2,
     description=(
         "Repair missing PDFs for existing Zotero items using the same source-aware "
         "PDF cascade as import: landing-page hints first, DOI fallbacks after."
@@ -8709,17 +10460,36 @@ def find_and_attach_pdfs(
         if zot is None:
             return "Error: Web API credentials not configured. Set ZOTERO_API_KEY and ZOTERO_LIBRARY_ID."
 
+        items: dict[str, Any] = {}
+        for key in item_keys:
+            try:
+                items[key] = zot.item(key)
+            except Exception as e:
+                items[key] = e
+        resolved = _resolve_metadata_batch(
+            dois=[
+                item.get("data", {}).get("DOI", "").strip()
+                for item in items.values()
+                if not isinstance(item, Exception)
+            ],
+            openalex=True,
+            ctx=ctx,
+        )
+
         results = []
         for key in item_keys:
             try:
-                item = zot.item(key)
+                item = items[key]
+                if isinstance(item, Exception):
+                    raise item
                 doi = item.get("data", {}).get("DOI", "").strip()
                 url = item.get("data", {}).get("url", "").strip()
                 signals = {"pdf_candidates": []}
-                crossref_work: dict[str, Any] | None = None
+                crossref_work: dict[str, Any] | None = resolved["crossref"].get(doi.lower())
                 if doi:
                     try:
-                        crossref_work = _fetch_crossref_work(doi)
+                        if crossref_work is None:
+                            crossref_work = _fetch_crossref_work(doi)
                         signals["pdf_candidates"] = _dedupe_pdf_candidates(
                             (signals.get("pdf_candidates") or [])
                             + _discover_pdf_candidates_from_crossref_work(
@@ -8746,6 +10516,7 @@ def find_and_attach_pdfs(
                     pdf_candidates=signals.get("pdf_candidates", []),
                     doi=doi or None,
                     crossref_work=crossref_work,
+                    openalex_work=resolved["openalex"].get(doi.lower()),
                     collection_key=(item.get("data", {}).get("collections") or [None])[0],
                     ctx=ctx,
                 )
@@ -8768,8 +10539,9 @@ def find_and_attach_pdfs(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_add_linked_url_attachment",
+    lane="work",
     description="Add a linked URL attachment to an existing Zotero item."
 )
 def add_linked_url_attachment(
@@ -8817,8 +10589,10 @@ def add_linked_url_attachment(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_add_items_by_arxiv",
+    lane="work",
+    max_concurrency=2,
     description=(
         "Add one or more preprints to Zotero by arXiv ID. Uses arXiv metadata "
         "and can attach the canonical arXiv PDF automatically."
@@ -8849,48 +10623,27 @@ def add_items_by_arxiv(
         if zot is None:
             return "Error: Web API credentials not configured. Set ZOTERO_API_KEY and ZOTERO_LIBRARY_ID."
 
-        results = []
-        for raw_id in arxiv_ids:
-            arxiv_id = _normalize_arxiv_id(raw_id) or raw_id.strip()
+        arxiv_ids = [_normalize_arxiv_id(raw_id) or raw_id.strip() for raw_id in arxiv_ids]
+        resolved = _resolve_metadata_batch(arxiv_ids=arxiv_ids, ctx=ctx)
+
+        def prepare(zot, arxiv_id: str, **kwargs: Any) -> dict[str, Any]:
             ctx.info(f"Fetching arXiv metadata for: {arxiv_id}")
-            try:
-                created = _create_item_from_arxiv(
-                    zot,
-                    arxiv_id,
-                    collection_key=collection_key,
-                    attach_pdf=attach_pdf,
-                    ctx=ctx,
-                )
-                results.append(
-                    _format_import_result(
-                        success=True,
-                        label=created["label"],
-                        key=created["key"],
-                        route=created["route"],
-                        pdf_source=created["pdf_source"],
-                        fallback_reason=created["fallback_reason"],
-                        local_item_key=created.get("local_item_key"),
-                    )
-                )
-                if attach_pdf:
-                    _append_import_note(
-                        results,
-                        route=created["route"],
-                        pdf_source=created["pdf_source"],
-                        fallback_reason=created["fallback_reason"],
-                        pdf_message=created.get("pdf_message"),
-                    )
-            except Exception as e:
-                results.append(
-                    _format_import_result(
-                        success=False,
-                        label=arxiv_id,
-                        route="arxiv",
-                        pdf_source="none",
-                        fallback_reason="arxiv_import_failed",
-                        error=str(e),
-                    )
-                )
+            return _prepare_arxiv_import(
+                zot,
+                arxiv_id,
+                arxiv_entry=resolved["arxiv"].get(arxiv_id.lower()),
+                **kwargs,
+            )
+
+        results = _import_planned_batch(
+            arxiv_ids,
+            prepare,
+            shared_zot=zot,
+            route="arxiv",
+            attach_pdf=attach_pdf,
+            collection_key=collection_key,
+            ctx=ctx,
+        )
 
         return "\n".join(results) if results else "No arXiv IDs processed."
     except Exception as e:
@@ -8898,8 +10651,10 @@ def add_items_by_arxiv(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_add_items_by_identifier",
+    lane="work",
+    max_concurrency=2,
     description="Smart import for papers by DOI, arXiv ID, direct PDF URL, or landing-page URL. Prefers proper paper/preprint items before falling back to webpage."
 )
 def add_items_by_identifier(
@@ -8924,20 +10679,22 @@ def add_items_by_identifier(
         if zot is None:
             return "Error: Web API credentials not configured. Set ZOTERO_API_KEY and ZOTERO_LIBRARY_ID."
 
-        results = []
         collection_path = _collection_label(zot, collection_key)
-        for raw_identifier in identifiers:
-            raw_identifier = raw_identifier.strip()
-            if not raw_identifier:
-                continue
+        shared_zot = zot
+        identifiers = [value.strip() for value in identifiers if value.strip()]
+        hints = {value: _identifier_route_hints(value) for value in identifiers}
+        resolved = _resolve_metadata_batch(
+            dois=[doi for doi, _ in hints.values() if doi],
+            arxiv_ids=[arxiv_id for doi, arxiv_id in hints.values() if arxiv_id and not doi],
+            openalex=attach_pdf,
+            ctx=ctx,
+        )
 
+        def import_one(raw_identifier: str) -> list[str]:
+            zot = get_web_zotero_client() or shared_zot
+            lines: list[str] = []
             try:
-                arxiv_hint = _normalize_arxiv_id(raw_identifier)
-                doi_hint = None if arxiv_hint and (
-                    "arxiv.org" in raw_identifier.lower()
-                    or raw_identifier.lower().startswith("arxiv:")
-                    or raw_identifier.lower().startswith("10.48550/arxiv.")
-                ) else _normalize_doi(raw_identifier)
+                doi_hint, arxiv_hint = hints[raw_identifier]
 
                 if doi_hint:
                     created = None
@@ -8952,6 +10709,8 @@ def add_items_by_identifier(
                                 collection_key=collection_key,
                                 attach_pdf=attach_pdf,
                                 ctx=ctx,
+                                work=resolved["crossref"].get(doi_candidate.lower()),
+                                openalex_work=resolved["openalex"].get(doi_candidate.lower()),
                             )
                             resolved_doi = doi_candidate
                             break
@@ -8965,7 +10724,7 @@ def add_items_by_identifier(
                         if last_exc is not None:
                             raise last_exc
                         raise RuntimeError(f"failed to resolve DOI from {raw_identifier}")
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=True,
                             label=created["label"],
@@ -8978,7 +10737,7 @@ def add_items_by_identifier(
                     )
                     if attach_pdf:
                         _append_import_note(
-                            results,
+                            lines,
                             route=created["route"],
                             pdf_source=created["pdf_source"],
                             fallback_reason=created["fallback_reason"],
@@ -9005,7 +10764,7 @@ def add_items_by_identifier(
                         message=created.get("pdf_message"),
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 if arxiv_hint:
                     created = _create_item_from_arxiv(
@@ -9014,8 +10773,9 @@ def add_items_by_identifier(
                         collection_key=collection_key,
                         attach_pdf=attach_pdf,
                         ctx=ctx,
+                        arxiv_entry=resolved["arxiv"].get(arxiv_hint.lower()),
                     )
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=True,
                             label=created["label"],
@@ -9028,7 +10788,7 @@ def add_items_by_identifier(
                     )
                     if attach_pdf:
                         _append_import_note(
-                            results,
+                            lines,
                             route=created["route"],
                             pdf_source=created["pdf_source"],
                             fallback_reason=created["fallback_reason"],
@@ -9055,7 +10815,7 @@ def add_items_by_identifier(
                         message=created.get("pdf_message"),
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 if _looks_like_direct_pdf_url(raw_identifier):
                     pdf_signals = _probe_identifier_from_direct_pdf_url(raw_identifier, ctx=ctx)
@@ -9069,7 +10829,7 @@ def add_items_by_identifier(
                                 ctx=ctx,
                                 pdf_candidates=pdf_signals.get("pdf_candidates"),
                             )
-                            results.append(
+                            lines.append(
                                 _format_import_result(
                                     success=True,
                                     label=created["label"],
@@ -9082,7 +10842,7 @@ def add_items_by_identifier(
                             )
                             if attach_pdf:
                                 _append_import_note(
-                                    results,
+                                    lines,
                                     route=created["route"],
                                     pdf_source=created["pdf_source"],
                                     fallback_reason=created["fallback_reason"],
@@ -9109,7 +10869,7 @@ def add_items_by_identifier(
                                 message=created.get("pdf_message"),
                                 ctx=ctx,
                             )
-                            continue
+                            return lines
 
                         inferred_pdf_doi = _lookup_crossref_doi_for_signals(pdf_signals, ctx=ctx)
                         if inferred_pdf_doi:
@@ -9121,7 +10881,7 @@ def add_items_by_identifier(
                                 ctx=ctx,
                                 pdf_candidates=pdf_signals.get("pdf_candidates"),
                             )
-                            results.append(
+                            lines.append(
                                 _format_import_result(
                                     success=True,
                                     label=created["label"],
@@ -9134,7 +10894,7 @@ def add_items_by_identifier(
                             )
                             if attach_pdf:
                                 _append_import_note(
-                                    results,
+                                    lines,
                                     route=created["route"],
                                     pdf_source=created["pdf_source"],
                                     fallback_reason=created["fallback_reason"],
@@ -9161,7 +10921,7 @@ def add_items_by_identifier(
                                 message=created.get("pdf_message"),
                                 ctx=ctx,
                             )
-                            continue
+                            return lines
 
                         if pdf_signals.get("arxiv_id"):
                             created = _create_item_from_arxiv(
@@ -9171,7 +10931,7 @@ def add_items_by_identifier(
                                 attach_pdf=attach_pdf,
                                 ctx=ctx,
                             )
-                            results.append(
+                            lines.append(
                                 _format_import_result(
                                     success=True,
                                     label=created["label"],
@@ -9184,7 +10944,7 @@ def add_items_by_identifier(
                             )
                             if attach_pdf:
                                 _append_import_note(
-                                    results,
+                                    lines,
                                     route=created["route"],
                                     pdf_source=created["pdf_source"],
                                     fallback_reason=created["fallback_reason"],
@@ -9211,10 +10971,10 @@ def add_items_by_identifier(
                                 message=created.get("pdf_message"),
                                 ctx=ctx,
                             )
-                            continue
+                            return lines
 
                     if fallback_mode == "skip":
-                        results.append(
+                        lines.append(
                             _format_import_result(
                                 success=False,
                                 label=raw_identifier,
@@ -9236,7 +10996,7 @@ def add_items_by_identifier(
                             error="direct PDF has no DOI/arXiv identifier and fallback_mode=skip",
                             ctx=ctx,
                         )
-                        continue
+                        return lines
                     created = _create_webpage_item(
                         zot,
                         raw_identifier,
@@ -9252,7 +11012,7 @@ def add_items_by_identifier(
                         ctx=ctx,
                         fallback_reason="missing_identifier",
                     )
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=True,
                             label=created["label"],
@@ -9265,7 +11025,7 @@ def add_items_by_identifier(
                     )
                     if attach_pdf:
                         _append_import_note(
-                            results,
+                            lines,
                             route=created["route"],
                             pdf_source=created["pdf_source"],
                             fallback_reason=created["fallback_reason"],
@@ -9292,7 +11052,7 @@ def add_items_by_identifier(
                         message=created.get("pdf_message"),
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 signals = _fetch_page_signals(raw_identifier, ctx=ctx)
                 if (
@@ -9347,7 +11107,7 @@ def add_items_by_identifier(
                         ctx=ctx,
                         pdf_candidates=signals.get("pdf_candidates"),
                     )
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=True,
                             label=created["label"],
@@ -9360,7 +11120,7 @@ def add_items_by_identifier(
                     )
                     if attach_pdf:
                         _append_import_note(
-                            results,
+                            lines,
                             route=created["route"],
                             pdf_source=created["pdf_source"],
                             fallback_reason=created["fallback_reason"],
@@ -9387,7 +11147,7 @@ def add_items_by_identifier(
                         message=created.get("pdf_message"),
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 inferred_doi = _lookup_crossref_doi_for_signals(signals, ctx=ctx)
                 if inferred_doi:
@@ -9399,7 +11159,7 @@ def add_items_by_identifier(
                         ctx=ctx,
                         pdf_candidates=signals.get("pdf_candidates"),
                     )
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=True,
                             label=created["label"],
@@ -9412,7 +11172,7 @@ def add_items_by_identifier(
                     )
                     if attach_pdf:
                         _append_import_note(
-                            results,
+                            lines,
                             route=created["route"],
                             pdf_source=created["pdf_source"],
                             fallback_reason=created["fallback_reason"],
@@ -9439,7 +11199,7 @@ def add_items_by_identifier(
                         message=created.get("pdf_message"),
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 if signals.get("arxiv_id"):
                     created = _create_item_from_arxiv(
@@ -9449,7 +11209,7 @@ def add_items_by_identifier(
                         attach_pdf=attach_pdf,
                         ctx=ctx,
                     )
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=True,
                             label=created["label"],
@@ -9461,7 +11221,7 @@ def add_items_by_identifier(
                     )
                     if attach_pdf:
                         _append_import_note(
-                            results,
+                            lines,
                             route=created["route"],
                             pdf_source=created["pdf_source"],
                             fallback_reason=created["fallback_reason"],
@@ -9488,10 +11248,10 @@ def add_items_by_identifier(
                         message=created.get("pdf_message"),
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 if fallback_mode == "skip":
-                    results.append(
+                    lines.append(
                         _format_import_result(
                             success=False,
                             label=raw_identifier,
@@ -9513,7 +11273,7 @@ def add_items_by_identifier(
                         error="no DOI/arXiv identifier detected and fallback_mode=skip",
                         ctx=ctx,
                     )
-                    continue
+                    return lines
 
                 created = _create_webpage_item(
                     zot,
@@ -9530,7 +11290,7 @@ def add_items_by_identifier(
                     ctx=ctx,
                     fallback_reason="missing_identifier",
                 )
-                results.append(
+                lines.append(
                     _format_import_result(
                         success=True,
                         label=created["label"],
@@ -9543,7 +11303,7 @@ def add_items_by_identifier(
                 )
                 if attach_pdf:
                     _append_import_note(
-                        results,
+                        lines,
                         route=created["route"],
                         pdf_source=created["pdf_source"],
                         fallback_reason=created["fallback_reason"],
@@ -9571,7 +11331,7 @@ def add_items_by_identifier(
                     ctx=ctx,
                 )
             except Exception as exc:
-                results.append(
+                lines.append(
                     _format_import_result(
                         success=False,
                         label=raw_identifier,
@@ -9593,6 +11353,13 @@ def add_items_by_identifier(
                     error=str(exc),
                     ctx=ctx,
                 )
+            return lines
+
+        results = [
+            line
+            for lines in _run_import_batch(identifiers, import_one, key=_identifier_batch_key)
+            for line in lines
+        ]
 
         return "\n".join(results) if results else "No identifiers processed."
     except Exception as exc:
@@ -9618,18 +11385,17 @@ def get_import_ledger(
     except (TypeError, ValueError):
         parsed_limit = 20
 
-    entries = _read_import_ledger()
-    if action != "all":
-        entries = [entry for entry in entries if entry.get("action") == action]
-    if status:
-        entries = [entry for entry in entries if entry.get("status") == status]
-    entries = entries[-max(parsed_limit, 0):]
+    entries = _read_import_ledger(
+        parsed_limit if parsed_limit > 0 else None,
+        action=None if action == "all" else action,
+        status=status,
+    )
 
     path = _import_ledger_path()
     if not entries:
         return (
             "No import ledger entries found. "
-            "The ledger file is created automatically on first import/reconcile. "
+            "The ledger database is created automatically on first import/reconcile. "
             "Advanced users can override its location with ZOTERO_MCP_IMPORT_LEDGER_PATH."
         )
 
@@ -9815,8 +11581,10 @@ def reconcile_local_copies(
         return f"Error: {exc}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_reconcile_collection_duplicates",
+    lane="work",
+    max_concurrency=1,
     description=(
         "Reconcile duplicate parent items inside a Zotero collection. "
         "Merges collection memberships onto one canonical item and optionally moves duplicates to trash."
@@ -9901,8 +11669,10 @@ def reconcile_collection_duplicates(
         return f"Error: {exc}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_add_item_by_url",
+    lane="work",
+    max_concurrency=2,
     description="Add a webpage item to Zotero by URL. Fetches the page title and OpenGraph metadata."
 )
 def add_item_by_url(
@@ -9968,8 +11738,9 @@ def add_item_by_url(
 # Write Tools — Group B: Item Modification
 # ─────────────────────────────────────────────────────────────────────────────
 
-@mcp.tool(
+@_tool(
     name="zotero_update_item",
+    lane="work",
     description="Update fields of an existing Zotero item by its item key."
 )
 def update_item(
@@ -10012,8 +11783,9 @@ def update_item(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_update_note",
+    lane="work",
     description="Replace the HTML content of an existing Zotero note item."
 )
 def update_note(
@@ -10058,8 +11830,9 @@ def update_note(
 # Write Tools — Group C: Organization
 # ─────────────────────────────────────────────────────────────────────────────
 
-@mcp.tool(
+@_tool(
     name="zotero_create_collection",
+    lane="work",
     description="Create a new collection in Zotero, optionally nested under a parent collection."
 )
 def create_collection(
@@ -10090,6 +11863,7 @@ def create_collection(
             payload["parentCollection"] = parent_key
 
         resp = zot.create_collections([payload])
+        _invalidate_collection_trees()
         created = resp.get("successful", {})
         if created:
             key = list(created.values())[0].get("key", "?")
@@ -10100,8 +11874,9 @@ def create_collection(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_move_items_to_collection",
+    lane="work",
     description="Add or remove items from a Zotero collection."
 )
 def move_items_to_collection(
@@ -10128,18 +11903,32 @@ def move_items_to_collection(
         if zot is None:
             return "Error: Web API credentials not configured."
 
+        items, errors, _ = _fetch_items_for_write(zot, item_keys)
+
+        def apply_membership(item: dict[str, Any]) -> bool:
+            collections = list(item["data"].get("collections") or [])
+            if action == "add":
+                if collection_key in collections:
+                    return False
+                item["data"]["collections"] = collections + [collection_key]
+            else:
+                if collection_key not in collections:
+                    return False
+                item["data"]["collections"] = [c for c in collections if c != collection_key]
+            return True
+
+        to_update = [items[key] for key in items if apply_membership(items[key])]
+        ctx.info(f"Updating collection membership for {len(to_update)} item(s)")
+        _, failures = _update_items_batched(zot, to_update, reapply=apply_membership, ctx=ctx)
+        errors.update(failures)
+
+        verb = "added to" if action == "add" else "removed from"
         results = []
-        for key in item_keys:
-            try:
-                item = zot.item(key)
-                if action == "add":
-                    zot.addto_collection(collection_key, item)
-                    results.append(f"✓ {key} added to {collection_key}")
-                else:
-                    zot.deletefrom_collection(collection_key, item)
-                    results.append(f"✓ {key} removed from {collection_key}")
-            except Exception as e:
-                results.append(f"✗ {key}: {e}")
+        for key in dict.fromkeys(item_keys):
+            if key in errors:
+                results.append(f"✗ {key}: {errors[key]}")
+            else:
+                results.append(f"✓ {key} {verb} {collection_key}")
 
         return "\n".join(results)
     except Exception as e:
@@ -10147,8 +11936,9 @@ def move_items_to_collection(
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_update_collection",
+    lane="work",
     description="Rename a Zotero collection or change its parent."
 )
 def update_collection(
@@ -10192,14 +11982,16 @@ def update_collection(
 
         col["data"] = data
         zot.update_collection(col)
+        _invalidate_collection_trees()
         return f"✓ Collection {collection_key} updated: {', '.join(changed)}"
     except Exception as e:
         ctx.error(f"Error in update_collection: {e}")
         return f"Error: {e}"
 
 
-@mcp.tool(
+@_tool(
     name="zotero_delete_collection",
+    lane="work",
     description="Delete a Zotero collection. Items inside the collection are NOT deleted — they remain in the library."
 )
 def delete_collection(
@@ -10227,6 +12019,7 @@ def delete_collection(
         ctx.info(f"Deleting collection {collection_key}")
         col = zot.collection(collection_key)
         zot.delete_collection(col)
+        _invalidate_collection_trees()
         return f"✓ Collection {collection_key} deleted."
     except Exception as e:
         ctx.error(f"Error in delete_collection: {e}")
@@ -10237,8 +12030,9 @@ def delete_collection(
 # Write Tools — Group D: Deletion
 # ─────────────────────────────────────────────────────────────────────────────
 
-@mcp.tool(
+@_tool(
     name="zotero_delete_items",
+    lane="work",
     description="Move one or more Zotero items to trash. Items can be restored from the Zotero trash."
 )
 def delete_items(
@@ -10263,14 +12057,21 @@ def delete_items(
         if zot is None:
             return "Error: Web API credentials not configured."
 
+        items, errors, library_version = _fetch_items_for_write(zot, item_keys)
+        _, failures = _delete_items_batched(
+            zot,
+            list(items.values()),
+            library_version=library_version,
+            ctx=ctx,
+        )
+        errors.update(failures)
+
         results = []
-        for key in item_keys:
-            try:
-                item = zot.item(key)
-                zot.delete_item(item)
+        for key in dict.fromkeys(item_keys):
+            if key in errors:
+                results.append(f"✗ {key}: {errors[key]}")
+            else:
                 results.append(f"✓ {key} moved to trash")
-            except Exception as e:
-                results.append(f"✗ {key}: {e}")
 
         return "\n".join(results)
     except Exception as e:
@@ -317,6 +317,9 @@ def setup_semantic_search(existing_semantic_config: dict = None, semantic_config
 
     config["update_config"] = update_config
     config["extraction"] = {"pdf_max_pages": pdf_max_pages}
+    existing_pdf_engine = existing_semantic_config.get("extraction", {}).get("pdf_engine") if existing_semantic_config else None
+    if existing_pdf_engine:
+        config["extraction"]["pdf_engine"] = existing_pdf_engine
     if zotero_db_path:
         config["zotero_db_path"] = zotero_db_path
 
@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import List, Dict
 import os
 import re
@@ -32,6 +33,17 @@ def is_local_mode() -> bool:
     value = os.getenv("ZOTERO_LOCAL", "")
     return value.lower() in {"true", "yes", "1"}
 
+
+def state_dir() -> Path:
+    """Return (and create) the directory for ledgers and caches.
+
+    Defaults to ~/.config/zotero-mcp/state; override with ZOTERO_MCP_STATE_DIR.
+    """
+    override = os.environ.get("ZOTERO_MCP_STATE_DIR")
+    base = Path(override).expanduser() if override else Path.home() / ".config" / "zotero-mcp" / "state"
+    base.mkdir(parents=True, exist_ok=True)
+    return base
+
 def clean_html(raw_html: str) -> str:
     """
     Remove HTML tags from a string.
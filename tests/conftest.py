@@ -7,6 +7,7 @@ SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
 if str(SRC_ROOT) not in sys.path:
     sys.path.insert(0, str(SRC_ROOT))
 
+from zotero_mcp import http_client  # noqa: E402
 import zotero_mcp.server as server  # noqa: E402
 
 
@@ -28,6 +29,9 @@ def isolate_state_dir(monkeypatch, tmp_path):
     state_dir.mkdir(parents=True, exist_ok=True)
     monkeypatch.setenv("ZOTERO_MCP_STATE_DIR", str(state_dir))
     monkeypatch.setenv("ZOTERO_MCP_DEBUG_IMPORT", "1")
+    # Fresh rate-limit buckets so tests never wait on each other's requests.
+    monkeypatch.setattr(http_client, "_buckets", {})
+    monkeypatch.setattr(server, "_collection_trees", {})
 
 
 class FakeWebZotero:
@@ -46,6 +50,8 @@ class FakeWebZotero:
         self._collections = {}  # key → collection dict
         self._children = {}     # parent key → child item dicts
         self.fail_on = set()    # item keys that raise RuntimeError
+        self.item_key_fetches = []  # key lists requested via items(itemKey=...)
+        self.write_batches = []     # item keys per update_items() call
 
     def item_template(self, item_type):
         return {"itemType": item_type, "title": "", "creators": [],
@@ -62,6 +68,10 @@ class FakeWebZotero:
         return self._children.get(key, [])
 
     def items(self, limit=None, sort=None, direction=None, **kwargs):
+        if kwargs.get("itemKey"):
+            keys = kwargs["itemKey"].split(",")
+            self.item_key_fetches.append(keys)
+            return [self.item(key) for key in keys]
         values = list(self._items.values())
         if limit is not None:
             values = values[:limit]
@@ -92,7 +102,10 @@ class FakeWebZotero:
         for idx, item in enumerate(items):
             key = f"NEWKEY{idx + 1}"
             self._items[key] = {"data": {"key": key, **item}}
-        return {"successful": {"0": {"key": "NEWKEY1"}}, "failed": {}}
+        return {
+            "successful": {str(idx): {"key": f"NEWKEY{idx + 1}"} for idx in range(len(items))},
+            "failed": {},
+        }
 
     def attachment_simple(self, files, parent_key):
         self.attached_files.append((tuple(files), parent_key))
@@ -115,6 +128,14 @@ class FakeWebZotero:
     def update_item(self, item):
         self.updated_items.append(item)
 
+    def update_items(self, payload):
+        self.write_batches.append([data["key"] for data in payload])
+        self.updated_items.extend(payload)
+        for data in payload:
+            if data["key"] in self._items:
+                self._items[data["key"]]["data"] = data
+        return True
+
     def create_collections(self, cols):
         self.created_collections.extend(cols)
         return {"successful": {"0": {"key": "COLKEY1"}}, "failed": {}}
@@ -137,13 +158,14 @@ class FakeWebZotero:
             collections = self._items[key]["data"].setdefault("collections", [])
             self._items[key]["data"]["collections"] = [c for c in collections if c != col_key]
 
-    def delete_item(self, item):
-        self.deleted_items.append(item)
-        key = item.get("key") if isinstance(item, dict) else None
-        if key and key in self._items:
-            del self._items[key]
-        if key and key in self._children:
-            del self._children[key]
+    def delete_item(self, item, last_modified=None):
+        for entry in item if isinstance(item, list) else [item]:
+            self.deleted_items.append(entry)
+            key = entry.get("key") if isinstance(entry, dict) else None
+            if key and key in self._items:
+                del self._items[key]
+            if key and key in self._children:
+                del self._children[key]
 
     def delete_collection(self, col):
         self.deleted_items.append(col)
@@ -175,3 +197,195 @@ def patch_no_credentials(monkeypatch):
     """Simulate missing credentials (returns None)."""
     monkeypatch.setattr(server, "get_web_zotero_client", lambda: None)
     monkeypatch.setenv("UNSAFE_OPERATIONS", "all")
+
+
+LOCAL_DB_SCHEMA = """
+CREATE TABLE libraries (libraryID INTEGER PRIMARY KEY, type TEXT, editable INT DEFAULT 1);
+CREATE TABLE groups (groupID INTEGER PRIMARY KEY, libraryID INT, name TEXT, description TEXT);
+CREATE TABLE itemTypes (itemTypeID INTEGER PRIMARY KEY, typeName TEXT);
+CREATE TABLE items (
+    itemID INTEGER PRIMARY KEY, itemTypeID INT, libraryID INT DEFAULT 1,
+    key TEXT, dateAdded TEXT, dateModified TEXT, version INT DEFAULT 0
+);
+CREATE TABLE deletedItems (itemID INTEGER PRIMARY KEY, dateDeleted TEXT);
+CREATE TABLE fields (fieldID INTEGER PRIMARY KEY, fieldName TEXT);
+CREATE TABLE itemDataValues (valueID INTEGER PRIMARY KEY, value TEXT);
+CREATE TABLE itemData (itemID INT, fieldID INT, valueID INT);
+CREATE TABLE creators (
+    creatorID INTEGER PRIMARY KEY, firstName TEXT, lastName TEXT, fieldMode INT DEFAULT 0
+);
+CREATE TABLE creatorTypes (creatorTypeID INTEGER PRIMARY KEY, creatorType TEXT);
+CREATE TABLE itemCreators (
+    itemID INT, creatorID INT, creatorTypeID INT DEFAULT 1, orderIndex INT DEFAULT 0
+);
+CREATE TABLE tags (tagID INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE itemTags (itemID INT, tagID INT, type INT DEFAULT 0);
+CREATE TABLE collections (
+    collectionID INTEGER PRIMARY KEY, collectionName TEXT, parentCollectionID INT,
+    libraryID INT DEFAULT 1, key TEXT, version INT DEFAULT 0
+);
+CREATE TABLE deletedCollections (collectionID INTEGER PRIMARY KEY, dateDeleted TEXT);
+CREATE TABLE collectionItems (collectionID INT, itemID INT, orderIndex INT DEFAULT 0);
+CREATE TABLE itemNotes (itemID INTEGER PRIMARY KEY, parentItemID INT, note TEXT, title TEXT);
+CREATE TABLE itemAttachments (
+    itemID INTEGER PRIMARY KEY, parentItemID INT, linkMode INT,
+    contentType TEXT, path TEXT
+);
+CREATE TABLE itemAnnotations (
+    itemID INTEGER PRIMARY KEY, parentItemID INT, type INT, authorName TEXT,
+    text TEXT, comment TEXT, color TEXT, pageLabel TEXT, sortIndex TEXT,
+    position TEXT, isExternal INT DEFAULT 0
+);
+INSERT INTO libraries VALUES (1, 'user', 1);
+INSERT INTO itemTypes VALUES (1, 'journalArticle'), (2, 'attachment'), (3, 'note'), (4, 'book'),
+    (5, 'annotation');
+INSERT INTO fields VALUES
+    (1, 'title'), (2, 'abstractNote'), (6, 'date'), (13, 'url'), (16, 'extra'), (26, 'DOI');
+INSERT INTO creatorTypes VALUES (1, 'author'), (2, 'editor');
+"""
+
+
+class LocalZoteroDB:
+    """Builds a minimal zotero.sqlite + storage/ tree for LocalZoteroReader tests."""
+
+    def __init__(self, root: Path):
+        import sqlite3
+
+        self.root = root
+        self.path = root / "zotero.sqlite"
+        self.storage = root / "storage"
+        self.storage.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.executescript(LOCAL_DB_SCHEMA)
+        self._next_id = 1
+
+    def _new_id(self) -> int:
+        item_id = self._next_id
+        self._next_id += 1
+        return item_id
+
+    def _set_field(self, item_id: int, field_id: int, value: str) -> None:
+        cur = self.conn.execute("INSERT INTO itemDataValues (value) VALUES (?)", (value,))
+        self.conn.execute(
+            "INSERT INTO itemData VALUES (?, ?, ?)", (item_id, field_id, cur.lastrowid)
+        )
+
+    def add_item(self, key: str, *, title: str = "", doi: str = "", date: str = "",
+                 item_type_id: int = 1, library_id: int = 1,
+                 date_added: str | None = None,
+                 date_modified: str = "2024-01-01 00:00:00") -> int:
+        item_id = self._new_id()
+        self.conn.execute(
+            "INSERT INTO items (itemID, itemTypeID, libraryID, key, dateAdded, dateModified) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (item_id, item_type_id, library_id, key, date_added or date_modified, date_modified),
+        )
+        if title:
+            self._set_field(item_id, 1, title)
+        if date:
+            self._set_field(item_id, 6, date)
+        if doi:
+            self._set_field(item_id, 26, doi)
+        self.conn.commit()
+        return item_id
+
+    def add_creator(self, item_id: int, last: str, first: str = "", *, order: int = 0) -> None:
+        cur = self.conn.execute(
+            "INSERT INTO creators (firstName, lastName, fieldMode) VALUES (?, ?, ?)",
+            (first, last, 0 if first else 1),
+        )
+        self.conn.execute(
+            "INSERT INTO itemCreators (itemID, creatorID, orderIndex) VALUES (?, ?, ?)",
+            (item_id, cur.lastrowid, order),
+        )
+        self.conn.commit()
+
+    def add_tag(self, item_id: int, name: str) -> None:
+        self.conn.execute("INSERT OR IGNORE INTO tags (name) VALUES (?)", (name,))
+        tag_id = self.conn.execute("SELECT tagID FROM tags WHERE name = ?", (name,)).fetchone()[0]
+        self.conn.execute("INSERT INTO itemTags (itemID, tagID) VALUES (?, ?)", (item_id, tag_id))
+        self.conn.commit()
+
+    def add_collection(self, key: str, name: str, *, parent_id: int | None = None,
+                       item_ids: tuple[int, ...] = ()) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO collections (collectionName, parentCollectionID, key) VALUES (?, ?, ?)",
+            (name, parent_id, key),
+        )
+        for item_id in item_ids:
+            self.conn.execute(
+                "INSERT INTO collectionItems (collectionID, itemID) VALUES (?, ?)",
+                (cur.lastrowid, item_id),
+            )
+        self.conn.commit()
+        return cur.lastrowid
+
+    def add_note(self, key: str, parent_id: int | None, note: str) -> int:
+        item_id = self._new_id()
+        self.conn.execute(
+            "INSERT INTO items (itemID, itemTypeID, key, dateAdded, dateModified) "
+            "VALUES (?, 3, ?, '2024-01-01', '2024-01-01')",
+            (item_id, key),
+        )
+        self.conn.execute(
+            "INSERT INTO itemNotes (itemID, parentItemID, note, title) VALUES (?, ?, ?, '')",
+            (item_id, parent_id, note),
+        )
+        self.conn.commit()
+        return item_id
+
+    def trash(self, item_id: int) -> None:
+        self.conn.execute("INSERT INTO deletedItems (itemID) VALUES (?)", (item_id,))
+        self.conn.commit()
+
+    def add_attachment(self, key: str, parent_id: int | None, *,
+                       filename: str = "file.pdf",
+                       content_type: str = "application/pdf",
+                       content: bytes | None = b"%PDF-1.4\n",
+                       link_mode: int = 0) -> int:
+        item_id = self._new_id()
+        self.conn.execute(
+            "INSERT INTO items (itemID, itemTypeID, key, dateAdded, dateModified) "
+            "VALUES (?, 2, ?, '2024-01-01', '2024-01-01')",
+            (item_id, key),
+        )
+        self.conn.execute(
+            "INSERT INTO itemAttachments VALUES (?, ?, ?, ?, ?)",
+            (item_id, parent_id, link_mode, content_type, f"storage:{filename}"),
+        )
+        self.conn.commit()
+        if content is not None:
+            folder = self.storage / key
+            folder.mkdir(parents=True, exist_ok=True)
+            (folder / filename).write_bytes(content)
+        return item_id
+
+    def add_annotation(self, key: str, attachment_id: int, *, text: str = "",
+                       comment: str = "", color: str = "#ffd400", ann_type: int = 1,
+                       page_index: int = 0, page_label: str = "1",
+                       date_added: str = "2024-01-01 00:00:00") -> int:
+        item_id = self._new_id()
+        self.conn.execute(
+            "INSERT INTO items (itemID, itemTypeID, key, dateAdded, dateModified) "
+            "VALUES (?, 5, ?, ?, ?)",
+            (item_id, key, date_added, date_added),
+        )
+        self.conn.execute(
+            "INSERT INTO itemAnnotations (itemID, parentItemID, type, text, comment, color, "
+            "pageLabel, sortIndex, position) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (item_id, attachment_id, ann_type, text, comment, color, page_label,
+             f"{page_index:05d}|000000|00000",
+             f'{{"pageIndex": {page_index}, "rects": [[0, 0, 1, 1]]}}'),
+        )
+        self.conn.commit()
+        return item_id
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+@pytest.fixture
+def local_zotero_db(tmp_path):
+    db = LocalZoteroDB(tmp_path / "Zotero")
+    yield db
+    db.close()
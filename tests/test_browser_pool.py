@@ -0,0 +1,166 @@
+import threading
+import time
+
+import pytest
+
+from zotero_mcp import browser_pool
+
+
+class FakeContext:
+    def __init__(self, owner):
+        self.owner = owner
+        self.closed = False
+        self.close_handlers = []
+
+    def on(self, event, handler):
+        assert event == "close"
+        self.close_handlers.append(handler)
+
+    def close(self):
+        self.closed = True
+        for handler in self.close_handlers:
+            handler(self)
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+        self.closed = False
+
+    def new_context(self, **kwargs):
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    def is_connected(self):
+        return not self.closed
+
+    def close(self):
+        self.closed = True
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    def launch(self, **kwargs):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    def launch_persistent_context(self, user_data_dir, **kwargs):
+        context = FakeContext(user_data_dir)
+        self.browsers.append(context)
+        return context
+
+    def stop(self):
+        self.stopped = True
+
+
+def make_pool(options=None, **kwargs):
+    started = []
+
+    def start():
+        playwright = FakePlaywright()
+        started.append(playwright)
+        return playwright
+
+    pool = browser_pool.BrowserPool(
+        options or browser_pool.LaunchOptions(),
+        start_playwright=start,
+        **kwargs,
+    )
+    return pool, started
+
+
+def test_concurrent_rescues_share_one_browser_and_reuse_host_contexts():
+    pool, started = make_pool(max_contexts=2)
+    seen = []
+    threads_used = set()
+
+    def job(context):
+        threads_used.add(threading.get_ident())
+        seen.append(context)
+        return context
+
+    workers = [
+        threading.Thread(target=pool.run, args=("a.example.com", job)) for _ in range(5)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    assert len(started) == 1
+    assert len(started[0].browsers) == 1
+    assert len(set(map(id, seen))) == 1
+    assert len(threads_used) == 1
+
+    context_b = pool.run("b.example.com", lambda context: context)
+    context_a = pool.run("a.example.com", lambda context: context)
+    context_c = pool.run("c.example.com", lambda context: context)
+
+    assert context_a is seen[0]
+    assert not context_a.closed
+    assert context_b.closed
+    assert not context_c.closed
+    pool.close()
+    assert started[0].stopped
+
+
+def test_idle_pool_shuts_browser_down_and_relaunches_on_demand():
+    pool, started = make_pool(idle_seconds=0.05)
+
+    pool.run("a.example.com", lambda context: None)
+    deadline = time.monotonic() + 5
+    while not started[0].stopped and time.monotonic() < deadline:
+        time.sleep(0.02)
+
+    assert started[0].stopped
+    assert started[0].browsers[0].closed
+
+    pool.run("a.example.com", lambda context: None)
+    assert len(started) == 2
+    pool.close()
+
+
+def test_queued_rescue_gets_its_full_timeout():
+    pool, _ = make_pool()
+    first_running = threading.Event()
+    results = []
+
+    def slow(context):
+        first_running.set()
+        time.sleep(0.3)
+        return "slow"
+
+    worker = threading.Thread(target=lambda: results.append(pool.run("a.example.com", slow, timeout=1.0)))
+    worker.start()
+    first_running.wait(5)
+
+    # Queued for 0.3s behind `slow`, longer than its own 0.2s budget.
+    assert pool.run("a.example.com", lambda context: "queued", timeout=0.2) == "queued"
+    worker.join()
+    assert results == ["slow"]
+    pool.close()
+
+
+def test_crashed_persistent_context_is_replaced():
+    pool, started = make_pool(browser_pool.LaunchOptions(user_data_dir="/tmp/profile"))
+    first = pool.run("a.example.com", lambda context: context)
+
+    def crash(context):
+        context.close()
+        raise RuntimeError("Target page, context or browser has been closed")
+
+    with pytest.raises(RuntimeError):
+        pool.run("b.example.com", crash)
+    second = pool.run("a.example.com", lambda context: context)
+
+    assert second is not first
+    assert not second.closed
+    assert len(started) == 1
+    assert started[0].browsers == [first, second]
+    pool.close()
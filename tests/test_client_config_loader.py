@@ -198,3 +198,86 @@ def test_all_absent_env_already_set(tmp_path, monkeypatch):
     _load_from_ai_tool_configs()
 
     assert os.environ["ZOTERO_API_KEY"] == "already-set"
+
+
+def test_client_factory_caches_clients_and_health_probe(monkeypatch):
+    from zotero_mcp import client as client_module
+
+    created = []
+
+    class FakeZotero:
+        def __init__(self, library_id, library_type, api_key, local, client=None):
+            self.local = local
+            self.client = client or object()
+            self.url_params = None
+            self.probes = 0
+            created.append(self)
+
+        def items(self, limit=None):
+            self.probes += 1
+            return []
+
+    monkeypatch.setattr(client_module.zotero, "Zotero", FakeZotero)
+    monkeypatch.delenv("ZOTERO_LOCAL", raising=False)
+    monkeypatch.setenv("ZOTERO_MCP_CLIENT_HEALTH_TTL", "60")
+    monkeypatch.setattr(client_module, "_cached_clients", {})
+    monkeypatch.setattr(client_module, "_shared_sessions", {})
+    monkeypatch.setattr(client_module, "_local_health", None)
+
+    first = client_module.get_zotero_client()
+    second = client_module.get_zotero_client()
+    local = client_module.get_local_zotero_client()
+
+    assert first is second and first.local is True
+    assert first.probes == 1
+    # Every client of a mode shares one HTTP session
+    assert local.client is first.client
+
+    client_module.invalidate_zotero_client_health()
+    client_module.get_zotero_client()
+    assert first.probes == 2
+
+
+def test_client_registry_drops_exited_threads_and_reprobes_after_local_errors(monkeypatch):
+    import threading
+
+    from zotero_mcp import client as client_module
+
+    class FakeSession:
+        def __init__(self):
+            self.fail = False
+
+        def send(self, request):
+            if self.fail:
+                raise ConnectionError("Zotero quit")
+            return type("Response", (), {"status_code": 200})()
+
+    class FakeZotero:
+        def __init__(self, library_id, library_type, api_key, local, client=None):
+            self.local = local
+            self.client = client or FakeSession()
+            self.url_params = None
+
+        def items(self, limit=None):
+            return []
+
+    monkeypatch.setattr(client_module.zotero, "Zotero", FakeZotero)
+    monkeypatch.setenv("ZOTERO_LOCAL", "true")
+    monkeypatch.setattr(client_module, "_cached_clients", {})
+    monkeypatch.setattr(client_module, "_shared_sessions", {})
+    monkeypatch.setattr(client_module, "_local_health", None)
+
+    for _ in range(5):
+        worker = threading.Thread(target=client_module.get_zotero_client)
+        worker.start()
+        worker.join()
+    client = client_module.get_zotero_client()
+
+    # Only the live thread's client is kept
+    assert list(client_module._cached_clients.values()) == [client]
+
+    client_module._local_health = (True, 0.0)
+    client.client.fail = True
+    with pytest.raises(ConnectionError):
+        client.client.send(object())
+    assert client_module._local_health is None
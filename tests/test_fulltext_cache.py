@@ -0,0 +1,149 @@
+import sys
+import types
+
+import zotero_mcp.server as server
+from zotero_mcp import fulltext_cache
+
+
+class FulltextZot:
+    def __init__(self, md5="abc"):
+        self.md5 = md5
+
+    def item(self, key):
+        return {"key": key, "data": {"key": key, "itemType": "journalArticle", "title": "Paper"}}
+
+    def children(self, key, **kwargs):
+        return [
+            {
+                "key": "ATT1",
+                "data": {
+                    "key": "ATT1",
+                    "itemType": "attachment",
+                    "contentType": "application/pdf",
+                    "filename": "paper.pdf",
+                    "md5": self.md5,
+                },
+            }
+        ]
+
+    def fulltext_item(self, key):
+        return {}
+
+    def dump(self, key, filename=None, path=None):
+        raise AssertionError("local storage copy should be read in place")
+
+
+def test_get_item_fulltext_reuses_converted_markdown_until_file_changes(monkeypatch, tmp_path, ctx):
+    pdf_path = tmp_path / "storage" / "paper.pdf"
+    pdf_path.parent.mkdir()
+    pdf_path.write_bytes(b"%PDF-1.4 stub")
+    zot = FulltextZot()
+    conversions = []
+
+    def fake_convert(path):
+        conversions.append(path)
+        return f"converted #{len(conversions)}"
+
+    monkeypatch.setattr(server, "get_zotero_client", lambda: zot)
+    monkeypatch.setattr(server, "_resolve_local_attachment_path", lambda key: pdf_path)
+    monkeypatch.setattr(server, "convert_to_markdown", fake_convert)
+
+    first = server.get_item_fulltext("ITEM1", ctx=ctx)
+    second = server.get_item_fulltext("ITEM1", ctx=ctx)
+    assert "converted #1" in first
+    assert "converted #1" in second
+    assert conversions == [str(pdf_path)]
+
+    refreshed = server.get_item_fulltext("ITEM1", refresh=True, ctx=ctx)
+    assert "converted #2" in refreshed
+
+    zot.md5 = "def"
+    pdf_path.write_bytes(b"%PDF-1.4 replaced file")
+    assert "converted #3" in server.get_item_fulltext("ITEM1", ctx=ctx)
+    assert "converted #3" in server.get_item_fulltext("ITEM1", ctx=ctx)
+    assert len(conversions) == 3
+
+
+def test_get_item_fulltext_does_not_cache_failed_conversions(monkeypatch, tmp_path, ctx):
+    pdf_path = tmp_path / "storage" / "paper.pdf"
+    pdf_path.parent.mkdir()
+    pdf_path.write_bytes(b"%PDF-1.4 stub")
+    results = [f"{server.CONVERSION_ERROR_PREFIX}markitdown is not installed", "converted text"]
+
+    monkeypatch.setattr(server, "get_zotero_client", lambda: FulltextZot())
+    monkeypatch.setattr(server, "_resolve_local_attachment_path", lambda key: pdf_path)
+    monkeypatch.setattr(server, "convert_to_markdown", lambda path: results.pop(0))
+
+    assert "markitdown is not installed" in server.get_item_fulltext("ITEM1", ctx=ctx)
+    assert "converted text" in server.get_item_fulltext("ITEM1", ctx=ctx)
+    assert results == []
+
+
+def test_fulltext_cache_evicts_least_recently_read_entries(tmp_path):
+    cache = fulltext_cache.FulltextCache(tmp_path / "fulltext.sqlite", max_bytes=2500)
+    cache.store("A", "md5:a", "a" * 1000)
+    cache.store("B", "md5:b", "b" * 1000)
+    assert cache.lookup("A", ["md5:a"]) == "a" * 1000
+    cache.store("C", "md5:c", "c" * 1000)
+
+    assert cache.evict() == 1
+    assert cache.lookup("B", ["md5:b"]) is None
+    assert cache.lookup("A", ["md5:a"]) is not None
+    assert cache.lookup("C", ["md5:other", "md5:c"]) is not None
+    assert cache.lookup("C", ["md5:other"]) is None
+
+
+def test_get_item_fulltext_returns_ranges_with_continuation(monkeypatch, tmp_path, ctx):
+    pdf_path = tmp_path / "storage" / "paper.pdf"
+    pdf_path.parent.mkdir()
+    pdf_path.write_bytes(b"%PDF-1.4 stub")
+    loaded_pages = []
+
+    class FakePage:
+        def __init__(self, index):
+            self.index = index
+
+        def get_text(self, mode):
+            return f"page {self.index + 1} text"
+
+    class FakeDoc:
+        def __len__(self):
+            return 600
+
+        def load_page(self, index):
+            loaded_pages.append(index)
+            return FakePage(index)
+
+        def close(self):
+            pass
+
+    monkeypatch.setitem(sys.modules, "fitz", types.SimpleNamespace(open=lambda path: FakeDoc()))
+    monkeypatch.setattr(server, "get_zotero_client", lambda: FulltextZot())
+    monkeypatch.setattr(server, "_resolve_local_attachment_path", lambda key: pdf_path)
+    monkeypatch.setattr(server, "convert_to_markdown", lambda path: "0123456789" * 5)
+
+    first = server.get_item_fulltext("ITEM1", max_chars=20, ctx=ctx)
+    assert "## Full Text\n\n01234567890123456789\n" in first
+    assert "_Characters 0-20 of 50. Continue with offset=20._" in first
+
+    last = server.get_item_fulltext("ITEM1", offset=40, max_chars=20, ctx=ctx)
+    assert "\n\n0123456789\n" in last
+    assert "_Characters 40-50 of 50. End of text._" in last
+
+    chapter = server.get_item_fulltext("ITEM1", page_start=10, page_end=12, ctx=ctx)
+    assert loaded_pages == [9, 10, 11]
+    assert "## Full Text (pages 10-12 of 600)" in chapter
+    assert "page 10 text\npage 11 text\npage 12 text" in chapter
+    assert "Continue with page_start=13, page_end=15._" in chapter
+
+    last_pages = server.get_item_fulltext("ITEM1", page_start=598, page_end=600, ctx=ctx)
+    assert "page 600 text" in last_pages and "Continue with" not in last_pages
+    assert "Continue with page_start=2, page_end=2._" in server.get_item_fulltext(
+        "ITEM1", page_start=1, page_end=1, ctx=ctx
+    )
+
+    partial = server.get_item_fulltext("ITEM1", page_start=10, page_end=12, max_chars=10, ctx=ctx)
+    assert "## Full Text (pages 10-12 of 600)\n\npage 10 te\n" in partial
+    assert "Continue with page_start=10, page_end=12, offset=10._" in partial
+
+    assert "no pages in the requested range" in server.get_item_fulltext("ITEM1", page_start=700, ctx=ctx)
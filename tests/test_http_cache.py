@@ -0,0 +1,88 @@
+import pytest
+import requests
+
+from zotero_mcp import http_cache, http_client
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, content=b'{"message": {"title": ["T"]}}'):
+        self.status_code = status_code
+        self.content = content
+        self.headers = {"Content-Type": "application/json", "Set-Cookie": "x"}
+        self.url = None
+
+
+@pytest.fixture
+def fake_get(monkeypatch):
+    calls = []
+    responses = {}
+
+    def get(url, **kwargs):
+        calls.append((url, kwargs.get("params")))
+        return responses.get(url, FakeResponse())
+
+    monkeypatch.setattr(http_client, "get", get)
+    get.calls = calls
+    get.responses = responses
+    return get
+
+
+def test_cache_key_sorts_params_and_drops_contact():
+    a = http_cache.cache_key("get", "https://API.crossref.org/works?rows=5", {"query": "x", "mailto": "a@b"})
+    b = http_cache.cache_key("GET", "https://api.crossref.org/works?query=x&rows=5")
+    assert a == b
+
+
+def test_cached_get_serves_repeats_from_disk(fake_get):
+    url = "https://api.crossref.org/works/10.1/abc"
+    http_client.cached_get(url)
+    second = http_client.cached_get(url)
+
+    assert len(fake_get.calls) == 1
+    assert second.json() == {"message": {"title": ["T"]}}
+    assert second.from_cache is True
+    assert dict(second.headers) == {"Content-Type": "application/json"}
+
+    http_client.cached_get(url, bypass_cache=True)
+    assert len(fake_get.calls) == 2
+
+
+def test_negative_cache_and_uncached_hosts(fake_get):
+    missing = "https://api.crossref.org/works/10.1/missing"
+    fake_get.responses[missing] = FakeResponse(status_code=404, content=b"Resource not found.")
+    fake_get.responses["https://api.crossref.org/works/10.1/busy"] = FakeResponse(status_code=503)
+
+    http_client.cached_get(missing)
+    replay = http_client.cached_get(missing)
+    with pytest.raises(requests.HTTPError):
+        replay.raise_for_status()
+
+    http_client.cached_get("https://api.crossref.org/works/10.1/busy")
+    http_client.cached_get("https://api.crossref.org/works/10.1/busy")
+    http_client.cached_get("https://example.com/page")
+    http_client.cached_get("https://example.com/page")
+    assert len(fake_get.calls) == 5
+
+
+def test_cache_can_be_disabled_or_refreshed(fake_get, monkeypatch):
+    url = "https://api.openalex.org/works"
+    monkeypatch.setenv("ZOTERO_MCP_HTTP_CACHE", "off")
+    http_client.cached_get(url, params={"filter": "doi:10.1/x"})
+    http_client.cached_get(url, params={"filter": "doi:10.1/x"})
+    assert len(fake_get.calls) == 2
+
+    monkeypatch.setenv("ZOTERO_MCP_HTTP_CACHE", "refresh")
+    http_client.cached_get(url, params={"filter": "doi:10.1/x"})
+    monkeypatch.delenv("ZOTERO_MCP_HTTP_CACHE")
+    http_client.cached_get(url, params={"filter": "doi:10.1/x"})
+    assert len(fake_get.calls) == 3
+
+
+def test_eviction_drops_expired_then_least_recent(tmp_path):
+    cache = http_cache.ResponseCache(tmp_path / "cache.sqlite", max_bytes=10)
+    cache.store("old", "crossref", status=200, content=b"123456")
+    cache.store("new", "crossref", status=200, content=b"abcdef")
+    cache.evict()
+
+    assert cache.lookup("old") is None
+    assert cache.lookup("new").content == b"abcdef"
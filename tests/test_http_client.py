@@ -0,0 +1,53 @@
+from zotero_mcp import http_client
+
+
+def test_user_agent_includes_contact_email(monkeypatch):
+    monkeypatch.delenv("UNPAYWALL_EMAIL", raising=False)
+    monkeypatch.delenv("ZOTERO_MCP_CONTACT_EMAIL", raising=False)
+    assert "mailto" not in http_client.user_agent()
+
+    monkeypatch.setenv("UNPAYWALL_EMAIL", "me@example.org")
+    assert http_client.user_agent().endswith("(mailto:me@example.org)")
+
+
+def test_timeouts_are_per_host_with_env_override(monkeypatch):
+    monkeypatch.delenv("ZOTERO_MCP_HTTP_TIMEOUT", raising=False)
+    assert http_client.timeout_for("https://api.crossref.org/works/10.1/x") == 15.0
+    assert http_client.timeout_for("https://example.com/paper.pdf") == http_client.DEFAULT_TIMEOUT
+
+    monkeypatch.setenv("ZOTERO_MCP_HTTP_TIMEOUT", "5")
+    assert http_client.timeout_for("https://api.crossref.org/works") == 5.0
+
+
+def test_requests_share_one_session(monkeypatch):
+    sent = []
+
+    class FakeSession:
+        def request(self, method, url, **kwargs):
+            sent.append((method, url, kwargs["timeout"]))
+            return "response"
+
+    monkeypatch.setattr(http_client, "_session", FakeSession())
+    monkeypatch.delenv("ZOTERO_MCP_HTTP_TIMEOUT", raising=False)
+
+    assert http_client.get("https://api.openalex.org/works") == "response"
+    http_client.post("http://127.0.0.1:23119/connector/ping", timeout=3)
+    assert sent == [
+        ("GET", "https://api.openalex.org/works", 15.0),
+        ("POST", "http://127.0.0.1:23119/connector/ping", 3),
+    ]
+
+
+def test_throttle_paces_hosts_independently(monkeypatch):
+    slept = []
+    monkeypatch.setattr(http_client.time, "sleep", slept.append)
+    monkeypatch.setattr(http_client, "HOST_RATES", {"export.arxiv.org": (1.0, 2.0)})
+
+    for _ in range(3):
+        http_client.throttle("http://export.arxiv.org/api/query?id_list=1")
+    http_client.throttle("https://publisher.example.com/paper.pdf")
+    http_client.throttle("http://127.0.0.1:23119/api/")
+
+    # Burst of two, then the third arXiv call waits about a second; other hosts don't.
+    assert len(slept) == 1
+    assert 0.9 < slept[0] <= 1.0
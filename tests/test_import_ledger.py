@@ -0,0 +1,58 @@
+import json
+import threading
+
+from zotero_mcp import import_ledger
+
+
+def test_jsonl_ledger_is_migrated_once_and_indexed_lookups_work(tmp_path, monkeypatch):
+    legacy = tmp_path / "import-ledger.jsonl"
+    monkeypatch.setenv("ZOTERO_MCP_IMPORT_LEDGER_PATH", str(legacy))
+    legacy.write_text(
+        "\n".join(
+            json.dumps(entry)
+            for entry in [
+                {"timestamp": "2026-10-01T10:00:00", "action": "import", "status": "success", "item_key": "A", "local_item_key": "LA"},
+                {"timestamp": "2026-10-01T11:00:00", "action": "reconcile", "status": "failed", "item_key": "B"},
+                {"timestamp": "2026-10-01T12:00:00", "action": "import", "status": "success", "item_key": "A", "local_item_key": "LA2"},
+            ]
+        )
+        + "\nnot json\n",
+        encoding="utf-8",
+    )
+
+    ledger = import_ledger.get_import_ledger()
+
+    assert ledger.path == tmp_path / "import-ledger.sqlite"
+    assert not legacy.exists()
+    assert (tmp_path / "import-ledger.jsonl.migrated").exists()
+    assert ledger.latest(item_key="A")["local_item_key"] == "LA2"
+    assert ledger.latest(local_item_key="LA")["timestamp"] == "2026-10-01T10:00:00"
+    assert ledger.latest(item_key="missing") is None
+    assert [entry["item_key"] for entry in ledger.recent(action="import")] == ["A", "A"]
+    assert [entry["item_key"] for entry in ledger.recent(1)] == ["A"]
+    assert [entry["status"] for entry in ledger.recent(status="failed")] == ["failed"]
+
+    ledger.append({"action": "import", "status": "success", "item_key": "C"})
+    assert len(import_ledger.get_import_ledger().recent()) == 4
+
+
+def test_concurrent_appends_and_retention(tmp_path):
+    ledger = import_ledger.ImportLedger(tmp_path / "ledger.sqlite", max_entries=150, max_age_days=30)
+
+    def append_many(worker):
+        for n in range(50):
+            ledger.append({"action": "import", "status": "success", "item_key": f"{worker}-{n}"})
+
+    threads = [threading.Thread(target=append_many, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(ledger.recent()) == 200
+
+    with ledger._connect() as conn:
+        conn.execute("UPDATE entries SET recorded_at = 0 WHERE item_key = '0-49'")
+    assert ledger.prune() == 50
+    remaining = ledger.recent()
+    assert len(remaining) == 150
+    assert all(entry["item_key"] != "0-49" for entry in remaining)
@@ -0,0 +1,132 @@
+from zotero_mcp.local_db import LocalZoteroReader
+
+
+def test_get_attachments_for_parents_groups_in_one_pass(local_zotero_db):
+    first = local_zotero_db.add_item("ITEMA001", title="First")
+    second = local_zotero_db.add_item("ITEMB002", title="Second")
+    local_zotero_db.add_attachment("ATTA0001", first, filename="a.pdf")
+    local_zotero_db.add_attachment(
+        "ATTA0002", first, filename="a.html", content_type="text/html"
+    )
+    local_zotero_db.add_attachment("ATTB0001", second, filename="missing.pdf", content=None)
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path)) as reader:
+        grouped = reader.get_attachments_for_parents([first, second])
+        whole_library = reader.get_attachments_for_parents()
+
+    assert sorted(r.key for r in grouped[first]) == ["ATTA0001", "ATTA0002"]
+    pdf = next(r for r in grouped[first] if r.key == "ATTA0001")
+    assert pdf.is_pdf and pdf.exists and pdf.is_usable
+    assert pdf.parent_key == "ITEMA001"
+    assert pdf.link_mode == 0
+    assert pdf.resolved_path == local_zotero_db.storage / "ATTA0001" / "a.pdf"
+
+    missing = grouped[second][0]
+    assert missing.exists is False
+    assert missing.is_usable is False
+    assert set(whole_library) == {first, second}
+
+
+def test_get_attachments_for_parent_keys_and_by_key(local_zotero_db):
+    parent = local_zotero_db.add_item("ITEMA001")
+    local_zotero_db.add_attachment("ATTA0001", parent, content=b"")
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path)) as reader:
+        by_parent = reader.get_attachments_for_parent_keys(["ITEMA001", "NOPE0000"])
+        by_key = reader.get_attachments_by_key(["ATTA0001", "NOPE0000"])
+
+    assert list(by_parent) == ["ITEMA001"]
+    assert set(by_key) == {"ATTA0001"}
+    # Empty files exist but are not usable.
+    assert by_key["ATTA0001"].exists is True
+    assert by_key["ATTA0001"].is_usable is False
+
+
+def test_get_attachments_for_parents_chunks_large_inputs(local_zotero_db):
+    parent = local_zotero_db.add_item("ITEMA001")
+    local_zotero_db.add_attachment("ATTA0001", parent)
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path)) as reader:
+        grouped = reader.get_attachments_for_parents(list(range(1, 1500)))
+
+    assert [r.key for r in grouped[parent]] == ["ATTA0001"]
+
+
+def test_pdf_extraction_prefers_fresh_zotero_fulltext_cache(local_zotero_db):
+    parent = local_zotero_db.add_item("ITEMA001")
+    local_zotero_db.add_attachment("ATTA0001", parent, filename="a.pdf")
+    cache = local_zotero_db.storage / "ATTA0001" / ".zotero-ft-cache"
+    cache.write_text("Cached full text from Zotero", encoding="utf-8")
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path)) as reader:
+        text, source = reader.extract_fulltext_for_item(parent)
+
+    assert text == "Cached full text from Zotero"
+    assert source == "pdf"
+    assert reader.extraction_stats == {"zotero_cache": 1}
+
+
+def test_pdf_extraction_skips_stale_cache_and_falls_back(local_zotero_db, monkeypatch):
+    import os
+
+    parent = local_zotero_db.add_item("ITEMA001")
+    local_zotero_db.add_attachment("ATTA0001", parent, filename="a.pdf")
+    cache = local_zotero_db.storage / "ATTA0001" / ".zotero-ft-cache"
+    cache.write_text("stale", encoding="utf-8")
+    pdf_mtime = (local_zotero_db.storage / "ATTA0001" / "a.pdf").stat().st_mtime
+    os.utime(cache, (pdf_mtime - 60, pdf_mtime - 60))
+
+    calls = []
+    monkeypatch.setattr(
+        LocalZoteroReader,
+        "_extract_text_with_pymupdf",
+        lambda self, path, maxpages: calls.append(("pymupdf", maxpages)) or "",
+    )
+    monkeypatch.setattr(
+        LocalZoteroReader,
+        "_extract_text_with_pdfminer",
+        lambda self, path, maxpages: calls.append(("pdfminer", maxpages)) or "pdfminer text",
+    )
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path), pdf_max_pages=3) as reader:
+        text, _ = reader.extract_fulltext_for_item(parent)
+
+    assert text == "pdfminer text"
+    assert calls == [("pymupdf", 3), ("pdfminer", 3)]
+    assert reader.extraction_stats == {"pdfminer": 1}
+
+
+def test_explicit_pdf_engine_ignores_cache(local_zotero_db, monkeypatch):
+    parent = local_zotero_db.add_item("ITEMA001")
+    local_zotero_db.add_attachment("ATTA0001", parent, filename="a.pdf")
+    (local_zotero_db.storage / "ATTA0001" / ".zotero-ft-cache").write_text("cached")
+    monkeypatch.setattr(
+        LocalZoteroReader, "_extract_text_with_pymupdf", lambda self, path, maxpages: "fitz text"
+    )
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path), pdf_engine="pymupdf") as reader:
+        text, _ = reader.extract_fulltext_for_item(parent)
+
+    assert text == "fitz text"
+    assert reader.extraction_stats == {"pymupdf": 1}
+
+
+def test_iter_items_streams_in_batches(local_zotero_db):
+    keys = [f"ITEM{i:04d}" for i in range(5)]
+    for i, key in enumerate(keys):
+        parent = local_zotero_db.add_item(key, title=f"Paper {i}")
+        local_zotero_db.add_creator(parent, "Curie", "Marie")
+    local_zotero_db.add_attachment("ATTA0001", parent, filename="a.pdf")
+
+    with LocalZoteroReader(db_path=str(local_zotero_db.path)) as reader:
+        stream = reader.iter_items(batch_size=2)
+        first = next(stream)
+        rest = list(stream)
+        limited = list(reader.iter_items(limit=3, batch_size=2))
+
+    streamed = [first] + rest
+    assert sorted(item.key for item in streamed) == keys
+    assert len(limited) == 3
+    assert first.creators == "Curie, Marie"
+    # Slotted records carry no per-instance __dict__.
+    assert not hasattr(first, "__dict__")
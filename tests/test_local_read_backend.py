@@ -0,0 +1,186 @@
+import zotero_mcp.server as server
+from zotero_mcp import local_db
+from zotero_mcp.local_db import LocalBackendUnsupported, LocalZoteroReader
+
+import pytest
+
+
+@pytest.fixture
+def library(local_zotero_db):
+    db = local_zotero_db
+    paper = db.add_item(
+        "PAPER001", title="Deep Learning for Genomics", date="2021-03-01 March 2021",
+        date_added="2024-01-02", date_modified="2024-02-01",
+    )
+    db.add_creator(paper, "Smith", "Alice")
+    db.add_tag(paper, "ml")
+    book = db.add_item(
+        "BOOK0001", title="Statistical Genomics", item_type_id=4,
+        date_added="2024-01-03", date_modified="2024-01-05",
+    )
+    db.add_creator(book, "Consortium")
+    db.add_tag(book, "stats")
+    trashed = db.add_item("TRASH001", title="Genomics Draft", date_added="2024-01-04")
+    db.trash(trashed)
+    db.add_attachment("ATTACH01", paper, filename="paper.pdf")
+    db.add_note("NOTE0001", paper, "<p>Key insight</p>")
+    parent_collection = db.add_collection("COLLTOP1", "Reading", item_ids=(paper,))
+    db.add_collection("COLLSUB1", "Genomics", parent_id=parent_collection, item_ids=(book,))
+    return db
+
+
+def test_search_items_matches_title_creator_and_year(library):
+    with LocalZoteroReader(db_path=str(library.path)) as reader:
+        by_title = reader.search_items("genomics")
+        by_creator_and_year = reader.search_items("smith 2021")
+        by_tag = reader.search_items("genomics", tags=["stats || nope"])
+        only_books = reader.search_items("genomics", item_type="book")
+
+    assert [r["key"] for r in by_title] == ["PAPER001", "BOOK0001"]
+    paper = by_creator_and_year[0]
+    assert [r["key"] for r in by_creator_and_year] == ["PAPER001"]
+    assert paper["data"]["date"] == "March 2021"
+    assert paper["data"]["creators"] == [
+        {"creatorType": "author", "firstName": "Alice", "lastName": "Smith"}
+    ]
+    assert paper["data"]["tags"] == [{"tag": "ml"}]
+    assert paper["data"]["collections"] == ["COLLTOP1"]
+    assert paper["meta"]["numChildren"] == 2
+    assert [r["key"] for r in by_tag] == ["BOOK0001"]
+    assert [r["key"] for r in only_books] == ["BOOK0001"]
+
+
+def test_search_everything_mode_is_unsupported(library):
+    with LocalZoteroReader(db_path=str(library.path)) as reader:
+        with pytest.raises(LocalBackendUnsupported):
+            reader.search_items("x", qmode="everything")
+
+
+def test_collections_children_tags_and_recent(library):
+    with LocalZoteroReader(db_path=str(library.path)) as reader:
+        collections = {c["key"]: c for c in reader.get_collections()}
+        collection_items = reader.get_collection_items("COLLSUB1")
+        children = reader.get_children("PAPER001")
+        tags = reader.get_tags()
+        recent = reader.get_recent_items(2)
+
+    assert collections["COLLTOP1"]["data"]["parentCollection"] is False
+    assert collections["COLLSUB1"]["data"]["parentCollection"] == "COLLTOP1"
+    assert [i["key"] for i in collection_items] == ["BOOK0001"]
+    assert {c["data"]["itemType"] for c in children} == {"attachment", "note"}
+    attachment = next(c for c in children if c["data"]["itemType"] == "attachment")
+    assert attachment["data"]["filename"] == "paper.pdf"
+    assert attachment["data"]["parentItem"] == "PAPER001"
+    assert tags == ["ml", "stats"]
+    # The trashed item is newest but excluded; attachment/note children follow the API.
+    assert "TRASH001" not in [i["key"] for i in recent]
+
+
+def test_tools_use_local_backend_without_touching_api(library, monkeypatch, ctx):
+    monkeypatch.setenv("ZOTERO_MCP_READ_BACKEND", "local")
+    monkeypatch.setattr(
+        local_db.LocalZoteroReader, "_find_zotero_db", lambda self: str(library.path)
+    )
+
+    def no_api():
+        raise AssertionError("Zotero API should not be used")
+
+    monkeypatch.setattr(server, "get_zotero_client", no_api)
+
+    result = server.search_items(query="genomics", ctx=ctx)
+    assert "Deep Learning for Genomics" in result
+    assert "Smith, Alice" in result
+
+    collections = server.get_collections(ctx=ctx)
+    assert "**Reading** (Key: COLLTOP1)" in collections
+    assert "  - **Genomics** (Key: COLLSUB1)" in collections
+
+    assert "Statistical Genomics" in server.get_collection_items(collection_key="COLLSUB1", ctx=ctx)
+    children = server.get_item_children(item_key="PAPER001", ctx=ctx)
+    assert "Child Items for: Deep Learning for Genomics" in children
+    assert "`stats`" in server.get_tags(ctx=ctx)
+    assert "Most Recently Added Items" in server.get_recent(limit=3, ctx=ctx)
+
+
+def test_tools_fall_back_to_api_for_unsupported_queries(library, monkeypatch, ctx):
+    monkeypatch.setenv("ZOTERO_MCP_READ_BACKEND", "local")
+    monkeypatch.setattr(
+        local_db.LocalZoteroReader, "_find_zotero_db", lambda self: str(library.path)
+    )
+
+    class FakeZot:
+        def add_parameters(self, **kwargs):
+            self.params = kwargs
+
+        def items(self):
+            return [{"key": "APIITEM1", "data": {"title": "From API", "creators": []}}]
+
+    monkeypatch.setattr(server, "get_zotero_client", lambda: FakeZot())
+    result = server.search_items(query="genomics", qmode="everything", ctx=ctx)
+    assert "From API" in result
+
+
+def test_api_backend_skips_local_database(monkeypatch):
+    monkeypatch.setenv("ZOTERO_MCP_READ_BACKEND", "api")
+    monkeypatch.setenv("ZOTERO_LOCAL", "true")
+    assert server._read_via_local_backend("get_tags") is None
+
+
+def test_get_annotations_joins_parents_and_filters(library):
+    attachment = library.conn.execute(
+        "SELECT itemID FROM items WHERE key = 'ATTACH01'"
+    ).fetchone()[0]
+    first = library.add_annotation(
+        "ANNO0001", attachment, text="Key finding", comment="Check this",
+        page_index=2, page_label="iii", date_added="2024-03-01 10:00:00",
+    )
+    library.add_tag(first, "todo")
+    library.add_annotation(
+        "ANNO0002", attachment, text="Background", color="#2ea8e5",
+        page_index=0, date_added="2024-01-15 09:00:00",
+    )
+    trashed = library.add_annotation("ANNO0003", attachment, text="Gone")
+    library.trash(trashed)
+
+    with LocalZoteroReader(db_path=str(library.path)) as reader:
+        everything = reader.get_annotations()
+        for_item = reader.get_annotations("PAPER001")
+        yellow = reader.get_annotations(colors=["#FFD400"])
+        tagged = reader.get_annotations(tags=["todo"])
+        in_january = reader.get_annotations(since="2024-01-01", until="2024-01-31")
+        in_collection = reader.get_annotations(collection_key="COLLTOP1")
+        elsewhere = reader.get_annotations(collection_key="COLLSUB1")
+        second_page = reader.get_annotations(limit=1, offset=1)
+
+    assert [a["key"] for a in everything] == ["ANNO0001", "ANNO0002"]
+    # Reading order (sortIndex) for a single item
+    assert [a["key"] for a in for_item] == ["ANNO0002", "ANNO0001"]
+    data = everything[0]["data"]
+    assert data["annotationType"] == "highlight"
+    assert data["annotationComment"] == "Check this"
+    assert data["parentItem"] == "ATTACH01"
+    assert data["_parent_title"] == "Deep Learning for Genomics"
+    assert data["_pdf_page"] == 3 and data["_pageLabel"] == "iii"
+    assert data["tags"] == [{"tag": "todo"}]
+    assert [a["key"] for a in yellow] == ["ANNO0001"]
+    assert [a["key"] for a in tagged] == ["ANNO0001"]
+    assert [a["key"] for a in in_january] == ["ANNO0002"]
+    assert len(in_collection) == 2 and elsewhere == []
+    assert [a["key"] for a in second_page] == ["ANNO0002"]
+
+
+def test_get_annotations_tool_reads_local_database(library, monkeypatch, ctx):
+    monkeypatch.setenv("ZOTERO_MCP_READ_BACKEND", "local")
+    monkeypatch.setattr(
+        local_db.LocalZoteroReader, "_find_zotero_db", lambda self: str(library.path)
+    )
+    monkeypatch.setattr(server, "get_zotero_client", lambda: pytest.fail("API used"))
+    attachment = library.conn.execute(
+        "SELECT itemID FROM items WHERE key = 'ATTACH01'"
+    ).fetchone()[0]
+    library.add_annotation("ANNO0001", attachment, text="Key finding", color="#5fb236")
+
+    result = server.get_annotations(color="green", ctx=ctx)
+    assert '## Annotation 1 (from "Deep Learning for Genomics")' in result
+    assert "**Text:** Key finding" in result
+    assert "No annotations found" in server.get_annotations(color="red", ctx=ctx)
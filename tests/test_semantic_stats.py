@@ -53,3 +53,29 @@ def test_process_item_batch_tracks_added_vs_updated(monkeypatch):
     assert stats["processed"] == 2
     assert stats["updated"] == 1
     assert stats["added"] == 1
+
+
+def test_process_item_batch_accepts_local_records(monkeypatch):
+    monkeypatch.setattr(semantic_search, "get_zotero_client", lambda: object())
+    client = FakeChromaClient()
+    search = semantic_search.ZoteroSemanticSearch(chroma_client=client)
+
+    item = semantic_search.ZoteroItem(
+        item_id=1,
+        key="ITEMB002",
+        item_type_id=1,
+        item_type="journalArticle",
+        title="Local Item",
+        creators="Curie, Marie",
+        extra="Citation Key: curie1903",
+    )
+    metadata = search._create_local_metadata(item)
+    stats = search._process_item_batch([item], force_rebuild=False)
+
+    assert stats["added"] == 1
+    assert client.upserted_ids == ["ITEMB002"]
+    assert metadata["title"] == "Local Item"
+    assert metadata["creators"] == search._create_metadata(
+        search._local_item_to_api_item(item)
+    )["creators"]
+    assert metadata["citation_key"] == "curie1903"
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -12,13 +13,32 @@ class _StubResponse:
     headers: dict[str, str]
     content: bytes = b""
 
+    def iter_bytes(self):
+        for i in range(0, len(self.content), 4):
+            yield self.content[i:i + 4]
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
 
 class _StubHttpxClient:
-    def __init__(self, response: _StubResponse):
+    def __init__(self, response: _StubResponse, *, requests=None, headers=None):
         self._response = response
+        self._requests = requests
+        self.headers = headers or {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        return None
 
-    def get(self, *_args, **_kwargs) -> _StubResponse:
-        return self._response
+    @contextmanager
+    def stream(self, method, url, **_kwargs):
+        if self._requests is not None:
+            self._requests.append((url, self.headers))
+        yield self._response
 
 
 class _StubCtx:
@@ -36,10 +56,10 @@ class _StubZot:
         self.library_id = library_id
 
     def default_headers(self) -> dict[str, str]:
-        return {}
+        return {"Zotero-API-Key": "secret"}
 
     def dump(self, *_args, **_kwargs) -> None:
-        raise RuntimeError("Request URL has an unsupported protocol 'file://'.")
+        pytest.fail("zot.dump buffers the whole file in memory")
 
 
 def test_dump_attachment_to_file_resolves_file_redirect(tmp_path: Path, monkeypatch) -> None:
@@ -83,3 +103,53 @@ def test_dump_attachment_to_file_accepts_inline_200_bytes(tmp_path: Path, monkey
 
     assert dest.read_bytes() == payload
 
+
+def test_dump_attachment_to_file_streams_web_api_redirect(tmp_path: Path, monkeypatch) -> None:
+    from zotero_mcp import server
+
+    payload = b"%PDF-web" * 10
+    responses = [
+        _StubResponse(status_code=302, headers={"Location": "https://files.example.com/signed?sig=1"}),
+        _StubResponse(status_code=200, headers={}, content=payload),
+    ]
+    requests: list[tuple[str, dict[str, str]]] = []
+    monkeypatch.setattr(server, "_resolve_local_attachment_path", lambda key: None)
+    monkeypatch.setattr(
+        server.httpx,
+        "Client",
+        lambda *a, **k: _StubHttpxClient(responses.pop(0), requests=requests, headers=k.get("headers")),
+    )
+
+    dest = tmp_path / "out.pdf"
+    server.dump_attachment_to_file(
+        _StubZot(endpoint="https://api.zotero.org", library_type="users", library_id="1"),
+        "ATTACHKEY",
+        dest,
+        ctx=_StubCtx(),
+    )
+
+    assert dest.read_bytes() == payload
+    assert requests == [
+        ("https://api.zotero.org/users/1/items/ATTACHKEY/file", {"Zotero-API-Key": "secret"}),
+        ("https://files.example.com/signed?sig=1", {}),
+    ]
+
+
+def test_dump_attachment_to_file_links_local_storage_file_instead_of_reading_it(
+    tmp_path: Path, monkeypatch
+) -> None:
+    from zotero_mcp import server
+
+    local = tmp_path / "storage" / "paper.pdf"
+    local.parent.mkdir()
+    local.write_bytes(b"%PDF-local")
+    monkeypatch.setattr(server, "_resolve_local_attachment_path", lambda key: local)
+    monkeypatch.setattr(Path, "read_bytes", lambda self: pytest.fail("file was read into memory"))
+
+    dest = tmp_path / "out.pdf"
+    server.dump_attachment_to_file(object(), "ATTACHKEY", dest, ctx=_StubCtx())
+
+    assert dest.stat().st_ino == local.stat().st_ino
+
+    with server._attachment_file(object(), "ATTACHKEY", filename="paper.pdf", ctx=_StubCtx()) as path:
+        assert path == local
@@ -1,3 +1,5 @@
+import copy
+
 from zotero_mcp import server
 
 
@@ -111,3 +113,83 @@ def test_batch_update_tags_validates_json_array(monkeypatch):
     )
 
     assert "must be a JSON array or a list of strings" in result
+
+
+class FakeWriteResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+class FakeZoteroForBatchTags:
+    def __init__(self, count):
+        self._items = {
+            f"ITEM{idx:04d}": {
+                "key": f"ITEM{idx:04d}",
+                "version": 1,
+                "data": {
+                    "key": f"ITEM{idx:04d}",
+                    "version": 1,
+                    "itemType": "journalArticle",
+                    "tags": [{"tag": "old"}],
+                },
+            }
+            for idx in range(count)
+        }
+        self.params = {}
+        self.pages = []
+        self.writes = []
+        self.conflict_once = set()
+        self.request = None
+
+    def add_parameters(self, **kwargs):
+        self.params = kwargs
+
+    def items(self, **kwargs):
+        if "itemKey" in kwargs:
+            return [copy.deepcopy(self._items[key]) for key in kwargs["itemKey"].split(",")]
+        params, self.params = self.params, {}
+        start, limit = params["start"], params["limit"]
+        self.pages.append((start, limit))
+        return [copy.deepcopy(item) for item in list(self._items.values())[start:start + limit]]
+
+    def update_items(self, payload):
+        self.writes.append([data["key"] for data in payload])
+        failed = {}
+        for index, data in enumerate(payload):
+            key = data["key"]
+            if key in self.conflict_once:
+                # Someone else edited the item: bump its version and reject the write.
+                self.conflict_once.discard(key)
+                self._items[key]["version"] = self._items[key]["data"]["version"] = 2
+                failed[str(index)] = {"key": key, "code": 412, "message": "Item has been modified"}
+                continue
+            self._items[key]["data"] = copy.deepcopy(data)
+        self.request = FakeWriteResponse({"successful": {}, "unchanged": {}, "failed": failed})
+        return True
+
+
+def test_batch_update_tags_paginates_and_writes_in_batches_of_fifty(monkeypatch):
+    fake_zot = FakeZoteroForBatchTags(120)
+    fake_zot.conflict_once.add("ITEM0005")
+    monkeypatch.setattr(server, "get_zotero_client", lambda: fake_zot)
+
+    result = server.batch_update_tags(
+        query="anything",
+        add_tags=["new"],
+        remove_tags=["old"],
+        limit=120,
+        ctx=DummyContext(),
+    )
+
+    assert fake_zot.pages == [(0, 100), (100, 20)]
+    assert [len(batch) for batch in fake_zot.writes] == [50, 50, 20, 1]
+    assert fake_zot.writes[-1] == ["ITEM0005"]
+    assert "Items updated: 120" in result
+    assert "- `new`: 120 items" in result
+    assert "- `old`: 120 items" in result
+    assert all(
+        item["data"]["tags"] == [{"tag": "new"}] for item in fake_zot._items.values()
+    )
@@ -1,10 +1,13 @@
 """Tests for write tools: DOI, arXiv, URL, and smart identifier import."""
 import asyncio
+import json
 from pathlib import Path
 import sys
+import threading
+import time
 import types
-import urllib.request
 
+import pytest
 import requests as requests_lib
 
 import zotero_mcp.server as server
@@ -91,6 +94,10 @@ class FakeRequestsResponse:
         self.headers = headers or {}
         self.content = content or b""
         self.url = url
+        self.closed = False
+
+    def close(self):
+        self.closed = True
 
     def raise_for_status(self):
         if self.status_code >= 400:
@@ -142,30 +149,36 @@ EUROPEPMC_FULLTEXT_XML = b"""<?xml version='1.0' encoding='UTF-8'?>
 """
 
 
-class FakeURLResponse:
-    """Context-manager fake for urllib.request.urlopen."""
-
-    def __init__(self, data: bytes):
-        self._data = data
-
-    def read(self, n=-1):
-        return self._data if n < 0 else self._data[:n]
+def fake_http_get(*, pages=None, arxiv=None, final_url=None, fallback=None):
+    """
+    Build a fake http_client.get for landing pages and the arXiv API.
 
-    def __enter__(self):
-        return self
+    `pages` maps landing-page URLs to HTML bytes, served from `final_url`
+    when given (as after a redirect); `arxiv` is the Atom feed returned for
+    every arXiv API query. Either may be an exception to raise instead.
+    Other URLs go to `fallback`, or to the real http_client.get.
+    """
+    fallback = fallback or server.http_client.get
 
-    def __exit__(self, *args):
-        pass
+    def fake_get(url, **kwargs):
+        if arxiv is not None and url == "https://export.arxiv.org/api/query":
+            body = arxiv
+        elif pages and url in pages:
+            body = pages[url]
+        else:
+            return fallback(url, **kwargs)
+        if isinstance(body, Exception):
+            raise body
+        return FakeRequestsResponse(content=body, url=final_url or url)
 
-    def geturl(self):
-        return "https://example.com/final"
+    return fake_get
 
 
 # ── zotero_add_items_by_doi ───────────────────────────────────────────────────
 
 def test_doi_single_success(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        server.requests, "get",
+        server.http_client, "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
@@ -178,7 +191,7 @@ def test_doi_single_success(monkeypatch, patch_web_client, ctx):
 def test_doi_single_success_defaults_to_user_friendly_output(monkeypatch, patch_web_client, ctx):
     monkeypatch.delenv("ZOTERO_MCP_DEBUG_IMPORT", raising=False)
     monkeypatch.setattr(
-        server.requests, "get",
+        server.http_client, "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
@@ -194,15 +207,189 @@ def test_doi_multiple_success(monkeypatch, patch_web_client, ctx):
         call_count["n"] += 1
         return FakeRequestsResponse(CROSSREF_RESPONSE)
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.1/a", "10.1/b"], ctx=ctx)
     assert result.count("✓") == 2
     assert call_count["n"] >= 2
 
 
+def test_identifier_batch_runs_concurrently_but_keeps_input_order(
+    monkeypatch, patch_web_client, ctx, tmp_path
+):
+    ledger_path = tmp_path / "import-ledger.jsonl"
+    monkeypatch.setenv("ZOTERO_MCP_IMPORT_LEDGER_PATH", str(ledger_path))
+    monkeypatch.setenv("ZOTERO_MCP_IMPORT_CONCURRENCY", "3")
+    # The first DOI answers last, so completion order is the reverse of input order.
+    delays = {"10.1234/a": 0.3, "10.1234/b": 0.15, "10.1234/c": 0.0}
+    in_flight = {"now": 0, "max": 0}
+    lock = threading.Lock()
+
+    def fake_get(url, headers=None, timeout=None, **kwargs):
+        doi = url.rsplit("/works/", 1)[-1]
+        with lock:
+            in_flight["now"] += 1
+            in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        time.sleep(delays.get(doi, 0))
+        with lock:
+            in_flight["now"] -= 1
+        payload = json.loads(json.dumps(CROSSREF_RESPONSE))
+        payload["message"]["title"] = [f"Paper {doi}"]
+        return FakeRequestsResponse(payload)
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    result = server.add_items_by_identifier(
+        identifiers=["10.1234/a", "10.1234/b", "10.1234/c"], attach_pdf=False, ctx=ctx
+    )
+
+    assert in_flight["max"] > 1
+    lines = [line for line in result.splitlines() if line.startswith("✓")]
+    assert [line.split(" → ")[0] for line in lines] == [
+        "✓ Paper 10.1234/a",
+        "✓ Paper 10.1234/b",
+        "✓ Paper 10.1234/c",
+    ]
+    ledger = server._read_import_ledger(action="import")
+    assert [entry["input"] for entry in ledger] == [
+        "10.1234/a",
+        "10.1234/b",
+        "10.1234/c",
+    ]
+
+
+def test_identifier_batch_serializes_repeated_identifiers(monkeypatch, patch_web_client, ctx):
+    monkeypatch.setenv("ZOTERO_MCP_IMPORT_CONCURRENCY", "4")
+    in_flight: dict[str, int] = {}
+    overlap = {"same_doi": 0, "any": 0}
+    lock = threading.Lock()
+
+    def fake_get(url, headers=None, timeout=None, **kwargs):
+        if "/works/" not in url:
+            return FakeRequestsResponse(json.loads(json.dumps(CROSSREF_RESPONSE)))
+        doi = url.rsplit("/works/", 1)[-1].lower()
+        with lock:
+            in_flight[doi] = in_flight.get(doi, 0) + 1
+            overlap["same_doi"] = max(overlap["same_doi"], in_flight[doi])
+            overlap["any"] = max(overlap["any"], sum(in_flight.values()))
+        time.sleep(0.1)
+        with lock:
+            in_flight[doi] -= 1
+        payload = json.loads(json.dumps(CROSSREF_RESPONSE))
+        payload["message"]["title"] = [f"Paper {doi}"]
+        return FakeRequestsResponse(payload)
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    server.add_items_by_identifier(
+        identifiers=["10.1234/dup", "https://doi.org/10.1234/DUP", "10.1234/other"],
+        attach_pdf=False,
+        ctx=ctx,
+    )
+
+    assert overlap["any"] > 1
+    assert overlap["same_doi"] == 1
+    assert server._identifier_batch_key("https://doi.org/10.1234/DUP") == server._identifier_batch_key(
+        "10.1234/dup"
+    )
+    assert server._identifier_batch_key("arXiv:2401.00001v2") == server._identifier_batch_key(
+        "https://arxiv.org/abs/2401.00001"
+    )
+
+
+def test_doi_batch_creates_all_parent_items_in_one_write(monkeypatch, patch_web_client, ctx):
+    def fake_get(url, headers=None, timeout=None, **kwargs):
+        payload = json.loads(json.dumps(CROSSREF_RESPONSE))
+        payload["message"]["title"] = [f"Paper {url.rsplit('/works/', 1)[-1]}"]
+        return FakeRequestsResponse(payload)
+
+    create_calls = []
+    original_create = patch_web_client.create_items
+
+    def counting_create(items, timeout=None):
+        create_calls.append((len(items), timeout))
+        return original_create(items)
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    monkeypatch.setattr(patch_web_client, "create_items", counting_create)
+    dois = [f"10.1234/p{i}" for i in range(5)] + ["10.1234/P0"]
+    result = server.add_items_by_doi(dois=dois, attach_pdf=False, ctx=ctx)
+
+    assert create_calls == [(5, server._ZOTERO_BATCH_WRITE_TIMEOUT)]
+    lines = [line for line in result.splitlines() if line.startswith("✓")]
+    assert [line.split(" → ")[0] for line in lines] == [
+        "✓ Paper 10.1234/p0",
+        "✓ Paper 10.1234/p1",
+        "✓ Paper 10.1234/p2",
+        "✓ Paper 10.1234/p3",
+        "✓ Paper 10.1234/p4",
+        "✓ Paper 10.1234/p0",
+    ]
+    assert "NEWKEY5" in lines[4]
+
+
+def test_doi_batch_resolves_metadata_in_one_request_per_service(
+    monkeypatch, patch_web_client, ctx
+):
+    requested = []
+
+    def fake_get(url, headers=None, timeout=None, params=None, **kwargs):
+        requested.append((url, dict(params or {})))
+        if url == "https://api.crossref.org/works":
+            dois = [part.split(":", 1)[1] for part in params["filter"].split(",")]
+            items = []
+            for doi in dois[:-1]:  # the last DOI is missing from the batch response
+                work = json.loads(json.dumps(CROSSREF_RESPONSE["message"]))
+                work.update({"DOI": doi.upper(), "title": [f"Paper {doi}"]})
+                items.append(work)
+            return FakeRequestsResponse({"message": {"items": items}})
+        payload = json.loads(json.dumps(CROSSREF_RESPONSE))
+        payload["message"]["title"] = [f"Single {url.rsplit('/works/', 1)[-1]}"]
+        return FakeRequestsResponse(payload)
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    result = server.add_items_by_doi(
+        dois=["10.1234/a", "10.1234/b", "10.1234/c"], attach_pdf=False, ctx=ctx
+    )
+
+    assert [url for url, _ in requested if "api.crossref.org" in url] == [
+        "https://api.crossref.org/works",
+        "https://api.crossref.org/works/10.1234/c",
+    ]
+    assert requested[0][1]["filter"] == "doi:10.1234/a,doi:10.1234/b,doi:10.1234/c"
+    lines = [line.split(" → ")[0] for line in result.splitlines() if line.startswith("✓")]
+    assert lines == ["✓ Paper 10.1234/a", "✓ Paper 10.1234/b", "✓ Single 10.1234/c"]
+
+
+def test_arxiv_batch_resolves_all_ids_with_one_id_list_query(monkeypatch, patch_web_client, ctx):
+    feed = b"""<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <entry><id>http://arxiv.org/abs/2301.00001v2</id><title>First</title>
+    <published>2023-01-01T00:00:00Z</published><author><name>A B</name></author></entry>
+  <entry><id>http://arxiv.org/abs/2301.00002v1</id><title>Second</title>
+    <published>2023-01-02T00:00:00Z</published><author><name>C D</name></author></entry>
+</feed>"""
+    opened = []
+
+    def fake_get(url, params=None, **kwargs):
+        opened.append((url, params))
+        return FakeRequestsResponse(content=feed, url=url)
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    result = server.add_items_by_arxiv(
+        arxiv_ids=["2301.00001", "arXiv:2301.00002"], attach_pdf=False, ctx=ctx
+    )
+
+    assert opened == [
+        (
+            "https://export.arxiv.org/api/query",
+            {"id_list": "2301.00001,2301.00002", "max_results": 2},
+        )
+    ]
+    assert [item["title"] for item in patch_web_client.created_items] == ["First", "Second"]
+    assert result.count("✓") == 2
+
+
 def test_doi_with_collection_key(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        server.requests, "get",
+        server.http_client, "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
     server.add_items_by_doi(dois=["10.1/x"], collection_key="COL1", ctx=ctx)
@@ -211,7 +398,7 @@ def test_doi_with_collection_key(monkeypatch, patch_web_client, ctx):
 
 def test_doi_http_error(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        server.requests, "get",
+        server.http_client, "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse({}, status_code=404),
     )
     result = server.add_items_by_doi(dois=["10.1/bad"], ctx=ctx)
@@ -229,7 +416,7 @@ def test_doi_create_items_failed(monkeypatch, fake_zot, ctx):
     fake_zot.create_items = lambda items: {"successful": {}, "failed": {"0": "err"}}
     monkeypatch.setattr(server, "get_web_zotero_client", lambda: fake_zot)
     monkeypatch.setattr(
-        server.requests, "get",
+        server.http_client, "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
     result = server.add_items_by_doi(dois=["10.1/x"], ctx=ctx)
@@ -251,7 +438,7 @@ def test_doi_attach_pdf_defaults_to_true(monkeypatch, patch_web_client, ctx):
             content=PDF_BYTES,
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
     assert "pdf_source=unpaywall" in result
     assert patch_web_client.attached_files
@@ -287,7 +474,7 @@ def test_doi_attach_pdf_uses_crossref_pdf_link_before_fallbacks(
             )
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
     assert "pdf_source=crossref:link" in result
     assert patch_web_client.attached_files
@@ -322,7 +509,7 @@ def test_doi_attach_pdf_can_infer_pdf_from_resolved_landing_url(
             )
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.21437/test"], ctx=ctx)
     assert "pdf_source=url_pattern:same_stem_pdf" in result
     assert patch_web_client.attached_files
@@ -390,7 +577,7 @@ def test_doi_attach_pdf_falls_back_to_openalex_when_unpaywall_fails(
             )
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
     assert "pdf_source=openalex:best_oa_location" in result
     assert patch_web_client.attached_files
@@ -423,7 +610,7 @@ def test_doi_attach_pdf_falls_back_to_openalex_without_unpaywall_email(
             )
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
     assert "pdf_source=openalex:best_oa_location" in result
     assert patch_web_client.attached_files
@@ -457,7 +644,7 @@ def test_find_and_attach_pdfs_defaults_to_user_friendly_output(
             content=PDF_BYTES,
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     monkeypatch.setattr(server, "_fetch_page_signals", lambda url, ctx: {"pdf_candidates": []})
 
     result = server.find_and_attach_pdfs(item_keys=["ITEM1"], ctx=ctx)
@@ -509,7 +696,7 @@ def test_find_and_attach_pdfs_reuses_doi_pdf_discovery_from_crossref_and_resolve
             return FakeRequestsResponse({"resultList": {"result": []}})
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     monkeypatch.setattr(server, "_fetch_page_signals", lambda url, ctx: {"pdf_candidates": []})
 
     result = server.find_and_attach_pdfs(item_keys=["ITEM1"], ctx=ctx)
@@ -555,7 +742,7 @@ def test_doi_conference_paper_uses_proceedings_title_field(monkeypatch, patch_we
 
     monkeypatch.setattr(patch_web_client, "item_template", fake_item_template)
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse(CROSSREF_PROCEEDINGS_RESPONSE),
     )
@@ -573,7 +760,7 @@ def test_doi_import_reuses_existing_local_copy_before_creating_new_parent(
     ctx,
 ):
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
         lambda url, headers=None, timeout=None: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
@@ -623,20 +810,16 @@ def test_doi_import_reuses_existing_local_copy_before_creating_new_parent(
 
 # ── zotero_add_items_by_arxiv ─────────────────────────────────────────────────
 
-def _make_arxiv_urlopen(data: bytes):
-    def fake_urlopen(url, timeout=None):
-        return FakeURLResponse(data)
-    return fake_urlopen
-
-
 def test_arxiv_bare_id(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(urllib.request, "urlopen", _make_arxiv_urlopen(ARXIV_XML))
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            arxiv=ARXIV_XML,
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
     result = server.add_items_by_arxiv(arxiv_ids=["2301.12345"], ctx=ctx)
@@ -649,13 +832,13 @@ def test_arxiv_bare_id(monkeypatch, patch_web_client, ctx):
 
 
 def test_arxiv_prefix_stripped(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(urllib.request, "urlopen", _make_arxiv_urlopen(ARXIV_XML))
+    monkeypatch.setattr(server.http_client, "get", fake_http_get(arxiv=ARXIV_XML))
     result = server.add_items_by_arxiv(arxiv_ids=["arXiv:2301.12345"], ctx=ctx)
     assert "✓" in result
 
 
 def test_arxiv_full_url_stripped(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(urllib.request, "urlopen", _make_arxiv_urlopen(ARXIV_XML))
+    monkeypatch.setattr(server.http_client, "get", fake_http_get(arxiv=ARXIV_XML))
     result = server.add_items_by_arxiv(
         arxiv_ids=["https://arxiv.org/abs/2301.12345"], ctx=ctx
     )
@@ -663,7 +846,7 @@ def test_arxiv_full_url_stripped(monkeypatch, patch_web_client, ctx):
 
 
 def test_arxiv_doi_prefix_stripped(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(urllib.request, "urlopen", _make_arxiv_urlopen(ARXIV_XML))
+    monkeypatch.setattr(server.http_client, "get", fake_http_get(arxiv=ARXIV_XML))
     result = server.add_items_by_arxiv(
         arxiv_ids=["10.48550/arXiv.2301.12345"], ctx=ctx
     )
@@ -671,17 +854,16 @@ def test_arxiv_doi_prefix_stripped(monkeypatch, patch_web_client, ctx):
 
 
 def test_arxiv_no_entry_found(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(urllib.request, "urlopen", _make_arxiv_urlopen(ARXIV_EMPTY_XML))
+    monkeypatch.setattr(server.http_client, "get", fake_http_get(arxiv=ARXIV_EMPTY_XML))
     result = server.add_items_by_arxiv(arxiv_ids=["9999.99999"], ctx=ctx)
     assert "✗" in result
     assert "not found" in result
 
 
 def test_arxiv_network_error(monkeypatch, patch_web_client, ctx):
-    def fail_urlopen(url, timeout=None):
-        raise OSError("Network unreachable")
-
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
+    monkeypatch.setattr(
+        server.http_client, "get", fake_http_get(arxiv=OSError("Network unreachable"))
+    )
     result = server.add_items_by_arxiv(arxiv_ids=["2301.12345"], ctx=ctx)
     assert "✗" in result
 
@@ -693,13 +875,15 @@ def test_arxiv_no_credentials(patch_no_credentials, ctx):
 
 
 def test_arxiv_pdf_url_variant_resolves(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(urllib.request, "urlopen", _make_arxiv_urlopen(ARXIV_XML))
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            arxiv=ARXIV_XML,
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
     result = server.add_items_by_arxiv(
@@ -788,8 +972,7 @@ HTML_BYTES = b"<html>not a pdf</html>"
 
 def test_url_og_title_used(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        urllib.request, "urlopen",
-        lambda req, timeout=None: FakeURLResponse(OG_TITLE_HTML),
+        server.http_client, "get", fake_http_get(pages={"https://example.com": OG_TITLE_HTML})
     )
     result = server.add_item_by_url(url="https://example.com", ctx=ctx)
     assert "✓" in result
@@ -800,8 +983,7 @@ def test_url_og_title_used(monkeypatch, patch_web_client, ctx):
 
 def test_url_plain_title_fallback(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        urllib.request, "urlopen",
-        lambda req, timeout=None: FakeURLResponse(PLAIN_TITLE_HTML),
+        server.http_client, "get", fake_http_get(pages={"https://example.com": PLAIN_TITLE_HTML})
     )
     result = server.add_item_by_url(url="https://example.com", ctx=ctx)
     assert "Plain Title" in result
@@ -810,8 +992,7 @@ def test_url_plain_title_fallback(monkeypatch, patch_web_client, ctx):
 
 def test_url_explicit_title_overrides_page(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        urllib.request, "urlopen",
-        lambda req, timeout=None: FakeURLResponse(OG_TITLE_HTML),
+        server.http_client, "get", fake_http_get(pages={"https://example.com": OG_TITLE_HTML})
     )
     result = server.add_item_by_url(
         url="https://example.com", title="My Custom Title", ctx=ctx
@@ -821,10 +1002,11 @@ def test_url_explicit_title_overrides_page(monkeypatch, patch_web_client, ctx):
 
 
 def test_url_network_error_uses_url_as_title(monkeypatch, patch_web_client, ctx):
-    def fail_urlopen(req, timeout=None):
-        raise OSError("Network error")
-
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(pages={"https://example.com/page": OSError("Network error")}),
+    )
     result = server.add_item_by_url(url="https://example.com/page", ctx=ctx)
     assert "✓" in result
     assert patch_web_client.created_items[0]["title"] == "https://example.com/page"
@@ -839,12 +1021,6 @@ def test_url_no_credentials(patch_no_credentials, ctx):
 def test_identifier_prefers_doi_from_landing_page(monkeypatch, patch_web_client, ctx):
     monkeypatch.setenv("UNPAYWALL_EMAIL", "tester@example.com")
 
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_DOI_AND_PDF),
-    )
-
     def fake_get(url, headers=None, timeout=None, params=None, stream=None):
         if "crossref" in url:
             return FakeRequestsResponse(CROSSREF_RESPONSE)
@@ -857,7 +1033,14 @@ def test_identifier_prefers_doi_from_landing_page(monkeypatch, patch_web_client,
             return FakeRequestsResponse({"best_oa_location": {}})
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://publisher.example.com/paper": LANDING_WITH_DOI_AND_PDF},
+            fallback=fake_get,
+        ),
+    )
     result = server.add_items_by_identifier(
         identifiers=["https://publisher.example.com/paper"],
         ctx=ctx,
@@ -883,7 +1066,7 @@ def test_identifier_retries_trimmed_doi_from_publisher_landing_url(
                 return FakeRequestsResponse(CROSSREF_RESPONSE)
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_identifier(
         identifiers=["https://academic.oup.com/nsr/article/doi/10.1093/nsr/nwaf086/8052010"],
         attach_pdf=False,
@@ -903,9 +1086,6 @@ def test_identifier_infers_mdpi_doi_from_structured_url_when_page_fetch_is_block
     patch_web_client,
     ctx,
 ):
-    def fail_urlopen(_req, timeout=None):
-        raise OSError("403 Forbidden")
-
     def fake_get(url, headers=None, timeout=None, params=None, stream=None):
         if "api.crossref.org/works?" in url or (url.endswith("/works") and params):
             return FakeRequestsResponse(CROSSREF_MDPI_SEARCH_RESPONSE)
@@ -913,8 +1093,14 @@ def test_identifier_infers_mdpi_doi_from_structured_url_when_page_fetch_is_block
             return FakeRequestsResponse(CROSSREF_MDPI_WORK)
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://www.mdpi.com/2072-4292/13/3/516": OSError("403 Forbidden")},
+            fallback=fake_get,
+        ),
+    )
 
     result = server.add_items_by_identifier(
         identifiers=["https://www.mdpi.com/2072-4292/13/3/516"],
@@ -929,16 +1115,14 @@ def test_identifier_infers_mdpi_doi_from_structured_url_when_page_fetch_is_block
 
 def test_identifier_falls_back_to_webpage_with_pdf(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-    monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
     result = server.add_items_by_identifier(
@@ -959,16 +1143,14 @@ def test_identifier_falls_back_to_webpage_with_pdf_defaults_to_user_friendly_out
 ):
     monkeypatch.delenv("ZOTERO_MCP_DEBUG_IMPORT", raising=False)
     monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-    monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
 
@@ -983,15 +1165,7 @@ def test_identifier_falls_back_to_webpage_with_pdf_defaults_to_user_friendly_out
 
 
 def test_fetch_page_signals_appends_url_inference_pdf_candidates_after_html_candidates(monkeypatch, ctx):
-    class StableURLResponse(FakeURLResponse):
-        def geturl(self):
-            return "https://proceedings.mlr.press/v139/radford21a.html"
-
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: StableURLResponse(LANDING_WITH_HTTP_PDF_META),
-    )
+    monkeypatch.setattr(server.http_client, "get", fake_http_get(pages={"https://proceedings.mlr.press/v139/radford21a.html": LANDING_WITH_HTTP_PDF_META}))
     signals = server._fetch_page_signals(
         "https://proceedings.mlr.press/v139/radford21a.html",
         ctx=ctx,
@@ -1017,16 +1191,6 @@ def test_identifier_falls_back_from_http_meta_pdf_to_inferred_https_pdf(
     patch_web_client,
     ctx,
 ):
-    class StableURLResponse(FakeURLResponse):
-        def geturl(self):
-            return "https://proceedings.mlr.press/v139/radford21a.html"
-
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: StableURLResponse(LANDING_WITH_HTTP_PDF_META),
-    )
-
     def fake_get(url, headers=None, timeout=None, params=None, stream=None):
         if url == "https://proceedings.mlr.press/v139/radford21a/radford21a.pdf":
             return FakeRequestsResponse(
@@ -1043,7 +1207,14 @@ def test_identifier_falls_back_from_http_meta_pdf_to_inferred_https_pdf(
             )
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://proceedings.mlr.press/v139/radford21a.html": LANDING_WITH_HTTP_PDF_META},
+            fallback=fake_get,
+        ),
+    )
     result = server.add_items_by_identifier(
         identifiers=["https://proceedings.mlr.press/v139/radford21a.html"],
         ctx=ctx,
@@ -1055,16 +1226,14 @@ def test_identifier_falls_back_from_http_meta_pdf_to_inferred_https_pdf(
 
 def test_identifier_webpage_fallback_salvages_metadata(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_RICH_METADATA),
-    )
-    monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            pages={"https://example.com/rich-landing": LANDING_WITH_RICH_METADATA},
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
     result = server.add_items_by_identifier(
@@ -1087,12 +1256,6 @@ def test_identifier_uses_crossref_title_lookup_before_webpage_fallback(
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_RICH_METADATA),
-    )
-
     def fake_get(url, headers=None, timeout=None, params=None, stream=None):
         if url == "https://api.crossref.org/works":
             return FakeRequestsResponse(
@@ -1120,7 +1283,14 @@ def test_identifier_uses_crossref_title_lookup_before_webpage_fallback(
             return FakeRequestsResponse({"best_oa_location": {}})
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/rich-landing": LANDING_WITH_RICH_METADATA},
+            fallback=fake_get,
+        ),
+    )
     result = server.add_items_by_identifier(
         identifiers=["https://example.com/rich-landing"],
         ctx=ctx,
@@ -1131,16 +1301,14 @@ def test_identifier_uses_crossref_title_lookup_before_webpage_fallback(
 
 def test_identifier_webpage_fallback_extracts_body_abstract(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_BODY_ABSTRACT),
-    )
-    monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            pages={"https://example.com/body-abstract": LANDING_WITH_BODY_ABSTRACT},
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
     result = server.add_items_by_identifier(
@@ -1171,30 +1339,28 @@ def test_fetch_page_signals_cvf_timeout_uses_url_derived_fallback(ctx):
 
 
 def test_fetch_page_signals_cvf_timeout_returns_fallback(monkeypatch, ctx):
-    def fail_urlopen(req, timeout=None):
-        raise urllib.error.URLError("timed out")
-
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    signals = server._fetch_page_signals(
+    url = (
         "https://openaccess.thecvf.com/content/CVPR2024/html/"
-        "Kim_Retrieval-Augmented_Open-Vocabulary_Object_Detection_CVPR_2024_paper.html",
-        ctx=ctx,
+        "Kim_Retrieval-Augmented_Open-Vocabulary_Object_Detection_CVPR_2024_paper.html"
     )
+    monkeypatch.setattr(
+        server.http_client, "get", fake_http_get(pages={url: requests_lib.Timeout("timed out")})
+    )
+    signals = server._fetch_page_signals(url, ctx=ctx)
     assert signals["title"] == "Retrieval-Augmented Open-Vocabulary Object Detection"
     assert signals["date"] == "2024"
     assert signals["pdf_candidates"][0]["source"] == "url_pattern:cvf_pdf"
 
 
 def test_fetch_page_signals_cvf_legacy_path_timeout_returns_fallback(monkeypatch, ctx):
-    def fail_urlopen(req, timeout=None):
-        raise urllib.error.URLError("timed out")
-
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    signals = server._fetch_page_signals(
+    url = (
         "https://openaccess.thecvf.com/content_ICCV_2017/html/"
-        "Wang_Learning_to_Detect_Instances_ICCV_2017_paper.html",
-        ctx=ctx,
+        "Wang_Learning_to_Detect_Instances_ICCV_2017_paper.html"
+    )
+    monkeypatch.setattr(
+        server.http_client, "get", fake_http_get(pages={url: requests_lib.Timeout("timed out")})
     )
+    signals = server._fetch_page_signals(url, ctx=ctx)
     assert signals["title"] == "Learning to Detect Instances"
     assert signals["venue"] == "ICCV"
     assert signals["date"] == "2017"
@@ -1208,14 +1374,11 @@ def test_fetch_page_signals_cvf_legacy_path_timeout_returns_fallback(monkeypatch
 
 
 def test_fetch_page_signals_timeout_uses_general_url_inference_for_pmlr(monkeypatch, ctx):
-    def fail_urlopen(req, timeout=None):
-        raise urllib.error.URLError("timed out")
-
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    signals = server._fetch_page_signals(
-        "https://proceedings.mlr.press/v139/radford21a.html",
-        ctx=ctx,
+    url = "https://proceedings.mlr.press/v139/radford21a.html"
+    monkeypatch.setattr(
+        server.http_client, "get", fake_http_get(pages={url: requests_lib.Timeout("timed out")})
     )
+    signals = server._fetch_page_signals(url, ctx=ctx)
     assert signals["title"] is None
     assert signals["venue"] == "Proceedings of Machine Learning Research"
     assert signals["date"] == ""
@@ -1232,14 +1395,11 @@ def test_fetch_page_signals_timeout_uses_general_url_inference_for_pmlr(monkeypa
 
 
 def test_fetch_page_signals_timeout_uses_general_url_inference_for_verbose_url(monkeypatch, ctx):
-    def fail_urlopen(req, timeout=None):
-        raise urllib.error.URLError("timed out")
-
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    signals = server._fetch_page_signals(
-        "https://papers.example.org/Smith_Deep_Learning_for_Science_CVPR_2025.html",
-        ctx=ctx,
+    url = "https://papers.example.org/Smith_Deep_Learning_for_Science_CVPR_2025.html"
+    monkeypatch.setattr(
+        server.http_client, "get", fake_http_get(pages={url: requests_lib.Timeout("timed out")})
     )
+    signals = server._fetch_page_signals(url, ctx=ctx)
     assert signals["title"] == "Smith Deep Learning for Science"
     assert signals["venue"] == "CVPR"
     assert signals["date"] == "2025"
@@ -1254,16 +1414,11 @@ def test_identifier_cvf_timeout_falls_back_to_url_derived_title_lookup(
     patch_web_client,
     ctx,
 ):
-    import urllib.request
-
     cvf_url = (
         "https://openaccess.thecvf.com/content/CVPR2024/html/"
         "Kim_Retrieval-Augmented_Open-Vocabulary_Object_Detection_CVPR_2024_paper.html"
     )
 
-    def fail_urlopen(req, timeout=None):
-        raise urllib.error.URLError("timed out")
-
     def fake_get(url, headers=None, timeout=None, params=None, stream=None):
         if url == "https://api.crossref.org/works":
             return FakeRequestsResponse(
@@ -1304,8 +1459,14 @@ def test_identifier_cvf_timeout_falls_back_to_url_derived_title_lookup(
             return FakeRequestsResponse({"results": [], "best_oa_location": {}})
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={cvf_url: requests_lib.Timeout("timed out")},
+            fallback=fake_get,
+        ),
+    )
 
     result = server.add_items_by_identifier(
         identifiers=[cvf_url],
@@ -1322,9 +1483,6 @@ def test_identifier_pmlr_timeout_falls_back_to_webpage_with_inferred_pdf(
     patch_web_client,
     ctx,
 ):
-    def fail_urlopen(req, timeout=None):
-        raise urllib.error.URLError("timed out")
-
     def fake_get(url, headers=None, timeout=None, params=None, stream=None):
         if url == "https://proceedings.mlr.press/v139/radford21a.pdf":
             return FakeRequestsResponse(
@@ -1341,8 +1499,16 @@ def test_identifier_pmlr_timeout_falls_back_to_webpage_with_inferred_pdf(
             return FakeRequestsResponse({"message": {"items": []}, "results": []})
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(urllib.request, "urlopen", fail_urlopen)
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={
+                "https://proceedings.mlr.press/v139/radford21a.html": requests_lib.Timeout("timed out")
+            },
+            fallback=fake_get,
+        ),
+    )
 
     result = server.add_items_by_identifier(
         identifiers=["https://proceedings.mlr.press/v139/radford21a.html"],
@@ -1402,11 +1568,46 @@ def test_lookup_crossref_doi_uses_partial_title_venue_year_author_hints(monkeypa
             }
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     doi = server._lookup_crossref_doi_for_signals(signals, ctx=ctx)
     assert doi == "10.5555/llmdet"
 
 
+def test_lookup_crossref_doi_stops_waiting_once_a_match_is_accepted(monkeypatch, ctx):
+    signals = {
+        "title": "Imaging Biomarkers for Neural Decoding",
+        "venue": "Nature",
+        "date": "2023",
+        "creators": [{"creatorType": "author", "lastName": "Smith"}],
+        "source_url": "https://example.com/landing",
+        "final_url": "https://example.com/landing",
+        "pdf_candidates": [],
+    }
+    release = threading.Event()
+    match = {
+        "DOI": "10.1038/biomarkers",
+        "title": ["Imaging Biomarkers for Neural Decoding"],
+        "author": [{"given": "Alice", "family": "Smith"}],
+        "published": {"date-parts": [[2023]]},
+        "container-title": ["Nature"],
+    }
+
+    def fake_get(url, headers=None, timeout=None, params=None, stream=None):
+        if "query.title" in (params or {}):
+            return FakeRequestsResponse({"message": {"items": [match, dict(match)]}})
+        release.wait(5)
+        return FakeRequestsResponse({"message": {"items": []}})
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    started = time.monotonic()
+    try:
+        doi = server._lookup_crossref_doi_for_signals(signals, ctx=ctx)
+    finally:
+        release.set()
+    assert doi == "10.1038/biomarkers"
+    assert time.monotonic() - started < 2
+
+
 def test_identifier_uses_url_pdf_venue_hints_when_title_missing(
     monkeypatch,
     patch_web_client,
@@ -1474,7 +1675,7 @@ def test_identifier_uses_url_pdf_venue_hints_when_title_missing(
         raise AssertionError(f"unexpected URL: {url}")
 
     monkeypatch.setattr(server, "_fetch_page_signals", fake_fetch_page_signals)
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_identifier(
         identifiers=["https://publisher.example.com/landing-page"],
         ctx=ctx,
@@ -1486,7 +1687,7 @@ def test_identifier_uses_url_pdf_venue_hints_when_title_missing(
 
 def test_identifier_direct_pdf_html_error_does_not_attach(monkeypatch, patch_web_client, ctx):
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
         lambda url, **kwargs: FakeRequestsResponse(
             headers={"Content-Type": "text/html"},
@@ -1534,7 +1735,7 @@ def test_identifier_direct_pdf_probe_prefers_paper_import_over_webpage(
         types.SimpleNamespace(open=lambda stream, filetype: FakeDoc()),
     )
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
         lambda url, headers=None, timeout=None, **kwargs: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
@@ -1576,7 +1777,7 @@ def test_identifier_direct_pdf_probe_can_use_playwright_download_fallback(
             return FakeRequestsResponse(CROSSREF_RESPONSE)
         raise requests_lib.HTTPError("403 forbidden")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     monkeypatch.setattr(server.time, "sleep", lambda *_: None)
     monkeypatch.setattr(
         server,
@@ -1637,7 +1838,7 @@ def test_identifier_direct_pdf_probe_can_rescue_doi_via_crossref_title_match(
         "fitz",
         types.SimpleNamespace(open=lambda stream, filetype: FakeDoc()),
     )
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
 
     result = server.add_items_by_identifier(
         identifiers=["https://example.com/title-only.pdf"],
@@ -1725,7 +1926,7 @@ def test_probe_identifier_from_direct_pdf_url_falls_back_to_local_connector_brow
         "_download_pdf_bytes",
         lambda pdf_url, *, ctx=None: (_ for _ in ()).throw(RuntimeError("403 forbidden")),
     )
-    monkeypatch.setattr(server.requests, "post", fake_post)
+    monkeypatch.setattr(server.http_client, "post", fake_post)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     monkeypatch.setattr(
         server,
@@ -1796,7 +1997,7 @@ def test_identifier_pdf_content_type_url_uses_pdf_probe_before_webpage(
         },
     )
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
         lambda url, headers=None, timeout=None, **kwargs: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
@@ -1856,7 +2057,7 @@ def test_identifier_pdf_content_type_url_retries_probe_with_source_url_when_fina
     monkeypatch.setattr(server, "_fetch_page_signals", fake_fetch_page_signals)
     monkeypatch.setattr(server, "_probe_identifier_from_direct_pdf_url", fake_probe)
     monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
         lambda url, headers=None, timeout=None, **kwargs: FakeRequestsResponse(CROSSREF_RESPONSE),
     )
@@ -1951,26 +2152,27 @@ def test_identifier_skips_duplicate_pdf(monkeypatch, patch_web_client, ctx):
             content=PDF_BYTES,
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     result = server.add_items_by_doi(dois=["10.1038/test"], ctx=ctx)
     assert "pdf_source=existing_attachment" in result
     assert not patch_web_client.attached_files
 
 
 def test_identifier_falls_back_to_local_zotero_on_quota(monkeypatch, patch_web_client, ctx):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     def fake_get(url, **kwargs):
         return FakeRequestsResponse(
             headers={"Content-Type": "application/pdf"},
             content=PDF_BYTES,
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            fallback=fake_get,
+        ),
+    )
 
     def quota_attachment(files, parent_key):
         raise RuntimeError("Code: 413 Response: File would exceed quota")
@@ -2001,7 +2203,7 @@ def test_download_pdf_bytes_retries_after_timeout(monkeypatch):
             content=PDF_BYTES,
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     monkeypatch.setattr(server.time, "sleep", lambda *_: None)
     pdf_bytes, content_type = server._download_pdf_bytes("https://example.com/paper.pdf")
     assert pdf_bytes == PDF_BYTES
@@ -2016,7 +2218,7 @@ def test_download_pdf_bytes_falls_back_to_playwright_after_request_failures(monk
         calls["n"] += 1
         raise requests_lib.HTTPError("403 forbidden")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     monkeypatch.setattr(server.time, "sleep", lambda *_: None)
     monkeypatch.setattr(
         server,
@@ -2034,17 +2236,201 @@ def test_download_pdf_bytes_falls_back_to_playwright_after_request_failures(monk
     assert calls["n"] == 2
 
 
+def test_download_pdf_to_file_resumes_with_range_after_dropped_connection(monkeypatch, tmp_path):
+    body = PDF_BYTES + b"x" * 4096
+    requests_seen = []
+
+    class DroppingResponse(FakeRequestsResponse):
+        def iter_content(self, chunk_size=8192):
+            yield self.content[:1000]
+            raise requests_lib.ConnectionError("connection reset")
+
+    opened = []
+
+    def fake_get(url, timeout=None, stream=None, headers=None):
+        requests_seen.append(dict(headers or {}))
+        if len(requests_seen) == 1:
+            opened.append(DroppingResponse(headers={"Content-Type": "application/pdf"}, content=body))
+            return opened[-1]
+        return FakeRequestsResponse(
+            status_code=206,
+            headers={
+                "Content-Type": "application/pdf",
+                "Content-Range": f"bytes 1000-{len(body) - 1}/{len(body)}",
+            },
+            content=body[1000:],
+        )
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    monkeypatch.setattr(server.time, "sleep", lambda *_: None)
+    dest = tmp_path / "paper.pdf"
+
+    size, content_type = server._download_pdf_to_file("https://example.com/paper.pdf", dest)
+
+    assert size == len(body)
+    assert dest.read_bytes() == body
+    assert content_type == "application/pdf"
+    assert "Range" not in requests_seen[0]
+    assert requests_seen[1]["Range"] == "bytes=1000-"
+    assert opened[0].closed
+
+
+def test_download_pdf_to_file_stops_at_first_chunk_of_html_and_at_size_limit(monkeypatch, tmp_path):
+    chunks_read = []
+
+    class HtmlResponse(FakeRequestsResponse):
+        def iter_content(self, chunk_size=8192):
+            for index in range(100):
+                chunks_read.append(index)
+                yield b"<html>" + b" " * 1000
+
+    responses = {
+        "https://example.com/landing": lambda: HtmlResponse(headers={"Content-Type": "text/html"}),
+        "https://example.com/huge.pdf": lambda: FakeRequestsResponse(
+            headers={"Content-Type": "application/pdf", "Content-Length": str(10 * 1024 * 1024)},
+            content=PDF_BYTES,
+        ),
+    }
+    opened = []
+
+    def fake_get(url, timeout=None, stream=None, headers=None):
+        opened.append(responses[url]())
+        return opened[-1]
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    monkeypatch.setattr(server, "_download_pdf_bytes_via_playwright", lambda pdf_url, *, ctx=None: None)
+    monkeypatch.setenv("ZOTERO_MCP_PDF_MAX_MB", "1")
+
+    with pytest.raises(RuntimeError, match="not a PDF"):
+        server._download_pdf_to_file("https://example.com/landing", tmp_path / "landing.pdf")
+    assert chunks_read == [0]
+    assert not (tmp_path / "landing.pdf").exists()
+
+    with pytest.raises(RuntimeError, match="larger than the 1 MB limit"):
+        server._download_pdf_to_file("https://example.com/huge.pdf", tmp_path / "huge.pdf")
+    assert not (tmp_path / "huge.pdf").exists()
+    assert opened and all(response.closed for response in opened)
+
+
+def test_pdf_cascade_skips_dead_candidates_and_commits_to_first_verified_pdf(
+    monkeypatch, patch_web_client, ctx
+):
+    def fake_get(url, timeout=None, stream=None, headers=None, **kwargs):
+        if url.endswith("/gone.pdf"):
+            return FakeRequestsResponse(status_code=404)
+        if url.endswith("/landing"):
+            return FakeRequestsResponse(headers={"Content-Type": "text/html"}, content=b"<html>")
+        if url.endswith("/refused.pdf"):
+            raise requests_lib.ConnectionError("connection refused")
+        return FakeRequestsResponse(
+            headers={"Content-Type": "application/pdf", "Content-Range": "bytes 0-1023/52000"},
+            content=PDF_BYTES,
+        )
+
+    attempts = []
+
+    def fake_attach(zot, item_key, pdf_url, *, ctx, source):
+        attempts.append(pdf_url)
+        return {"success": True, "pdf_source": source, "message": f"PDF attached from {source}"}
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    monkeypatch.setattr(server, "_attach_pdf_from_url", fake_attach)
+    monkeypatch.setattr(server, "_item_has_usable_pdf_attachment", lambda *a, **kw: False)
+
+    result = server._attach_pdf_with_cascade(
+        patch_web_client,
+        "ITEM1",
+        pdf_candidates=[
+            {"source": "landing_page", "url": "https://publisher.example.com/landing"},
+            {"source": "citation_pdf_url", "url": "https://publisher.example.com/gone.pdf"},
+            {"source": "mirror", "url": "https://mirror.example.com/refused.pdf"},
+            {"source": "repository", "url": "https://repo.example.com/paper.pdf"},
+        ],
+        doi=None,
+        collection_key=None,
+        ctx=ctx,
+    )
+
+    assert result["success"] is True
+    assert result["pdf_source"] == "repository"
+    assert attempts == ["https://repo.example.com/paper.pdf"]
+    assert server._probe_pdf_candidate("https://repo.example.com/paper.pdf")["size"] == 52000
+
+
+def test_probe_pdf_candidate_marks_only_unresolvable_hosts_dead(monkeypatch):
+    import socket
+
+    import urllib3
+
+    def fake_get(url, **kwargs):
+        if "timeout" in url:
+            raise requests_lib.ConnectTimeout("connect timed out")
+        if "reset" in url:
+            raise requests_lib.ConnectionError("connection reset by peer")
+        dns_error = urllib3.exceptions.NameResolutionError(
+            "nxdomain.example", None, socket.gaierror(-2, "Name or service not known")
+        )
+        raise requests_lib.ConnectionError(urllib3.exceptions.MaxRetryError(None, url, dns_error))
+
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+
+    assert server._probe_pdf_candidate("https://slow.example.com/timeout.pdf")["verdict"] == "unknown"
+    assert server._probe_pdf_candidate("https://flaky.example.com/reset.pdf")["verdict"] == "unknown"
+    assert server._probe_pdf_candidate("https://nxdomain.example/paper.pdf")["verdict"] == "dead"
+
+
+def test_pdf_cascade_falls_back_to_unverified_candidates_in_priority_order(
+    monkeypatch, patch_web_client, ctx
+):
+    def fake_get(url, timeout=None, stream=None, headers=None, **kwargs):
+        if "api.openalex.org" in url:
+            return FakeRequestsResponse(
+                {"results": [{"best_oa_location": {"pdf_url": "https://oa.example.com/oa.pdf"}}]}
+            )
+        if "ebi.ac.uk" in url:
+            return FakeRequestsResponse({"resultList": {"result": []}})
+        if url == "https://oa.example.com/oa.pdf":
+            return FakeRequestsResponse(headers={"Content-Type": "application/pdf"}, content=PDF_BYTES)
+        return FakeRequestsResponse(status_code=403)
+
+    attempts = []
+
+    def fake_attach(zot, item_key, pdf_url, *, ctx, source):
+        attempts.append(source)
+        return {"success": False, "pdf_source": source, "message": f"PDF attach failed from {source}"}
+
+    monkeypatch.delenv("UNPAYWALL_EMAIL", raising=False)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    monkeypatch.setattr(server, "_attach_pdf_from_url", fake_attach)
+    monkeypatch.setattr(server, "_item_has_usable_pdf_attachment", lambda *a, **kw: False)
+    monkeypatch.setattr(
+        server,
+        "_attach_crossref_metadata_surrogate_pdf",
+        lambda *a, **kw: {"success": False, "pdf_source": "none", "message": "no surrogate"},
+    )
+
+    result = server._attach_pdf_with_cascade(
+        patch_web_client,
+        "ITEM1",
+        pdf_candidates=[
+            {"source": "citation_pdf_url", "url": "https://publisher.example.com/protected.pdf"},
+        ],
+        doi="10.1234/example",
+        collection_key=None,
+        ctx=ctx,
+    )
+
+    # The verified OpenAlex PDF is tried first; the 403 publisher link still gets a full attempt.
+    assert attempts == ["openalex:best_oa_location", "citation_pdf_url"]
+    assert result["success"] is False
+    assert "UNPAYWALL_EMAIL not set" in result["message"]
+
+
 def test_identifier_prefers_direct_web_attach_before_local_connector(
     monkeypatch,
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     def fake_get(url, **kwargs):
         return FakeRequestsResponse(
             headers={"Content-Type": "application/pdf"},
@@ -2056,8 +2442,15 @@ def test_identifier_prefers_direct_web_attach_before_local_connector(
 
     local_zot = type(patch_web_client)()
     monkeypatch.setenv("ZOTERO_MCP_LOCAL_PDF_MODE", "threshold")
-    monkeypatch.setattr(server.requests, "get", fake_get)
-    monkeypatch.setattr(server.requests, "post", fail_if_connector_post)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            fallback=fake_get,
+        ),
+    )
+    monkeypatch.setattr(server.http_client, "post", fail_if_connector_post)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
 
     result = server.add_items_by_identifier(
@@ -2075,12 +2468,6 @@ def test_identifier_prefers_connector_url_attach_before_pdf_download(
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     local_zot = type(patch_web_client)()
     local_zot.client = object()
     state = {"attached": False}
@@ -2127,8 +2514,16 @@ def test_identifier_prefers_connector_url_attach_before_pdf_download(
             return PostResponse(201)
         raise AssertionError(f"unexpected POST url: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
-    monkeypatch.setattr(server.requests, "post", fake_post)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            final_url="https://example.com/final",
+            fallback=fake_get,
+        ),
+    )
+    monkeypatch.setattr(server.http_client, "post", fake_post)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     monkeypatch.setattr(server, "_connector_target_snapshot", lambda: {})
     monkeypatch.setattr(
@@ -2187,9 +2582,10 @@ def test_attach_pdf_from_url_skips_slow_connector_url_host_after_timeout(
             raise requests_lib.ReadTimeout("connector url import timed out")
         raise AssertionError(f"unexpected POST url: {url}")
 
-    def fake_download(url, *, ctx=None):
+    def fake_download(url, dest, *, ctx=None):
         calls["download"] += 1
-        return PDF_BYTES, "application/pdf"
+        dest.write_bytes(PDF_BYTES)
+        return len(PDF_BYTES), "application/pdf"
 
     def fake_copy(*args, **kwargs):
         calls["copy"] += 1
@@ -2200,9 +2596,9 @@ def test_attach_pdf_from_url_skips_slow_connector_url_host_after_timeout(
         }
 
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
-    monkeypatch.setattr(server.requests, "post", fake_post)
+    monkeypatch.setattr(server.http_client, "post", fake_post)
     monkeypatch.setattr(server, "_connector_target_snapshot", lambda: {})
-    monkeypatch.setattr(server, "_download_pdf_bytes", fake_download)
+    monkeypatch.setattr(server, "_download_pdf_to_file", fake_download)
     monkeypatch.setattr(server, "_save_pdf_via_local_connector_copy", fake_copy)
     monkeypatch.setattr(server, "_item_has_usable_pdf_attachment", lambda *args, **kwargs: False)
 
@@ -2275,7 +2671,7 @@ def test_attach_europepmc_fulltext_pdf_generates_surrogate_pdf(
             return Response(content=EUROPEPMC_FULLTEXT_XML)
         raise AssertionError(f"unexpected GET url: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
     monkeypatch.setattr(patch_web_client, "attachment_simple", fake_attachment_simple)
     monkeypatch.setattr(server, "_item_has_usable_pdf_attachment", lambda *args, **kwargs: False)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: None)
@@ -2325,7 +2721,7 @@ def test_doi_attach_pdf_falls_back_to_crossref_metadata_surrogate_for_open_mdpi(
             return FakeRequestsResponse({}, status_code=403, headers={"Content-Type": "text/html"}, content=HTML_BYTES)
         raise AssertionError(f"unexpected URL: {url}")
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(server.http_client, "get", fake_get)
 
     result = server.add_items_by_doi(dois=["10.3390/rs13030516"], ctx=ctx)
 
@@ -2338,12 +2734,6 @@ def test_identifier_repairs_pending_local_parent_after_connector_url_attach_stal
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     local_zot = type(patch_web_client)()
     local_zot.client = object()
     state = {"save_items": 0, "save_attachment": 0}
@@ -2386,8 +2776,16 @@ def test_identifier_repairs_pending_local_parent_after_connector_url_attach_stal
             return {"success": True, "attachment_key": "LPDF1"}
         return {"success": False, "message": "not materialized yet"}
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
-    monkeypatch.setattr(server.requests, "post", fake_post)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            final_url="https://example.com/final",
+            fallback=fake_get,
+        ),
+    )
+    monkeypatch.setattr(server.http_client, "post", fake_post)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     monkeypatch.setattr(server, "_connector_target_snapshot", lambda: {})
     monkeypatch.setattr(server, "_confirm_local_pdf_attachment_materialized", fake_confirm)
@@ -2447,6 +2845,59 @@ def test_confirm_local_pdf_attachment_materialized_waits_for_late_attachment(
     assert result["attachment_key"] == "ATT1"
 
 
+def test_wait_for_local_change_rechecks_as_soon_as_watched_file_changes(tmp_path):
+    db_path = tmp_path / "zotero.sqlite"
+    db_path.write_bytes(b"v1")
+    calls = []
+
+    def check():
+        calls.append(time.monotonic())
+        return db_path.read_bytes() == b"v2"
+
+    def commit():
+        time.sleep(0.3)
+        db_path.write_bytes(b"v2")
+
+    writer = threading.Thread(target=commit)
+    started = time.monotonic()
+    writer.start()
+    result = server._wait_for_local_change(
+        check,
+        wait_seconds=20.0,
+        watch_paths=lambda: [db_path],
+        initial_interval=1.0,
+        max_interval=10.0,
+    )
+    writer.join()
+
+    # The commit lands 0.3s in; the re-check must not wait for the 1.0s poll interval.
+    assert result is True
+    assert len(calls) == 2
+    assert calls[1] - started < 0.8
+
+
+def test_wait_for_local_change_backs_off_without_watch_paths(monkeypatch):
+    sleeps = []
+    clock = {"now": 0.0}
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+
+    monkeypatch.setattr(server.time, "monotonic", lambda: clock["now"])
+    monkeypatch.setattr(server.time, "sleep", fake_sleep)
+
+    result = server._wait_for_local_change(
+        lambda: None,
+        wait_seconds=10.0,
+        initial_interval=0.5,
+        max_interval=4.0,
+    )
+
+    assert result is None
+    assert sleeps == [0.5, 1.0, 2.0, 4.0, 2.5]
+
+
 def test_save_pdf_via_local_connector_copy_repairs_pending_local_parent_after_connector_exception(
     monkeypatch,
     patch_web_client,
@@ -2498,7 +2949,7 @@ def test_save_pdf_via_local_connector_copy_repairs_pending_local_parent_after_co
             return {"success": True, "attachment_key": "LPDF1"}
         return {"success": False, "message": "not materialized yet"}
 
-    monkeypatch.setattr(server.requests, "post", fake_post)
+    monkeypatch.setattr(server.http_client, "post", fake_post)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     monkeypatch.setattr(
         server,
@@ -2526,19 +2977,20 @@ def test_identifier_skips_when_local_attachment_already_exists(
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     def fake_get(url, **kwargs):
         return FakeRequestsResponse(
             headers={"Content-Type": "application/pdf"},
             content=PDF_BYTES,
         )
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            fallback=fake_get,
+        ),
+    )
 
     local_zot = type(patch_web_client)()
     local_zot._children["NEWKEY1"] = [
@@ -2575,12 +3027,6 @@ def test_identifier_reuses_existing_local_copy_before_creating_another_one(
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     def fake_get(url, **kwargs):
         return FakeRequestsResponse(
             headers={"Content-Type": "application/pdf"},
@@ -2645,8 +3091,16 @@ def test_identifier_reuses_existing_local_copy_before_creating_another_one(
     patch_web_client._collections["COLINT"] = {"data": {"key": "COLINT", "name": "Intended", "parentCollection": False}}
     patch_web_client._collections["COLSEL"] = {"data": {"key": "COLSEL", "name": "Selected", "parentCollection": False}}
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
-    monkeypatch.setattr(server.requests, "post", fail_if_connector_post)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            final_url="https://example.com/final",
+            fallback=fake_get,
+        ),
+    )
+    monkeypatch.setattr(server.http_client, "post", fail_if_connector_post)
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     patch_web_client.attachment_simple = quota_attachment
 
@@ -2665,12 +3119,6 @@ def test_identifier_reuses_existing_local_copy_and_reconciles_into_intended_coll
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     def fake_get(url, **kwargs):
         return FakeRequestsResponse(
             headers={"Content-Type": "application/pdf"},
@@ -2735,8 +3183,16 @@ def test_identifier_reuses_existing_local_copy_and_reconciles_into_intended_coll
     patch_web_client._collections["COLINT"] = {"data": {"key": "COLINT", "name": "Intended", "parentCollection": False}}
     patch_web_client._collections["COLSEL"] = {"data": {"key": "COLSEL", "name": "Selected", "parentCollection": False}}
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
-    monkeypatch.setattr(server.requests, "post", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should reuse existing local copy without connector POST")))
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            final_url="https://example.com/final",
+            fallback=fake_get,
+        ),
+    )
+    monkeypatch.setattr(server.http_client, "post", lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should reuse existing local copy without connector POST")))
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     patch_web_client.attachment_simple = quota_attachment
 
@@ -2758,12 +3214,6 @@ def test_identifier_reuses_existing_local_copy_and_removes_selected_target_membe
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-
     def fake_get(url, **kwargs):
         raise AssertionError("should reuse existing local copy before any PDF download")
 
@@ -2811,7 +3261,15 @@ def test_identifier_reuses_existing_local_copy_and_removes_selected_target_membe
     patch_web_client._collections["COLKEYX"] = {"data": {"key": "COLKEYX", "name": "Intended", "parentCollection": False}}
     patch_web_client._collections["COLSEL"] = {"data": {"key": "COLSEL", "name": "Selected", "parentCollection": False}}
 
-    monkeypatch.setattr(server.requests, "get", fake_get)
+    monkeypatch.setattr(
+        server.http_client,
+        "get",
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            final_url="https://example.com/final",
+            fallback=fake_get,
+        ),
+    )
     monkeypatch.setattr(server, "get_local_zotero_client", lambda: local_zot)
     monkeypatch.setattr(
         server,
@@ -2837,11 +3295,7 @@ def test_arxiv_import_reuses_existing_web_copy_when_local_client_is_unavailable(
     patch_web_client,
     ctx,
 ):
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(ARXIV_XML),
-    )
+    monkeypatch.setattr(server.http_client, "get", fake_http_get(arxiv=ARXIV_XML))
     patch_web_client._collections["COLINT"] = {
         "data": {"key": "COLINT", "name": "Intended", "parentCollection": False}
     }
@@ -3440,7 +3894,11 @@ def test_attach_pdf_from_url_recovers_materialized_local_copy_with_repair_proven
         lambda: {"current_collection_id": "COLSEL", "current_name": "Selected"},
     )
     monkeypatch.setattr(server, "_save_pdf_via_local_connector_url", lambda *a, **k: {"success": False, "message": "url attach timed out"})
-    monkeypatch.setattr(server, "_download_pdf_bytes", lambda url, *, ctx=None: (PDF_BYTES, "application/pdf"))
+    monkeypatch.setattr(
+        server,
+        "_download_pdf_to_file",
+        lambda url, dest, *, ctx=None: (dest.write_bytes(PDF_BYTES), "application/pdf"),
+    )
     monkeypatch.setattr(server, "_save_pdf_via_local_connector_copy", lambda *a, **k: {"success": False, "message": "copy path failed"})
     monkeypatch.setattr(server, "_attach_pdf_via_local_zotero", lambda *a, **k: {"success": False, "message": "local attach pending"})
 
@@ -3502,7 +3960,11 @@ def test_attach_pdf_from_url_uses_context_warning_api_when_warn_is_missing(
     monkeypatch.setattr(server, "_get_item_payload", lambda *a, **k: None)
     monkeypatch.setattr(server, "_pdf_filename_for_item", lambda *a, **k: "Recovered Paper.pdf")
     monkeypatch.setattr(server, "_should_prefer_local_pdf_after_download", lambda *a, **k: False)
-    monkeypatch.setattr(server, "_download_pdf_bytes", lambda url, *, ctx=None: (PDF_BYTES, "application/pdf"))
+    monkeypatch.setattr(
+        server,
+        "_download_pdf_to_file",
+        lambda url, dest, *, ctx=None: (dest.write_bytes(PDF_BYTES), "application/pdf"),
+    )
 
     result = server._attach_pdf_from_url(
         patch_web_client,
@@ -3535,6 +3997,47 @@ def test_public_import_api_is_minimal():
     assert "zotero_reconcile_local_copies" not in tool_names
 
 
+def test_tool_lanes_keep_reads_responsive_and_cap_tool_concurrency(monkeypatch):
+    from fastmcp import Client, FastMCP
+
+    monkeypatch.setattr(server, "mcp", FastMCP("lanes"))
+    monkeypatch.setattr(server, "_tool_lanes", {})
+    release = threading.Event()
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+
+    @server._tool(name="slow_import", lane="work", max_concurrency=1)
+    def slow_import() -> str:
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        release.wait(5)
+        with lock:
+            running["now"] -= 1
+        return "imported"
+
+    @server._tool(name="quick_read", lane="read")
+    def quick_read() -> str:
+        return "read"
+
+    async def main():
+        async with Client(server.mcp) as client:
+            slow_calls = [
+                asyncio.create_task(client.call_tool("slow_import", {})) for _ in range(2)
+            ]
+            await asyncio.sleep(0.2)
+            read = await asyncio.wait_for(client.call_tool("quick_read", {}), 2)
+            release.set()
+            return read, await asyncio.gather(*slow_calls)
+
+    read, slow_results = asyncio.run(main())
+    assert read.content[0].text == "read"
+    assert [result.content[0].text for result in slow_results] == ["imported", "imported"]
+    assert running["max"] == 1
+    # The decorated name is still the plain function.
+    assert slow_import() == "imported"
+
+
 def test_reconcile_collection_duplicates_merges_membership_and_trashes_duplicates(
     monkeypatch,
     patch_web_client,
@@ -3782,6 +4285,99 @@ def test_reconcile_collection_duplicates_runs_missing_pdf_postpass_after_dedupe(
     assert attach_calls[0][1] == "10.21437/test"
 
 
+def test_reconcile_collection_duplicates_uses_listing_payloads_without_per_item_fetches(
+    monkeypatch,
+    patch_web_client,
+    ctx,
+):
+    patch_web_client._collections["ROOTCOL"] = {
+        "data": {"key": "ROOTCOL", "name": "Root", "parentCollection": False}
+    }
+    listing = []
+    for n in range(30):
+        listing.append({
+            "key": f"P{n}",
+            "version": 1,
+            "data": {
+                "key": f"P{n}",
+                "version": 1,
+                "itemType": "journalArticle",
+                "title": f"Paper {n // 2}",
+                "DOI": f"10.5555/{n // 2}",
+                "collections": ["ROOTCOL"],
+            },
+        })
+        if n % 2 == 0:
+            listing.append({
+                "key": f"A{n}",
+                "data": {
+                    "key": f"A{n}",
+                    "itemType": "attachment",
+                    "parentItem": f"P{n}",
+                    "contentType": "application/pdf",
+                },
+            })
+    for entry in listing:
+        patch_web_client._items[entry["key"]] = entry
+
+    per_item_calls = []
+    monkeypatch.setattr(
+        patch_web_client,
+        "collection_items",
+        lambda key, limit=None, start=0, **kwargs: listing[start:start + limit],
+    )
+    monkeypatch.setattr(
+        patch_web_client, "children", lambda key, **kwargs: per_item_calls.append(("children", key)) or []
+    )
+    original_item = patch_web_client.item
+    monkeypatch.setattr(
+        patch_web_client, "item", lambda key: per_item_calls.append(("item", key)) or original_item(key)
+    )
+
+    result = server.reconcile_collection_duplicates(
+        collection_key="ROOTCOL",
+        dry_run=True,
+        ctx=ctx,
+    )
+
+    assert "duplicate groups: 15" in result
+    # Every even paper has the PDF, so it is kept as canonical.
+    assert "Paper 0 (P0) | yes | P1 |" in result
+    assert per_item_calls == []
+    # One collections listing plus one page of collection items.
+    assert "- api_calls: 2" in result
+
+
+def test_collection_payload_map_drops_pdf_map_when_a_listing_page_fails(monkeypatch, patch_web_client):
+    patch_web_client._collections["ROOTCOL"] = {
+        "data": {"key": "ROOTCOL", "name": "Root", "parentCollection": False}
+    }
+    listing = [
+        {"key": f"P{n}", "data": {"key": f"P{n}", "itemType": "journalArticle", "title": f"Paper {n}"}}
+        for n in range(99)
+    ]
+    listing.append({
+        "key": "A0",
+        "data": {"key": "A0", "itemType": "attachment", "parentItem": "P0", "contentType": "application/pdf"},
+    })
+
+    def collection_items(key, limit=None, start=0, **kwargs):
+        if start:
+            raise RuntimeError("HTTP 503")
+        return listing[:limit]
+
+    monkeypatch.setattr(patch_web_client, "collection_items", collection_items)
+
+    items, complete = server._collection_items_listing(patch_web_client, "ROOTCOL")
+    assert (len(items), complete) == (100, False)
+    _, items_by_key, pdf_children = server._collection_items_payload_map(
+        patch_web_client, collection_key="ROOTCOL", include_subcollections=False
+    )
+    assert len(items_by_key) == 99
+    # The failed page may have held other parents' PDFs, so they are checked one by one.
+    assert pdf_children is None
+
+
 def test_reconcile_collection_duplicates_uses_local_db_fallback_for_local_only_duplicates(
     monkeypatch,
     patch_web_client,
@@ -3873,16 +4469,14 @@ def test_get_import_ledger_reads_recent_entries(
         "data": {"key": "COL1", "name": "COL1", "parentCollection": False}
     }
     monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda req, timeout=None: FakeURLResponse(LANDING_WITH_PDF_ONLY),
-    )
-    monkeypatch.setattr(
-        server.requests,
+        server.http_client,
         "get",
-        lambda url, **kwargs: FakeRequestsResponse(
-            headers={"Content-Type": "application/pdf"},
-            content=PDF_BYTES,
+        fake_http_get(
+            pages={"https://example.com/landing": LANDING_WITH_PDF_ONLY},
+            fallback=lambda url, **kwargs: FakeRequestsResponse(
+                headers={"Content-Type": "application/pdf"},
+                content=PDF_BYTES,
+            ),
         ),
     )
 
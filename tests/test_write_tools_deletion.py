@@ -1,3 +1,7 @@
+import types
+
+from pyzotero import zotero_errors
+
 import zotero_mcp.server as server
 
 
@@ -40,3 +44,80 @@ def test_delete_no_credentials(patch_no_credentials, ctx):
     result = server.delete_items(item_keys=["ITEM1"], ctx=ctx)
     assert "Error" in result
     assert "credentials" in result.lower()
+
+
+class _VersionedLibrary:
+    """Library version bookkeeping the multi-key delete endpoint enforces."""
+
+    def __init__(self, zot, version):
+        self.zot = zot
+        self.version = version
+        self.calls = []
+        self.original_delete = zot.delete_item
+        self.original_items = zot.items
+        zot.delete_item = self.delete_item
+        zot.items = self.items
+        zot.last_modified_version = lambda: self.version
+        self._respond()
+
+    def _respond(self):
+        self.zot.request = types.SimpleNamespace(
+            headers={"last-modified-version": str(self.version)}
+        )
+        return self.zot.request
+
+    def items(self, *args, **kwargs):
+        result = self.original_items(*args, **kwargs)
+        self._respond()
+        return result
+
+    def delete_item(self, items, last_modified=None):
+        self.calls.append((len(items), last_modified))
+        if last_modified != self.version:
+            raise zotero_errors.PreConditionFailedError("412 library has been modified")
+        self.original_delete(items, last_modified=last_modified)
+        self.version += 1
+        return self._respond()
+
+
+def _add_items(zot, count):
+    for idx in range(count):
+        key = f"D{idx:03d}"
+        zot._items[key] = {
+            "key": key,
+            "version": idx + 1,
+            "data": {"key": key, "version": idx + 1, "itemType": "book"},
+        }
+
+
+def test_delete_many_items_uses_multi_key_deletes(patch_web_client, ctx):
+    library = _VersionedLibrary(patch_web_client, version=500)
+    _add_items(patch_web_client, 120)
+
+    result = server.delete_items(item_keys=list(patch_web_client._items), ctx=ctx)
+
+    assert result.count("moved to trash") == 120
+    assert [len(batch) for batch in patch_web_client.item_key_fetches] == [50, 50, 20]
+    # Each batch carries the version returned by the previous delete, so none hit 412.
+    assert library.calls == [(50, 500), (50, 501), (20, 502)]
+    assert patch_web_client._items == {}
+
+
+def test_delete_many_items_refetches_and_retries_after_412(patch_web_client, ctx):
+    library = _VersionedLibrary(patch_web_client, version=500)
+    _add_items(patch_web_client, 60)
+    original_items = patch_web_client.items
+
+    def items_then_concurrent_edit(*args, **kwargs):
+        result = original_items(*args, **kwargs)
+        if len(patch_web_client.item_key_fetches) == 2:
+            # Another client writes after the items were read
+            library.version += 1
+        return result
+
+    patch_web_client.items = items_then_concurrent_edit
+
+    result = server.delete_items(item_keys=list(patch_web_client._items), ctx=ctx)
+
+    assert result.count("moved to trash") == 60
+    assert library.calls == [(50, 500), (50, 501), (10, 502)]
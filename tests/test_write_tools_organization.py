@@ -34,13 +34,23 @@ def test_create_collection_no_credentials(patch_no_credentials, ctx):
 
 # ── move_items_to_collection ─────────────────────────────────────────────────
 
+def _seed_items(fake, keys, collections=()):
+    for key in keys:
+        fake._items[key] = {
+            "key": key,
+            "version": 1,
+            "data": {"key": key, "version": 1, "itemType": "journalArticle",
+                     "collections": list(collections)},
+        }
+
+
 def test_move_add_single_item(patch_web_client, ctx):
     result = server.move_items_to_collection(
         item_keys=["ITEM1"], collection_key="COL1", action="add", ctx=ctx
     )
     assert "✓ ITEM1 added to COL1" in result
-    assert len(patch_web_client.added_to) == 1
-    assert patch_web_client.added_to[0][0] == "COL1"
+    assert len(patch_web_client.updated_items) == 1
+    assert patch_web_client.updated_items[0]["collections"] == ["COL1"]
 
 
 def test_move_add_multiple_items(patch_web_client, ctx):
@@ -48,23 +58,37 @@ def test_move_add_multiple_items(patch_web_client, ctx):
         item_keys=["A", "B", "C"], collection_key="COL2", action="add", ctx=ctx
     )
     assert result.count("✓") == 3
-    assert len(patch_web_client.added_to) == 3
+    assert patch_web_client.write_batches == [["A", "B", "C"]]
 
 
 def test_move_remove_single_item(patch_web_client, ctx):
+    _seed_items(patch_web_client, ["ITEM1"], collections=["COL1", "COL9"])
     result = server.move_items_to_collection(
         item_keys=["ITEM1"], collection_key="COL1", action="remove", ctx=ctx
     )
     assert "✓ ITEM1 removed from COL1" in result
-    assert len(patch_web_client.removed_from) == 1
+    assert patch_web_client._items["ITEM1"]["data"]["collections"] == ["COL9"]
 
 
 def test_move_remove_multiple_items(patch_web_client, ctx):
+    _seed_items(patch_web_client, ["X", "Y"], collections=["COL3"])
     result = server.move_items_to_collection(
         item_keys=["X", "Y"], collection_key="COL3", action="remove", ctx=ctx
     )
     assert result.count("✓") == 2
-    assert len(patch_web_client.removed_from) == 2
+    assert patch_web_client.write_batches == [["X", "Y"]]
+
+
+def test_move_many_items_uses_batched_fetches_and_writes(patch_web_client, ctx):
+    keys = [f"K{idx:03d}" for idx in range(120)]
+    _seed_items(patch_web_client, keys)
+    result = server.move_items_to_collection(
+        item_keys=keys, collection_key="COL1", action="add", ctx=ctx
+    )
+    assert result.count("✓") == 120
+    assert [len(batch) for batch in patch_web_client.item_key_fetches] == [50, 50, 20]
+    assert [len(batch) for batch in patch_web_client.write_batches] == [50, 50, 20]
+    assert all(item["data"]["collections"] == ["COL1"] for item in patch_web_client._items.values())
 
 
 def test_move_one_item_raises_error(patch_web_client, ctx):
@@ -143,3 +167,43 @@ def test_delete_collection_no_credentials(patch_no_credentials, ctx):
     result = server.delete_collection(collection_key="COL1", ctx=ctx)
     assert "Error" in result
     assert "credentials" in result.lower()
+
+
+def test_collection_tree_answers_paths_and_descendants_from_one_listing(patch_web_client, ctx):
+    listing_calls = []
+    single_fetches = []
+
+    def collections(limit=None, start=0, **kwargs):
+        listing_calls.append(start)
+        values = list(patch_web_client._collections.values())
+        return values[start:start + limit]
+
+    def collection(key):
+        single_fetches.append(key)
+        return patch_web_client._collections[key]
+
+    patch_web_client.collections = collections
+    patch_web_client.collection = collection
+    for n in range(250):
+        parent = f"C{(n - 1) // 2}" if n else False
+        patch_web_client._collections[f"C{n}"] = {
+            "data": {"key": f"C{n}", "name": f"N{n}", "parentCollection": parent}
+        }
+
+    assert server._collection_label(patch_web_client, "C6") == "N0 / N2 / N6"
+    for n in range(250):
+        server._collection_path(patch_web_client, f"C{n}")
+    assert server._collection_descendant_keys(patch_web_client, "C2") == [
+        "C2", "C5", "C6", "C11", "C12", "C13", "C14",
+        *[f"C{n}" for n in range(23, 31)],
+        *[f"C{n}" for n in range(47, 63)],
+        *[f"C{n}" for n in range(95, 127)],
+        *[f"C{n}" for n in range(191, 250)],
+    ]
+    assert listing_calls == [0, 100, 200]
+    assert single_fetches == []
+
+    server.update_collection(collection_key="C6", name="Renamed", ctx=ctx)
+    patch_web_client._collections["C6"]["data"]["name"] = "Renamed"
+    assert server._collection_label(patch_web_client, "C6") == "N0 / N2 / Renamed"
+    assert listing_calls == [0, 100, 200, 0, 100, 200]